@@ -0,0 +1,134 @@
+"""
+Benchmark of the columnar results store against the text outputs of a run.
+
+Compares size on disk and load time of the time series of an .eso file (and
+the ReadVarsESO CSV of the same run) with the columnar store written from it:
+
+  read_csv      pandas.read_csv of the whole CSV
+  read_csv col  pandas.read_csv of the date column and one variable column
+  read_eso      read_eso of every variable
+  store all     ColumnarStore.load of every variable at the finest frequency
+  store var     ColumnarStore.load of one variable (all keys)
+  store key     ColumnarStore.load of one key of that variable
+
+Stores are written as float64 and float32 .npz, and as Parquet when pyarrow is
+installed. --scale N repeats the data section N times as separate environments.
+
+Usage:
+    python benchmarks/bench_columnar_store.py [--eso file.eso] [--csv file.csv]
+        [--scale 1 10] [--variable "Zone Air Temperature"] [--key SPACE1-1] [--repeat 5]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+import numpy as np
+import pandas as pd
+
+from energyplus_mcp_server.utils.eso_reader import read_eso
+from energyplus_mcp_server.utils.columnar_store import ColumnarStore, write_columnar_store, pq
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def scale_outputs(eso_path, csv_path, scale, work):
+    """Copy an .eso and CSV into ``work`` with the data section repeated ``scale`` times"""
+    with open(eso_path) as f:
+        lines = f.readlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith("End of Data Dictionary")) + 1
+    end = next(i for i in range(len(lines) - 1, -1, -1) if lines[i].startswith("End of Data"))
+    scaled_eso = os.path.join(work, "eplusout.eso")
+    with open(scaled_eso, "w") as f:
+        f.writelines(lines[:start])
+        for _ in range(scale):
+            f.writelines(lines[start:end])
+        f.writelines(lines[end:])
+
+    scaled_csv = None
+    if csv_path and os.path.exists(csv_path):
+        with open(csv_path) as f:
+            header, *rows = f.readlines()
+        scaled_csv = os.path.join(work, "eplusout.csv")
+        with open(scaled_csv, "w") as f:
+            f.write(header)
+            for _ in range(scale):
+                f.writelines(rows)
+    return scaled_eso, scaled_csv
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--eso", default=example + ".eso", help="EnergyPlus .eso file")
+    parser.add_argument("--csv", default=example + ".csv", help="ReadVarsESO CSV of the same run")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10], help="Data section repetitions")
+    parser.add_argument("--variable", default="Zone Air Temperature", help="Variable of the selective loads")
+    parser.add_argument("--key", default="SPACE1-1", help="Key of the single-series load")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stores = [("npz f64", "npz", np.float64), ("npz f32", "npz", np.float32)]
+    if pq is not None:
+        stores += [("parquet f64", "parquet", np.float64), ("parquet f32", "parquet", np.float32)]
+    else:
+        print("pyarrow not installed, benchmarking the .npz store only\n")
+
+    print(f"{'scale':>6}{'format':>13}{'path':>14}{'MB':>9}{'ms':>10}{'vs csv':>9}")
+    for scale in args.scale:
+        work = tempfile.mkdtemp(prefix="bench_columnar_")
+        try:
+            eso_path, csv_path = scale_outputs(args.eso, args.csv, scale, work)
+            eso_mb = os.path.getsize(eso_path) / 1e6
+            csv_time = None
+            if csv_path:
+                csv_mb = os.path.getsize(csv_path) / 1e6
+                column = next(c for c in pd.read_csv(csv_path, nrows=0).columns
+                              if c.startswith(f"{args.key}:{args.variable}"))
+                csv_time, _ = best_of(lambda: pd.read_csv(csv_path), args.repeat)
+                col_time, _ = best_of(lambda: pd.read_csv(csv_path, usecols=["Date/Time", column]), args.repeat)
+                print(f"{scale:>6}{'csv':>13}{'read_csv':>14}{csv_mb:>9.2f}{csv_time * 1000:>10.1f}")
+                print(f"{scale:>6}{'csv':>13}{'read_csv col':>14}{'':>9}{col_time * 1000:>10.1f}"
+                      f"{csv_time / col_time:>8.1f}x")
+            eso_time, _ = best_of(lambda: read_eso(eso_path), args.repeat)
+            ratio = f"{csv_time / eso_time:>8.1f}x" if csv_time else ""
+            print(f"{scale:>6}{'eso':>13}{'read_eso':>14}{eso_mb:>9.2f}{eso_time * 1000:>10.1f}{ratio}")
+
+            for label, fmt, dtype in stores:
+                write_time, manifest = best_of(
+                    lambda: write_columnar_store(work, fmt=fmt, dtype=dtype, force=True), 1)
+                store = ColumnarStore(work)
+                size_mb = manifest["size_bytes"] / 1e6
+                print(f"{scale:>6}{label:>13}{'write':>14}{size_mb:>9.2f}{write_time * 1000:>10.1f}")
+                for path, kwargs in (("store all", {}),
+                                     ("store var", {"variables": [args.variable]}),
+                                     ("store key", {"variables": [f"{args.key}:{args.variable}"]})):
+                    seconds, frame = best_of(lambda: store.load(**kwargs), args.repeat)
+                    ratio = f"{csv_time / seconds:>8.1f}x" if csv_time else ""
+                    print(f"{scale:>6}{label:>13}{path:>14}{'':>9}{seconds * 1000:>10.1f}{ratio}")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
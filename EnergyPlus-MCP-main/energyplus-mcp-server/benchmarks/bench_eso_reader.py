@@ -0,0 +1,161 @@
+"""
+Benchmark of time-series loading: ReadVarsESO + CSV vs. the streaming ESO reader.
+
+Loads the variables of an .eso file the way post-processing did and the way
+read_eso does, and checks that both give the same values:
+
+  readvars    ReadVarsESO converts the .eso to CSV (only with --readvars)
+  read_csv    pandas.read_csv of that CSV (every column)
+  eso all     read_eso of every variable (float64)
+  eso f32     read_eso of every variable as float32
+  eso select  read_eso of one variable, the rest is skipped unparsed
+
+--scale N writes a larger .eso (and matching CSV) by repeating the data
+section N times as separate environments, to show how each path grows.
+Peak memory is the Python heap peak measured with tracemalloc in a separate pass.
+
+Usage:
+    python benchmarks/bench_eso_reader.py [--eso file.eso] [--csv file.csv] [--readvars /path/to/ReadVarsESO]
+        [--scale 1 10 50] [--select "Zone Air Temperature"] [--repeat 3]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from energyplus_mcp_server.utils.eso_reader import read_eso
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def peak_mb(func):
+    """Python heap peak (MB) while running func once"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def scale_outputs(eso_path, csv_path, scale, work):
+    """Write an .eso and CSV whose data section is repeated ``scale`` times"""
+    with open(eso_path) as f:
+        lines = f.readlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith("End of Data Dictionary")) + 1
+    end = next(i for i in range(len(lines) - 1, -1, -1) if lines[i].startswith("End of Data"))
+    scaled_eso = os.path.join(work, f"scaled_{scale}.eso")
+    with open(scaled_eso, "w") as f:
+        f.writelines(lines[:start])
+        for _ in range(scale):
+            f.writelines(lines[start:end])
+        f.writelines(lines[end:])
+
+    scaled_csv = None
+    if csv_path and os.path.exists(csv_path):
+        with open(csv_path) as f:
+            header, *rows = f.readlines()
+        scaled_csv = os.path.join(work, f"scaled_{scale}.csv")
+        with open(scaled_csv, "w") as f:
+            f.write(header)
+            for _ in range(scale):
+                f.writelines(rows)
+    return scaled_eso, scaled_csv
+
+
+def run_readvars(readvars, eso_path, work):
+    """Convert an .eso to CSV with ReadVarsESO, as the EnergyPlus CLI does"""
+    csv_path = os.path.join(work, "readvars.csv")
+    rvi = os.path.join(work, "readvars.rvi")
+    with open(rvi, "w") as f:
+        f.write(f"{eso_path}\n{csv_path}\n")
+    subprocess.run([readvars, rvi, "unlimited"], cwd=work, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return csv_path
+
+
+def max_difference(frame, csv):
+    """Largest relative difference between the reader's columns and the CSV's"""
+    csv.columns = [c.strip() for c in csv.columns]
+    common = [c for c in frame.columns[1:] if c in csv.columns]
+    if not common or len(frame) != len(csv):
+        return float("nan")
+    expected = csv[common].to_numpy(np.float64)
+    actual = frame[common].to_numpy(np.float64)
+    return float(np.nanmax(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-12)))
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled")
+    idd = os.getenv("EPLUS_IDD_PATH")
+    default_readvars = os.path.join(os.path.dirname(idd), "PostProcess", "ReadVarsESO") if idd else None
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--eso", default=example + ".eso", help="EnergyPlus .eso file")
+    parser.add_argument("--csv", default=example + ".csv", help="ReadVarsESO CSV of the same run")
+    parser.add_argument("--readvars", default=default_readvars, help="ReadVarsESO executable")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 50], help="Data section repetitions")
+    parser.add_argument("--select", default="SPACE1-1:Zone Air Temperature", help="Variable for the selective read")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    readvars = args.readvars if args.readvars and os.path.exists(args.readvars) else None
+    if not readvars:
+        print("ReadVarsESO not found, timing read_csv of the existing CSV only\n")
+
+    print(f"{'scale':>6}{'eso MB':>8}{'path':>12}{'ms':>10}{'peak MB':>10}{'speedup':>9}  max rel. diff")
+    for scale in args.scale:
+        work = tempfile.mkdtemp(prefix="bench_eso_")
+        try:
+            eso_path, csv_path = scale_outputs(args.eso, args.csv, scale, work)
+            size_mb = os.path.getsize(eso_path) / 1e6
+            rows = []
+            if readvars:
+                readvars_time, csv_path = best_of(lambda: run_readvars(readvars, eso_path, work), args.repeat)
+                rows.append(("readvars", readvars_time, None, None))
+            csv_time = csv = None
+            if csv_path:
+                csv_time, csv = best_of(lambda: pd.read_csv(csv_path), args.repeat)
+                rows.append(("read_csv", csv_time, peak_mb(lambda: pd.read_csv(csv_path)), None))
+
+            for label, kwargs in (("eso all", {}), ("eso f32", {"dtype": np.float32}),
+                                  ("eso select", {"variables": [args.select]})):
+                eso_time, data = best_of(lambda: read_eso(eso_path, **kwargs), args.repeat)
+                diff = max_difference(data.to_frame(), csv.copy()) if csv is not None else float("nan")
+                rows.append((label, eso_time, peak_mb(lambda: read_eso(eso_path, **kwargs)), diff))
+
+            baseline = sum(row[1] for row in rows if row[0] in ("readvars", "read_csv"))
+            for label, seconds, peak, diff in rows:
+                ratio = f"{baseline / seconds:>8.1f}x" if diff is not None and baseline else f"{'':>9}"
+                peak_text = f"{peak:>10.1f}" if peak is not None else f"{'-':>10}"
+                diff_text = f"  {diff:.1e}" if diff is not None else ""
+                print(f"{scale:>6}{size_mb:>8.1f}{label:>12}{seconds * 1000:>10.1f}{peak_text}{ratio}{diff_text}")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
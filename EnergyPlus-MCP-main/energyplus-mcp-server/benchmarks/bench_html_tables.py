@@ -0,0 +1,100 @@
+"""
+Benchmark of table extraction from EnergyPlus HTML tabular reports.
+
+Reads every table of each bundled *Table.htm with:
+
+  read_html     pandas.read_html (lxml), tables only, without report names
+  beautifulsoup BeautifulSoup with the lxml parser, walking every <table>
+  stream        parse_html_tables, the line-streaming extractor
+  cached        load_html_tables answered from the JSON cache next to the report
+
+and reports the size of the JSON cache against the HTML. Times are compared
+with read_html.
+
+Usage:
+    python benchmarks/bench_html_tables.py [--html file.htm ...] [--repeat 5]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import io
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+from energyplus_mcp_server.utils.html_tables import parse_html_tables, load_html_tables, CACHE_SUFFIX
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def read_html(html_path):
+    import pandas as pd
+    with open(html_path, encoding="utf-8") as f:
+        return pd.read_html(io.StringIO(f.read()), flavor="lxml")
+
+
+def beautifulsoup(html_path):
+    from bs4 import BeautifulSoup
+    with open(html_path, encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "lxml")
+    return [[[cell.get_text(strip=True) for cell in row.find_all("td")] for row in table.find_all("tr")]
+            for table in soup.find_all("table")]
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    examples = sorted(glob.glob(os.path.join(here, "..", "illustrative examples", "*", "*Table.htm")))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--html", nargs="+", default=examples, help="EnergyPlus HTML tabular reports")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'report':>32}{'HTML MB':>9}{'JSON MB':>9}{'tables':>8}{'path':>15}{'ms':>9}{'vs read_html':>14}")
+    for html_path in args.html:
+        work = tempfile.mkdtemp(prefix="bench_html_")
+        try:
+            local = os.path.join(work, os.path.basename(html_path))
+            shutil.copy(html_path, local)
+            rows = []
+            for label, func in (("read_html", read_html), ("beautifulsoup", beautifulsoup)):
+                try:
+                    rows.append((label, best_of(lambda: func(local), args.repeat)[0]))
+                except ImportError as e:
+                    print(f"  skipping {label}: {e}")
+            stream_time, tables = best_of(lambda: parse_html_tables(local), args.repeat)
+            rows.append(("stream", stream_time))
+            load_html_tables(local)  # writes the cache
+            rows.append(("cached", best_of(lambda: load_html_tables(local), args.repeat)[0]))
+
+            name = os.path.basename(html_path)[:30]
+            html_mb = os.path.getsize(local) / 1e6
+            cache_path = os.path.join(work, os.path.splitext(os.path.basename(local))[0] + CACHE_SUFFIX)
+            json_mb = os.path.getsize(cache_path) / 1e6
+            reference = dict(rows).get("read_html", stream_time)
+            for label, seconds in rows:
+                print(f"{name:>32}{html_mb:>9.2f}{json_mb:>9.2f}{len(tables):>8}{label:>15}"
+                      f"{seconds * 1000:>9.1f}{reference / seconds:>13.1f}x")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
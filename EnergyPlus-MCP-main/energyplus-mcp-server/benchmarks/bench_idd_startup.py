@@ -0,0 +1,94 @@
+"""
+Startup benchmark for the pre-compiled IDD snapshot.
+
+Measures time-to-first-model in fresh Python processes, since eppy keeps the
+parsed IDD in class attributes for the lifetime of a process:
+
+  plain     IDF.setiddname + IDF(model)                    (old behaviour)
+  cold      initialize_idd with an empty cache + IDF(model) (parses and writes snapshot)
+  snapshot  initialize_idd with a warm cache + IDF(model)
+
+Usage:
+    python benchmarks/bench_idd_startup.py --idd /path/to/Energy+.idd \\
+        --idf sample_files/5ZoneAirCooled.idf --repeat 3
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+CHILD = r"""
+import sys, time, json
+start = time.perf_counter()
+from eppy.modeleditor import IDF
+from energyplus_mcp_server.utils.idd_snapshot import initialize_idd
+mode, idd, idf, cache_dir = sys.argv[1:5]
+imported = time.perf_counter()
+if mode == "plain":
+    IDF.setiddname(idd)
+    info = {"source": "lazy"}
+else:
+    info = initialize_idd(idd, cache_dir)
+ready = time.perf_counter()
+IDF(idf)
+done = time.perf_counter()
+print(json.dumps({"source": info["source"], "idd_s": ready - imported,
+                  "first_model_s": done - imported, "total_s": done - start}))
+"""
+
+
+def run_child(mode: str, idd: str, idf: str, cache_dir: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, mode, idd, idf, cache_dir],
+        check=True, capture_output=True, text=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--idd", default=os.getenv("EPLUS_IDD_PATH"), help="Path to Energy+.idd")
+    parser.add_argument("--idf", required=True, help="Model parsed after the IDD is ready")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if not args.idd:
+        parser.error("--idd is required when EPLUS_IDD_PATH is not set")
+
+    cache_dir = tempfile.mkdtemp(prefix="idd_snapshot_bench_")
+    results = {"plain": [], "cold": [], "snapshot": []}
+    try:
+        for _ in range(args.repeat):
+            results["plain"].append(run_child("plain", args.idd, args.idf, cache_dir))
+            shutil.rmtree(cache_dir)
+            os.makedirs(cache_dir)
+            results["cold"].append(run_child("snapshot", args.idd, args.idf, cache_dir))
+            results["snapshot"].append(run_child("snapshot", args.idd, args.idf, cache_dir))
+        snapshot_size = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in os.listdir(cache_dir))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"{'mode':<10}{'idd ready (s)':>16}{'first model (s)':>18}{'process (s)':>14}")
+    for mode, runs in results.items():
+        print(f"{mode:<10}"
+              f"{statistics.median(r['idd_s'] for r in runs):>16.3f}"
+              f"{statistics.median(r['first_model_s'] for r in runs):>18.3f}"
+              f"{statistics.median(r['total_s'] for r in runs):>14.3f}")
+    plain = statistics.median(r["first_model_s"] for r in results["plain"])
+    warm = statistics.median(r["first_model_s"] for r in results["snapshot"])
+    print(f"\nsnapshot size: {snapshot_size / 1e6:.1f} MB, first-model speedup: {plain / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
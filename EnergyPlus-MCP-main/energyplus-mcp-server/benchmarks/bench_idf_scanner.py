@@ -0,0 +1,77 @@
+"""
+Benchmark of the streaming IDF scanner against a full eppy parse.
+
+For every IDF in the sample directory it times, with the IDD already loaded:
+
+  eppy      IDF(path)                                   (full EpBunch object graph)
+  counts    count_idf_objects(path, load_idf types)     (what load_idf needs)
+  basics    group_idf_records(path, 4 singleton types)  (what get_model_basics needs)
+  zones     group_idf_records(path, ["Zone"])           (what list_zones needs)
+
+Usage:
+    python benchmarks/bench_idf_scanner.py --idd /path/to/Energy+.idd [--dir sample_files] [--repeat 5]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+
+from eppy.modeleditor import IDF
+
+from energyplus_mcp_server.utils.idd_snapshot import initialize_idd
+from energyplus_mcp_server.utils.idf_scanner import count_idf_objects, group_idf_records
+
+LOAD_IDF_TYPES = ["Building", "Zone", "BuildingSurface:Detailed", "Material", "Material:NoMass", "Construction"]
+BASICS_TYPES = ["Building", "Site:Location", "SimulationControl", "Version"]
+
+
+def best_of(func, repeat: int) -> float:
+    """Median wall time of func() in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--idd", default=os.getenv("EPLUS_IDD_PATH"), help="Path to Energy+.idd")
+    parser.add_argument("--dir", default=os.path.join(here, "..", "sample_files"), help="Directory of IDF files")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if not args.idd:
+        parser.error("--idd is required when EPLUS_IDD_PATH is not set")
+
+    initialize_idd(args.idd, os.path.join(tempfile.gettempdir(), "energyplus_mcp_idd"))
+
+    print(f"{'file':<46}{'KB':>7}{'eppy ms':>10}{'counts ms':>11}{'basics ms':>11}{'zones ms':>10}{'speedup':>9}")
+    for path in sorted(glob.glob(os.path.join(args.dir, "*.idf"))):
+        try:
+            eppy_ms = best_of(lambda: IDF(path), args.repeat)
+        except Exception:
+            # The configured IDD may not match the file's version; the scanner does not care
+            eppy_ms = None
+        counts_ms = best_of(lambda: count_idf_objects(path, LOAD_IDF_TYPES), args.repeat)
+        basics_ms = best_of(lambda: group_idf_records(path, BASICS_TYPES), args.repeat)
+        zones_ms = best_of(lambda: group_idf_records(path, ["Zone"]), args.repeat)
+        eppy_txt = f"{eppy_ms:>10.1f}" if eppy_ms is not None else f"{'error':>10}"
+        speedup = f"{eppy_ms / max(counts_ms, basics_ms, zones_ms):>8.0f}x" if eppy_ms else f"{'-':>9}"
+        print(f"{os.path.basename(path):<46}{os.path.getsize(path) / 1024:>7.0f}{eppy_txt}"
+              f"{counts_ms:>11.2f}{basics_ms:>11.2f}{zones_ms:>10.2f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
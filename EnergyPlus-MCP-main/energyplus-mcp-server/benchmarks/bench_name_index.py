@@ -0,0 +1,118 @@
+"""
+Benchmark of output variable name validation on large batches.
+
+Validates a batch of requested names (a mix of exact names and typos) against a
+variable dictionary the way validate_variable_name did and the way it does now:
+
+  rebuild   name set and lookup dict rebuilt per name, difflib.get_close_matches
+            over every available name for each unknown name
+  index     NameIndex built once, dict lookup, trigram-narrowed suggestions
+
+The dictionary is the .rdd of an illustrative example, padded with synthetic
+names up to --size entries.
+
+Usage:
+    python benchmarks/bench_name_index.py [--rdd file.rdd] [--size 1000] [--batch 100] [--repeat 5]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import random
+import argparse
+import statistics
+from difflib import get_close_matches
+
+from energyplus_mcp_server.utils.name_index import NameIndex
+from energyplus_mcp_server.utils.output_discovery import parse_rdd_file
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def build_dictionary(rdd_path, size):
+    variables = parse_rdd_file(rdd_path)
+    names = [v["variable_name"] for v in variables]
+    rng = random.Random(0)
+    suffixes = ["Rate", "Energy", "Temperature", "Mass Flow Rate", "Fraction", "Status", "Power"]
+    while len(variables) < size:
+        words = rng.choice(names).split()
+        name = " ".join(words[:max(2, len(words) - 1)] + [rng.choice(suffixes), str(len(variables))])
+        variables.append({"variable_name": name, "units": ""})
+    return variables
+
+
+def make_batch(variables, batch, typo_share=0.5):
+    rng = random.Random(1)
+    requests = []
+    for _ in range(batch):
+        name = rng.choice(variables)["variable_name"]
+        if rng.random() < typo_share:
+            i = rng.randrange(len(name))
+            name = name[:i] + name[i + 1:]  # drop one character
+        requests.append(name)
+    return requests
+
+
+def validate_rebuild(variables, requests):
+    results = []
+    for name in requests:
+        available_names = {var["variable_name"] for var in variables}
+        variable_lookup = {var["variable_name"]: var for var in variables}
+        if name in available_names:
+            results.append((True, variable_lookup[name]["variable_name"]))
+        else:
+            results.append((False, tuple(get_close_matches(name, available_names, n=5, cutoff=0.6))))
+    return results
+
+
+def validate_index(variables, requests):
+    index = NameIndex(variables, "variable_name")
+    results = []
+    for name in requests:
+        entry = index.get(name)
+        if entry is not None:
+            results.append((True, entry["variable_name"]))
+        else:
+            results.append((False, tuple(index.suggest(name, n=5, cutoff=0.6))))
+    return results
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rdd", default=os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled",
+                                                      "5ZoneAirCooled.rdd"), help="Variable dictionary (.rdd)")
+    parser.add_argument("--size", type=int, default=1000, help="Available variables")
+    parser.add_argument("--batch", type=int, nargs="+", default=[10, 100, 1000], help="Requested names per batch")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    variables = build_dictionary(args.rdd, args.size)
+    print(f"{len(variables)} available variables, half of the requested names misspelled\n")
+    print(f"{'batch':>7}{'rebuild ms':>13}{'index ms':>11}{'speedup':>10}{'same suggestions':>19}")
+    for batch in args.batch:
+        requests = make_batch(variables, batch)
+        rebuild_time, rebuild_results = best_of(lambda: validate_rebuild(variables, requests), args.repeat)
+        index_time, index_results = best_of(lambda: validate_index(variables, requests), args.repeat)
+        same = sum(1 for a, b in zip(rebuild_results, index_results) if a == b)
+        print(f"{batch:>7}{rebuild_time * 1000:>13.1f}{index_time * 1000:>11.1f}"
+              f"{rebuild_time / index_time:>9.1f}x{same:>12}/{batch}")
+
+
+if __name__ == "__main__":
+    main()
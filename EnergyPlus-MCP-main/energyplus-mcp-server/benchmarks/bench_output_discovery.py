@@ -0,0 +1,135 @@
+"""
+Benchmark of the output discovery run: eppy-edited model vs. stripped discovery model.
+
+For every IDF in the sample directory it runs one discovery simulation each way
+and checks that both produce the same variable and meter dictionaries:
+
+  eppy      IDF(path), add Output:VariableDictionary, shorten the RunPeriod,
+            idf.save(), idf.run(expandobjects=True)        (previous discovery path)
+  stripped  write_discovery_idf() on the IDF text, then the EnergyPlus CLI with
+            no ReadVarsESO and ExpandObjects only when needed (current path)
+
+Usage:
+    python benchmarks/bench_output_discovery.py --idd /path/to/Energy+.idd \
+        [--energyplus /path/to/energyplus] [--weather file.epw] [--dir sample_files]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from eppy.modeleditor import IDF
+
+from energyplus_mcp_server.utils.idd_snapshot import initialize_idd
+from energyplus_mcp_server.utils.simulation_jobs import build_energyplus_command
+from energyplus_mcp_server.utils.output_discovery import write_discovery_idf, parse_rdd_file, parse_mdd_file
+
+
+def dictionaries(output_dir: str):
+    """Variable names and meter names found in a run's .rdd/.mdd (None if missing)"""
+    rdd = glob.glob(os.path.join(output_dir, "*.rdd"))
+    mdd = glob.glob(os.path.join(output_dir, "*.mdd"))
+    variables = {v["variable_name"] for v in parse_rdd_file(rdd[0])} if rdd else None
+    meters = {m["meter_name"] for m in parse_mdd_file(mdd[0])} if mdd else None
+    return variables, meters
+
+
+def eppy_discovery(path: str, work: str, weather: str):
+    """Previous path: edit the model with eppy and run it through idf.run"""
+    start = time.perf_counter()
+    idf = IDF(path)
+    for var_dict in list(idf.idfobjects.get("Output:VariableDictionary", [])):
+        idf.removeidfobject(var_dict)
+    idf.newidfobject("Output:VariableDictionary").Key_Field = "IDF"
+    run_periods = idf.idfobjects.get("RunPeriod", [])
+    if run_periods:
+        run_periods[0].Begin_Month = 1
+        run_periods[0].Begin_Day_of_Month = 1
+        run_periods[0].End_Month = 1
+        run_periods[0].End_Day_of_Month = 1
+    sim_control = idf.idfobjects.get("SimulationControl", [])
+    if sim_control:
+        sim_control[0].Run_Simulation_for_Sizing_Periods = "No"
+        sim_control[0].Run_Simulation_for_Weather_File_Run_Periods = "Yes"
+    temp_idf = os.path.join(work, "eppy_discovery.idf")
+    idf.save(temp_idf)
+    transform = time.perf_counter() - start
+
+    output_dir = os.path.join(work, "eppy")
+    os.makedirs(output_dir)
+    start = time.perf_counter()
+    IDF(temp_idf, weather).run(output_directory=output_dir, weather=weather, readvars=False,
+                               expandobjects=True, output_prefix="output_discovery",
+                               output_suffix="C", verbose="q")
+    return transform, time.perf_counter() - start, dictionaries(output_dir)
+
+
+def stripped_discovery(path: str, work: str, weather: str, executable: str, idd: str):
+    """Current path: stripped discovery model, EnergyPlus CLI called directly"""
+    start = time.perf_counter()
+    temp_idf = os.path.join(work, "stripped_discovery.idf")
+    transform_info = write_discovery_idf(path, temp_idf, 1)
+    transform = time.perf_counter() - start
+
+    output_dir = os.path.join(work, "stripped")
+    os.makedirs(output_dir)
+    options = {"output_directory": output_dir, "weather": weather, "readvars": False,
+               "expandobjects": transform_info["needs_expandobjects"],
+               "output_prefix": "output_discovery", "output_suffix": "C"}
+    start = time.perf_counter()
+    subprocess.run(build_energyplus_command(executable, temp_idf, options, idd_path=idd), cwd=output_dir,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return transform, time.perf_counter() - start, dictionaries(output_dir)
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--idd", default=os.getenv("EPLUS_IDD_PATH"), help="Path to Energy+.idd")
+    parser.add_argument("--energyplus", help="EnergyPlus executable (default: next to the IDD)")
+    parser.add_argument("--dir", default=os.path.join(here, "..", "sample_files"), help="Directory of IDF files")
+    parser.add_argument("--weather", help="Weather file (default: first .epw in --dir)")
+    args = parser.parse_args()
+    if not args.idd:
+        parser.error("--idd is required when EPLUS_IDD_PATH is not set")
+    executable = args.energyplus or os.path.join(os.path.dirname(args.idd), "energyplus")
+    weather = args.weather or sorted(glob.glob(os.path.join(args.dir, "*.epw")))[0]
+
+    initialize_idd(args.idd, os.path.join(tempfile.gettempdir(), "energyplus_mcp_idd"))
+
+    print(f"{'file':<46}{'eppy edit s':>12}{'eppy run s':>11}{'strip ms':>10}{'strip run s':>12}"
+          f"{'speedup':>9}{'variables':>12}{'meters':>10}  dictionaries")
+    for path in sorted(glob.glob(os.path.join(args.dir, "*.idf"))):
+        work = tempfile.mkdtemp(prefix="bench_discovery_")
+        try:
+            try:
+                eppy_edit, eppy_run, (eppy_vars, eppy_meters) = eppy_discovery(path, work, weather)
+            except Exception as e:
+                # The configured IDD may not match the file's version
+                print(f"{os.path.basename(path):<46}  eppy path failed: {type(e).__name__}: {e}")
+                continue
+            strip_edit, strip_run, (vars_, meters) = stripped_discovery(path, work, weather, executable, args.idd)
+
+            same = (vars_ == eppy_vars and meters == eppy_meters)
+            missing = len((eppy_vars or set()) - (vars_ or set())) + len((eppy_meters or set()) - (meters or set()))
+            verdict = "identical" if same else f"differ ({missing} missing)"
+            speedup = (eppy_edit + eppy_run) / max(strip_edit + strip_run, 1e-9)
+            print(f"{os.path.basename(path):<46}{eppy_edit:>12.2f}{eppy_run:>11.2f}{strip_edit * 1000:>10.1f}"
+                  f"{strip_run:>12.2f}{speedup:>8.1f}x{len(vars_ or ()):>12}{len(meters or ()):>10}  {verdict}")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of interactive plot artifacts for batch studies.
+
+Writes the same figure for --runs run directories under one output root and
+compares total size on disk and write time of:
+
+  inline        plotly.js embedded in every HTML file (the former output)
+  shared        plotly.js loaded from one bundle under the output root
+  shared gzip   shared bundle and gzip-compressed HTML
+
+The figure plots every column of a ReadVarsESO CSV, downsampled like
+create_interactive_plot to --max-points per series.
+
+Usage:
+    python benchmarks/bench_plot_output.py [--csv file.csv] [--runs 100] [--max-points 5000]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from energyplus_mcp_server.utils.eso_reader import parse_csv_timestamps
+from energyplus_mcp_server.utils.downsampling import lttb_indices
+from energyplus_mcp_server.utils.plot_output import write_plot_html
+
+
+def build_figure(csv_path, max_points):
+    """One line per CSV column, downsampled to max_points"""
+    frame = pd.read_csv(csv_path)
+    frame.columns = [str(column).strip() for column in frame.columns]
+    times, _ = parse_csv_timestamps(frame.pop("Date/Time"))
+    scatter = go.Scattergl if len(frame) * frame.shape[1] > 20000 else go.Scatter
+    fig = go.Figure()
+    for column in frame.columns:
+        values = frame[column].to_numpy(np.float64)
+        keep = lttb_indices(times, values, max_points) if max_points else slice(None)
+        fig.add_trace(scatter(x=times[keep], y=values[keep], mode="lines", name=column))
+    return fig
+
+
+def directory_mb(path):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files) / 1e6
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled.csv")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", default=example, help="ReadVarsESO CSV to plot")
+    parser.add_argument("--runs", type=int, default=100, help="Run directories written")
+    parser.add_argument("--max-points", type=int, default=5000, help="Points kept per series")
+    args = parser.parse_args()
+
+    fig = build_figure(args.csv, args.max_points)
+    print(f"{'mode':>12}{'runs':>6}{'total MB':>10}{'MB/plot':>9}{'s':>8}{'ms/plot':>9}")
+    for label, bundle, compress in (("inline", "inline", False), ("shared", "shared", False),
+                                    ("shared gzip", "shared", True)):
+        root = tempfile.mkdtemp(prefix="bench_plots_")
+        try:
+            start = time.perf_counter()
+            for run in range(args.runs):
+                run_dir = os.path.join(root, f"run_{run:04d}")
+                os.makedirs(run_dir)
+                write_plot_html(fig, os.path.join(run_dir, "plot.html"), bundle=bundle,
+                                output_root=root, compress=compress)
+            seconds = time.perf_counter() - start
+            total_mb = directory_mb(root)
+            print(f"{label:>12}{args.runs:>6}{total_mb:>10.1f}{total_mb / args.runs:>9.2f}"
+                  f"{seconds:>8.2f}{seconds * 1000 / args.runs:>9.1f}")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark of time stamp parsing and downsampling for interactive plots.
+
+Builds an annual ReadVarsESO-style CSV at a sub-hourly timestep from the
+columns of an example CSV, then compares:
+
+  apply parse   per-row pd.to_datetime of "MM/DD  HH:MM:SS" (the former parser)
+  vector parse  parse_csv_timestamps of the whole Date/Time column
+  lttb          lttb_indices of every series down to --max-points
+  html full     plotly HTML of every point of every series (WebGL)
+  html lttb     plotly HTML of the downsampled series
+
+The per-row parse is timed on the first 5000 rows and scaled to the file.
+
+Usage:
+    python benchmarks/bench_plot_timestamps.py [--csv file.csv] [--minutes 10]
+        [--max-points 5000] [--repeat 3]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from energyplus_mcp_server.utils.eso_reader import parse_csv_timestamps
+from energyplus_mcp_server.utils.downsampling import lttb_indices
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def annual_csv(csv_path, minutes, work):
+    """Write an annual CSV with the columns of ``csv_path`` at a ``minutes`` timestep"""
+    header = [column.strip() for column in pd.read_csv(csv_path, nrows=0).columns]
+    rows = 365 * 24 * 60 // minutes
+    end = np.datetime64("2001-01-01T00:00") + np.arange(1, rows + 1) * np.timedelta64(minutes, "m")
+    day_end = (end - np.timedelta64(1, "m")).astype("datetime64[D]")  # 24:00 belongs to the day before
+    stamps = pd.Series(pd.DatetimeIndex(day_end).strftime(" %m/%d  ")) + np.where(
+        (end - end.astype("datetime64[D]")) == np.timedelta64(0, "m"), "24:00:00",
+        pd.DatetimeIndex(end).strftime("%H:%M:00"))
+    values = np.cumsum(np.random.default_rng(0).normal(size=(rows, len(header) - 1)), axis=0)
+    frame = pd.DataFrame(values, columns=header[1:])
+    frame.insert(0, "Date/Time", stamps)
+    path = os.path.join(work, "annual.csv")
+    frame.to_csv(path, index=False)
+    return path
+
+
+def apply_parse(stamps):
+    """The former per-row parser"""
+    def parse(text):
+        try:
+            return pd.to_datetime(f"2001/{text}", format="%Y/%m/%d  %H:%M:%S")
+        except Exception:
+            return None
+    return stamps.apply(parse)
+
+
+def write_plot(times, frame, path, max_points):
+    """Write one WebGL figure of every column, downsampled to max_points when > 0"""
+    fig = go.Figure()
+    for column in frame.columns:
+        values = frame[column].to_numpy()
+        keep = lttb_indices(times, values, max_points) if max_points else slice(None)
+        fig.add_trace(go.Scattergl(x=times[keep], y=values[keep], mode="lines", name=column))
+    fig.write_html(path)
+    return os.path.getsize(path) / 1e6
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled.csv")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", default=example, help="ReadVarsESO CSV whose columns are reused")
+    parser.add_argument("--minutes", type=int, default=10, help="Timestep of the annual CSV")
+    parser.add_argument("--max-points", type=int, default=5000, help="Points kept per series")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="bench_plot_")
+    try:
+        path = annual_csv(args.csv, args.minutes, work)
+        frame = pd.read_csv(path)
+        stamps = frame.pop("Date/Time")
+        print(f"{len(frame)} rows x {frame.shape[1]} series, {os.path.getsize(path) / 1e6:.1f} MB CSV\n")
+
+        sample = min(5000, len(stamps))
+        seconds, parsed = best_of(lambda: apply_parse(stamps.head(sample)), 1)
+        apply_time = seconds * len(stamps) / sample
+        vector_time, (times, _) = best_of(lambda: parse_csv_timestamps(stamps), args.repeat)
+        lttb_time, _ = best_of(lambda: [lttb_indices(times, frame[c].to_numpy(), args.max_points)
+                                        for c in frame.columns], args.repeat)
+
+        print(f"{'step':>14}{'ms':>10}{'MB':>9}{'points':>10}")
+        print(f"{'apply parse':>14}{apply_time * 1000:>10.1f}{'':>9}{int(parsed.notna().sum() * len(stamps) / sample):>10}")
+        print(f"{'vector parse':>14}{vector_time * 1000:>10.1f}{'':>9}{int((~np.isnat(times)).sum()):>10}")
+        print(f"{'lttb':>14}{lttb_time * 1000:>10.1f}{'':>9}{args.max_points * frame.shape[1]:>10}")
+        for label, max_points in (("html full", 0), ("html lttb", args.max_points)):
+            seconds, size_mb = best_of(
+                lambda: write_plot(times, frame, os.path.join(work, "plot.html"), max_points), 1)
+            points = (max_points or len(frame)) * frame.shape[1]
+            print(f"{label:>14}{seconds * 1000:>10.1f}{size_mb:>9.1f}{points:>10}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark of time-series aggregation: whole-CSV pandas vs. query_time_series.
+
+Computes the monthly mean, peak and 95th percentile of one variable during
+08:00-18:00, the way an agent would with pandas and with query_time_series
+from each source:
+
+  pandas      read_csv of the whole CSV, parse dates, filter and group by month
+  query csv   chunked read of the date column and one column as float32
+  query eso   read of the one variable from the .eso
+  query store load of the one variable from the columnar store
+
+--scale N repeats the data section N times (as separate environments in the
+.eso) to show how time and peak memory grow with the size of the output. Peak
+memory is the Python heap peak measured with tracemalloc in a separate pass.
+
+Usage:
+    python benchmarks/bench_series_query.py [--eso file.eso] [--csv file.csv]
+        [--scale 1 10 50] [--variable "SPACE1-1:Zone Air Temperature"] [--repeat 3]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+
+import pandas as pd
+
+from energyplus_mcp_server.utils.series_query import query_time_series
+from energyplus_mcp_server.utils.columnar_store import write_columnar_store
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def peak_mb(func):
+    """Python heap peak (MB) while running func once"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def scale_outputs(eso_path, csv_path, scale, work):
+    """Copy an .eso and CSV into ``work`` with the data section repeated ``scale`` times"""
+    with open(eso_path) as f:
+        lines = f.readlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith("End of Data Dictionary")) + 1
+    end = next(i for i in range(len(lines) - 1, -1, -1) if lines[i].startswith("End of Data"))
+    with open(os.path.join(work, "eplusout.eso"), "w") as f:
+        f.writelines(lines[:start])
+        for _ in range(scale):
+            f.writelines(lines[start:end])
+        f.writelines(lines[end:])
+
+    with open(csv_path) as f:
+        header, *rows = f.readlines()
+    scaled_csv = os.path.join(work, "eplusout.csv")
+    with open(scaled_csv, "w") as f:
+        f.write(header)
+        for _ in range(scale):
+            f.writelines(rows)
+    return scaled_csv
+
+
+def pandas_query(csv_path, column):
+    """Monthly mean, peak and p95 during 08:00-18:00 with a whole-file pandas read"""
+    frame = pd.read_csv(csv_path)
+    stamps = frame["Date/Time"].str.strip()
+    end = pd.to_datetime("2001/" + stamps.str.replace(" 24:", " 00:"), format="%Y/%m/%d  %H:%M:%S")
+    end = end + pd.to_timedelta(stamps.str.contains(" 24:").astype(int), unit="D")
+    start = end - pd.Timedelta(minutes=1)
+    occupied = frame[(start.dt.hour >= 8) & (start.dt.hour < 18)]
+    grouped = occupied[column].groupby(start[occupied.index].dt.month)
+    return grouped.agg(["mean", "max", lambda s: s.quantile(0.95)])
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--eso", default=example + ".eso", help="EnergyPlus .eso file")
+    parser.add_argument("--csv", default=example + ".csv", help="ReadVarsESO CSV of the same run")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 50], help="Data section repetitions")
+    parser.add_argument("--variable", default="SPACE1-1:Zone Air Temperature", help="Variable to aggregate")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    query = {"variables": [args.variable], "aggregations": ["mean", "max"], "window": "monthly",
+             "percentiles": [95], "hours": [8, 18]}
+    print(f"{'scale':>6}{'csv MB':>8}{'path':>13}{'ms':>10}{'peak MB':>10}{'speedup':>9}")
+    for scale in args.scale:
+        work = tempfile.mkdtemp(prefix="bench_query_")
+        try:
+            csv_path = scale_outputs(args.eso, args.csv, scale, work)
+            size_mb = os.path.getsize(csv_path) / 1e6
+            column = next(c for c in pd.read_csv(csv_path, nrows=0).columns if c.startswith(args.variable))
+            baseline, _ = best_of(lambda: pandas_query(csv_path, column), args.repeat)
+            rows = [("pandas", baseline, peak_mb(lambda: pandas_query(csv_path, column)))]
+
+            for label, source in (("query csv", "csv"), ("query eso", "eso"), ("query store", "store")):
+                if source == "store":
+                    write_columnar_store(work)
+                seconds, _ = best_of(lambda: query_time_series(work, source=source, **query), args.repeat)
+                rows.append((label, seconds, peak_mb(lambda: query_time_series(work, source=source, **query))))
+
+            for label, seconds, peak in rows:
+                print(f"{scale:>6}{size_mb:>8.1f}{label:>13}{seconds * 1000:>10.1f}{peak:>10.1f}"
+                      f"{baseline / seconds:>8.1f}x")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
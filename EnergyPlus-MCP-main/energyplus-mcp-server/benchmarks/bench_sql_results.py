@@ -0,0 +1,207 @@
+"""
+Benchmark of time-series reads from the EnergyPlus SQLite output.
+
+Writes the time series of an .eso file into a SQLite file with the EnergyPlus
+schema and indexes (Time, ReportDataDictionary, ReportData, EnvironmentPeriods),
+then reads one variable:
+
+  read_csv      pandas.read_csv of the date column and the variable's column
+  read_eso      read_eso of the one variable
+  sql plain     SqlResults.columns on the file as EnergyPlus writes it
+  sql indexed   SqlResults.columns after ensure_sql_indexes
+  query sql     query_time_series monthly mean/max from the indexed file
+
+--scale N repeats the data section N times as separate environments, and
+--copies K writes every variable K times under new keys, like a model with K
+times the zones, so the selected variable is a smaller share of ReportData.
+
+Usage:
+    python benchmarks/bench_sql_results.py [--eso file.eso] [--csv file.csv]
+        [--scale 1 10] [--copies 1 10] [--variable "SPACE1-1:Zone Air Temperature"] [--repeat 3]
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import statistics
+
+import numpy as np
+import pandas as pd
+
+from energyplus_mcp_server.utils.eso_reader import read_eso, DAY_TYPES
+from energyplus_mcp_server.utils.sql_results import SqlResults, ensure_sql_indexes
+from energyplus_mcp_server.utils.series_query import query_time_series
+
+# Subset of the schema EnergyPlus writes, with the indexes it creates itself
+SCHEMA = """
+CREATE TABLE Simulations (SimulationIndex INTEGER PRIMARY KEY, EnergyPlusVersion TEXT, TimeStamp TEXT,
+    NumTimestepsPerHour INTEGER, Completed BOOL, CompletedSuccessfully BOOL);
+CREATE TABLE EnvironmentPeriods (EnvironmentPeriodIndex INTEGER PRIMARY KEY, SimulationIndex INTEGER,
+    EnvironmentName TEXT, EnvironmentType INTEGER);
+CREATE TABLE Time (TimeIndex INTEGER PRIMARY KEY, Year INTEGER, Month INTEGER, Day INTEGER, Hour INTEGER,
+    Minute INTEGER, Dst INTEGER, Interval INTEGER, IntervalType INTEGER, SimulationDays INTEGER,
+    DayType TEXT, EnvironmentPeriodIndex INTEGER, WarmupFlag INTEGER);
+CREATE TABLE ReportDataDictionary (ReportDataDictionaryIndex INTEGER PRIMARY KEY, IsMeter INTEGER,
+    Type TEXT, IndexGroup TEXT, TimestepType TEXT, KeyValue TEXT, Name TEXT, ReportingFrequency TEXT,
+    ScheduleName TEXT, Units TEXT);
+CREATE TABLE ReportData (ReportDataIndex INTEGER PRIMARY KEY, TimeIndex INTEGER,
+    ReportDataDictionaryIndex INTEGER, Value REAL);
+CREATE TABLE StringTypes (StringTypeIndex INTEGER PRIMARY KEY, Value TEXT);
+CREATE TABLE Strings (StringIndex INTEGER PRIMARY KEY, StringTypeIndex INTEGER, Value TEXT);
+CREATE TABLE TabularData (TabularDataIndex INTEGER PRIMARY KEY, ReportNameIndex INTEGER,
+    ReportForStringIndex INTEGER, TableNameIndex INTEGER, RowNameIndex INTEGER, ColumnNameIndex INTEGER,
+    UnitsIndex INTEGER, SimulationIndex INTEGER, RowId INTEGER, ColumnId INTEGER, Value TEXT);
+CREATE INDEX rddMTR ON ReportDataDictionary (IsMeter);
+CREATE INDEX rdTI ON ReportData (TimeIndex ASC);
+"""
+
+SQL_FREQUENCIES = {"Each Call": "HVAC System Timestep", "Detailed": "HVAC System Timestep",
+                   "TimeStep": "Zone Timestep", "Hourly": "Hourly", "Daily": "Daily", "Monthly": "Monthly",
+                   "RunPeriod": "Run Period", "Annual": "Annual"}
+INTERVAL_TYPES = {"Each Call": -1, "Detailed": -1, "TimeStep": 0, "Hourly": 1, "Daily": 2, "Monthly": 3,
+                  "RunPeriod": 4, "Annual": 5}
+
+
+def eso_to_sql(eso_path, sql_path, scale=1, copies=1):
+    """
+    Write the time series of an .eso into an EnergyPlus-schema SQLite file, ``scale``
+    times over, with every variable also written ``copies - 1`` more times under new keys
+    """
+    data = read_eso(eso_path)
+    connection = sqlite3.connect(sql_path)
+    connection.executescript(SCHEMA)
+    variables = list(data.variables.values())
+    step = max(var.report_id for var in variables)
+    entries = []
+    for copy in range(copies):
+        for var in variables:
+            key = var.key if copy == 0 or not var.key else f"{var.key} COPY {copy}"
+            entries.append((var.report_id + copy * step, int(not var.key), key, var.name,
+                            SQL_FREQUENCIES.get(var.frequency, var.frequency), var.units))
+    connection.executemany(
+        "INSERT INTO ReportDataDictionary VALUES (?, ?, 'Sum', '', 'Zone', ?, ?, ?, NULL, ?)", entries)
+
+    time_index = 0
+    frequencies = sorted({var.frequency for var in variables}, key=list(INTERVAL_TYPES).index)
+    for copy in range(scale):
+        for env, title in enumerate(data.environments):
+            env_id = copy * len(data.environments) + env + 1
+            connection.execute("INSERT INTO EnvironmentPeriods VALUES (?, 1, ?, 3)",
+                               (env_id, title if scale == 1 else f"{title} #{copy + 1}"))
+        for frequency in frequencies:
+            columns = data.columns(frequency)
+            stamps = columns["Date/Time"]
+            interval = INTERVAL_TYPES[frequency]
+            # Timestep and hourly stamps end the interval (24:00 belongs to the day before); coarser ones start it
+            day_start = (stamps - np.timedelta64(1 if interval < 2 else 0, "m")).astype("datetime64[D]")
+            offset = (stamps - day_start).astype(np.int64)
+            dates = pd.DatetimeIndex(np.where(np.isnat(stamps), np.datetime64("2001-01-01"), day_start))
+            times = []
+            for i in range(len(stamps)):
+                time_index += 1
+                hour, minute = (int(offset[i]) // 60, int(offset[i]) % 60) if interval < 2 else (24, 0)
+                code = int(columns["Day Type"][i])
+                times.append((time_index, 2001, int(dates.month[i]), int(dates.day[i]), hour, minute, 0, 60,
+                              interval, 0, DAY_TYPES[code] if code >= 0 else None,
+                              copy * len(data.environments) + int(columns["Environment"][i]) + 1, 0))
+            connection.executemany("INSERT INTO Time VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", times)
+            first = time_index - len(stamps) + 1
+            rows = []
+            for var in variables:
+                if var.frequency != frequency:
+                    continue
+                values = columns[var.label]
+                present = np.flatnonzero(~np.isnan(values))
+                for duplicate in range(copies if var.key else 1):
+                    rows.extend(zip((first + present).tolist(), [var.report_id + duplicate * step] * len(present),
+                                    values[present].tolist()))
+            rows.sort()  # EnergyPlus writes ReportData in time order
+            connection.executemany("INSERT INTO ReportData (TimeIndex, ReportDataDictionaryIndex, Value) "
+                                   "VALUES (?, ?, ?)", rows)
+    connection.commit()
+    connection.close()
+
+
+def best_of(func, repeat):
+    """Median wall time of ``repeat`` calls, and the last result"""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def scale_csv(csv_path, scale, copies, work):
+    """Copy a CSV into ``work`` with its rows repeated ``scale`` times and its value columns ``copies`` times"""
+    with open(csv_path) as f:
+        lines = [line.rstrip("\n") for line in f]
+    lines = [line + ("," + line.split(",", 1)[1]) * (copies - 1) for line in lines]
+    scaled = os.path.join(work, "eplusout.csv")
+    with open(scaled, "w") as f:
+        f.write(lines[0] + "\n")
+        for _ in range(scale):
+            f.write("\n".join(lines[1:]) + "\n")
+    return scaled
+
+
+def read_sql(sql_path, variable):
+    with SqlResults(sql_path, create_indexes=False) as results:
+        variables = results.find([variable])
+        return results.columns(variables, variables[0].frequency)
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    example = os.path.join(here, "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--eso", default=example + ".eso", help="EnergyPlus .eso file")
+    parser.add_argument("--csv", default=example + ".csv", help="ReadVarsESO CSV of the same run")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10], help="Data section repetitions")
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10], help="Copies of every variable")
+    parser.add_argument("--variable", default="SPACE1-1:Zone Air Temperature", help="Variable to read")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'scale':>6}{'copies':>7}{'sql MB':>8}{'path':>13}{'ms':>10}{'vs csv':>9}")
+    for scale, copies in ((scale, copies) for copies in args.copies for scale in args.scale):
+        work = tempfile.mkdtemp(prefix="bench_sql_")
+        try:
+            sql_path = os.path.join(work, "eplusout.sql")
+            eso_to_sql(args.eso, sql_path, scale, copies)
+            size_mb = os.path.getsize(sql_path) / 1e6  # before the indexes are added
+            csv_path = scale_csv(args.csv, scale, copies, work)
+            column = next(c for c in pd.read_csv(csv_path, nrows=0).columns if c.startswith(args.variable))
+            csv_time, _ = best_of(lambda: pd.read_csv(csv_path, usecols=["Date/Time", column]), args.repeat)
+            rows = [("read_csv", csv_time)]
+
+            if scale == 1 and copies == 1:
+                rows.append(("read_eso", best_of(lambda: read_eso(args.eso, variables=[args.variable]),
+                                                 args.repeat)[0]))
+            rows.append(("sql plain", best_of(lambda: read_sql(sql_path, args.variable), args.repeat)[0]))
+            ensure_sql_indexes(sql_path)
+            rows.append(("sql indexed", best_of(lambda: read_sql(sql_path, args.variable), args.repeat)[0]))
+            os.remove(csv_path)  # query_time_series must take the SQLite output
+            rows.append(("query sql", best_of(lambda: query_time_series(
+                work, [args.variable], ["mean", "max"], "monthly", source="sql"), args.repeat)[0]))
+
+            for label, seconds in rows:
+                print(f"{scale:>6}{copies:>7}{size_mb:>8.1f}{label:>13}{seconds * 1000:>10.1f}"
+                      f"{csv_time / seconds:>8.1f}x")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
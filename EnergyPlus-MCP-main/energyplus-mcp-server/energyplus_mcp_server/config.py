@@ -35,11 +35,17 @@ class PathConfig:
     sample_files_path: str = ""
     temp_dir: str = "/tmp"
     output_dir: str = "/workspace/energyplus-mcp-server/outputs"
+    cache_dir: str = ""
+    illustrative_examples_path: str = ""  # example models with .rdd files that train the variable predictor
     
     def __post_init__(self):
         """Set default paths after initialization"""
         if not self.sample_files_path:
             self.sample_files_path = os.path.join(self.workspace_root, "sample_files")
+        if not self.cache_dir:
+            self.cache_dir = os.path.join(self.workspace_root, "cache")
+        if not self.illustrative_examples_path:
+            self.illustrative_examples_path = os.path.join(self.workspace_root, "illustrative examples")
 
 
 @dataclass
@@ -48,8 +54,33 @@ class ServerConfig:
     name: str = "energyplus-mcp-server"
     version: str = "0.1.0"
     log_level: str = "INFO"
-    simulation_timeout: int = 300  # seconds
+    simulation_timeout: int = 300  # wall-clock seconds per simulation run (0 = unlimited)
+    simulation_cpu_limit: int = 0  # CPU seconds per simulation run (0 = unlimited, Linux only)
+    simulation_workers: int = 0  # simulations run in parallel (0 = CPU count)
+    simulation_memory_limit_mb: int = 0  # summed memory of running simulations (0 = 80% of RAM)
+    simulation_memory_estimate_mb: int = 1024  # assumed peak memory of a model that has not run yet
+    result_cache_enabled: bool = True  # reuse outputs of identical IDF/EPW/option runs
+    result_cache_max_mb: int = 2048  # summed size of cached output directories under output_dir
     tool_timeout: int = 60  # seconds
+    model_cache_max_entries: int = 16  # parsed IDF models kept in memory
+    model_cache_max_mb: int = 256  # summed size of cached IDF files
+    idd_snapshot_enabled: bool = True  # load the parsed IDD from a pickle under cache_dir
+    session_idle_timeout: int = 1800  # seconds before an unused model session is closed
+    max_sessions: int = 8  # concurrently open model sessions
+    session_max_mb: int = 32  # summed IDF file size of open sessions (parsed models take ~35-120x that in memory)
+    max_job_history: int = 100  # finished simulation jobs kept for status/result queries
+    discovery_cache_max_entries: int = 500  # output discovery results kept in cache_dir/output_discovery.sqlite
+    predict_output_variables: bool = True  # validate against predicted variables until a model is discovered
+    validation_cache_max_entries: int = 256  # configured/available output lists and name indexes kept
+    validation_cache_ttl: int = 300  # seconds a validation cache entry stays valid (0 = until evicted)
+    validation_cache_max_mb: int = 64  # estimated summed size of validation cache entries
+    speculative_discovery: bool = False  # start output discovery when a model is loaded, on idle workers
+    speculative_discovery_priority: int = -10  # scheduler priority of speculative discovery runs
+    columnar_results: bool = False  # convert .eso/.mtr time series to a columnar store after each run
+    columnar_results_format: str = "auto"  # "parquet" (needs pyarrow), "npz" or "auto"
+    sqlite_output: bool = False  # add Output:SQLite to simulated models and index the SQLite output
+    plot_bundle: str = "shared"  # "shared" loads plotly.js from one local copy per output root, "inline" embeds it
+    plot_gzip: bool = False  # write interactive plots as gzip-compressed .html.gz
 
 
 @dataclass
@@ -11,25 +11,26 @@ See License.txt in the parent directory for license details.
 
 import os
 import json
+import asyncio
 import logging
+from functools import partial
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-import eppy
 from eppy.modeleditor import IDF
 from eppy import hvacbuilder
 from eppy.useful_scripts import loopdiagram
 from eppy import walk_hvac
-from datetime import datetime
+from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch
 import networkx as nx
-import calendar
 import string
 import random
 
 # For simulation post-processing
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -42,9 +43,28 @@ from .utils.output_meters import OutputMeterManager
 from .utils.people_utils import PeopleManager
 from .utils.lights_utils import LightsManager
 from .utils.electric_equipment_utils import ElectricEquipmentManager
+from .utils.model_cache import get_model_cache
+from .utils.idd_snapshot import initialize_idd
+from .utils.idf_scanner import count_idf_objects, group_idf_records
+from .utils.model_sessions import ModelSessionManager
+from .utils.simulation_jobs import get_simulation_job_manager, build_energyplus_command
+from .utils.eso_reader import read_eso, read_eso_dictionary, parse_csv_timestamps, FREQUENCIES as ESO_FREQUENCIES
+from .utils.downsampling import lttb_indices
+from .utils.plot_output import write_plot_html
+from .utils.columnar_store import ColumnarStore, write_columnar_store, summarize_store, is_store_current
+from .utils.series_query import query_time_series
+from .utils.sql_results import SqlResults, find_sql_output, inject_sqlite_output, ensure_sql_indexes
+from .utils.html_tables import find_html_tables, load_html_tables, html_table_index, html_table_cells
+from .utils.result_cache import get_result_cache, make_result_key, existing_files
+from .utils.simulation_salvage import salvage_partial_outputs
+from .utils.simulation_progress import estimate_simulation_days
+from .utils.parametric import normalize_variants, build_variants, summarize_simulation_outputs, build_result_table
 
 logger = logging.getLogger(__name__)
 
+# Plots with more points than this are drawn with WebGL (Scattergl) instead of SVG
+PLOT_WEBGL_POINTS = 20000
+
 
 class EnergyPlusManager:
     """Manager class for EnergyPlus operations using eppy with configuration management"""
@@ -54,13 +74,25 @@ class EnergyPlusManager:
         self.config = config or get_config()
         self._initialize_eppy()
         
+        # Shared parsed-model cache used by all read-only inspection tools
+        self.model_cache = get_model_cache()
+        
+        # Open model editing sessions (one parse, many edits, one save)
+        self.sessions = ModelSessionManager.from_config(self.config)
+        
+        # Background EnergyPlus runs tracked by job ID
+        self.simulation_jobs = get_simulation_job_manager()
+        
+        # Outputs of earlier runs, keyed by model/weather/options content
+        self.result_cache = get_result_cache()
+        
         # Initialize utilities
         self.diagram_generator = HVACDiagramGenerator()
         self.output_var_manager = OutputVariableManager(self.config)
         self.output_meter_manager = OutputMeterManager(self.config)
-        self.people_manager = PeopleManager()
-        self.lights_manager = LightsManager()
-        self.electric_equipment_manager = ElectricEquipmentManager()
+        self.people_manager = PeopleManager(self.model_cache)
+        self.lights_manager = LightsManager(self.model_cache)
+        self.electric_equipment_manager = ElectricEquipmentManager(self.model_cache)
         
         logger.info(f"EnergyPlus Manager initialized with IDD: {self.config.energyplus.idd_path}")
     
@@ -76,8 +108,12 @@ class EnergyPlusManager:
             raise RuntimeError(f"IDD file not found at: {idd_path}")
         
         try:
-            eppy.modeleditor.IDF.setiddname(idd_path)
-            logger.debug(f"Eppy initialized with IDD: {idd_path}")
+            self.idd_load_info = initialize_idd(
+                idd_path,
+                os.path.join(self.config.paths.cache_dir, "idd"),
+                use_snapshot=self.config.server.idd_snapshot_enabled
+            )
+            logger.debug(f"Eppy initialized with IDD: {idd_path} ({self.idd_load_info['source']})")
         except Exception as e:
             raise RuntimeError(f"Failed to initialize eppy with IDD {idd_path}: {e}")
     
@@ -94,14 +130,17 @@ class EnergyPlusManager:
         
         try:
             logger.info(f"Loading IDF file: {resolved_path}")
-            idf = IDF(resolved_path)
+            # Counts only need object types, so stream the file instead of building EpBunches
+            counts = count_idf_objects(resolved_path, [
+                "Building", "Zone", "BuildingSurface:Detailed", "Material", "Material:NoMass", "Construction"
+            ])
             
             # Get basic counts
-            building_count = len(idf.idfobjects.get("Building", []))
-            zone_count = len(idf.idfobjects.get("Zone", []))
-            surface_count = len(idf.idfobjects.get("BuildingSurface:Detailed", []))
-            material_count = len(idf.idfobjects.get("Material", [])) + len(idf.idfobjects.get("Material:NoMass", []))
-            construction_count = len(idf.idfobjects.get("Construction", []))
+            building_count = counts["BUILDING"]
+            zone_count = counts["ZONE"]
+            surface_count = counts["BUILDINGSURFACE:DETAILED"]
+            material_count = counts["MATERIAL"] + counts["MATERIAL:NOMASS"]
+            construction_count = counts["CONSTRUCTION"]
             
             result = {
                 "file_path": resolved_path,
@@ -123,6 +162,39 @@ class EnergyPlusManager:
             raise RuntimeError(f"Error loading IDF file: {str(e)}")
     
 
+    def speculate_output_discovery(self, idf_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Start output discovery for a model that was just loaded, on idle worker slots
+        
+        Enabled by ServerConfig.speculative_discovery. Must be called from the
+        server's event loop. Speculation is best effort and never raises.
+        
+        Returns:
+            OutputDiscovery.speculate result, or None if disabled or not started
+        """
+        if not self.config.server.speculative_discovery:
+            return None
+        try:
+            resolved_path = self._resolve_idf_path(idf_path)
+            return self.output_var_manager.discovery.speculate(
+                resolved_path, self.simulation_jobs,
+                priority=self.config.server.speculative_discovery_priority
+            )
+        except Exception as e:
+            logger.warning(f"Could not start speculative output discovery for {idf_path}: {e}")
+            return None
+    
+
+    async def wait_for_speculative_discovery(self, idf_path: str) -> bool:
+        """Let a running speculative discovery of the model finish, so discovery reuses its result"""
+        try:
+            resolved_path = self._resolve_idf_path(idf_path)
+            return await self.output_var_manager.discovery.wait_for_speculation(resolved_path, self.simulation_jobs)
+        except Exception as e:
+            logger.warning(f"Could not wait for speculative output discovery of {idf_path}: {e}")
+            return False
+    
+
     def list_available_files(self, include_example_files: bool = False, include_weather_data: bool = False) -> str:
         """List available files in specified directories
         
@@ -326,7 +398,7 @@ class EnergyPlusManager:
             
             if file_types and '.idf' in file_types:
                 try:
-                    idf = IDF(resolved_target_path)
+                    self.model_cache.get_model(resolved_target_path)
                     validation_message = "IDF file loads successfully"
                 except Exception as e:
                     validation_passed = False
@@ -446,6 +518,8 @@ class EnergyPlusManager:
                     "version": self.config.server.version,
                     "log_level": self.config.server.log_level,
                     "simulation_timeout": self.config.server.simulation_timeout,
+                    "simulation_cpu_limit": self.config.server.simulation_cpu_limit,
+                    "simulation_workers": self.simulation_jobs.max_workers,
                     "tool_timeout": self.config.server.tool_timeout
                 },
                 "debug_mode": self.config.debug_mode
@@ -464,7 +538,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Validating IDF file: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             validation_results = {
                 "file_path": resolved_path,
@@ -541,56 +615,56 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Getting model basics for: {resolved_path}")
-            idf = IDF(resolved_path)
+            objects = group_idf_records(resolved_path, ["Building", "Site:Location", "SimulationControl", "Version"])
             basics = {}
             
             # Building information
-            building_objs = idf.idfobjects.get("Building", [])
+            building_objs = objects["BUILDING"]
             if building_objs:
                 bldg = building_objs[0]
                 basics["Building"] = {
-                    "Name": getattr(bldg, 'Name', 'Unknown'),
-                    "North Axis": getattr(bldg, 'North_Axis', 'Unknown'),
-                    "Terrain": getattr(bldg, 'Terrain', 'Unknown'),
-                    "Loads Convergence Tolerance": getattr(bldg, 'Loads_Convergence_Tolerance_Value', 'Unknown'),
-                    "Temperature Convergence Tolerance": getattr(bldg, 'Temperature_Convergence_Tolerance_Value', 'Unknown'),
-                    "Solar Distribution": getattr(bldg, 'Solar_Distribution', 'Unknown'),
-                    "Max Warmup Days": getattr(bldg, 'Maximum_Number_of_Warmup_Days', 'Unknown'),
-                    "Min Warmup Days": getattr(bldg, 'Minimum_Number_of_Warmup_Days', 'Unknown')
+                    "Name": bldg.get('Name', 'Unknown'),
+                    "North Axis": bldg.get('North_Axis', 'Unknown'),
+                    "Terrain": bldg.get('Terrain', 'Unknown'),
+                    "Loads Convergence Tolerance": bldg.get('Loads_Convergence_Tolerance_Value', 'Unknown'),
+                    "Temperature Convergence Tolerance": bldg.get('Temperature_Convergence_Tolerance_Value', 'Unknown'),
+                    "Solar Distribution": bldg.get('Solar_Distribution', 'Unknown'),
+                    "Max Warmup Days": bldg.get('Maximum_Number_of_Warmup_Days', 'Unknown'),
+                    "Min Warmup Days": bldg.get('Minimum_Number_of_Warmup_Days', 'Unknown')
                 }
             
             # Site:Location information
-            site_objs = idf.idfobjects.get("Site:Location", [])
+            site_objs = objects["SITE:LOCATION"]
             if site_objs:
                 site = site_objs[0]
                 basics["Site:Location"] = {
-                    "Name": getattr(site, 'Name', 'Unknown'),
-                    "Latitude": getattr(site, 'Latitude', 'Unknown'),
-                    "Longitude": getattr(site, 'Longitude', 'Unknown'),
-                    "Time Zone": getattr(site, 'Time_Zone', 'Unknown'),
-                    "Elevation": getattr(site, 'Elevation', 'Unknown')
+                    "Name": site.get('Name', 'Unknown'),
+                    "Latitude": site.get('Latitude', 'Unknown'),
+                    "Longitude": site.get('Longitude', 'Unknown'),
+                    "Time Zone": site.get('Time_Zone', 'Unknown'),
+                    "Elevation": site.get('Elevation', 'Unknown')
                 }
             
             # SimulationControl information
-            sim_objs = idf.idfobjects.get("SimulationControl", [])
+            sim_objs = objects["SIMULATIONCONTROL"]
             if sim_objs:
                 sim = sim_objs[0]
                 basics["SimulationControl"] = {
-                    "Do Zone Sizing Calculation": getattr(sim, 'Do_Zone_Sizing_Calculation', 'Unknown'),
-                    "Do System Sizing Calculation": getattr(sim, 'Do_System_Sizing_Calculation', 'Unknown'),
-                    "Do Plant Sizing Calculation": getattr(sim, 'Do_Plant_Sizing_Calculation', 'Unknown'),
-                    "Run Simulation for Sizing Periods": getattr(sim, 'Run_Simulation_for_Sizing_Periods', 'Unknown'),
-                    "Run Simulation for Weather File Run Periods": getattr(sim, 'Run_Simulation_for_Weather_File_Run_Periods', 'Unknown'),
-                    "Do HVAC Sizing Simulation for Sizing Periods": getattr(sim, 'Do_HVAC_Sizing_Simulation_for_Sizing_Periods', 'Unknown'),
-                    "Max Number of HVAC Sizing Simulation Passes": getattr(sim, 'Maximum_Number_of_HVAC_Sizing_Simulation_Passes', 'Unknown')
+                    "Do Zone Sizing Calculation": sim.get('Do_Zone_Sizing_Calculation', 'Unknown'),
+                    "Do System Sizing Calculation": sim.get('Do_System_Sizing_Calculation', 'Unknown'),
+                    "Do Plant Sizing Calculation": sim.get('Do_Plant_Sizing_Calculation', 'Unknown'),
+                    "Run Simulation for Sizing Periods": sim.get('Run_Simulation_for_Sizing_Periods', 'Unknown'),
+                    "Run Simulation for Weather File Run Periods": sim.get('Run_Simulation_for_Weather_File_Run_Periods', 'Unknown'),
+                    "Do HVAC Sizing Simulation for Sizing Periods": sim.get('Do_HVAC_Sizing_Simulation_for_Sizing_Periods', 'Unknown'),
+                    "Max Number of HVAC Sizing Simulation Passes": sim.get('Maximum_Number_of_HVAC_Sizing_Simulation_Passes', 'Unknown')
                 }
             
             # Version information
-            version_objs = idf.idfobjects.get("Version", [])
+            version_objs = objects["VERSION"]
             if version_objs:
                 version = version_objs[0]
                 basics["Version"] = {
-                    "Version Identifier": getattr(version, 'Version_Identifier', 'Unknown')
+                    "Version Identifier": version.get('Version_Identifier', 'Unknown')
                 }
             
             logger.debug(f"Model basics extracted for {len(basics)} sections")
@@ -607,7 +681,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Checking simulation settings for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             settings_info = {
                 "file_path": resolved_path,
@@ -697,22 +771,21 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Listing zones for: {resolved_path}")
-            idf = IDF(resolved_path)
-            zones = idf.idfobjects.get("Zone", [])
+            zones = group_idf_records(resolved_path, ["Zone"])["ZONE"]
             
             zone_info = []
             for i, zone in enumerate(zones):
                 zone_data = {
                     "Index": i + 1,
-                    "Name": getattr(zone, 'Name', 'Unknown'),
-                    "Direction of Relative North": getattr(zone, 'Direction_of_Relative_North', 'Unknown'),
-                    "X Origin": getattr(zone, 'X_Origin', 'Unknown'),
-                    "Y Origin": getattr(zone, 'Y_Origin', 'Unknown'),
-                    "Z Origin": getattr(zone, 'Z_Origin', 'Unknown'),
-                    "Type": getattr(zone, 'Type', 'Unknown'),
-                    "Multiplier": getattr(zone, 'Multiplier', 'Unknown'),
-                    "Ceiling Height": getattr(zone, 'Ceiling_Height', 'autocalculate'),
-                    "Volume": getattr(zone, 'Volume', 'autocalculate')
+                    "Name": zone.get('Name', 'Unknown'),
+                    "Direction of Relative North": zone.get('Direction_of_Relative_North', 'Unknown'),
+                    "X Origin": zone.get('X_Origin', 'Unknown'),
+                    "Y Origin": zone.get('Y_Origin', 'Unknown'),
+                    "Z Origin": zone.get('Z_Origin', 'Unknown'),
+                    "Type": zone.get('Type', 'Unknown'),
+                    "Multiplier": zone.get('Multiplier', 'Unknown'),
+                    "Ceiling Height": zone.get('Ceiling_Height', 'autocalculate'),
+                    "Volume": zone.get('Volume', 'autocalculate')
                 }
                 zone_info.append(zone_data)
             
@@ -730,7 +803,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Getting surfaces for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             surfaces = idf.idfobjects.get("BuildingSurface:Detailed", [])
             
             surface_info = []
@@ -762,7 +835,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Getting materials for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             materials = []
             
@@ -830,7 +903,8 @@ class EnergyPlusManager:
     
     
     def modify_people(self, idf_path: str, modifications: List[Dict[str, Any]], 
-                     output_path: Optional[str] = None) -> str:
+                     output_path: Optional[str] = None,
+                     session_id: Optional[str] = None) -> str:
         """
         Modify People objects in the EnergyPlus model
         
@@ -840,11 +914,12 @@ class EnergyPlusManager:
                           - "target": "all", "zone:ZoneName", or "name:PeopleName"
                           - "field_updates": Dictionary of field names and new values
             output_path: Optional path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         
         Returns:
             JSON string with modification results
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         try:
             logger.info(f"Modifying People objects for: {resolved_path}")
@@ -859,16 +934,18 @@ class EnergyPlusManager:
                 }, indent=2)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
             # Apply modifications
             result = self.people_manager.modify_people_objects(
-                resolved_path, modifications, output_path
+                resolved_path, modifications, None if session_id else output_path,
+                idf=self._get_session_model(session_id)
             )
             
             if result["success"]:
+                self._record_session_edit(session_id, "modify_people", result, result["total_modifications_applied"])
                 logger.info(f"Successfully modified People objects and saved to: {output_path}")
                 return json.dumps(result, indent=2)
             else:
@@ -907,7 +984,8 @@ class EnergyPlusManager:
     
     
     def modify_lights(self, idf_path: str, modifications: List[Dict[str, Any]], 
-                     output_path: Optional[str] = None) -> str:
+                     output_path: Optional[str] = None,
+                     session_id: Optional[str] = None) -> str:
         """
         Modify Lights objects in the EnergyPlus model
         
@@ -917,11 +995,12 @@ class EnergyPlusManager:
                           - "target": "all", "zone:ZoneName", or "name:LightsName"
                           - "field_updates": Dictionary of field names and new values
             output_path: Optional path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         
         Returns:
             JSON string with modification results
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         try:
             logger.info(f"Modifying Lights objects for: {resolved_path}")
@@ -936,16 +1015,18 @@ class EnergyPlusManager:
                 }, indent=2)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
             # Apply modifications
             result = self.lights_manager.modify_lights_objects(
-                resolved_path, modifications, output_path
+                resolved_path, modifications, None if session_id else output_path,
+                idf=self._get_session_model(session_id)
             )
             
             if result["success"]:
+                self._record_session_edit(session_id, "modify_lights", result, result["total_modifications_applied"])
                 logger.info(f"Successfully modified Lights objects and saved to: {output_path}")
                 return json.dumps(result, indent=2)
             else:
@@ -984,7 +1065,8 @@ class EnergyPlusManager:
     
     
     def modify_electric_equipment(self, idf_path: str, modifications: List[Dict[str, Any]], 
-                                 output_path: Optional[str] = None) -> str:
+                                 output_path: Optional[str] = None,
+                                 session_id: Optional[str] = None) -> str:
         """
         Modify ElectricEquipment objects in the EnergyPlus model
         
@@ -994,11 +1076,12 @@ class EnergyPlusManager:
                           - "target": "all", "zone:ZoneName", or "name:ElectricEquipmentName"
                           - "field_updates": Dictionary of field names and new values
             output_path: Optional path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         
         Returns:
             JSON string with modification results
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         try:
             logger.info(f"Modifying ElectricEquipment objects for: {resolved_path}")
@@ -1013,16 +1096,18 @@ class EnergyPlusManager:
                 }, indent=2)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
             # Apply modifications
             result = self.electric_equipment_manager.modify_electric_equipment_objects(
-                resolved_path, modifications, output_path
+                resolved_path, modifications, None if session_id else output_path,
+                idf=self._get_session_model(session_id)
             )
             
             if result["success"]:
+                self._record_session_edit(session_id, "modify_electric_equipment", result, result["total_modifications_applied"])
                 logger.info(f"Successfully modified ElectricEquipment objects and saved to: {output_path}")
                 return json.dumps(result, indent=2)
             else:
@@ -1066,7 +1151,8 @@ class EnergyPlusManager:
     def add_output_variables(self, idf_path: str, variables: List, 
                             validation_level: str = "moderate", 
                             allow_duplicates: bool = False,
-                            output_path: Optional[str] = None) -> str:
+                            output_path: Optional[str] = None,
+                            session_id: Optional[str] = None) -> str:
         """
         Add output variables to an EnergyPlus IDF file with validation
         
@@ -1076,6 +1162,7 @@ class EnergyPlusManager:
             validation_level: "strict", "moderate", or "lenient" 
             allow_duplicates: Whether to allow duplicate variable specifications
             output_path: Optional path for output file (auto-generated if None)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         
         Returns:
             JSON string with operation results
@@ -1084,7 +1171,8 @@ class EnergyPlusManager:
             logger.info(f"Adding output variables to {idf_path} (validation: {validation_level})")
             
             # Resolve IDF path
-            resolved_path = self._resolve_idf_path(idf_path)
+            resolved_path = self._resolve_edit_path(idf_path, session_id)
+            session_idf = self._get_session_model(session_id)
             
             # Auto-resolve variable specifications to standard format
             resolved_variables = self.output_var_manager.auto_resolve_variable_specs(variables)
@@ -1094,21 +1182,28 @@ class EnergyPlusManager:
                 resolved_path, resolved_variables, validation_level
             )
             
-            # Handle duplicates
+            # Handle duplicates (key patterns were expanded to one specification per matching key)
+            valid_specifications = []
+            for v in validation_report["valid_variables"]:
+                valid_specifications.extend(v.get("expanded_specifications", [v["specification"]]))
             duplicate_report = self.output_var_manager.check_duplicate_variables(
                 resolved_path, 
-                [v["specification"] for v in validation_report["valid_variables"]], 
-                allow_duplicates
+                valid_specifications, 
+                allow_duplicates,
+                idf=session_idf
             )
             
             # Determine output path
-            if output_path is None:
+            if session_id:
+                output_path = None
+            elif output_path is None:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_with_outputs{path_obj.suffix}")
             
             # Add variables to IDF
             addition_result = self.output_var_manager.add_variables_to_idf(
-                resolved_path, duplicate_report["new_variables"], output_path
+                resolved_path, duplicate_report["new_variables"], output_path,
+                idf=session_idf
             )
             
             # Compile comprehensive result
@@ -1144,6 +1239,9 @@ class EnergyPlusManager:
             if not addition_result["success"]:
                 result["addition_error"] = addition_result.get("error", "Unknown error")
             
+            if addition_result["success"]:
+                self._record_session_edit(session_id, "add_output_variables", result, addition_result["added_count"])
+            
             logger.info(f"Successfully processed output variables: {addition_result['added_count']} added")
             return json.dumps(result, indent=2)
             
@@ -1160,7 +1258,8 @@ class EnergyPlusManager:
     def add_output_meters(self, idf_path: str, meters: List, 
                          validation_level: str = "moderate", 
                          allow_duplicates: bool = False,
-                         output_path: Optional[str] = None) -> str:
+                         output_path: Optional[str] = None,
+                         session_id: Optional[str] = None) -> str:
         """
         Add output meters to an EnergyPlus IDF file with intelligent validation
         
@@ -1178,6 +1277,7 @@ class EnergyPlusManager:
                              - "lenient": Minimal validation (for advanced users)
             allow_duplicates: Whether to allow duplicate output meter specifications (default: False)
             output_path: Optional path for output file (if None, creates one with _with_meters suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         
         Returns:
             JSON string with detailed results including validation report, added meters, and performance metrics
@@ -1199,7 +1299,8 @@ class EnergyPlusManager:
             logger.info(f"Adding output meters to {idf_path} (validation: {validation_level})")
             
             # Resolve IDF path
-            resolved_path = self._resolve_idf_path(idf_path)
+            resolved_path = self._resolve_edit_path(idf_path, session_id)
+            session_idf = self._get_session_model(session_id)
             
             # Auto-resolve meter specifications to standard format
             resolved_meters = self.output_meter_manager.auto_resolve_meter_specs(meters)
@@ -1213,17 +1314,21 @@ class EnergyPlusManager:
             duplicate_report = self.output_meter_manager.check_duplicate_meters(
                 resolved_path, 
                 [m["specification"] for m in validation_report["valid_meters"]], 
-                allow_duplicates
+                allow_duplicates,
+                idf=session_idf
             )
             
             # Determine output path
-            if output_path is None:
+            if session_id:
+                output_path = None
+            elif output_path is None:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_with_meters{path_obj.suffix}")
             
             # Add meters to IDF
             addition_result = self.output_meter_manager.add_meters_to_idf(
-                resolved_path, duplicate_report["new_meters"], output_path
+                resolved_path, duplicate_report["new_meters"], output_path,
+                idf=session_idf
             )
             
             # Compile comprehensive result
@@ -1259,6 +1364,9 @@ class EnergyPlusManager:
             if not addition_result["success"]:
                 result["addition_error"] = addition_result.get("error", "Unknown error")
             
+            if addition_result["success"]:
+                self._record_session_edit(session_id, "add_output_meters", result, addition_result["added_count"])
+            
             logger.info(f"Successfully processed output meters: {addition_result['added_count']} added")
             return json.dumps(result, indent=2)
             
@@ -1319,7 +1427,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Inspecting schedules for: {resolved_path} (include_values={include_values})")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             # Define all schedule object types to inspect
             schedule_object_types = [
@@ -1532,7 +1640,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Discovering HVAC loops for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             hvac_info = {
                 "file_path": resolved_path,
@@ -1616,7 +1724,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Getting loop topology for '{loop_name}' in: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self.model_cache.get_model(resolved_path)
             
             # Try to find the loop in different loop types
             loop_obj = None
@@ -2179,7 +2287,7 @@ class EnergyPlusManager:
     def _create_simplified_diagram(self, idf_path: str, loop_name: str, 
                                 output_path: str, format: str) -> Dict[str, Any]:
         """Create a simplified diagram when eppy's full functionality isn't available"""
-        idf = IDF(idf_path)
+        idf = self.model_cache.get_model(idf_path)
         
         # Get basic loop information
         loops_info = []
@@ -2244,9 +2352,94 @@ class EnergyPlusManager:
             "diagram_type": "simplified"
         }        
     
+    # ------------------------ Model Sessions ------------------------
+    def open_model_session(self, idf_path: str) -> str:
+        """Parse a model once into an editing session and return its session ID"""
+        resolved_path = self._resolve_idf_path(idf_path)
+        
+        try:
+            session = self.sessions.open_session(resolved_path)
+            result = {
+                "success": True,
+                **session.get_info(),
+                "idle_timeout_seconds": self.sessions.idle_timeout
+            }
+            return json.dumps(result, indent=2)
+            
+        except Exception as e:
+            logger.error(f"Error opening model session for {resolved_path}: {e}")
+            raise RuntimeError(f"Error opening model session: {str(e)}")
+    
+
+    def save_model_session(self, session_id: str, output_path: Optional[str] = None) -> str:
+        """Write a session's in-memory model to disk (the session stays open)"""
+        try:
+            result = self.sessions.save_session(session_id, output_path)
+            self.model_cache.invalidate(result["output_file"])
+            return json.dumps(result, indent=2)
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error saving model session {session_id}: {e}")
+            raise RuntimeError(f"Error saving model session: {str(e)}")
+    
+
+    def close_model_session(self, session_id: str, discard_changes: bool = False) -> str:
+        """Close a session, refusing if it has unsaved edits unless discard_changes is True"""
+        result = self.sessions.close_session(session_id, discard_changes)
+        return json.dumps({"success": True, **result}, indent=2)
+    
+
+    def list_model_sessions(self) -> str:
+        """List open model sessions"""
+        result = {
+            "sessions": self.sessions.list_sessions(),
+            **self.sessions.get_stats()
+        }
+        return json.dumps(result, indent=2)
+    
+
+    def _resolve_edit_path(self, idf_path: str, session_id: Optional[str] = None) -> str:
+        """Resolve the file a modify tool works on: the session's source file or idf_path"""
+        if session_id:
+            return self.sessions.get_session(session_id).source_path
+        return self._resolve_idf_path(idf_path)
+    
+
+    def _get_session_model(self, session_id: Optional[str]):
+        """Return the in-memory model of a session, or None outside a session"""
+        return self.sessions.get_session(session_id).idf if session_id else None
+    
+
+    def _get_edit_model(self, resolved_path: str, session_id: Optional[str] = None):
+        """Return a writable model: the session's model or a fresh parse of resolved_path"""
+        if session_id:
+            return self._get_session_model(session_id)
+        return IDF(resolved_path)
+    
+
+    def _save_edited_model(self, idf, output_path: str, session_id: Optional[str] = None) -> Optional[str]:
+        """Save an edited model unless it belongs to a session; returns the written path"""
+        if session_id:
+            return None
+        idf.save(output_path)
+        return output_path
+    
+
+    def _record_session_edit(self, session_id: Optional[str], tool: str, result: Dict[str, Any],
+                             total_modifications: int):
+        """Log a successful edit on its session and tag the result with the session ID"""
+        if not session_id:
+            return
+        self.sessions.get_session(session_id).record_edit(tool, total_modifications)
+        result["session_id"] = session_id
+        result["saved"] = False
+    
     # ------------------------ Model Modification Methods ------------------------
     def modify_simulation_settings(self, idf_path: str, object_type: str, field_updates: Dict[str, Any], 
-                                 run_period_index: int = 0, output_path: Optional[str] = None) -> str:
+                                 run_period_index: int = 0, output_path: Optional[str] = None,
+                                 session_id: Optional[str] = None) -> str:
         """
         Modify SimulationControl or RunPeriod settings and save to a new file
         
@@ -2256,15 +2449,16 @@ class EnergyPlusManager:
             field_updates: Dictionary of field names and new values
             run_period_index: Index of RunPeriod to modify (default 0, ignored for SimulationControl)
             output_path: Path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         try:
             logger.info(f"Modifying {object_type} settings for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._get_edit_model(resolved_path, session_id)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
@@ -2343,7 +2537,7 @@ class EnergyPlusManager:
                 raise ValueError(f"Invalid object_type: {object_type}. Must be 'SimulationControl' or 'RunPeriod'")
             
             # Save the modified IDF
-            idf.save(output_path)
+            output_path = self._save_edited_model(idf, output_path, session_id)
             
             result = {
                 "success": True,
@@ -2355,6 +2549,8 @@ class EnergyPlusManager:
                 "total_modifications": len(modifications_made)
             }
             
+            self._record_session_edit(session_id, "modify_simulation_settings", result, len(modifications_made))
+            
             logger.info(f"Successfully modified {object_type} and saved to: {output_path}")
             return json.dumps(result, indent=2)
             
@@ -2364,7 +2560,8 @@ class EnergyPlusManager:
 
 
     def add_coating_outside(self, idf_path: str, location, solar_abs=0.4, thermal_abs=0.9, 
-                            output_path: Optional[str] = None) -> str:
+                            output_path: Optional[str] = None,
+                            session_id: Optional[str] = None) -> str:
 
         """
         Add exterior coating to all exterior surfaces of the specified location (wall or roof)
@@ -2375,21 +2572,23 @@ class EnergyPlusManager:
             solar_abs: Solar Absorptance of the exterior coating
             thermal_abs: Thermal Absorptance of the exterior coating
             output_path: Path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
 
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
+            idf = self._get_edit_model(resolved_path, session_id)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
-            all_surfs = idf.idfobjects['BuildingSurface:Detailed']
+            # Copy the object lists; extending them in place would add objects to the model
+            all_surfs = list(idf.idfobjects['BuildingSurface:Detailed'])
             if location.casefold() == "wall":
                 all_surfs.extend(idf.idfobjects['Wall:Detailed'])
             elif location.casefold() == "roof":
@@ -2405,7 +2604,7 @@ class EnergyPlusManager:
             construction_names = set([x.Construction_Name for x in ext_surfs])
             constructions = [x for x in idf.idfobjects["Construction"] if x.Name in construction_names]
             ext_layer_names = set([x.Outside_Layer for x in constructions])
-            materials = idf.idfobjects['Material']
+            materials = list(idf.idfobjects['Material'])
             materials.extend(idf.idfobjects['Material:NoMass'])
             ext_layers = [x for x in materials if x.Name in ext_layer_names]
             logger.debug(f"Found {len(ext_layers)} exterior layers for {location} surfaces: {ext_surf_names}")
@@ -2436,7 +2635,7 @@ class EnergyPlusManager:
                     logger.error(f"Error setting Solar and Thermal Absorptance of {ext_layer.Name}: {e}")
 
             # Save the modified IDF
-            idf.save(output_path)
+            output_path = self._save_edited_model(idf, output_path, session_id)
             
             result = {
                 "success": True,
@@ -2448,6 +2647,8 @@ class EnergyPlusManager:
                 "total_modifications": len(modifications_made)
             }
             
+            self._record_session_edit(session_id, "add_coating_outside", result, len(modifications_made))
+            
             logger.info(f"Successfully modified exterior coating and saved to: {output_path}")
             return json.dumps(result, indent=2)
             
@@ -2457,7 +2658,8 @@ class EnergyPlusManager:
 
 
     def add_window_film_outside(self, idf_path: str, u_value = 4.94, shgc = 0.45, visible_transmittance = 0.66,
-                                output_path: Optional[str] = None) -> str:
+                                output_path: Optional[str] = None,
+                                session_id: Optional[str] = None) -> str:
         """
         Use WindowMaterial:SimpleGlazingSystem to mimic the outside window film with specified U-value, SHGC, and visible transmittance
         The default u_value, shgc, and visible_transmittance are from CBES
@@ -2468,6 +2670,7 @@ class EnergyPlusManager:
             shgc: Solar Heat Gain Coefficient of the window film
             visible_transmittance: Visible transmittance of the window film
             output_path: Path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
 
         """
         # helper, generate a random suffix so that the window surface name won't collide with others
@@ -2477,15 +2680,15 @@ class EnergyPlusManager:
             random_string = ''.join(random.choices(characters, k=length))
             return random_string
 
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
+            idf = self._get_edit_model(resolved_path, session_id)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
@@ -2532,7 +2735,7 @@ class EnergyPlusManager:
                 logger.debug(f"change construction of {ext_window_surfs[0].Name} to {window_film_construction_name}")
 
             # Save the modified IDF
-            idf.save(output_path)
+            output_path = self._save_edited_model(idf, output_path, session_id)
             
             result = {
                 "success": True,
@@ -2545,6 +2748,8 @@ class EnergyPlusManager:
                 "total_modifications": len(modifications_made)
             }
             
+            self._record_session_edit(session_id, "add_window_film_outside", result, len(modifications_made))
+            
             logger.info(f"Successfully modified {window_film_construction_name} and saved to: {output_path}")
             return json.dumps(result, indent=2)
             
@@ -2554,7 +2759,8 @@ class EnergyPlusManager:
 
 
     def change_infiltration_by_mult(self, idf_path: str, mult = 0.9,
-                                 output_path: Optional[str] = None) -> str:
+                                 output_path: Optional[str] = None,
+                                 session_id: Optional[str] = None) -> str:
         """
         Modify infiltration rates in the IDF file by a multiplier
 
@@ -2562,16 +2768,17 @@ class EnergyPlusManager:
             idf_path: Path to the input IDF file
             mult: multiplier for infiltration rates
             output_path: Path for output file (if None, creates one with _modified suffix)
+            session_id: Open model session to edit in memory (see open_model_session); idf_path is ignored
         """
-        resolved_path = self._resolve_idf_path(idf_path)
+        resolved_path = self._resolve_edit_path(idf_path, session_id)
         
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
+            idf = self._get_edit_model(resolved_path, session_id)
             
             # Determine output path
-            if output_path is None:
+            if output_path is None and not session_id:
                 path_obj = Path(resolved_path)
                 output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
             
@@ -2610,7 +2817,7 @@ class EnergyPlusManager:
                     logger.error(f"Error setting {flow_field} to {new_value}: {e}")
 
             # Save the modified IDF
-            idf.save(output_path)
+            output_path = self._save_edited_model(idf, output_path, session_id)
             
             result = {
                 "success": True,
@@ -2621,6 +2828,8 @@ class EnergyPlusManager:
                 "total_modifications": len(modifications_made)
             }
             
+            self._record_session_edit(session_id, "change_infiltration_by_mult", result, len(modifications_made))
+            
             logger.info(f"Successfully modified {object_type} and saved to: {output_path}")
             return json.dumps(result, indent=2)
             
@@ -2630,124 +2839,503 @@ class EnergyPlusManager:
     
     
     # ------------------------ Simulation Execution ------------------------
+    def _prepare_simulation(self, idf_path: str, weather_file: str = None,
+                            output_directory: str = None, annual: bool = True,
+                            design_day: bool = False, readvars: bool = True,
+                            expandobjects: bool = True, sqlite: bool = False) -> Dict[str, Any]:
+        """Resolve inputs, choose the output directory and build the EnergyPlus options"""
+        resolved_idf_path = self._resolve_idf_path(idf_path)
+        
+        # Resolve weather file path
+        resolved_weather_path = None
+        if weather_file:
+            resolved_weather_path = self._resolve_weather_file_path(weather_file)
+            logger.info(f"Using weather file: {resolved_weather_path}")
+        
+        # Set up output directory
+        if output_directory is None:
+            idf_name = Path(resolved_idf_path).stem
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_directory = str(Path(self.config.paths.output_dir) / f"{idf_name}_simulation_{timestamp}")
+        
+        # Configure simulation options
+        simulation_options = {
+            'output_directory': output_directory,
+            'annual': annual,
+            'design_day': design_day,
+            'readvars': readvars,
+            'expandobjects': expandobjects,
+            'output_prefix': Path(resolved_idf_path).stem,
+            'output_suffix': 'C',  # Capital suffix style
+            'verbose': 'v'  # Verbose output
+        }
+        
+        # Add weather file to options if provided
+        if resolved_weather_path:
+            simulation_options['weather'] = resolved_weather_path
+        
+        return {
+            "input_idf": resolved_idf_path,
+            "weather_file": resolved_weather_path,
+            "output_directory": output_directory,
+            "simulation_options": simulation_options,
+            "sqlite_output": sqlite
+        }
+    
+
+    def _simulation_cache_key(self, prepared: Dict[str, Any]) -> str:
+        """Content-addressed key of a prepared simulation"""
+        options = prepared["simulation_options"]
+        if prepared.get("sqlite_output"):
+            options = {**options, "output_sqlite": True}  # not a CLI option, but it changes the outputs
+        return make_result_key(
+            prepared["input_idf"],
+            prepared["weather_file"],
+            options,
+            self.config.energyplus.version
+        )
+    
+
+    def _lookup_cached_simulation(self, cache_key: str, prepared: Dict[str, Any],
+                                  explicit_directory: bool) -> Optional[Dict[str, Any]]:
+        """
+        Return prepared-simulation fields pointing at cached outputs, or None on a miss
+        
+        When the caller asked for a specific output directory, the cached files are
+        copied into it; otherwise the cached directory is returned as is.
+        """
+        entry = self.result_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        output_directory = prepared["output_directory"]
+        if explicit_directory and os.path.abspath(output_directory) != entry["output_directory"]:
+            self.result_cache.materialize(entry, output_directory)
+        else:
+            output_directory = entry["output_directory"]
+        
+        logger.info(f"Reusing cached simulation results from {entry['output_directory']}")
+        return {
+            **prepared,
+            "output_directory": output_directory,
+            "simulation_options": {**prepared["simulation_options"], "output_directory": output_directory},
+            "cached_from": entry["output_directory"]
+        }
+    
+
+    def _store_simulation_result(self, cache_key: str, prepared: Dict[str, Any], preexisting: List[str]):
+        """Add the outputs of a successful run, without the files that were there before it, to the result cache"""
+        try:
+            self.result_cache.put(cache_key, prepared["output_directory"], {
+                "input_idf": prepared["input_idf"],
+                "weather_file": prepared["weather_file"]
+            }, exclude=preexisting)
+        except Exception as e:
+            logger.warning(f"Could not cache simulation results of {prepared['output_directory']}: {e}")
+    
+
+    def _cache_finished_job(self, cache_key: str, preexisting: List[str], job):
+        """Scheduler on_finish callback: cache the outputs of a completed job"""
+        if job.status == "completed":
+            self._store_simulation_result(cache_key, job.metadata, preexisting)
+    
+
+    def _post_process_job(self, sqlite: bool, columnar: bool, job):
+        """Scheduler post_process callback: index the SQLite output and build the columnar store"""
+        if sqlite:
+            self._index_sql_results(job.metadata["output_directory"])
+        if columnar:
+            self._write_columnar_results(job.metadata["output_directory"])
+    
+
+    def _build_simulation_result(self, prepared: Dict[str, Any], success: bool, duration=None,
+                                 energyplus_result: str = None, error: str = None) -> Dict[str, Any]:
+        """Build the result dictionary reported for a finished simulation"""
+        output_directory = prepared["output_directory"]
+        
+        if success:
+            result = {
+                "success": True,
+                **prepared,
+                "simulation_duration": str(duration),
+                "output_files": self._find_simulation_outputs(output_directory),
+                "energyplus_result": energyplus_result or "Simulation completed",
+                "timestamp": datetime.now().isoformat()
+            }
+            store = summarize_store(output_directory)
+            if store:
+                result["columnar_store"] = store
+            sql_path = find_sql_output(output_directory)
+            if sql_path:
+                result["sql_output"] = str(sql_path)
+            return result
+        
+        # Try to find error file for more detailed error information
+        error_file = Path(output_directory) / f"{Path(prepared['input_idf']).stem}.err"
+        error_details = ""
+        
+        if error_file.exists():
+            try:
+                with open(error_file, 'r') as f:
+                    error_details = f.read()
+            except Exception:
+                error_details = "Could not read error file"
+        
+        return {
+            "success": False,
+            **prepared,
+            "error": error,
+            "error_details": error_details,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+
+    def _write_columnar_results(self, output_directory: str) -> Dict[str, Any]:
+        """Convert a run's .eso/.mtr time series to its columnar store; returns the store summary or the error"""
+        try:
+            manifest = write_columnar_store(output_directory, self.config.server.columnar_results_format)
+            return summarize_store(output_directory, manifest)
+        except Exception as e:
+            logger.warning(f"Could not write columnar results for {output_directory}: {e}")
+            return {"error": str(e)}
+    
+
+    def _index_sql_results(self, output_directory: str):
+        """Add the query indexes to a run's SQLite output, before the run is cached"""
+        sql_path = find_sql_output(output_directory)
+        if sql_path is None:
+            logger.warning(f"No SQLite output in {output_directory}")
+            return
+        try:
+            ensure_sql_indexes(sql_path)
+        except Exception as e:
+            logger.warning(f"Could not index {sql_path}: {e}")
+    
+
     def run_simulation(self, idf_path: str, weather_file: str = None, 
                        output_directory: str = None, annual: bool = True,
                        design_day: bool = False, readvars: bool = True,
-                       expandobjects: bool = True) -> str:
-            """
-            Run EnergyPlus simulation with specified IDF and weather file
-            
-            Args:
-                idf_path: Path to the IDF file
-                weather_file: Path to weather file (.epw). If None, searches for weather files in sample_files
-                output_directory: Directory for simulation outputs. If None, creates one in outputs/
-                annual: Run annual simulation (default: True)
-                design_day: Run design day only simulation (default: False)
-                readvars: Run ReadVarsESO after simulation (default: True)
-                expandobjects: Run ExpandObjects prior to simulation (default: True)
-            
-            Returns:
-                JSON string with simulation results and output file paths
-            """
-            resolved_idf_path = self._resolve_idf_path(idf_path)
+                       expandobjects: bool = True, use_cache: bool = True,
+                       columnar: Optional[bool] = None, sqlite: Optional[bool] = None) -> str:
+        """
+        Run EnergyPlus simulation with specified IDF and weather file (blocking)
+        
+        Use submit_simulation from async code; this method blocks until EnergyPlus exits.
+        
+        Args:
+            idf_path: Path to the IDF file
+            weather_file: Path to weather file (.epw). If None, searches for weather files in sample_files
+            output_directory: Directory for simulation outputs. If None, creates one in outputs/
+            annual: Run annual simulation (default: True)
+            design_day: Run design day only simulation (default: False)
+            readvars: Run ReadVarsESO after simulation (default: True)
+            expandobjects: Run ExpandObjects prior to simulation (default: True)
+            use_cache: Reuse the outputs of an identical earlier run; when False the
+                       fresh outputs still replace the cache entry (default: True)
+            columnar: Convert the time series to a columnar store after the run
+                      (None uses ServerConfig.columnar_results)
+            sqlite: Add Output:SQLite to the simulated model (a copy when the model lacks it)
+                    and index the SQLite output (None uses ServerConfig.sqlite_output)
+        
+        Returns:
+            JSON string with simulation results and output file paths
+        """
+        resolved_idf_path = self._resolve_idf_path(idf_path)
+        if columnar is None:
+            columnar = self.config.server.columnar_results
+        if sqlite is None:
+            sqlite = self.config.server.sqlite_output
+        
+        try:
+            logger.info(f"Starting simulation for: {resolved_idf_path}")
+            prepared = self._prepare_simulation(resolved_idf_path, weather_file, output_directory,
+                                                annual, design_day, readvars, expandobjects, sqlite)
+            
+            cache_key = None
+            if self.config.server.result_cache_enabled:
+                cache_key = self._simulation_cache_key(prepared)
+                cached = use_cache and self._lookup_cached_simulation(
+                    cache_key, prepared, output_directory is not None
+                )
+                if cached:
+                    store = columnar and self._write_columnar_results(cached["output_directory"])
+                    result = self._build_simulation_result(cached, True, timedelta(0), "Reused cached results")
+                    if store:
+                        result["columnar_store"] = store
+                    result["cache_hit"] = True
+                    return json.dumps(result, indent=2)
+            
+            preexisting = existing_files(prepared["output_directory"])
+            os.makedirs(prepared["output_directory"], exist_ok=True)
+            logger.info(f"Output directory: {prepared['output_directory']}")
+            simulated_idf_path = resolved_idf_path
+            if sqlite:
+                simulated_idf_path = inject_sqlite_output(resolved_idf_path, prepared["output_directory"])
+            
+            # Load IDF file
+            if prepared["weather_file"]:
+                idf = IDF(simulated_idf_path, prepared["weather_file"])
+            else:
+                idf = IDF(simulated_idf_path)
             
+            logger.info("Starting EnergyPlus simulation...")
+            start_time = datetime.now()
+            
+            # Run the simulation
             try:
-                logger.info(f"Starting simulation for: {resolved_idf_path}")
-                
-                # Resolve weather file path
-                resolved_weather_path = None
-                if weather_file:
-                    resolved_weather_path = self._resolve_weather_file_path(weather_file)
-                    logger.info(f"Using weather file: {resolved_weather_path}")
-                
-                # Set up output directory
-                if output_directory is None:
-                    idf_name = Path(resolved_idf_path).stem
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    output_directory = str(Path(self.config.paths.output_dir) / f"{idf_name}_simulation_{timestamp}")
-                
-                # Create output directory if it doesn't exist
-                os.makedirs(output_directory, exist_ok=True)
-                logger.info(f"Output directory: {output_directory}")
-                
-                # Load IDF file
-                if resolved_weather_path:
-                    idf = IDF(resolved_idf_path, resolved_weather_path)
-                else:
-                    idf = IDF(resolved_idf_path)
-                
-                # Configure simulation options
-                simulation_options = {
-                    'output_directory': output_directory,
-                    'annual': annual,
-                    'design_day': design_day,
-                    'readvars': readvars,
-                    'expandobjects': expandobjects,
-                    'output_prefix': Path(resolved_idf_path).stem,
-                    'output_suffix': 'C',  # Capital suffix style
-                    'verbose': 'v'  # Verbose output
-                }
-                
-                # Add weather file to options if provided
-                if resolved_weather_path:
-                    simulation_options['weather'] = resolved_weather_path
-                
-                logger.info("Starting EnergyPlus simulation...")
-                start_time = datetime.now()
+                result = idf.run(**prepared["simulation_options"])
+                duration = datetime.now() - start_time
+                if sqlite:
+                    self._index_sql_results(prepared["output_directory"])
+                store = columnar and self._write_columnar_results(prepared["output_directory"])
+                simulation_result = self._build_simulation_result(
+                    prepared, True, duration, str(result) if result else None
+                )
+                if store:
+                    simulation_result["columnar_store"] = store
+                if cache_key:
+                    self._store_simulation_result(cache_key, prepared, preexisting)
+                logger.info(f"Simulation completed successfully in {duration}")
                 
-                # Run the simulation
-                try:
-                    result = idf.run(**simulation_options)
-                    end_time = datetime.now()
-                    duration = end_time - start_time
-                    
-                    # Check for common output files
-                    output_files = self._find_simulation_outputs(output_directory)
-                    
-                    simulation_result = {
-                        "success": True,
-                        "input_idf": resolved_idf_path,
-                        "weather_file": resolved_weather_path,
-                        "output_directory": output_directory,
-                        "simulation_duration": str(duration),
-                        "simulation_options": simulation_options,
-                        "output_files": output_files,
-                        "energyplus_result": str(result) if result else "Simulation completed",
-                        "timestamp": end_time.isoformat()
-                    }
-                    
-                    logger.info(f"Simulation completed successfully in {duration}")
-                    return json.dumps(simulation_result, indent=2)
-                    
-                except Exception as e:
-                    # Try to find error file for more detailed error information
-                    error_file = Path(output_directory) / f"{Path(resolved_idf_path).stem}.err"
-                    error_details = ""
-                    
-                    if error_file.exists():
-                        try:
-                            with open(error_file, 'r') as f:
-                                error_details = f.read()
-                        except Exception:
-                            error_details = "Could not read error file"
-                    
-                    simulation_result = {
-                        "success": False,
-                        "input_idf": resolved_idf_path,
-                        "weather_file": resolved_weather_path,
-                        "output_directory": output_directory,
-                        "error": str(e),
-                        "error_details": error_details,
-                        "simulation_options": simulation_options,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    
-                    logger.error(f"Simulation failed: {str(e)}")
-                    return json.dumps(simulation_result, indent=2)
-                    
             except Exception as e:
-                logger.error(f"Error setting up simulation for {resolved_idf_path}: {e}")
-                raise RuntimeError(f"Error running simulation: {str(e)}")
+                simulation_result = self._build_simulation_result(prepared, False, error=str(e))
+                logger.error(f"Simulation failed: {str(e)}")
+            
+            return json.dumps(simulation_result, indent=2)
+                
+        except Exception as e:
+            logger.error(f"Error setting up simulation for {resolved_idf_path}: {e}")
+            raise RuntimeError(f"Error running simulation: {str(e)}")
+    
+
+    def submit_simulation(self, idf_path: str, weather_file: str = None, 
+                          output_directory: str = None, annual: bool = True,
+                          design_day: bool = False, readvars: bool = True,
+                          expandobjects: bool = True, priority: int = 0,
+                          use_cache: bool = True, timeout: Optional[int] = None,
+                          cpu_limit: Optional[int] = None, columnar: Optional[bool] = None,
+                          sqlite: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Queue an EnergyPlus simulation on the job scheduler and return its job
+        
+        Must be called from the server's event loop. The IDF is passed to the
+        EnergyPlus CLI directly, so the model is not parsed or re-saved by eppy.
+        Arguments are the same as run_simulation, plus:
+        
+        Args:
+            priority: Higher values start first when all worker slots are busy
+            use_cache: Reuse the outputs of an identical earlier run; a hit returns an
+                       already completed job. When False the fresh outputs still
+                       replace the cache entry (default: True)
+            timeout: Wall-clock limit in seconds (None uses ServerConfig.simulation_timeout, 0 disables)
+            cpu_limit: CPU-time limit in seconds (None uses ServerConfig.simulation_cpu_limit, 0 disables)
+            columnar: Convert the time series to a columnar store before the job completes
+                      (None uses ServerConfig.columnar_results)
+            sqlite: Add Output:SQLite to the simulated model and index the SQLite output
+                    before the job completes (None uses ServerConfig.sqlite_output)
+        
+        Returns:
+            Dictionary with the job ID and job status
+        """
+        resolved_idf_path = self._resolve_idf_path(idf_path)
+        
+        try:
+            if sqlite is None:
+                sqlite = self.config.server.sqlite_output
+            prepared = self._prepare_simulation(resolved_idf_path, weather_file, output_directory,
+                                                annual, design_day, readvars, expandobjects, sqlite)
+            if columnar is None:
+                columnar = self.config.server.columnar_results
+            
+            cache_key = None
+            if self.config.server.result_cache_enabled:
+                cache_key = self._simulation_cache_key(prepared)
+                cached = use_cache and self._lookup_cached_simulation(
+                    cache_key, prepared, output_directory is not None
+                )
+                if cached:
+                    if columnar:
+                        self._write_columnar_results(cached["output_directory"])
+                    return self.simulation_jobs.record_cached(cached).get_info()
+            
+            preexisting = existing_files(prepared["output_directory"])
+            os.makedirs(prepared["output_directory"], exist_ok=True)
+            logger.info(f"Output directory: {prepared['output_directory']}")
+            simulated_idf_path = resolved_idf_path
+            if sqlite:
+                simulated_idf_path = inject_sqlite_output(resolved_idf_path, prepared["output_directory"])
+            
+            on_finish = partial(self._cache_finished_job, cache_key, preexisting) if cache_key else None
+            post_process = partial(self._post_process_job, sqlite, columnar) if sqlite or columnar else None
+            
+            command = build_energyplus_command(
+                self.config.energyplus.executable_path,
+                simulated_idf_path,
+                prepared["simulation_options"],
+                idd_path=self.config.energyplus.idd_path
+            )
+            prefix = prepared["simulation_options"]["output_prefix"]
+            job = self.simulation_jobs.submit(
+                command,
+                cwd=prepared["output_directory"],
+                metadata=prepared,
+                log_path=os.path.join(prepared["output_directory"], f"{prefix}.stdout.log"),
+                priority=priority,
+                on_finish=on_finish,
+                timeout=self.config.server.simulation_timeout if timeout is None else timeout,
+                cpu_limit=self.config.server.simulation_cpu_limit if cpu_limit is None else cpu_limit,
+                total_days=estimate_simulation_days(resolved_idf_path, annual, design_day,
+                                                    has_weather=prepared["weather_file"] is not None),
+                post_process=post_process
+            )
+            return job.get_info()
+            
+        except Exception as e:
+            logger.error(f"Error submitting simulation for {resolved_idf_path}: {e}")
+            raise RuntimeError(f"Error submitting simulation: {str(e)}")
+    
+
+    def get_simulation_status(self, job_id: str, tail_lines: int = 20) -> str:
+        """Return the status of a simulation job with the last lines of EnergyPlus output"""
+        job = self.simulation_jobs.get_job(job_id)
+        return json.dumps(job.get_info(tail=tail_lines), indent=2)
+    
+
+    def list_simulation_jobs(self, status: Optional[str] = None) -> str:
+        """List known simulation jobs, newest first, with scheduler occupancy"""
+        result = {
+            "jobs": self.simulation_jobs.list_jobs(status),
+            "scheduler": self.simulation_jobs.get_stats()
+        }
+        return json.dumps(result, indent=2)
+    
+
+    def get_simulation_results(self, job_id: str) -> str:
+        """Return the results of a finished simulation job (output files or error details)"""
+        job = self.simulation_jobs.get_job(job_id)
+        if not job.finished:
+            return json.dumps({
+                "success": False,
+                "error": f"Simulation job is still {job.status}",
+                **job.get_info(tail=5)
+            }, indent=2)
+        
+        if job.status == "completed":
+            duration = timedelta(seconds=job.finished_at - job.started_at)
+            result = self._build_simulation_result(job.metadata, True, duration)
+        else:
+            result = self._build_simulation_result(job.metadata, False, error=job.error or job.status)
+            if job.limit_exceeded:
+                result["limit_exceeded"] = job.limit_exceeded
+            result["salvage"] = salvage_partial_outputs(job.metadata["output_directory"], job.stdout_tail)
+        result["job_id"] = job.job_id
+        result["status"] = job.status
+        result["cache_hit"] = job.cached
+        return json.dumps(result, indent=2)
+    
+
+    def cancel_simulation(self, job_id: str) -> str:
+        """Cancel a running simulation job (must be called from the server's event loop)"""
+        job = self.simulation_jobs.cancel(job_id)
+        return json.dumps(job.get_info(), indent=2)
+    
+
+    async def run_parametric_batch(self, idf_path: str, variants: List[Dict[str, Any]],
+                                   weather_file: str = None, output_directory: str = None,
+                                   annual: bool = True, design_day: bool = False,
+                                   include_baseline: bool = True, priority: int = 0,
+                                   use_cache: bool = True) -> str:
+        """
+        Build model variants from a base IDF and simulate them concurrently
+        
+        Variant IDFs are generated in a process pool using the regular modification
+        tools (see utils.parametric.normalize_variants for the variant format). The
+        simulations then go through the job scheduler, so they share the worker
+        slots and the result cache with every other run.
+        
+        Args:
+            idf_path: Path to the base IDF file
+            variants: List of variant specifications
+            weather_file: Weather file used for every run
+            output_directory: Batch directory (if None, creates one in outputs/)
+            annual: Run annual simulations (default: True)
+            design_day: Run design day only simulations (default: False)
+            include_baseline: Also simulate the unmodified base model (default: True)
+            priority: Scheduler priority of the batch's jobs
+            use_cache: Reuse outputs of identical earlier runs (default: True)
+        
+        Returns:
+            JSON string with a compact result table (one row per variant)
+        """
+        resolved_idf_path = self._resolve_idf_path(idf_path)
+        
+        try:
+            variants = normalize_variants(variants)
+            if not variants and not include_baseline:
+                raise ValueError("No variants to simulate")
+            
+            if output_directory is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_directory = str(Path(self.config.paths.output_dir) /
+                                       f"{Path(resolved_idf_path).stem}_batch_{timestamp}")
+            os.makedirs(output_directory, exist_ok=True)
+            logger.info(f"Building {len(variants)} variants of {resolved_idf_path} in {output_directory}")
+            
+            start_time = datetime.now()
+            built = []
+            if variants:
+                built = await asyncio.get_running_loop().run_in_executor(
+                    None, build_variants, resolved_idf_path, variants, output_directory,
+                    self.simulation_jobs.max_workers, self.config
+                )
+            if include_baseline:
+                built.insert(0, {"name": "baseline", "idf_path": resolved_idf_path, "transforms": []})
+            
+            jobs = {}
+            for variant in built:
+                if variant["idf_path"]:
+                    jobs[variant["name"]] = self.submit_simulation(
+                        variant["idf_path"], weather_file,
+                        os.path.join(output_directory, variant["name"]),
+                        annual=annual, design_day=design_day,
+                        priority=priority, use_cache=use_cache
+                    )["job_id"]
+            
+            for job_id in jobs.values():
+                await self.simulation_jobs.wait(job_id)
+            
+            rows = []
+            for variant in built:
+                row = {"variant": variant["name"], "status": "build_failed", "error": variant.get("error")}
+                if variant["name"] in jobs:
+                    job = self.simulation_jobs.get_job(jobs[variant["name"]])
+                    row.update({
+                        "status": job.status,
+                        "cache_hit": job.cached,
+                        "elapsed_seconds": job.get_info()["elapsed_seconds"],
+                        "error": job.error,
+                        **summarize_simulation_outputs(job.metadata["output_directory"])
+                    })
+                rows.append(row)
+            
+            result = {
+                "success": all(row["status"] == "completed" for row in rows),
+                "input_idf": resolved_idf_path,
+                "weather_file": weather_file,
+                "output_directory": output_directory,
+                "variant_count": len(built),
+                "batch_duration": str(datetime.now() - start_time),
+                "results": build_result_table(rows),
+                "variants": {v["name"]: {"idf_path": v["idf_path"], "job_id": jobs.get(v["name"]),
+                                         "transforms": v["transforms"]} for v in built}
+            }
+            
+            logger.info(f"Parametric batch of {len(built)} runs finished in {result['batch_duration']}")
+            return json.dumps(result, indent=2)
+            
+        except Exception as e:
+            logger.error(f"Error running parametric batch for {resolved_idf_path}: {e}")
+            raise RuntimeError(f"Error running parametric batch: {str(e)}")
         
 
     def _resolve_weather_file_path(self, weather_file: str) -> str:
@@ -2805,50 +3393,59 @@ class EnergyPlusManager:
         return output_files
 
     # ------------------------ Post-Processing and Visualization ------------------------
-    def create_interactive_plot(self, output_directory: str, idf_name: str = None, 
-                                file_type: str = "auto", custom_title: str = None) -> str:
+    def _load_plot_data(self, output_dir: Path, idf_name: Optional[str], file_type: str,
+                        environment: Optional[str]) -> Dict[str, Any]:
         """
-        Create interactive HTML plot from EnergyPlus output files (meter or variable outputs)
-        
-        Args:
-            output_directory: Directory containing the output files
-            idf_name: Name of the IDF file (without extension). If None, tries to detect from directory
-            file_type: "meter", "variable", or "auto" to detect automatically
-            custom_title: Custom title for the plot
+        Read the series of one environment of a run for plotting, from the columnar
+        store, the ReadVarsESO CSV or the .eso/.mtr (in that order), with a single read
         
         Returns:
-            JSON string with plot creation results
+            Dictionary with df (time stamps in "Date/Time" when known), idf_name,
+            data_type, input_file and environment
         """
-        try:
-            logger.info(f"Creating interactive plot from: {output_directory}")
-            
-            output_dir = Path(output_directory)
-            if not output_dir.exists():
-                raise FileNotFoundError(f"Output directory not found: {output_directory}")
+        # Auto-detect IDF name if not provided
+        if not idf_name:
+            csv_files = list(output_dir.glob("*.csv"))
+            if csv_files:
+                # Try to find the pattern
+                for csv_file in csv_files:
+                    if csv_file.name.endswith("Meter.csv"):
+                        idf_name = csv_file.name[:-9]  # Remove "Meter.csv"
+                        break
+                    elif not csv_file.name.endswith("Meter.csv"):
+                        idf_name = csv_file.stem  # Remove .csv
+                        break
+            else:
+                # Runs without ReadVarsESO only have the .eso/.mtr files
+                eso_files = list(output_dir.glob("*.eso")) + list(output_dir.glob("*.mtr"))
+                if eso_files:
+                    idf_name = eso_files[0].stem
             
-            # Auto-detect IDF name if not provided
             if not idf_name:
-                csv_files = list(output_dir.glob("*.csv"))
-                if csv_files:
-                    # Try to find the pattern
-                    for csv_file in csv_files:
-                        if csv_file.name.endswith("Meter.csv"):
-                            idf_name = csv_file.name[:-9]  # Remove "Meter.csv"
-                            break
-                        elif not csv_file.name.endswith("Meter.csv"):
-                            idf_name = csv_file.stem  # Remove .csv
-                            break
-                
-                if not idf_name:
-                    raise ValueError("Could not auto-detect IDF name. Please specify idf_name parameter.")
-            
+                raise ValueError("Could not auto-detect IDF name. Please specify idf_name parameter.")
+        
+        # Prefer the run's columnar store: it loads without parsing text or time stamps
+        store = ColumnarStore(output_dir) if is_store_current(output_dir) else None
+        store_source = None
+        if store is not None:
+            candidates = {"meter": ["mtr"], "variable": ["eso"]}.get(file_type, ["mtr", "eso"])
+            store_source = next((source for source in candidates if store.frequencies(source)), None)
+        
+        if store_source:
+            data_type = "Meter" if store_source == "mtr" else "Variable"
+            input_file = store.root
+            logger.info(f"Processing {data_type} series from columnar store: {input_file}")
+            df = store.load(frequency=store.frequencies(store_source)[0], source=store_source, stamps=True)
+            df = df.drop(columns=["Day Type"])
+            environments = store.manifest["environments"].get(store_source, [])
+        else:
             # Determine which file to process
             meter_file = output_dir / f"{idf_name}Meter.csv"
             variable_file = output_dir / f"{idf_name}.csv"
-            
+        
             csv_file = None
             data_type = None
-            
+        
             if file_type == "auto":
                 if meter_file.exists():
                     csv_file = meter_file
@@ -2862,98 +3459,170 @@ class EnergyPlusManager:
             elif file_type == "variable":
                 csv_file = variable_file
                 data_type = "Variable"
-            
+        
+            eso_file = None
             if not csv_file or not csv_file.exists():
-                raise FileNotFoundError(f"Output CSV file not found. Checked: {meter_file}, {variable_file}")
-            
-            logger.info(f"Processing {data_type} file: {csv_file}")
-            
-            # Read CSV file
-            df = pd.read_csv(csv_file)
-            
+                # Fall back to the EnergyPlus output itself when ReadVarsESO did not run
+                candidates = {"meter": [("Meter", ".mtr")], "variable": [("Variable", ".eso")]}.get(
+                    file_type, [("Meter", ".mtr"), ("Variable", ".eso")])
+                for candidate_type, suffix in candidates:
+                    if (output_dir / f"{idf_name}{suffix}").exists():
+                        eso_file, data_type = output_dir / f"{idf_name}{suffix}", candidate_type
+                        break
+                if eso_file is None:
+                    raise FileNotFoundError(f"Output CSV file not found. Checked: {meter_file}, {variable_file}")
+        
+            input_file = eso_file or csv_file
+            environments = []
+            if eso_file is not None:
+                # Plot the finest reporting frequency present, like a single ReadVarsESO table
+                logger.info(f"Processing {data_type} file: {eso_file}")
+                reported = {var.frequency for var in read_eso_dictionary(eso_file)}
+                frequency = next((f for f in ESO_FREQUENCIES if f in reported), None)
+                if frequency is None:
+                    raise ValueError(f"No output variables in {eso_file}")
+                data = read_eso(eso_file, frequencies=[frequency])
+                columns = data.columns(frequency)
+                del columns["Row"], columns["Day Type"]
+                df = pd.DataFrame(columns)
+                environments = data.environments
+            else:
+                logger.info(f"Processing {data_type} file: {csv_file}")
+            
+                # Read CSV file and build its time stamps vectorized (24:00 rolls over to the next day)
+                df = pd.read_csv(csv_file)
+                df.columns = [str(col).strip() for col in df.columns]
+                datetime_col = next((col for col in df.columns
+                                     if 'date' in col.lower() and 'time' in col.lower()), None)
+                if datetime_col:
+                    times, env_indexes = parse_csv_timestamps(df[datetime_col])
+                    df = df.drop(columns=[datetime_col])
+                    df.insert(0, "Environment", env_indexes)
+                    df.insert(0, "Date/Time", times)
+        
+        if df.empty:
+            raise ValueError(f"No data in {input_file}")
+        
+        # Plot one environment (design days and run periods share calendar dates)
+        env_label = None
+        if "Environment" in df.columns:
+            if environment is None:
+                env_index = int(df["Environment"].value_counts().idxmax())
+            elif str(environment).isdigit():
+                env_index = int(environment)
+            else:
+                titles = [str(title).casefold() for title in environments]
+                if str(environment).casefold() not in titles:
+                    raise ValueError(f"Unknown environment '{environment}'. Available: {environments}")
+                env_index = titles.index(str(environment).casefold())
+            env_label = environments[env_index] if env_index < len(environments) else env_index
+            df = df[df["Environment"] == env_index].drop(columns=["Environment"]).reset_index(drop=True)
             if df.empty:
-                raise ValueError(f"CSV file is empty: {csv_file}")
-            
-            # Try to parse Date/Time column
-            datetime_col = None
-            datetime_parsed = False
+                raise ValueError(f"No data for environment {env_label} in {input_file}")
+        
+        return {"df": df, "idf_name": idf_name, "data_type": data_type, "input_file": input_file,
+                "environment": env_label}
+
+    def create_interactive_plot(self, output_directory: str, idf_name: str = None, 
+                                file_type: str = "auto", custom_title: str = None,
+                                environment: str = None, max_points: int = 5000,
+                                panels: Optional[List[List[str]]] = None,
+                                compress: Optional[bool] = None) -> str:
+        """
+        Create interactive HTML plot from EnergyPlus output files (meter or variable outputs)
+        
+        One environment is plotted; series longer than max_points are downsampled with
+        LTTB, and large plots are drawn with WebGL. With panels, a dashboard of stacked
+        plots sharing the time axis is built from the same single read of the outputs.
+        
+        Args:
+            output_directory: Directory containing the output files
+            idf_name: Name of the IDF file (without extension). If None, tries to detect from directory
+            file_type: "meter", "variable", or "auto" to detect automatically
+            custom_title: Custom title for the plot
+            environment: Environment title or index to plot (default: the one with the most rows)
+            max_points: Points kept per series (0 plots every point)
+            panels: Column selectors per dashboard panel (case-insensitive substrings of the
+                column names, e.g. [["Electricity:Facility"], ["Zone Air Temperature"]])
+            compress: Write gzip-compressed HTML (default: config plot_gzip)
+        
+        Returns:
+            JSON string with plot creation results
+        """
+        try:
+            logger.info(f"Creating interactive plot from: {output_directory}")
             
-            # Look for Date/Time column (case insensitive)
-            for col in df.columns:
-                if 'date' in col.lower() and 'time' in col.lower():
-                    datetime_col = col
-                    break
+            output_dir = Path(output_directory)
+            if not output_dir.exists():
+                raise FileNotFoundError(f"Output directory not found: {output_directory}")
             
-            if datetime_col:
-                try:
-                    # Try MM/DD HH:MM:SS format first
-                    def parse_datetime_mmdd(dt_str):
-                        try:
-                            # Add current year and parse
-                            current_year = datetime.now().year
-                            full_dt_str = f"{current_year}/{dt_str}"
-                            return pd.to_datetime(full_dt_str, format="%Y/%m/%d  %H:%M:%S")
-                        except:
-                            return None
-                    
-                    # Try monthly format
-                    def parse_monthly(dt_str):
-                        try:
-                            dt_str = dt_str.strip()
-                            if dt_str in calendar.month_name[1:]:  # Full month names
-                                month_num = list(calendar.month_name).index(dt_str)
-                                return pd.to_datetime(f"2023-{month_num:02d}-01")  # Use 2023 as default year
-                            return None
-                        except:
-                            return None
-                    
-                    # Try to parse datetime
-                    sample_value = str(df[datetime_col].iloc[0]).strip()
-                    
-                    if '/' in sample_value and ':' in sample_value:
-                        # MM/DD HH:MM:SS format
-                        df['parsed_datetime'] = df[datetime_col].apply(parse_datetime_mmdd)
-                    elif sample_value in calendar.month_name[1:]:
-                        # Monthly format
-                        df['parsed_datetime'] = df[datetime_col].apply(parse_monthly)
-                    else:
-                        df['parsed_datetime'] = pd.to_datetime(df[datetime_col], errors='coerce')
-                    
-                    # Check if parsing was successful
-                    if df['parsed_datetime'].notna().any():
-                        datetime_parsed = True
-                        x_values = df['parsed_datetime']
-                        x_title = "Date/Time"
-                        logger.info("Successfully parsed datetime column")
-                    else:
-                        logger.warning("DateTime parsing failed, using index")
-                        
-                except Exception as e:
-                    logger.warning(f"DateTime parsing error: {e}, falling back to index")
+            data = self._load_plot_data(output_dir, idf_name, file_type, environment)
+            df, idf_name, data_type = data["df"], data["idf_name"], data["data_type"]
             
-            # Fallback to simple version if datetime parsing failed
-            if not datetime_parsed:
-                x_values = df.index
+            datetime_parsed = "Date/Time" in df.columns and df["Date/Time"].notna().any()
+            if datetime_parsed:
+                x_values = df["Date/Time"].to_numpy()
+                x_title = "Date/Time"
+            else:
+                x_values = np.arange(len(df))
                 x_title = "Index"
             
-            # Create plotly figure
-            fig = go.Figure()
+            # Group columns into panels; a plain plot is one panel of every column
+            numeric_cols = list(df.select_dtypes(include=['number']).columns)
+            groups = [(None, numeric_cols)]
+            unmatched_panels = []
+            if panels:
+                groups = []
+                for selectors in panels:
+                    wanted = [str(selector).casefold() for selector in selectors]
+                    columns = [col for col in numeric_cols if any(w in col.casefold() for w in wanted)]
+                    if columns:
+                        groups.append((", ".join(selectors), columns))
+                    else:
+                        unmatched_panels.append(selectors)
+                if not groups:
+                    raise ValueError(f"No columns match the panels {panels}. Available: {numeric_cols}")
+            
+            # Downsample long series (LTTB keeps peaks and shape) so the HTML stays bounded
+            series = []
+            for panel, (_, columns) in enumerate(groups):
+                for col in columns:
+                    y_values = df[col].to_numpy(np.float64)
+                    present = np.isfinite(y_values)
+                    if datetime_parsed:
+                        present &= ~np.isnat(x_values)
+                    xs, ys = x_values[present], y_values[present]
+                    if max_points and len(ys) > max_points:
+                        keep = lttb_indices(xs, ys, max_points)
+                        xs, ys = xs[keep], ys[keep]
+                    series.append((panel, col, xs, ys, int(present.sum())))
+            points_plotted = sum(len(ys) for _, _, _, ys, _ in series)
+            scatter = go.Scattergl if points_plotted > PLOT_WEBGL_POINTS else go.Scatter
+            
+            # Create plotly figure (one row per panel in a dashboard)
+            if panels:
+                fig = make_subplots(rows=len(groups), cols=1, shared_xaxes=True, vertical_spacing=0.04,
+                                    subplot_titles=[name for name, _ in groups])
+            else:
+                fig = go.Figure()
             
-            # Add traces for all numeric columns (except datetime)
-            numeric_cols = df.select_dtypes(include=['number']).columns
+            # Add traces for all numeric columns
             colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
             
-            for i, col in enumerate(numeric_cols):
-                if col != datetime_col:  # Skip original datetime column
-                    color = colors[i % len(colors)]
-                    fig.add_trace(go.Scatter(
-                        x=x_values,
-                        y=df[col],
-                        mode='lines',
-                        name=col,
-                        line=dict(color=color),
-                        hovertemplate=f'<b>{col}</b><br>Value: %{{y}}<br>Time: %{{x}}<extra></extra>'
-                    ))
+            for i, (panel, col, xs, ys, _) in enumerate(series):
+                color = colors[i % len(colors)]
+                trace = scatter(
+                    x=xs,
+                    y=ys,
+                    mode='lines',
+                    name=col,
+                    line=dict(color=color),
+                    hovertemplate=f'<b>{col}</b><br>Value: %{{y}}<br>Time: %{{x}}<extra></extra>'
+                )
+                if panels:
+                    fig.add_trace(trace, row=panel + 1, col=1)
+                else:
+                    fig.add_trace(trace)
             
             # Update layout
             title = custom_title or f"EnergyPlus {data_type} Output - {idf_name}"
@@ -2971,32 +3640,138 @@ class EnergyPlusManager:
                     x=1.02
                 )
             )
+            if panels:
+                fig.update_layout(height=max(450, 300 * len(groups)), xaxis_title=None, yaxis_title=None)
+                fig.update_xaxes(title_text=x_title, row=len(groups), col=1)
             
-            # Save as HTML
-            html_filename = f"{idf_name}_{data_type.lower()}_plot.html"
+            # Save as HTML, loading plotly.js from the bundle shared by the output root
+            html_filename = f"{idf_name}_{data_type.lower()}_{'dashboard' if panels else 'plot'}.html"
             html_path = output_dir / html_filename
             
-            fig.write_html(str(html_path))
+            written = write_plot_html(fig, html_path, bundle=self.config.server.plot_bundle,
+                                      output_root=self.config.paths.output_dir,
+                                      compress=self.config.server.plot_gzip if compress is None else compress)
             
             result = {
                 "success": True,
-                "input_file": str(csv_file),
-                "output_file": str(html_path),
+                "input_file": str(data["input_file"]),
+                "output_file": written["output_file"],
+                "output_size_bytes": written["size_bytes"],
+                "plotly_bundle": written["plotly_bundle"],
                 "data_type": data_type,
                 "idf_name": idf_name,
-                "datetime_parsed": datetime_parsed,
-                "columns_plotted": list(numeric_cols),
+                "datetime_parsed": bool(datetime_parsed),
+                "environment": data["environment"],
+                "columns_plotted": [col for _, col, _, _, _ in series],
                 "total_data_points": len(df),
+                "points_plotted": points_plotted,
+                "downsampled": any(len(ys) < count for _, _, _, ys, count in series),
+                "renderer": "webgl" if scatter is go.Scattergl else "svg",
                 "title": title
             }
+            if panels:
+                result["panels"] = [{"title": name, "columns": columns} for name, columns in groups]
+                result["unmatched_panels"] = unmatched_panels
             
-            logger.info(f"Interactive plot created: {html_path}")
+            logger.info(f"Interactive plot created: {written['output_file']}")
             return json.dumps(result, indent=2)
             
         except Exception as e:
             logger.error(f"Error creating interactive plot: {e}")
             raise RuntimeError(f"Error creating interactive plot: {str(e)}")
 
+    def query_simulation_results(self, output_directory: str, variables: List[str],
+                                 aggregations: Optional[List[str]] = None, window: str = "none",
+                                 percentiles: Optional[List[float]] = None, day_types: Optional[List[str]] = None,
+                                 hours: Optional[List[int]] = None, months: Optional[List[int]] = None,
+                                 environment: Optional[str] = None, frequency: Optional[str] = None) -> str:
+        """
+        Aggregate selected output variables or meters of a run over time windows
+        
+        Reads only the selected series (see utils.series_query.query_time_series for
+        the sources and arguments) and returns per-window statistics, not the data.
+        
+        Returns:
+            JSON string with one entry per series and window
+        """
+        try:
+            logger.info(f"Querying {variables} in {output_directory} (window: {window})")
+            result = query_time_series(output_directory, variables, aggregations, window, percentiles,
+                                       day_types, hours, months, environment, frequency)
+            return json.dumps({"success": True, "output_directory": output_directory, **result}, indent=2)
+        except Exception as e:
+            logger.error(f"Error querying simulation results in {output_directory}: {e}")
+            raise RuntimeError(f"Error querying simulation results: {str(e)}")
+
+    def query_tabular_results(self, output_directory: str, report: Optional[str] = None,
+                              table: Optional[str] = None, report_for: Optional[str] = None,
+                              rows: Optional[List[str]] = None, columns: Optional[List[str]] = None,
+                              max_cells: int = 2000, source: str = "auto") -> str:
+        """
+        Read tables of the tabular reports of a run from its SQLite output or HTML report
+        
+        Names match exactly, ignoring case. Without any filter, the reports and
+        tables the run wrote are listed instead.
+        
+        Args:
+            output_directory: Output directory of a finished run
+            report: Report name, e.g. "AnnualBuildingUtilityPerformanceSummary"
+            table: Table name, e.g. "End Uses"
+            report_for: Report "for" string, e.g. "Entire Facility"
+            rows: Row names to keep
+            columns: Column names (without units) to keep
+            max_cells: Maximum number of cells returned
+            source: "sql", "html" (the *Table.htm, through its JSON table cache), or
+                "auto" for the SQLite output when the run wrote one, else the HTML
+        
+        Returns:
+            JSON string with one entry per table: {column label: value} per row name
+        """
+        try:
+            if source not in ("auto", "sql", "html"):
+                raise ValueError(f"Unknown source '{source}'; use ['auto', 'sql', 'html']")
+            
+            sql_path = find_sql_output(output_directory) if source != "html" else None
+            html_path = find_html_tables(output_directory) if sql_path is None and source != "sql" else None
+            if sql_path is None and html_path is None:
+                if source == "sql":
+                    raise FileNotFoundError(f"No SQLite output in {output_directory}. "
+                                            f"Run the simulation with sqlite=True to write one.")
+                raise FileNotFoundError(f"No SQLite output or HTML tabular report in {output_directory}")
+            
+            filtered = any([report, table, report_for, rows, columns])
+            if sql_path is not None:
+                result = {"success": True, "source": "sql", "sql_output": str(sql_path)}
+                with SqlResults(sql_path) as results:
+                    if not filtered:
+                        result["tables"] = results.tabular_index()
+                        return json.dumps(result, indent=2)
+                    cells = results.tabular(report, table, report_for, rows, columns, max_cells + 1)
+            else:
+                html_tables, cached = load_html_tables(html_path)
+                result = {"success": True, "source": "html", "html_output": str(html_path), "cached": cached}
+                if not filtered:
+                    result["tables"] = html_table_index(html_tables)
+                    return json.dumps(result, indent=2)
+                cells = html_table_cells(html_tables, report, table, report_for, rows, columns, max_cells + 1)
+            
+            tables = {}
+            for cell in cells[:max_cells]:
+                key = (cell["report"], cell["report_for"], cell["table"])
+                entry = tables.setdefault(key, {"report": key[0], "report_for": key[1], "table": key[2], "rows": {}})
+                label = f"{cell['column']} [{cell['units']}]" if cell["units"] else cell["column"]
+                entry["rows"].setdefault(cell["row"], {})[label] = cell["value"]
+            
+            result.update({
+                "cells": min(len(cells), max_cells),
+                "truncated": len(cells) > max_cells,
+                "tables": list(tables.values())
+            })
+            return json.dumps(result, indent=2)
+        except Exception as e:
+            logger.error(f"Error querying tabular results in {output_directory}: {e}")
+            raise RuntimeError(f"Error querying tabular results: {str(e)}")
+
     def _get_branches_from_list(self, idf, branch_list_name: str) -> List[Dict[str, Any]]:
         """Helper method to get branch information from a branch list"""
         branches = []
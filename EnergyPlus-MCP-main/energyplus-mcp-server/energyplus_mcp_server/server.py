@@ -18,7 +18,7 @@ from pathlib import Path
 from datetime import datetime
 
 # Import FastMCP instead of the low-level Server
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 
 # Import our EnergyPlus utilities and configuration
 from energyplus_mcp_server.energyplus_tools import EnergyPlusManager
@@ -95,11 +95,16 @@ async def load_idf_model(idf_path: str) -> str:
         idf_path: Path to the IDF file (can be absolute, relative, or just filename for sample files)
     
     Returns:
-        JSON string with model information and loading status
+        JSON string with model information and loading status. With speculative
+        discovery enabled, output_discovery tells whether the model's available
+        outputs are already known (stored) or being discovered in the background.
     """
     try:
         logger.info(f"Loading IDF model: {idf_path}")
         result = ep_manager.load_idf(idf_path)
+        speculation = ep_manager.speculate_output_discovery(idf_path)
+        if speculation:
+            result["output_discovery"] = speculation["status"]
         return f"Successfully loaded IDF: {result['original_path']}\nModel info: {result}"
     except FileNotFoundError as e:
         logger.warning(f"IDF file not found: {idf_path}")
@@ -126,6 +131,7 @@ async def get_model_summary(idf_path: str) -> str:
     try:
         logger.info(f"Getting model summary: {idf_path}")
         summary = ep_manager.get_model_basics(idf_path)
+        ep_manager.speculate_output_discovery(idf_path)
         return f"Model Summary for {idf_path}:\n{summary}"
     except FileNotFoundError as e:
         logger.warning(f"IDF file not found: {idf_path}")
@@ -213,7 +219,8 @@ async def inspect_people(idf_path: str) -> str:
 async def modify_people(
     idf_path: str,
     modifications: List[Dict[str, Any]],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify People objects in the EnergyPlus model
@@ -241,6 +248,8 @@ async def modify_people(
                         - Thermal_Comfort_Model_1_Type
                         - Thermal_Comfort_Model_2_Type
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -281,7 +290,7 @@ async def modify_people(
     """
     try:
         logger.info(f"Modifying People objects: {idf_path}")
-        result = ep_manager.modify_people(idf_path, modifications, output_path)
+        result = ep_manager.modify_people(idf_path, modifications, output_path, session_id)
         return f"People modification results:\n{result}"
     except FileNotFoundError as e:
         logger.warning(f"IDF file not found: {idf_path}")
@@ -325,7 +334,8 @@ async def inspect_lights(idf_path: str) -> str:
 async def modify_lights(
     idf_path: str,
     modifications: List[Dict[str, Any]],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify Lights objects in the EnergyPlus model
@@ -355,6 +365,8 @@ async def modify_lights(
                         - Return_Air_Heat_Gain_Node_Name
                         - Exhaust_Air_Heat_Gain_Node_Name
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -395,7 +407,7 @@ async def modify_lights(
     """
     try:
         logger.info(f"Modifying Lights objects: {idf_path}")
-        result = ep_manager.modify_lights(idf_path, modifications, output_path)
+        result = ep_manager.modify_lights(idf_path, modifications, output_path, session_id)
         return f"Lights modification results:\n{result}"
     except FileNotFoundError as e:
         logger.warning(f"IDF file not found: {idf_path}")
@@ -439,7 +451,8 @@ async def inspect_electric_equipment(idf_path: str) -> str:
 async def modify_electric_equipment(
     idf_path: str,
     modifications: List[Dict[str, Any]],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify ElectricEquipment objects in the EnergyPlus model
@@ -463,6 +476,8 @@ async def modify_electric_equipment(
                         - Fraction_Lost
                         - EndUse_Subcategory
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -503,7 +518,7 @@ async def modify_electric_equipment(
     """
     try:
         logger.info(f"Modifying ElectricEquipment objects: {idf_path}")
-        result = ep_manager.modify_electric_equipment(idf_path, modifications, output_path)
+        result = ep_manager.modify_electric_equipment(idf_path, modifications, output_path, session_id)
         return f"ElectricEquipment modification results:\n{result}"
     except FileNotFoundError as e:
         logger.warning(f"IDF file not found: {idf_path}")
@@ -520,7 +535,8 @@ async def modify_electric_equipment(
 async def modify_simulation_control(
     idf_path: str, 
     field_updates: Dict[str, Any],  # Changed from str to Dict[str, Any]
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify SimulationControl settings and save to a new file
@@ -529,6 +545,8 @@ async def modify_simulation_control(
         idf_path: Path to the input IDF file
         field_updates: Dictionary with field names and new values (e.g., {"Run_Simulation_for_Weather_File_Run_Periods": "Yes"})
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -541,7 +559,8 @@ async def modify_simulation_control(
             idf_path=idf_path,
             object_type="SimulationControl",
             field_updates=field_updates,  # Pass the dict directly
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         return f"SimulationControl modification results:\n{result}"
     except FileNotFoundError as e:
@@ -557,7 +576,8 @@ async def modify_run_period(
     idf_path: str, 
     field_updates: Dict[str, Any],  # Changed from str to Dict[str, Any]
     run_period_index: int = 0,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify RunPeriod settings and save to a new file
@@ -567,6 +587,8 @@ async def modify_run_period(
         field_updates: Dictionary with field names and new values (e.g., {"Begin_Month": 1, "End_Month": 3})
         run_period_index: Index of RunPeriod to modify (default 0 for first RunPeriod)
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -580,7 +602,8 @@ async def modify_run_period(
             object_type="RunPeriod",
             field_updates=field_updates,  # Pass the dict directly
             run_period_index=run_period_index,
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         return f"RunPeriod modification results:\n{result}"
     except FileNotFoundError as e:
@@ -595,7 +618,8 @@ async def modify_run_period(
 async def change_infiltration_by_mult(
     idf_path: str, 
     mult: float,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Modify infiltration in ZoneInfiltration:DesignFlowRate and save to a new file
@@ -604,6 +628,8 @@ async def change_infiltration_by_mult(
         idf_path: Path to the input IDF file
         mult: Multiplicative factor to apply to all ZoneInfiltration:DesignFlowRate objects
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -615,7 +641,8 @@ async def change_infiltration_by_mult(
         result = ep_manager.change_infiltration_by_mult(
             idf_path=idf_path,
             mult=mult,  # Pass the float directly
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         return f"Infiltration modification results:\n{result}"
     except FileNotFoundError as e:
@@ -632,7 +659,8 @@ async def add_window_film_outside(
     u_value: float = 4.94,
     shgc: float = 0.45,
     visible_transmittance: float = 0.66,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Add exterior window film to all exterior windows using WindowMaterial:SimpleGlazingSystem
@@ -643,6 +671,8 @@ async def add_window_film_outside(
         shgc: Solar Heat Gain Coefficient of the window film (default: 0.45)
         visible_transmittance: Visible transmittance of the window film (default: 0.66)
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -654,7 +684,8 @@ async def add_window_film_outside(
             u_value=u_value,
             shgc=shgc,
             visible_transmittance=visible_transmittance,
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         return f"Window film modification results:\n{result}"
     except FileNotFoundError as e:
@@ -671,7 +702,8 @@ async def add_coating_outside(
     location: str,
     solar_abs: float = 0.4,
     thermal_abs: float = 0.9,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Add exterior coating to all exterior surfaces of the specified location (wall or roof)
@@ -682,6 +714,8 @@ async def add_coating_outside(
         solar_abs: Solar Absorptance of the exterior coating (default: 0.4)
         thermal_abs: Thermal Absorptance of the exterior coating (default: 0.9)
         output_path: Optional path for output file (if None, creates one with _modified suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with modification results
@@ -693,7 +727,8 @@ async def add_coating_outside(
             location=location,
             solar_abs=solar_abs,
             thermal_abs=thermal_abs,
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         return f"Exterior coating modification results:\n{result}"
     except FileNotFoundError as e:
@@ -707,6 +742,100 @@ async def add_coating_outside(
         return f"Error adding exterior coating for {idf_path}: {str(e)}"
 
 
+@mcp.tool()
+async def open_model_session(idf_path: str) -> str:
+    """
+    Open an IDF model into an editing session so several edits cost one parse and one save
+    
+    Pass the returned session_id to any modify tool (modify_people, modify_lights,
+    modify_electric_equipment, modify_simulation_control, modify_run_period,
+    change_infiltration_by_mult, add_coating_outside, add_window_film_outside,
+    add_output_variables, add_output_meters). Edits stay in memory until
+    save_model_session is called. Idle sessions are closed automatically; unsaved
+    edits of automatically closed sessions are written to the cache directory.
+    
+    Args:
+        idf_path: Path to the IDF file (can be absolute, relative, or filename for sample files)
+    
+    Returns:
+        JSON string with the session ID and session details
+    """
+    try:
+        logger.info(f"Opening model session: {idf_path}")
+        result = ep_manager.open_model_session(idf_path)
+        return f"Model session opened:\n{result}"
+    except FileNotFoundError as e:
+        logger.warning(f"IDF file not found: {idf_path}")
+        return f"File not found: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error opening model session for {idf_path}: {str(e)}")
+        return f"Error opening model session for {idf_path}: {str(e)}"
+
+
+@mcp.tool()
+async def save_model_session(session_id: str, output_path: Optional[str] = None) -> str:
+    """
+    Save the in-memory model of an editing session to disk (the session stays open)
+    
+    Args:
+        session_id: Session ID returned by open_model_session
+        output_path: Optional path for output file (if None, creates one with _modified suffix)
+    
+    Returns:
+        JSON string with the saved file and the number of edits it contains
+    """
+    try:
+        logger.info(f"Saving model session: {session_id}")
+        result = ep_manager.save_model_session(session_id, output_path)
+        return f"Model session saved:\n{result}"
+    except ValueError as e:
+        logger.warning(f"Invalid model session: {str(e)}")
+        return f"Invalid session: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error saving model session {session_id}: {str(e)}")
+        return f"Error saving model session {session_id}: {str(e)}"
+
+
+@mcp.tool()
+async def close_model_session(session_id: str, discard_changes: bool = False) -> str:
+    """
+    Close an editing session and free its memory
+    
+    Args:
+        session_id: Session ID returned by open_model_session
+        discard_changes: Close even if the session has unsaved edits (default: False)
+    
+    Returns:
+        JSON string describing the closed session
+    """
+    try:
+        logger.info(f"Closing model session: {session_id}")
+        result = ep_manager.close_model_session(session_id, discard_changes)
+        return f"Model session closed:\n{result}"
+    except ValueError as e:
+        logger.warning(f"Cannot close model session: {str(e)}")
+        return f"Cannot close session: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error closing model session {session_id}: {str(e)}")
+        return f"Error closing model session {session_id}: {str(e)}"
+
+
+@mcp.tool()
+async def list_model_sessions() -> str:
+    """
+    List open model editing sessions with their edits and idle times
+    
+    Returns:
+        JSON string with open sessions and session limits
+    """
+    try:
+        result = ep_manager.list_model_sessions()
+        return f"Model sessions:\n{result}"
+    except Exception as e:
+        logger.error(f"Error listing model sessions: {str(e)}")
+        return f"Error listing model sessions: {str(e)}"
+
+
 @mcp.tool()
 async def list_zones(idf_path: str) -> str:
     """
@@ -816,6 +945,8 @@ async def get_output_variables(idf_path: str, discover_available: bool = False,
     """
     try:
         logger.info(f"Getting output variables: {idf_path} (discover_available={discover_available})")
+        if discover_available:
+            await ep_manager.wait_for_speculative_discovery(idf_path)
         result = ep_manager.get_output_variables(idf_path, discover_available, run_days)
         
         mode = "available variables discovery" if discover_available else "configured variables"
@@ -847,6 +978,8 @@ async def get_output_meters(idf_path: str, discover_available: bool = False, run
     """
     try:
         logger.info(f"Getting output meters: {idf_path} (discover_available={discover_available})")
+        if discover_available:
+            await ep_manager.wait_for_speculative_discovery(idf_path)
         result = ep_manager.get_output_meters(idf_path, discover_available, run_days)
         
         mode = "available meters discovery" if discover_available else "configured meters"
@@ -866,7 +999,8 @@ async def add_output_variables(
     variables: List,  # Can be List[Dict], List[str], or mixed
     validation_level: str = "moderate",
     allow_duplicates: bool = False,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Add output variables to an EnergyPlus IDF file with intelligent validation
@@ -878,12 +1012,20 @@ async def add_output_variables(
                   - [name, frequency] pairs: [["Zone Air Temperature", "hourly"], ["Surface Temperature", "daily"]]
                   - Full specifications: [{"key_value": "*", "variable_name": "Zone Air Temperature", "frequency": "hourly"}]
                   - Mixed formats in the same list
+                  key_value may also be a wildcard ("SPACE*") or "regex:<pattern>"; it is expanded to
+                  one output variable per matching object name
         validation_level: Validation strictness level:
-                         - "strict": Full validation with model checking (recommended for beginners)
+                         - "strict": Full validation with model checking, including key values against
+                                     object names (recommended for beginners)
                          - "moderate": Basic validation with helpful warnings (default)
                          - "lenient": Minimal validation (for advanced users)
+                         Until the model's variables have been discovered, names are checked against
+                         variables predicted from its object types and discovery runs in the background;
+                         strict validation runs the discovery right away if any name is not predicted
         allow_duplicates: Whether to allow duplicate output variable specifications (default: False)
         output_path: Optional path for output file (if None, creates one with _with_outputs suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with detailed results including validation report, added variables, and performance metrics
@@ -909,7 +1051,8 @@ async def add_output_variables(
             variables=variables,
             validation_level=validation_level,
             allow_duplicates=allow_duplicates,
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         
         return f"Output variables addition results:\n{result}"
@@ -931,7 +1074,8 @@ async def add_output_meters(
     meters: List,  # Can be List[Dict], List[str], or mixed
     validation_level: str = "moderate",
     allow_duplicates: bool = False,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> str:
     """
     Add output meters to an EnergyPlus IDF file with intelligent validation
@@ -950,6 +1094,8 @@ async def add_output_meters(
                          - "lenient": Minimal validation (for advanced users)
         allow_duplicates: Whether to allow duplicate output meter specifications (default: False)
         output_path: Optional path for output file (if None, creates one with _with_meters suffix)
+        session_id: Optional open model session (from open_model_session) to edit in memory instead of
+                    reading idf_path and writing output_path; save it later with save_model_session
     
     Returns:
         JSON string with detailed results including validation report, added meters, and performance metrics
@@ -975,7 +1121,8 @@ async def add_output_meters(
             meters=meters,
             validation_level=validation_level,
             allow_duplicates=allow_duplicates,
-            output_path=output_path
+            output_path=output_path,
+            session_id=session_id
         )
         
         return f"Output meters addition results:\n{result}"
@@ -1061,13 +1208,20 @@ async def get_server_status() -> str:
             "energyplus": {
                 "version": config.energyplus.version,
                 "idd_available": os.path.exists(config.energyplus.idd_path) if config.energyplus.idd_path else False,
-                "executable_available": os.path.exists(config.energyplus.executable_path) if config.energyplus.executable_path else False
+                "executable_available": os.path.exists(config.energyplus.executable_path) if config.energyplus.executable_path else False,
+                "idd_load": ep_manager.idd_load_info
             },
             "paths": {
                 "sample_files_available": os.path.exists(config.paths.sample_files_path),
                 "temp_dir_available": os.path.exists(config.paths.temp_dir),
                 "output_dir_available": os.path.exists(config.paths.output_dir)
-            }
+            },
+            "model_cache": ep_manager.model_cache.get_stats(),
+            "model_sessions": ep_manager.sessions.get_stats(),
+            "simulation_jobs": ep_manager.simulation_jobs.get_stats(),
+            "result_cache": ep_manager.result_cache.get_stats(),
+            "output_discovery": ep_manager.output_var_manager.discovery.get_stats(),
+            "validation_cache": ep_manager.output_var_manager.validation_cache.get_stats()
         }
         
         import json
@@ -1169,11 +1323,26 @@ async def run_energyplus_simulation(
     annual: bool = True,
     design_day: bool = False,
     readvars: bool = True,
-    expandobjects: bool = True
+    expandobjects: bool = True,
+    wait: bool = False,
+    priority: int = 0,
+    use_cache: bool = True,
+    timeout: Optional[int] = None,
+    cpu_limit: Optional[int] = None,
+    columnar: Optional[bool] = None,
+    sqlite: Optional[bool] = None,
+    ctx: Context = None
 ) -> str:
     """
     Run EnergyPlus simulation with specified IDF and weather file
     
+    The simulation runs as a background job so the server stays responsive. Jobs are
+    queued when all worker slots (one per CPU by default) are busy. By default the job
+    ID is returned immediately; poll it with get_simulation_status and fetch outputs
+    with get_simulation_results. With wait=True, progress (current environment, warmup
+    day, simulated date and estimated time remaining) is sent as MCP progress
+    notifications while the simulation runs.
+    
     Args:
         idf_path: Path to the IDF file (can be absolute, relative, or just filename for sample files)
         weather_file: Path to weather file (.epw) or city name (e.g., 'San Francisco'). If None, simulation runs without weather file
@@ -1182,25 +1351,61 @@ async def run_energyplus_simulation(
         design_day: Run design day only simulation (default: False) 
         readvars: Run ReadVarsESO after simulation to process outputs (default: True)
         expandobjects: Run ExpandObjects prior to simulation for HVAC templates (default: True)
+        wait: Wait for the simulation to finish and return its results (default: False)
+        priority: Queue priority; higher values start first when workers are busy (default: 0)
+        use_cache: Reuse outputs of an identical earlier run (same model content, weather,
+                   options and EnergyPlus version); set False to force a fresh run (default: True)
+        timeout: Wall-clock limit in seconds; the whole EnergyPlus process group is killed when
+                 it is exceeded (default: server simulation_timeout, 0 disables)
+        cpu_limit: CPU-time limit in seconds (default: server simulation_cpu_limit, 0 disables)
+        columnar: Convert the .eso/.mtr time series to a compressed columnar store (one file
+                  per frequency and variable, plus manifest.json) in <output_directory>/columnar
+                  before the job completes (default: server columnar_results)
+        sqlite: Write the EnergyPlus SQLite output (Output:SQLite is added to a copy of the
+                model when missing) and index it, for query_tabular_results and fast
+                query_simulation_results (default: server sqlite_output)
     
     Returns:
-        JSON string with simulation results, duration, and output file paths
+        JSON string with the job ID and status, or the simulation results when wait is True
     """
     try:
         logger.info(f"Running EnergyPlus simulation: {idf_path}")
         if weather_file:
             logger.info(f"With weather file: {weather_file}")
         
-        result = ep_manager.run_simulation(
+        job = ep_manager.submit_simulation(
             idf_path=idf_path,
             weather_file=weather_file,
             output_directory=output_directory,
             annual=annual,
             design_day=design_day,
             readvars=readvars,
-            expandobjects=expandobjects
+            expandobjects=expandobjects,
+            priority=priority,
+            use_cache=use_cache,
+            timeout=timeout,
+            cpu_limit=cpu_limit,
+            columnar=columnar,
+            sqlite=sqlite
+        )
+        
+        if not wait:
+            return f"EnergyPlus simulation started:\n{json.dumps(job, indent=2)}"
+        
+        async def report_progress(sim_job):
+            progress = sim_job.progress.get_info()
+            message = progress["message"] if sim_job.status == "running" else sim_job.status.capitalize()
+            if progress["percent"] is not None:
+                await ctx.report_progress(progress["percent"], 100, message=message)
+            else:
+                await ctx.report_progress(progress["day_of_simulation"], None, message=message)
+        
+        await ep_manager.simulation_jobs.wait(
+            job["job_id"],
+            on_progress=report_progress if ctx is not None and not job["cached"] else None
         )
-        return f"EnergyPlus simulation completed:\n{result}"
+        result = ep_manager.get_simulation_results(job["job_id"])
+        return f"EnergyPlus simulation finished:\n{result}"
     except FileNotFoundError as e:
         logger.warning(f"File not found for simulation: {str(e)}")
         return f"File not found: {str(e)}"
@@ -1209,28 +1414,201 @@ async def run_energyplus_simulation(
         return f"Error running simulation: {str(e)}"
 
 
+@mcp.tool()
+async def run_parametric_batch(
+    idf_path: str,
+    variants: List[Dict[str, Any]],
+    weather_file: Optional[str] = None,
+    output_directory: Optional[str] = None,
+    annual: bool = True,
+    design_day: bool = False,
+    include_baseline: bool = True,
+    priority: int = 0,
+    use_cache: bool = True
+) -> str:
+    """
+    Build variants of a base model and simulate them all concurrently across cores
+    
+    Args:
+        idf_path: Path to the base IDF file
+        variants: List of variant specifications. Each item may have:
+                 - "name": Variant name (default: variant_N)
+                 - "infiltration_multiplier": Multiplier for infiltration rates
+                 - "coating": {"location": "wall" or "roof", "solar_abs": 0.4, "thermal_abs": 0.9} (or a list)
+                 - "window_film": {"u_value": 4.94, "shgc": 0.45, "visible_transmittance": 0.66}
+                 - "people", "lights", "electric_equipment": Modification lists in the same
+                   format as modify_people / modify_lights / modify_electric_equipment
+        weather_file: Path to weather file (.epw) or city name used for every run
+        output_directory: Batch directory (if None, creates timestamped directory in outputs/)
+        annual: Run annual simulations (default: True)
+        design_day: Run design day only simulations (default: False)
+        include_baseline: Also simulate the unmodified base model for comparison (default: True)
+        priority: Queue priority of the batch's simulations (default: 0)
+        use_cache: Reuse outputs of identical earlier runs (default: True)
+    
+    Returns:
+        JSON string with a compact table of key results per variant (site/source energy,
+        EUI, unmet hours, change vs. baseline, warnings) and the variant IDF paths
+    
+    Examples:
+        # Compare two infiltration levels and a cool roof
+        run_parametric_batch("model.idf", [
+            {"name": "tight", "infiltration_multiplier": 0.5},
+            {"name": "leaky", "infiltration_multiplier": 1.5},
+            {"name": "cool_roof", "coating": {"location": "roof", "solar_abs": 0.2}}
+        ], weather_file="San Francisco")
+    """
+    try:
+        logger.info(f"Running parametric batch of {len(variants)} variants for: {idf_path}")
+        result = await ep_manager.run_parametric_batch(
+            idf_path=idf_path,
+            variants=variants,
+            weather_file=weather_file,
+            output_directory=output_directory,
+            annual=annual,
+            design_day=design_day,
+            include_baseline=include_baseline,
+            priority=priority,
+            use_cache=use_cache
+        )
+        return f"Parametric batch completed:\n{result}"
+    except FileNotFoundError as e:
+        logger.warning(f"File not found for parametric batch: {str(e)}")
+        return f"File not found: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error running parametric batch: {str(e)}")
+        return f"Error running parametric batch: {str(e)}"
+
+
+@mcp.tool()
+async def get_simulation_status(job_id: str, tail_lines: int = 20) -> str:
+    """
+    Get the status of a simulation job started with run_energyplus_simulation
+    
+    Args:
+        job_id: Simulation job ID
+        tail_lines: Number of recent EnergyPlus output lines to include (default: 20)
+    
+    Returns:
+        JSON string with job status, elapsed time and recent EnergyPlus output
+    """
+    try:
+        result = ep_manager.get_simulation_status(job_id, tail_lines)
+        return f"Simulation job status:\n{result}"
+    except ValueError as e:
+        logger.warning(f"Unknown simulation job: {str(e)}")
+        return f"Invalid job: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error getting simulation status for {job_id}: {str(e)}")
+        return f"Error getting simulation status: {str(e)}"
+
+
+@mcp.tool()
+async def list_simulation_jobs(status: Optional[str] = None) -> str:
+    """
+    List simulation jobs, newest first
+    
+    Args:
+        status: Only list jobs in this state ("queued", "running", "completed", "failed", "cancelled", "timed_out")
+    
+    Returns:
+        JSON string with job summaries, CPU/wall-time accounting and scheduler occupancy
+    """
+    try:
+        result = ep_manager.list_simulation_jobs(status)
+        return f"Simulation jobs:\n{result}"
+    except Exception as e:
+        logger.error(f"Error listing simulation jobs: {str(e)}")
+        return f"Error listing simulation jobs: {str(e)}"
+
+
+@mcp.tool()
+async def get_simulation_results(job_id: str) -> str:
+    """
+    Get the results of a finished simulation job
+    
+    Args:
+        job_id: Simulation job ID
+    
+    Returns:
+        JSON string with output file paths, or for failed, cancelled or timed-out runs the
+        error details plus a salvage report of how far the run got (.err/.eso/console output)
+    """
+    try:
+        result = ep_manager.get_simulation_results(job_id)
+        return f"Simulation results:\n{result}"
+    except ValueError as e:
+        logger.warning(f"Unknown simulation job: {str(e)}")
+        return f"Invalid job: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error getting simulation results for {job_id}: {str(e)}")
+        return f"Error getting simulation results: {str(e)}"
+
+
+@mcp.tool()
+async def cancel_simulation(job_id: str) -> str:
+    """
+    Cancel a queued or running simulation job
+    
+    Args:
+        job_id: Simulation job ID
+    
+    Returns:
+        JSON string with the job status after the cancellation request
+    """
+    try:
+        result = ep_manager.cancel_simulation(job_id)
+        return f"Simulation cancellation requested:\n{result}"
+    except ValueError as e:
+        logger.warning(f"Unknown simulation job: {str(e)}")
+        return f"Invalid job: {str(e)}"
+    except Exception as e:
+        logger.error(f"Error cancelling simulation {job_id}: {str(e)}")
+        return f"Error cancelling simulation: {str(e)}"
+
+
 @mcp.tool()
 async def create_interactive_plot(
     output_directory: str,
     idf_name: Optional[str] = None,
     file_type: str = "auto",
-    custom_title: Optional[str] = None
+    custom_title: Optional[str] = None,
+    environment: Optional[str] = None,
+    max_points: int = 5000,
+    panels: Optional[List[List[str]]] = None,
+    compress: Optional[bool] = None
 ) -> str:
     """
     Create interactive HTML plot from EnergyPlus output files (meter or variable outputs)
     
+    Long series (e.g. annual timestep output) are downsampled with LTTB, which keeps
+    peaks and shape, and large plots are drawn with WebGL so the HTML stays small.
+    Plots load plotly.js from one local copy shared by the output directory root, so
+    they work offline without embedding the library in every file.
+    
     Args:
-        output_directory: Directory containing the CSV output files from simulation
+        output_directory: Directory containing the CSV output files from simulation (or, for runs
+                          without ReadVarsESO, the .eso/.mtr files); a current columnar store
+                          of the run is read instead when present
         idf_name: Name of the IDF file (without extension). If None, auto-detects from files
         file_type: Type of file to plot - "meter", "variable", or "auto" (default: auto)
         custom_title: Custom title for the plot (optional)
+        environment: Environment (run period or design day) title or index to plot
+                     (default: the environment with the most data)
+        max_points: Points kept per series (default: 5000, 0 keeps every point)
+        panels: Build a dashboard of stacked panels sharing the time axis from a single read
+                of the outputs; each panel lists column selectors matched case-insensitively
+                as substrings of the column names
+                Example: [["Electricity:Facility"], ["SPACE1-1:Zone Air Temperature", "Outdoor Air Drybulb"]]
+        compress: Write gzip-compressed HTML (.html.gz) (default: server configuration)
     
     Returns:
         JSON string with plot creation results and file path
     """
     try:
         logger.info(f"Creating interactive plot from: {output_directory}")
-        result = ep_manager.create_interactive_plot(output_directory, idf_name, file_type, custom_title)
+        result = ep_manager.create_interactive_plot(output_directory, idf_name, file_type, custom_title,
+                                                    environment, max_points, panels, compress)
         return f"Interactive plot created:\n{result}"
     except FileNotFoundError as e:
         logger.warning(f"Output files not found: {str(e)}")
@@ -1240,6 +1618,99 @@ async def create_interactive_plot(
         return f"Error creating interactive plot: {str(e)}"
 
 
+@mcp.tool()
+async def query_simulation_results(
+    output_directory: str,
+    variables: List[str],
+    aggregations: Optional[List[str]] = None,
+    window: str = "none",
+    percentiles: Optional[List[float]] = None,
+    day_types: Optional[List[str]] = None,
+    hours: Optional[List[int]] = None,
+    months: Optional[List[int]] = None,
+    environment: Optional[str] = None,
+    frequency: Optional[str] = None
+) -> str:
+    """
+    Compute statistics of output variables or meters of a finished simulation
+    
+    Answers questions like "monthly peak of Electricity:Facility" or "mean zone air
+    temperature on weekdays 08:00-18:00" without returning the time series. Only the
+    selected series are read, as float32: from the run's columnar store if present,
+    else the indexed SQLite output, else the .eso/.mtr, else the CSV in chunks.
+    
+    Args:
+        output_directory: Directory with the simulation outputs
+        variables: Variable or meter names (all keys), "KEY:Variable Name" or CSV column labels,
+                   e.g. ["Electricity:Facility"] or ["SPACE1-1:Zone Air Temperature"]
+        aggregations: Any of "count", "sum", "mean", "min", "max" (default: all); min/max
+                      include the time they occurred
+        window: "none" (whole run period), "hourly", "daily" or "monthly" (default: none)
+        percentiles: Percentiles per window, e.g. [50, 95]
+        day_types: EnergyPlus day types ("Monday", "Holiday", ...) or "Weekday", "Weekend",
+                   "DesignDay"; needs the .eso or SQLite output (not available from CSV only outputs)
+        hours: [start, end) hours of the day to include, e.g. [8, 18] for occupied hours
+        months: Months to include (1-12)
+        environment: Environment (run period or design day) title to include (default: all)
+        frequency: Reporting frequency to use when a variable has several (default: finest)
+    
+    Returns:
+        JSON string with per-series, per-window statistics
+    """
+    try:
+        logger.info(f"Querying simulation results in {output_directory}: {variables}")
+        result = ep_manager.query_simulation_results(output_directory, variables, aggregations, window,
+                                                     percentiles, day_types, hours, months,
+                                                     environment, frequency)
+        return f"Simulation results query:\n{result}"
+    except Exception as e:
+        logger.error(f"Error querying simulation results: {str(e)}")
+        return f"Error querying simulation results: {str(e)}"
+
+
+@mcp.tool()
+async def query_tabular_results(
+    output_directory: str,
+    report: Optional[str] = None,
+    table: Optional[str] = None,
+    report_for: Optional[str] = None,
+    rows: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    max_cells: int = 2000,
+    source: str = "auto"
+) -> str:
+    """
+    Read tables of the EnergyPlus tabular reports (end uses, site and source energy,
+    unmet hours, sizing, ...) of a finished simulation, selected by name
+    
+    Reads the SQLite output of runs simulated with sqlite=True, else the HTML
+    tabular report (*Table.htm), whose tables are cached as JSON next to it after
+    the first query. Call it without filters first to list the reports and tables
+    of the run.
+    
+    Args:
+        output_directory: Directory with the simulation outputs
+        report: Report name, e.g. "AnnualBuildingUtilityPerformanceSummary"
+        table: Table name, e.g. "Site and Source Energy" or "End Uses"
+        report_for: Report "for" string, e.g. "Entire Facility"
+        rows: Row names to include, e.g. ["Total Site Energy"]
+        columns: Column names without units to include, e.g. ["Electricity"]
+        max_cells: Maximum number of cells returned (default: 2000)
+        source: "auto" (SQLite output when present, else HTML report), "sql" or "html"
+    
+    Returns:
+        JSON string with the matching tables as {row name: {column [units]: value}}
+    """
+    try:
+        logger.info(f"Querying tabular results in {output_directory}: {report} / {table}")
+        result = ep_manager.query_tabular_results(output_directory, report, table, report_for,
+                                                  rows, columns, max_cells, source)
+        return f"Tabular results query:\n{result}"
+    except Exception as e:
+        logger.error(f"Error querying tabular results: {str(e)}")
+        return f"Error querying tabular results: {str(e)}"
+
+
 @mcp.tool()
 async def get_server_logs(lines: int = 50) -> str:
     """
@@ -15,9 +15,33 @@ from .schedules import ScheduleValueParser, ScheduleLanguageParser, ScheduleConv
 from .diagrams import HVACDiagramGenerator
 from .output_variables import OutputVariableManager
 from .output_meters import OutputMeterManager
+from .variable_predictor import VariablePredictor
+from .name_index import NameIndex, ObjectNameIndex
+from .validation_cache import ValidationCache, get_validation_cache
+from .output_discovery import (
+    OutputDiscovery, DiscoveryStore, get_output_discovery, output_signature, write_discovery_idf,
+    parse_rdd_file, parse_mdd_file
+)
 from .people_utils import PeopleManager
 from .lights_utils import LightsManager
 from .electric_equipment_utils import ElectricEquipmentManager
+from .model_cache import ModelCache, ReadOnlyIDF, ReadOnlyModelError, get_model_cache
+from .file_hashing import file_sha256
+from .idd_snapshot import initialize_idd, load_idd_snapshot, write_idd_snapshot, get_snapshot_key
+from .model_sessions import ModelSession, ModelSessionManager, get_session_manager
+from .idf_scanner import iter_idf_objects, count_idf_objects, scan_idf_records, group_idf_records
+from .simulation_jobs import SimulationJob, SimulationJobManager, get_simulation_job_manager, build_energyplus_command
+from .result_cache import SimulationResultCache, get_result_cache, make_result_key, idf_content_digest, existing_files
+from .simulation_salvage import salvage_partial_outputs, summarize_err_file, find_eso_progress
+from .simulation_progress import SimulationProgress, estimate_simulation_days
+from .eso_reader import EsoData, EsoVariable, read_eso, read_eso_dictionary, parse_csv_timestamps
+from .columnar_store import ColumnarStore, write_columnar_store, load_manifest, summarize_store, is_store_current
+from .series_query import query_time_series
+from .sql_results import SqlResults, find_sql_output, inject_sqlite_output, ensure_sql_indexes
+from .html_tables import find_html_tables, parse_html_tables, load_html_tables, html_table_index, html_table_cells
+from .downsampling import lttb_indices
+from .plot_output import write_plot_html, ensure_plotly_bundle, bundle_root_for
+from .parametric import normalize_variants, build_variants, summarize_simulation_outputs, build_result_table
 from .path_utils import (
     PathResolver,
     resolve_path,
@@ -38,9 +62,79 @@ __all__ = [
     "HVACDiagramGenerator",
     "OutputVariableManager",
     "OutputMeterManager",
+    "OutputDiscovery",
+    "DiscoveryStore",
+    "get_output_discovery",
+    "output_signature",
+    "write_discovery_idf",
+    "VariablePredictor",
+    "NameIndex",
+    "ObjectNameIndex",
+    "ValidationCache",
+    "get_validation_cache",
+    "parse_rdd_file",
+    "parse_mdd_file",
     "PeopleManager",
     "LightsManager",
     "ElectricEquipmentManager",
+    "ModelCache",
+    "ReadOnlyIDF",
+    "ReadOnlyModelError",
+    "get_model_cache",
+    "file_sha256",
+    "initialize_idd",
+    "load_idd_snapshot",
+    "write_idd_snapshot",
+    "get_snapshot_key",
+    "ModelSession",
+    "ModelSessionManager",
+    "get_session_manager",
+    "iter_idf_objects",
+    "count_idf_objects",
+    "scan_idf_records",
+    "group_idf_records",
+    "SimulationJob",
+    "SimulationJobManager",
+    "get_simulation_job_manager",
+    "build_energyplus_command",
+    "SimulationResultCache",
+    "get_result_cache",
+    "make_result_key",
+    "idf_content_digest",
+    "existing_files",
+    "salvage_partial_outputs",
+    "summarize_err_file",
+    "find_eso_progress",
+    "SimulationProgress",
+    "estimate_simulation_days",
+    "EsoData",
+    "EsoVariable",
+    "read_eso",
+    "read_eso_dictionary",
+    "parse_csv_timestamps",
+    "ColumnarStore",
+    "write_columnar_store",
+    "load_manifest",
+    "summarize_store",
+    "is_store_current",
+    "query_time_series",
+    "SqlResults",
+    "find_sql_output",
+    "inject_sqlite_output",
+    "ensure_sql_indexes",
+    "find_html_tables",
+    "parse_html_tables",
+    "load_html_tables",
+    "html_table_index",
+    "html_table_cells",
+    "lttb_indices",
+    "write_plot_html",
+    "ensure_plotly_bundle",
+    "bundle_root_for",
+    "normalize_variants",
+    "build_variants",
+    "summarize_simulation_outputs",
+    "build_result_table",
     "PathResolver",
     "resolve_path",
     "resolve_idf_path",
@@ -0,0 +1,368 @@
+"""
+Columnar store of simulation time series for EnergyPlus MCP Server.
+Converts the .eso/.mtr outputs of a run into compressed column files, one per
+source, reporting frequency and variable name, described by a JSON manifest,
+so later analyses load only the series they need instead of re-parsing text.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import re
+import json
+import shutil
+import logging
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import numpy as np
+
+from .eso_reader import read_eso, FREQUENCIES, DAY_TYPES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet is optional; stores fall back to compressed NumPy archives
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout changes so existing stores are rebuilt
+STORE_FORMAT = 1
+
+STORE_DIRECTORY = "columnar"
+MANIFEST_NAME = "manifest.json"
+
+# Time series sources of a run: the variable output (.eso) and the meter output (.mtr)
+SOURCES = ("eso", "mtr")
+
+# Time stamp columns stored in every partition, next to the value columns
+_STAMP_COLUMNS = {"Row": "row", "Date/Time": "timestamp", "Environment": "environment", "Day Type": "day_type"}
+_STAMP_DTYPES = {"row": np.int32, "environment": np.int16, "day_type": np.int8}
+
+
+def resolve_store_format(fmt: str = "auto") -> str:
+    """
+    Pick the file format of a store: "parquet" (needs pyarrow) or "npz"
+
+    Raises:
+        ValueError: If the format is unknown or Parquet is requested without pyarrow
+    """
+    if fmt == "auto":
+        return "parquet" if pq is not None else "npz"
+    if fmt not in ("parquet", "npz"):
+        raise ValueError(f"Unknown columnar store format '{fmt}'; use 'parquet', 'npz' or 'auto'")
+    if fmt == "parquet" and pq is None:
+        raise ValueError("The Parquet columnar store format needs pyarrow, which is not installed")
+    return fmt
+
+
+def find_time_series_sources(output_directory: Union[str, Path]) -> Dict[str, str]:
+    """Return {"eso": path, "mtr": path} of the newest .eso/.mtr files in an output directory"""
+    sources = {}
+    for source in SOURCES:
+        candidates = sorted(Path(output_directory).glob(f"*.{source}"), key=lambda p: p.stat().st_mtime)
+        if candidates:
+            sources[source] = str(candidates[-1])
+    return sources
+
+
+def _slug(name: str) -> str:
+    """File name fragment of a variable or frequency name"""
+    return re.sub(r"[^0-9a-z]+", "_", name.casefold()).strip("_") or "unnamed"
+
+
+def _source_state(path: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {"name": os.path.basename(path), "size_bytes": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _write_partition(path: str, columns: Dict[str, np.ndarray], fmt: str):
+    """Write the named columns of one partition"""
+    if fmt == "parquet":
+        arrays = {name: (column.astype("datetime64[s]") if column.dtype.kind == "M" else column)
+                  for name, column in columns.items()}
+        pq.write_table(pa.table(arrays), path, compression="zstd")
+    else:
+        np.savez_compressed(path, **columns)
+
+
+def _read_partition(path: str, names: List[str], fmt: str) -> Dict[str, np.ndarray]:
+    """Read only the named columns of one partition"""
+    if fmt == "parquet":
+        table = pq.read_table(path, columns=names)
+        return {name: table.column(name).to_numpy() for name in names}
+    with np.load(path) as archive:  # members of an .npz are decompressed on access
+        return {name: archive[name] for name in names}
+
+
+def load_manifest(output_directory: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Return the manifest of the columnar store of an output directory, or None"""
+    path = os.path.join(output_directory, STORE_DIRECTORY, MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("store_format") == STORE_FORMAT else None
+
+
+def is_store_current(output_directory: Union[str, Path], manifest: Optional[Dict[str, Any]] = None) -> bool:
+    """True if a columnar store exists and its .eso/.mtr sources are unchanged"""
+    manifest = manifest or load_manifest(output_directory)
+    if manifest is None:
+        return False
+    sources = find_time_series_sources(output_directory)
+    if set(sources) != set(manifest["sources"]):
+        return False
+    return all(_source_state(path) == manifest["sources"][source] for source, path in sources.items())
+
+
+def write_columnar_store(output_directory: Union[str, Path], fmt: str = "auto", dtype=np.float64,
+                         force: bool = False) -> Dict[str, Any]:
+    """
+    Convert the .eso/.mtr time series of a run into a columnar store
+
+    The store lives in ``<output_directory>/columnar``: one file per source,
+    frequency and variable name (``eso/Hourly/zone_air_temperature.npz``) with a
+    column per key plus the time stamp columns, and ``manifest.json`` listing
+    the partitions. The store is written next to the outputs and swapped in
+    whole, so readers never see a partial store.
+
+    Args:
+        output_directory: Output directory of the run
+        fmt: "parquet", "npz" or "auto" (Parquet when pyarrow is installed)
+        dtype: dtype of the value columns (np.float32 halves them)
+        force: Rebuild even if the store is current
+
+    Returns:
+        The manifest
+
+    Raises:
+        FileNotFoundError: If the directory has no .eso or .mtr file
+        ValueError: If the format is not available
+    """
+    output_directory = str(output_directory)
+    fmt = resolve_store_format(fmt)
+    sources = find_time_series_sources(output_directory)
+    if not sources:
+        raise FileNotFoundError(f"No .eso or .mtr output in {output_directory}")
+
+    existing = load_manifest(output_directory)
+    if not force and existing and existing["format"] == fmt and is_store_current(output_directory, existing):
+        return existing
+
+    root = os.path.join(output_directory, STORE_DIRECTORY)
+    staging = tempfile.mkdtemp(prefix=".columnar_", dir=output_directory)
+    extension = ".parquet" if fmt == "parquet" else ".npz"
+    try:
+        partitions = []
+        environments = {}
+        for source, path in sources.items():
+            data = read_eso(path, dtype=dtype)
+            environments[source] = data.environments
+            groups: Dict[Tuple[str, str], List[int]] = {}
+            for var in data.variables.values():
+                groups.setdefault((var.frequency, var.name), []).append(var.report_id)
+
+            used = set()
+            for (frequency, name), report_ids in groups.items():
+                relative = f"{source}/{_slug(frequency)}/{_slug(name)}"
+                if relative in used:  # names that only differ in punctuation
+                    relative = f"{relative}_{report_ids[0]}"
+                used.add(relative)
+                relative += extension
+
+                columns = data.columns(frequency, report_ids)
+                stored = {column: columns[stamp].astype(_STAMP_DTYPES.get(column, columns[stamp].dtype))
+                          for stamp, column in _STAMP_COLUMNS.items()}
+                keys = []
+                for i, report_id in enumerate(report_ids):
+                    var = data.variables[report_id]
+                    column = var.label if fmt == "parquet" else f"v{i}"
+                    stored[column] = columns[var.label]
+                    keys.append({"key": var.key, "label": var.label, "report_id": report_id, "column": column})
+
+                target = os.path.join(staging, relative)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                _write_partition(target, stored, fmt)
+                partitions.append({
+                    "source": source,
+                    "frequency": frequency,
+                    "variable": name,
+                    "units": data.variables[report_ids[0]].units,
+                    "file": relative,
+                    "rows": int(len(columns["Row"])),
+                    "size_bytes": os.path.getsize(target),
+                    "keys": keys
+                })
+
+        manifest = {
+            "store_format": STORE_FORMAT,
+            "format": fmt,
+            "dtype": np.dtype(dtype).name,
+            "created": datetime.now().isoformat(),
+            "sources": {source: _source_state(path) for source, path in sources.items()},
+            "environments": environments,
+            "source_bytes": sum(os.path.getsize(path) for path in sources.values()),
+            "size_bytes": sum(p["size_bytes"] for p in partitions),
+            "partitions": partitions
+        }
+        with open(os.path.join(staging, MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        shutil.rmtree(root, ignore_errors=True)
+        os.replace(staging, root)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logger.info(f"Wrote {len(partitions)} columnar partitions ({fmt}, {manifest['size_bytes']} bytes "
+                f"from {manifest['source_bytes']} bytes of .eso/.mtr) to {root}")
+    return manifest
+
+
+def summarize_store(output_directory: Union[str, Path], manifest: Optional[Dict[str, Any]] = None
+                    ) -> Optional[Dict[str, Any]]:
+    """Compact description of a columnar store for simulation results, or None without one"""
+    manifest = manifest or load_manifest(output_directory)
+    if manifest is None:
+        return None
+    frequencies = {p["frequency"] for p in manifest["partitions"]}
+    return {
+        "path": os.path.join(str(output_directory), STORE_DIRECTORY),
+        "format": manifest["format"],
+        "partitions": len(manifest["partitions"]),
+        "frequencies": [f for f in FREQUENCIES if f in frequencies],
+        "size_bytes": manifest["size_bytes"],
+        "source_bytes": manifest["source_bytes"],
+        "current": is_store_current(output_directory, manifest)
+    }
+
+
+class ColumnarStore:
+    """Read access to a store written by write_columnar_store
+
+    Loads read only the partitions, and within them only the columns, of the
+    requested variables.
+    """
+
+    def __init__(self, output_directory: Union[str, Path]):
+        """
+        Open the columnar store of an output directory
+
+        Raises:
+            FileNotFoundError: If the directory has no (current format) store
+        """
+        self.output_directory = str(output_directory)
+        self.root = os.path.join(self.output_directory, STORE_DIRECTORY)
+        manifest = load_manifest(self.output_directory)
+        if manifest is None:
+            raise FileNotFoundError(f"No columnar store in {self.output_directory}")
+        if manifest["format"] == "parquet" and pq is None:
+            raise FileNotFoundError(f"The columnar store in {self.output_directory} is Parquet, "
+                                    f"which needs pyarrow")
+        self.manifest = manifest
+        self.format = manifest["format"]
+
+    @property
+    def partitions(self) -> List[Dict[str, Any]]:
+        return self.manifest["partitions"]
+
+    def frequencies(self, source: str = "eso") -> List[str]:
+        """Reporting frequencies stored for a source, finest first"""
+        present = {p["frequency"] for p in self.partitions if p["source"] == source}
+        return [f for f in FREQUENCIES if f in present]
+
+    def find(self, variables: Optional[Iterable[Union[str, int]]] = None, frequency: Optional[str] = None,
+             source: str = "eso") -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Partitions and keys named by selectors
+
+        Args:
+            variables: Selectors as in read_eso: variable name (all keys),
+                       "KEY:Variable Name", column label or report id;
+                       case-insensitive (default: all)
+            frequency: Reporting frequency (default: all)
+            source: "eso" for output variables, "mtr" for meters
+
+        Returns:
+            List of (partition, selected keys)
+        """
+        selectors = {str(s).casefold() for s in variables} if variables is not None else None
+        matches = []
+        for partition in self.partitions:
+            if partition["source"] != source or (frequency and partition["frequency"] != frequency):
+                continue
+            if selectors is None or partition["variable"].casefold() in selectors:
+                matches.append((partition, partition["keys"]))
+                continue
+            keys = [key for key in partition["keys"]
+                    if f"{key['key']}:{partition['variable']}".casefold() in selectors
+                    or key["label"].casefold() in selectors
+                    or str(key["report_id"]) in selectors]
+            if keys:
+                matches.append((partition, keys))
+        return matches
+
+    def load(self, variables: Optional[Iterable[Union[str, int]]] = None, frequency: Optional[str] = None,
+             source: str = "eso", environment: Optional[Union[int, str]] = None, stamps: bool = False):
+        """
+        Selected series of one frequency as a pandas DataFrame
+
+        Columns are "Date/Time" (datetime64, NaT for run period values) and one
+        column per key, labelled like ReadVarsESO's CSV; with ``stamps`` also
+        "Environment" (index) and "Day Type" (name, empty for monthly and coarser).
+
+        Args:
+            variables: Selectors (see find; default: all)
+            frequency: Frequency to load (default: the finest one of the matches)
+            source: "eso" for output variables, "mtr" for meters
+            environment: Environment index or title to include (default: all)
+            stamps: Include the environment and day type columns
+
+        Raises:
+            ValueError: If no stored series matches
+        """
+        import pandas as pd
+
+        matches = self.find(variables, frequency, source)
+        if not matches:
+            raise ValueError(f"No stored {source} series match {list(variables) if variables else 'any'}"
+                             + (f" at {frequency} frequency" if frequency else ""))
+        if frequency is None:
+            frequency = next(f for f in FREQUENCIES if any(p["frequency"] == f for p, _ in matches))
+            matches = [(p, keys) for p, keys in matches if p["frequency"] == frequency]
+
+        stamp_names = list(_STAMP_COLUMNS.values())
+        stamp_frames, value_frames = [], []
+        for partition, keys in matches:
+            columns = _read_partition(os.path.join(self.root, partition["file"]),
+                                      stamp_names + [key["column"] for key in keys], self.format)
+            index = pd.Index(columns["row"], name="Row")
+            stamp_frames.append(pd.DataFrame({stamp: columns[column] for stamp, column in _STAMP_COLUMNS.items()
+                                              if stamp != "Row"}, index=index))
+            value_frames.append(pd.DataFrame({key["label"]: columns[key["column"]] for key in keys}, index=index))
+
+        # Partitions of one source and frequency share its stamp rows; join on them
+        stamp_frame = pd.concat(stamp_frames)
+        stamp_frame = stamp_frame[~stamp_frame.index.duplicated()]
+        frame = stamp_frame.join(pd.concat(value_frames, axis=1), how="left").sort_index()
+
+        if environment is not None:
+            names = self.manifest["environments"].get(source, [])
+            env_index = names.index(environment) if isinstance(environment, str) else environment
+            frame = frame[frame["Environment"] == env_index]
+        if stamps:
+            day_names = np.array(DAY_TYPES + ("",), dtype=object)
+            frame["Day Type"] = day_names[frame["Day Type"].to_numpy(np.int64)]
+        else:
+            frame = frame.drop(columns=["Environment", "Day Type"])
+        return frame.reset_index(drop=True)
@@ -0,0 +1,65 @@
+"""
+Downsampling of long time series for plotting in EnergyPlus MCP Server.
+Implements Largest-Triangle-Three-Buckets (LTTB) selection with NumPy, so an
+annual timestep series can be drawn from a few thousand points that keep its
+peaks and shape.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps
+
+    The first and last points are always kept. The points between them are
+    split into ``threshold - 2`` buckets of equal count, and each bucket keeps
+    the point that forms the largest triangle with the means of the previous
+    and the next bucket. Classic LTTB anchors on the point kept in the previous
+    bucket instead of its mean, which makes it sequential; with mean anchors
+    every bucket is evaluated at once.
+
+    Args:
+        x: Increasing x values (numbers or datetime64)
+        y: y values without NaN
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted int64 indices into x and y (all of them when len(x) <= threshold)
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n, dtype=np.int64)
+
+    x = np.asarray(x)
+    x = (x.astype("datetime64[s]").astype(np.int64) if x.dtype.kind == "M" else x).astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Interior points 1..n-2 split into buckets of (nearly) equal count
+    buckets = threshold - 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.int64)
+    counts = np.diff(edges)
+    bucket = np.repeat(np.arange(buckets), counts)
+    x_mean = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    y_mean = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+
+    # Anchors: mean of the previous bucket (first point for the first bucket) and of the next one
+    ax = np.concatenate(([x[0]], x_mean[:-1]))[bucket]
+    ay = np.concatenate(([y[0]], y_mean[:-1]))[bucket]
+    cx = np.concatenate((x_mean[1:], [x[-1]]))[bucket]
+    cy = np.concatenate((y_mean[1:], [y[-1]]))[bucket]
+    bx, by = x[1:n - 1], y[1:n - 1]
+    area = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+
+    # Largest area per bucket: sort by (bucket, -area) and take each bucket's first entry
+    order = np.lexsort((-area, bucket))
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    chosen = order[first] + 1
+    return np.concatenate(([0], np.sort(chosen), [n - 1])).astype(np.int64)
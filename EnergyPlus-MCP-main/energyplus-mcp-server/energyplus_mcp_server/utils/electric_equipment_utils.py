@@ -12,7 +12,8 @@ See License.txt in the parent directory for license details.
 
 import logging
 from typing import Dict, List, Any, Optional
-from eppy.modeleditor import IDF
+
+from .model_cache import ModelCache, get_model_cache
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +41,9 @@ class ElectricEquipmentManager:
         "Data Center": 215.0
     }
     
-    def __init__(self):
-        """Initialize the ElectricEquipment manager"""
-        pass
+    def __init__(self, model_cache: Optional[ModelCache] = None):
+        """Initialize the ElectricEquipment manager with the shared model cache"""
+        self.model_cache = model_cache or get_model_cache()
     
     def get_electric_equipment_objects(self, idf_path: str) -> Dict[str, Any]:
         """
@@ -55,7 +56,7 @@ class ElectricEquipmentManager:
             Dictionary with electric equipment objects information
         """
         try:
-            idf = IDF(idf_path)
+            idf = self.model_cache.get_model(idf_path)
             equipment_objects = idf.idfobjects.get("ElectricEquipment", [])
             
             result = {
@@ -154,20 +155,22 @@ class ElectricEquipmentManager:
         return None
     
     def modify_electric_equipment_objects(self, idf_path: str, modifications: List[Dict[str, Any]], 
-                                         output_path: str) -> Dict[str, Any]:
+                                         output_path: Optional[str], idf=None) -> Dict[str, Any]:
         """
         Modify ElectricEquipment objects in the IDF file
         
         Args:
             idf_path: Path to the input IDF file
             modifications: List of modification specifications
-            output_path: Path for the output IDF file
+            output_path: Path for the output IDF file (None leaves the model unsaved)
+            idf: Already open writable model to edit (e.g. from a model session)
             
         Returns:
             Dictionary with modification results
         """
         try:
-            idf = IDF(idf_path)
+            if idf is None:
+                idf = self.model_cache.get_model(idf_path, read_only=False)
             equipment_objects = idf.idfobjects.get("ElectricEquipment", [])
             
             result = {
@@ -214,8 +217,9 @@ class ElectricEquipmentManager:
                 except Exception as e:
                     result["errors"].append(f"Error processing modification: {str(e)}")
             
-            # Save the modified IDF
-            idf.save(output_path)
+            # Save the modified IDF (session models stay in memory until the session is saved)
+            if output_path:
+                idf.save(output_path)
             result["total_modifications_applied"] = len(result["modifications_applied"])
             
             logger.info(f"Applied {len(result['modifications_applied'])} modifications to ElectricEquipment objects")
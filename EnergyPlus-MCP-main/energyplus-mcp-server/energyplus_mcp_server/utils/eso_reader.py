@@ -0,0 +1,431 @@
+"""
+Streaming reader for EnergyPlus .eso/.mtr output files.
+Reads the data dictionary and the data section line by line into one typed
+NumPy array per selected variable, plus a table of time stamps per reporting
+frequency, without ReadVarsESO or an intermediate CSV.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import re
+import logging
+import calendar
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Time stamp record of each reporting frequency (record id in the data section)
+_FREQUENCY_STAMPS = {
+    "Each Call": "2", "Detailed": "2", "TimeStep": "2", "Hourly": "2",
+    "Daily": "3", "Monthly": "4", "RunPeriod": "5", "Annual": "6"
+}
+
+# Fields of each time stamp record, after the record id
+_STAMP_FIELDS = {
+    "2": ("day_of_simulation", "month", "day", "dst", "hour", "start_minute", "end_minute", "day_type"),
+    "3": ("day_of_simulation", "month", "day", "dst", "day_type"),
+    "4": ("day_of_simulation", "month"),
+    "5": ("day_of_simulation",),
+    "6": ("year",),
+}
+
+# Frequencies from finest to coarsest
+FREQUENCIES = ("Each Call", "Detailed", "TimeStep", "Hourly", "Daily", "Monthly", "RunPeriod", "Annual")
+
+DAY_TYPES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Holiday",
+             "SummerDesignDay", "WinterDesignDay", "CustomDay1", "CustomDay2")
+
+_DICTIONARY_END = "End of Data Dictionary"
+_DATA_END = "End of Data"
+
+_DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+
+# ReadVarsESO CSV stamp: " MM/DD  HH:MM:SS" (hourly and finer) or " MM/DD" (daily); monthly rows hold month names
+_CSV_STAMP = re.compile(r"(\d+)/(\d+)(?:\s+(\d+):(\d+))?")
+
+
+def _stamp_times(table: Dict[str, np.ndarray], stamp_id: str, rows: np.ndarray, year: int) -> np.ndarray:
+    """Calendar time stamps (datetime64[m]) of rows of a stamp table (see EsoData.timestamps)"""
+    if stamp_id == "5" or not len(rows):
+        return np.full(len(rows), np.datetime64("NaT"), dtype="datetime64[m]")
+    if stamp_id == "6":
+        return (table["year"][rows] - 1970).astype("datetime64[Y]").astype("datetime64[m]")
+
+    month = table["month"][rows].astype(np.int64)
+    day = table["day"][rows].astype(np.int64) if "day" in table else np.ones(len(rows), dtype=np.int64)
+    leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+    day_of_year = _DAYS_BEFORE_MONTH[month - 1] + day - 1 + ((month > 2) & leap)
+    minutes = day_of_year * 1440
+    if stamp_id == "2":
+        minutes = minutes + (table["hour"][rows].astype(np.int64) - 1) * 60 + table["end_minute"][rows]
+    return np.datetime64(f"{year}-01-01", "m") + minutes.astype("timedelta64[m]")
+
+
+def _fixed_width_fields(stamps) -> Optional[Tuple[np.ndarray, ...]]:
+    """Month, day, hour and minute of stamps that all read "MM/DD  HH:MM:SS", else None"""
+    try:
+        raw = np.array(stamps.tolist(), dtype="S")
+    except UnicodeEncodeError:
+        return None
+    if not len(raw) or raw.dtype.itemsize != 15:
+        return None
+    chars = raw.view(np.uint8).reshape(-1, 15)
+    digits = chars[:, [0, 1, 3, 4, 7, 8, 10, 11]].astype(np.int64) - ord("0")
+    if not ((chars[:, 2] == ord("/")).all() and (chars[:, 9] == ord(":")).all()
+            and ((digits >= 0) & (digits <= 9)).all()):
+        return None
+    numbers = digits[:, 0::2] * 10 + digits[:, 1::2]
+    return numbers[:, 0], numbers[:, 1], numbers[:, 2], numbers[:, 3]
+
+
+def parse_csv_timestamps(stamps, year: int = 2001) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized time stamps of a ReadVarsESO CSV "Date/Time" column
+
+    Stamps are end-of-interval like in the .eso, so "24:00:00" rolls over to
+    00:00 of the next day. Daily rows are stamped at the start of their day and
+    monthly rows (month names) at the start of their month; rows without a
+    calendar stamp (run period) are NaT. The CSV does not mark where one
+    environment (design day, run period) ends, so a new environment is assumed
+    wherever the finest kind of stamp present goes backwards in time; coarser
+    rows, which follow the rows they summarize, belong to the environment of
+    the preceding finest row.
+
+    Args:
+        stamps: pandas Series of the "Date/Time" column
+        year: Calendar year for the time stamps
+
+    Returns:
+        (datetime64[m] time stamps, environment index per row)
+    """
+    stamps = stamps.astype(str).str.strip()
+    fields = _fixed_width_fields(stamps)
+    if fields is not None:
+        # The usual hourly or timestep CSV: read the digits in place
+        month, day, hour, minute = fields
+        valid = np.ones(len(month), dtype=bool)
+        kind = np.zeros(len(month), dtype=np.int64)
+    else:
+        parts = stamps.str.extract(_CSV_STAMP).astype(float)
+        month_numbers = {name: number for number, name in enumerate(calendar.month_name) if name}
+        month = parts[0].fillna(stamps.map(month_numbers)).to_numpy()
+        valid = ~np.isnan(month)
+        month = np.where(valid, month, 1).astype(np.int64)
+        day = parts[1].fillna(1).to_numpy(np.int64)
+        hour = parts[2].fillna(0).to_numpy(np.int64)
+        minute = parts[3].fillna(0).to_numpy(np.int64)
+        # Stamp kind: 0 = date and time, 1 = date only, 2 = month name
+        kind = np.where(parts[2].notna().to_numpy(), 0, np.where(parts[1].notna().to_numpy(), 1, 2))
+
+    leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+    day_of_year = _DAYS_BEFORE_MONTH[month - 1] + day - 1 + ((month > 2) & leap)
+    minutes = day_of_year * 1440 + hour * 60 + minute
+    times = np.datetime64(f"{year}-01-01", "m") + minutes.astype("timedelta64[m]")
+    times[~valid] = np.datetime64("NaT")
+
+    finest = np.flatnonzero(valid & (kind == kind[valid].min())) if valid.any() else np.array([], dtype=np.int64)
+    restarts = np.zeros(len(times), dtype=np.int32)
+    restarts[finest[1:]] = minutes[finest[1:]] < minutes[finest[:-1]]
+    return times, np.cumsum(restarts).astype(np.int32)
+
+
+class EsoVariable:
+    """One entry of the .eso data dictionary (an output variable or a meter)"""
+
+    __slots__ = ("report_id", "key", "name", "units", "frequency")
+
+    def __init__(self, report_id: int, key: str, name: str, units: str, frequency: str):
+        self.report_id = report_id
+        self.key = key  # empty for meters
+        self.name = name
+        self.units = units
+        self.frequency = frequency
+
+    @property
+    def label(self) -> str:
+        """Column header ReadVarsESO writes for this variable"""
+        prefix = f"{self.key}:" if self.key else ""
+        return f"{prefix}{self.name} [{self.units}]({self.frequency})"
+
+    def matches(self, selectors: set) -> bool:
+        """True if any case-folded selector names this variable (see read_eso)"""
+        return (self.name.casefold() in selectors
+                or f"{self.key}:{self.name}".casefold() in selectors
+                or self.label.casefold() in selectors
+                or str(self.report_id) in selectors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"report_id": self.report_id, "key": self.key, "name": self.name,
+                "units": self.units, "frequency": self.frequency}
+
+
+def _parse_dictionary_line(line: str) -> Optional[EsoVariable]:
+    """Parse 'id,fields,key,name [units] !Frequency [...]'; None for time stamp and malformed entries"""
+    body, _, comment = line.partition("!")
+    parts = body.split(",")
+    if len(parts) < 3 or parts[0].strip() in _STAMP_FIELDS or parts[0].strip() == "1":
+        return None
+    try:
+        report_id = int(parts[0])
+    except ValueError:
+        return None
+    if len(parts) >= 4:
+        key, name_units = parts[2].strip(), ",".join(parts[3:]).strip()
+    else:
+        key, name_units = "", parts[2].strip()  # meters have no key
+    name, units = name_units, ""
+    if name_units.endswith("]") and "[" in name_units:
+        name, _, units = name_units[:-1].rpartition("[")
+        name, units = name.strip(), units.strip()
+    frequency = comment.split("[")[0].strip() or "Hourly"
+    return EsoVariable(report_id, key, name, units, frequency)
+
+
+def read_eso_dictionary(eso_path: Union[str, Path]) -> List[EsoVariable]:
+    """
+    Read only the data dictionary of an .eso/.mtr file
+
+    Raises:
+        ValueError: If the file has no complete data dictionary
+    """
+    variables = []
+    with open(eso_path, "r", encoding="utf-8", errors="replace") as f:
+        next(f, None)  # Program Version line
+        for line in f:
+            if line.startswith(_DICTIONARY_END):
+                return variables
+            variable = _parse_dictionary_line(line)
+            if variable is not None:
+                variables.append(variable)
+    raise ValueError(f"No complete data dictionary in {eso_path}")
+
+
+class EsoData:
+    """Selected series of an .eso file
+
+    ``values[report_id]`` holds the values of one variable and ``rows[report_id]``
+    the index of each value's time stamp in ``stamps[frequency stamp id]``, a
+    table of NumPy columns (environment, month, day, hour, ...). Daily and
+    coarser variables keep only their aggregated value, not the minimum and
+    maximum EnergyPlus writes next to it.
+    """
+
+    def __init__(self, path: str, variables: Dict[int, EsoVariable], environments: List[str],
+                 values: Dict[int, np.ndarray], rows: Dict[int, np.ndarray],
+                 stamps: Dict[str, Dict[str, np.ndarray]]):
+        self.path = path
+        self.variables = variables
+        self.environments = environments
+        self.values = values
+        self.rows = rows
+        self.stamps = stamps
+
+    def find(self, selector: Union[str, int]) -> List[EsoVariable]:
+        """Variables named by a selector (name, KEY:name, column label or report id)"""
+        selectors = {str(selector).casefold()}
+        return [var for var in self.variables.values() if var.matches(selectors)]
+
+    def timestamps(self, report_id: int, year: int = 2001) -> np.ndarray:
+        """
+        End-of-interval time stamps of one variable as datetime64[m]
+
+        Hour 24 rolls over to 00:00 of the next day. Daily values are stamped at
+        the start of their day and monthly ones at the start of their month; run
+        period values have no calendar date (NaT). ``year`` only places the dates
+        on a calendar; EnergyPlus does not write one for sub-annual frequencies.
+        """
+        stamp_id = _FREQUENCY_STAMPS.get(self.variables[report_id].frequency, "2")
+        return _stamp_times(self.stamps[stamp_id], stamp_id, self.rows[report_id], year)
+
+    def columns(self, frequency: str, report_ids: Optional[Iterable[int]] = None,
+                environment: Optional[Union[int, str]] = None, year: int = 2001) -> Dict[str, np.ndarray]:
+        """
+        Time stamp and value columns of variables reporting at one frequency
+
+        Rows are the union of the variables' time stamps; a variable that did not
+        report at a row holds NaN there.
+
+        Args:
+            frequency: Reporting frequency of the variables
+            report_ids: Variables to include (default: every selected one at that frequency)
+            environment: Environment index or title to include (default: all)
+            year: Calendar year for the time stamps (see timestamps)
+
+        Returns:
+            {"Row": stamp table index, "Date/Time": datetime64[m], "Environment": index,
+            "Day Type": DAY_TYPES index (-1 for monthly and coarser), then one array
+            per variable label}
+        """
+        if report_ids is None:
+            selected = [var for var in self.variables.values() if var.frequency == frequency]
+        else:
+            selected = [self.variables[rid] for rid in report_ids if self.variables[rid].frequency == frequency]
+        if not selected:
+            raise ValueError(f"No selected variables report at {frequency} frequency")
+
+        rows = np.unique(np.concatenate([self.rows[var.report_id] for var in selected]))
+        stamp_id = _FREQUENCY_STAMPS.get(frequency, "2")
+        table = self.stamps[stamp_id]
+        if environment is not None:
+            env_index = self.environments.index(environment) if isinstance(environment, str) else environment
+            rows = rows[table["environment"][rows] == env_index]
+
+        columns = {
+            "Row": rows,
+            "Date/Time": _stamp_times(table, stamp_id, rows, year),
+            "Environment": table["environment"][rows],
+            "Day Type": table["day_type"][rows] if "day_type" in table else np.full(len(rows), -1, dtype=np.int32)
+        }
+        for var in selected:
+            column = np.full(len(rows), np.nan, dtype=self.values[var.report_id].dtype)
+            positions = np.searchsorted(rows, self.rows[var.report_id])
+            present = (positions < len(rows))
+            present[present] = rows[positions[present]] == self.rows[var.report_id][present]
+            column[positions[present]] = self.values[var.report_id][present]
+            columns[var.label] = column
+        return columns
+
+    def to_frame(self, frequency: Optional[str] = None, environment: Optional[Union[int, str]] = None,
+                 year: int = 2001):
+        """
+        Selected variables of one frequency as a pandas DataFrame
+
+        Columns are a "Date/Time" column of datetime64 values followed by one column
+        per variable, labelled like ReadVarsESO's CSV. Time stamps that some
+        variable did not report hold NaN for it.
+
+        Args:
+            frequency: Frequency to include (default: the only one present)
+            environment: Environment index or title to include (default: all)
+            year: Calendar year for the time stamps (see timestamps)
+        """
+        import pandas as pd
+
+        frequencies = {var.frequency for var in self.variables.values()}
+        if frequency is None:
+            if len(frequencies) > 1:
+                raise ValueError(f"Variables have several frequencies {sorted(frequencies)}; choose one")
+            frequency = next(iter(frequencies), "Hourly")
+
+        columns = self.columns(frequency, environment=environment, year=year)
+        for stamp in ("Row", "Environment", "Day Type"):
+            del columns[stamp]
+        return pd.DataFrame(columns)
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-serializable description of what was read"""
+        return {
+            "path": self.path,
+            "environments": self.environments,
+            "variables": [{**var.to_dict(), "values": int(len(self.values[rid]))}
+                          for rid, var in self.variables.items()],
+            "stamps": {stamp_id: len(table["environment"]) for stamp_id, table in self.stamps.items()}
+        }
+
+
+def read_eso(eso_path: Union[str, Path], variables: Optional[Iterable[Union[str, int]]] = None,
+             frequencies: Optional[Iterable[str]] = None, dtype=np.float64) -> EsoData:
+    """
+    Stream an .eso/.mtr file into per-variable arrays
+
+    Data lines of unselected variables are skipped after reading their record id,
+    so their values are never converted or stored.
+
+    Args:
+        eso_path: Path to the .eso or .mtr file
+        variables: Selectors of the variables to read, each a variable name (all
+                   keys), "KEY:Variable Name", a column label as written by
+                   ReadVarsESO, or a report id; case-insensitive (default: all)
+        frequencies: Reporting frequencies to read, e.g. ["Hourly"] (default: all)
+        dtype: NumPy dtype of the value arrays (np.float32 halves their memory)
+
+    Returns:
+        EsoData with the selected variables
+
+    Raises:
+        ValueError: If the file has no complete data dictionary
+    """
+    eso_path = str(eso_path)
+    selectors = {str(s).casefold() for s in variables} if variables is not None else None
+    frequency_set = set(frequencies) if frequencies is not None else None
+    typecode = "f" if np.dtype(dtype) == np.float32 else "d"
+
+    selected: Dict[str, EsoVariable] = {}  # record id as written -> variable
+    value_buffers: Dict[str, array] = {}
+    row_buffers: Dict[str, array] = {}
+    stamp_buffers = {stamp_id: {name: array("i") for name in ("environment",) + fields}
+                     for stamp_id, fields in _STAMP_FIELDS.items()}
+    stamp_rows = {stamp_id: -1 for stamp_id in _STAMP_FIELDS}
+    environments: List[str] = []
+    day_type_codes = {name: code for code, name in enumerate(DAY_TYPES)}
+
+    with open(eso_path, "r", encoding="utf-8", errors="replace", buffering=1024 * 1024) as f:
+        next(f, None)  # Program Version line
+        for line in f:
+            if line.startswith(_DICTIONARY_END):
+                break
+            variable = _parse_dictionary_line(line)
+            if variable is None:
+                continue
+            if frequency_set is not None and variable.frequency not in frequency_set:
+                continue
+            if selectors is not None and not variable.matches(selectors):
+                continue
+            record_id = str(variable.report_id)
+            selected[record_id] = variable
+            value_buffers[record_id] = array(typecode)
+            row_buffers[record_id] = array("i")
+        else:
+            raise ValueError(f"No complete data dictionary in {eso_path}")
+
+        # Bound appends and stamp record of each selected variable, looked up once per data line
+        targets = {rid: (value_buffers[rid].append, row_buffers[rid].append,
+                         _FREQUENCY_STAMPS.get(var.frequency, "2")) for rid, var in selected.items()}
+        environment = -1
+        for line in f:
+            record_id, _, rest = line.partition(",")
+            target = targets.get(record_id)
+            if target is not None:
+                append_value, append_row, stamp_id = target
+                comma = rest.find(",")
+                append_value(float(rest if comma < 0 else rest[:comma]))
+                append_row(stamp_rows[stamp_id])
+            elif record_id in stamp_rows:
+                fields = rest.rstrip("\n").split(",")
+                columns = stamp_buffers[record_id]
+                columns["environment"].append(environment)
+                for i, name in enumerate(_STAMP_FIELDS[record_id]):
+                    raw = fields[i].strip() if i < len(fields) else ""
+                    if name == "day_type":
+                        columns[name].append(day_type_codes.get(raw, -1))
+                    else:
+                        columns[name].append(int(float(raw)) if raw else -1)
+                stamp_rows[record_id] += 1
+            elif record_id == "1":
+                environments.append(rest.split(",")[0].strip())
+                environment += 1
+            elif line.startswith(_DATA_END):
+                break
+
+    stamps = {stamp_id: {name: np.frombuffer(column, dtype=np.int32) for name, column in columns.items()}
+              for stamp_id, columns in stamp_buffers.items()}
+
+    result = EsoData(
+        eso_path,
+        {var.report_id: var for var in selected.values()},
+        environments,
+        {var.report_id: np.frombuffer(value_buffers[rid], dtype=typecode) for rid, var in selected.items()},
+        {var.report_id: np.frombuffer(row_buffers[rid], dtype=np.int32) for rid, var in selected.items()},
+        stamps
+    )
+    logger.debug(f"Read {len(selected)} variables over {len(environments)} environments from {eso_path}")
+    return result
@@ -0,0 +1,228 @@
+"""
+HTML tabular report extractor for EnergyPlus MCP Server.
+Streams the *Table.htm EnergyPlus writes by default into one compact entry per
+report table, and caches the tables as JSON next to the report, keyed by the
+hash of the HTML, so later queries skip the parse.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import re
+import json
+import html
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from .file_hashing import file_sha256
+from .sql_results import _cell_value
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached table layout changes so old cache files are re-parsed
+TABLES_FORMAT = 1
+
+CACHE_SUFFIX = ".tables.json"
+
+HTML_PATTERNS = ("*Table.htm", "*Table.html", "*tbl.htm", "*tbl.html")
+
+# Reports start with an anchor named "<ReportName>::<For without spaces>"
+_ANCHOR = re.compile(r"<a name=\"?([^\">:]+)::")
+_REPORT = re.compile(r"<p>Report:<b>(.*?)</b>")
+_FOR = re.compile(r"<p>For:<b>(.*?)</b>")
+# The last bold line before a table is its name ("Values gathered over ..." lines come first)
+_BOLD = re.compile(r"^<b>(.*?)</b><br>")
+_CELL = re.compile(r"<td[^>]*>(.*?)</td>")
+_TAG = re.compile(r"<[^>]+>")
+_UNITS = re.compile(r"^(.*?)\s*\[([^\[\]]*)\]$")
+
+
+def find_html_tables(output_directory: Union[str, Path]) -> Optional[Path]:
+    """Return the HTML tabular report of a run (eplustbl.htm first, else the newest), or None"""
+    output_dir = Path(output_directory)
+    preferred = output_dir / "eplustbl.htm"
+    if preferred.is_file():
+        return preferred
+    candidates = [path for pattern in HTML_PATTERNS for path in output_dir.glob(pattern)]
+    return max(candidates, key=lambda path: path.stat().st_mtime) if candidates else None
+
+
+def _cell_text(text: str) -> str:
+    """Text of a cell, without inline tags and entities"""
+    if "<" in text:
+        text = _TAG.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text.strip()
+
+
+def parse_html_tables(html_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Extract every table of an EnergyPlus HTML tabular report
+
+    The file is read line by line: EnergyPlus writes each cell on its own line,
+    so no document tree is built.
+
+    Args:
+        html_path: Path of the *Table.htm file
+
+    Returns:
+        List of {"report", "title", "report_for", "table", "columns", "rows"} in file
+        order. "report" is the report name as in the SQLite output (e.g.
+        "AnnualBuildingUtilityPerformanceSummary"), "title" its heading, "columns" the
+        header labels with units, and each row is [row name, values...] with numeric
+        values as floats.
+    """
+    tables = []
+    report = title = report_for = table_name = None
+    current = row = None
+    with open(html_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if current is not None:
+                # Most lines of the file are cells, so test for them first
+                if "<tr" in line:
+                    row = []
+                if "<td" in line and row is not None:
+                    row.extend(_cell_text(text) for text in _CELL.findall(line))
+                if "</tr>" in line and row is not None:
+                    if current["columns"] is None:
+                        current["columns"] = row[1:]
+                    else:
+                        current["rows"].append([row[0]] + [_cell_value(value) for value in row[1:]])
+                    row = None
+                if "</table>" in line:
+                    tables.append(current)
+                    current = None
+                continue
+
+            if line.startswith("<table"):
+                current = {"report": report, "title": title, "report_for": report_for,
+                           "table": table_name, "columns": None, "rows": []}
+                table_name = None
+            elif line.startswith("<b>"):
+                match = _BOLD.match(line)
+                if match:
+                    table_name = _cell_text(match.group(1))
+            elif line.startswith("<a name="):
+                match = _ANCHOR.match(line)
+                if match:
+                    report, title, report_for, table_name = match.group(1), None, None, None
+            elif line.startswith("<p>Report:"):
+                match = _REPORT.match(line)
+                if match:
+                    title = _cell_text(match.group(1))
+            elif line.startswith("<p>For:"):
+                match = _FOR.match(line)
+                if match:
+                    report_for = _cell_text(match.group(1))
+
+    for entry in tables:
+        entry["columns"] = entry["columns"] or []
+        entry["report"] = entry["report"] or (entry["title"] or "").replace(" ", "")
+    return tables
+
+
+def _cache_path(html_path: Path) -> Path:
+    return html_path.with_name(html_path.stem + CACHE_SUFFIX)
+
+
+def load_html_tables(html_path: Union[str, Path], use_cache: bool = True) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Tables of an HTML tabular report, from the JSON cache next to it when its hash matches
+
+    A miss parses the report and rewrites the cache. A directory that cannot be
+    written only costs the cache, with a warning.
+
+    Args:
+        html_path: Path of the *Table.htm file
+        use_cache: Read and write the cache file
+
+    Returns:
+        Tuple of the tables (see parse_html_tables) and whether they came from the cache
+    """
+    html_path = Path(html_path)
+    if not use_cache:
+        return parse_html_tables(html_path), False
+
+    digest = file_sha256(str(html_path))
+    cache_path = _cache_path(html_path)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("format") == TABLES_FORMAT and cached.get("sha256") == digest:
+            return cached["tables"], True
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable table cache {cache_path}: {e}")
+
+    tables = parse_html_tables(html_path)
+    payload = {"format": TABLES_FORMAT, "source": html_path.name, "sha256": digest, "tables": tables}
+    try:
+        # Write to a temp file first so a concurrent reader never sees a partial cache
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write table cache {cache_path}: {e}")
+    return tables, False
+
+
+def html_table_index(tables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reports and tables with their cell counts, like SqlResults.tabular_index"""
+    return [{"report": entry["report"], "report_for": entry["report_for"], "table": entry["table"],
+             "cells": len(entry["rows"]) * len(entry["columns"])} for entry in tables]
+
+
+def html_table_cells(tables: List[Dict[str, Any]], report: Optional[str] = None, table: Optional[str] = None,
+                     report_for: Optional[str] = None, rows: Optional[List[str]] = None,
+                     columns: Optional[List[str]] = None, limit: int = 2000) -> List[Dict[str, Any]]:
+    """
+    Cells of the tables, filtered and shaped like SqlResults.tabular
+
+    Names match exactly, ignoring case; a report matches by name or by title.
+
+    Returns:
+        List of {"report", "report_for", "table", "row", "column", "units", "value"} in
+        file order, row by row
+    """
+    def wanted(values):
+        return {str(value).casefold() for value in values} if values else None
+
+    row_names, column_names = wanted(rows), wanted(columns)
+    cells = []
+    for entry in tables:
+        if report and report.casefold() not in ((entry["report"] or "").casefold(), (entry["title"] or "").casefold()):
+            continue
+        if table and table.casefold() != (entry["table"] or "").casefold():
+            continue
+        if report_for and report_for.casefold() != (entry["report_for"] or "").casefold():
+            continue
+        labels = []
+        for label in entry["columns"]:
+            match = _UNITS.match(label)
+            labels.append((match.group(1), match.group(2)) if match else (label, None))
+        for name, *values in entry["rows"]:
+            if row_names is not None and name.casefold() not in row_names:
+                continue
+            for (column, units), value in zip(labels, values):
+                if column_names is not None and column.casefold() not in column_names:
+                    continue
+                cells.append({"report": entry["report"], "report_for": entry["report_for"], "table": entry["table"],
+                              "row": name, "column": column, "units": units, "value": value})
+                if len(cells) >= limit:
+                    return cells
+    return cells
@@ -0,0 +1,190 @@
+"""
+Pre-compiled IDD snapshots for EnergyPlus MCP Server.
+Parsing Energy+.idd is the dominant cost of the first model load. The parsed eppy
+structures are pickled once per IDD and reloaded on later server starts.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import gc
+import time
+import pickle
+import hashlib
+import logging
+import tempfile
+from typing import Dict, Any, Optional
+
+import eppy
+from eppy.modeleditor import IDF
+from eppy.idfreader import iddversiontuple
+from eppy.EPlusInterfaceFunctions import parse_idd
+
+from .file_hashing import file_sha256
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled payload layout changes
+SNAPSHOT_FORMAT = 1
+
+
+def get_snapshot_key(idd_path: str) -> Dict[str, Any]:
+    """
+    Build the identity of an IDD snapshot
+
+    Args:
+        idd_path: Path to the Energy+.idd file
+
+    Returns:
+        Dictionary with the resolved path, content hash, IDD version and the
+        eppy/pickle details the snapshot depends on
+    """
+    path = os.path.realpath(idd_path)
+    return {
+        "idd_path": path,
+        "sha256": file_sha256(path),
+        "idd_version": ".".join(str(v) for v in iddversiontuple(path)),
+        "eppy_version": getattr(eppy, "__version__", "unknown"),
+        "format": SNAPSHOT_FORMAT,
+        "protocol": pickle.HIGHEST_PROTOCOL
+    }
+
+
+def get_snapshot_path(key: Dict[str, Any], cache_dir: str) -> str:
+    """Return the snapshot file location for a snapshot key"""
+    ident = "|".join(str(key[k]) for k in sorted(key))
+    name_hash = hashlib.sha256(ident.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"idd_{key['idd_version']}_{name_hash}.pkl")
+
+
+def parse_idd_file(idd_path: str) -> tuple:
+    """
+    Parse an IDD with eppy's reader
+
+    Returns:
+        (idd_info, idd_index, block, idd_version) in the order IDF.setidd expects
+    """
+    block, _, commdct, idd_index = parse_idd.extractidddata(idd_path)
+    return commdct, idd_index, block, iddversiontuple(idd_path)
+
+
+def write_idd_snapshot(key: Dict[str, Any], payload: tuple, cache_dir: str) -> str:
+    """
+    Write a parsed IDD payload to the snapshot cache
+
+    Args:
+        key: Snapshot key from get_snapshot_key
+        payload: Parsed IDD structures from parse_idd_file
+        cache_dir: Directory that holds snapshot files
+
+    Returns:
+        Path of the written snapshot
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    snapshot_path = get_snapshot_path(key, cache_dir)
+
+    # Write to a temp file first so a concurrent reader never sees a partial snapshot
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"key": key, "payload": payload}, f, protocol=key["protocol"])
+        os.replace(tmp_path, snapshot_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(f"Wrote IDD snapshot: {snapshot_path}")
+    return snapshot_path
+
+
+def load_idd_snapshot(idd_path: str, cache_dir: str,
+                      key: Optional[Dict[str, Any]] = None) -> Optional[tuple]:
+    """
+    Load a previously written snapshot
+
+    Args:
+        idd_path: Path to the Energy+.idd file
+        cache_dir: Directory that holds snapshot files
+        key: Precomputed snapshot key (computed if omitted)
+
+    Returns:
+        (idd_info, idd_index, block, idd_version) or None if no valid snapshot exists
+    """
+    key = key or get_snapshot_key(idd_path)
+    snapshot_path = get_snapshot_path(key, cache_dir)
+    if not os.path.exists(snapshot_path):
+        return None
+
+    # The payload is hundreds of thousands of small containers; cyclic GC only slows the load
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(snapshot_path, "rb") as f:
+            data = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable IDD snapshot {snapshot_path}: {e}")
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    if not isinstance(data, dict) or data.get("key") != key:
+        logger.warning(f"Ignoring stale IDD snapshot: {snapshot_path}")
+        return None
+    return data["payload"]
+
+
+def initialize_idd(idd_path: str, cache_dir: str, use_snapshot: bool = True) -> Dict[str, Any]:
+    """
+    Point eppy at an IDD, preloading its parsed structures from a snapshot
+
+    On a snapshot miss the IDD is parsed once and the snapshot is written, so the
+    first IDF() of this and every later process skips IDD parsing.
+
+    Args:
+        idd_path: Path to the Energy+.idd file
+        cache_dir: Directory that holds snapshot files
+        use_snapshot: If False, only call IDF.setiddname (eppy parses lazily)
+
+    Returns:
+        Dictionary describing what happened (source, timing, snapshot path)
+    """
+    start = time.perf_counter()
+    IDF.setiddname(idd_path)
+
+    if not use_snapshot:
+        return {"source": "disabled", "seconds": 0.0}
+    if IDF.idd_info:
+        # Already loaded in this process
+        return {"source": "memory", "seconds": 0.0}
+
+    key = get_snapshot_key(idd_path)
+    payload = load_idd_snapshot(idd_path, cache_dir, key)
+    snapshot_path = get_snapshot_path(key, cache_dir)
+    source = "snapshot"
+
+    if payload is None:
+        source = "parsed"
+        payload = parse_idd_file(key["idd_path"])
+        try:
+            write_idd_snapshot(key, payload, cache_dir)
+        except OSError as e:
+            # Read-only cache location: keep the parsed IDD for this process anyway
+            logger.warning(f"Could not write IDD snapshot to {cache_dir}: {e}")
+            snapshot_path = None
+
+    IDF.setidd(*payload)
+    elapsed = time.perf_counter() - start
+    logger.info(f"IDD {key['idd_version']} loaded from {source} in {elapsed:.3f}s")
+    return {
+        "source": source,
+        "seconds": round(elapsed, 4),
+        "idd_version": key["idd_version"],
+        "snapshot_path": snapshot_path
+    }
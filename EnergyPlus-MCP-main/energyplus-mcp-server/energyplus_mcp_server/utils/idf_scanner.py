@@ -0,0 +1,198 @@
+"""
+Streaming IDF scanner for EnergyPlus MCP Server.
+Tokenizes IDF text into (object type, fields) tuples without building the eppy
+object graph, for summary tools that only need counts or a few objects.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+from eppy.modeleditor import IDF
+from eppy.bunchhelpers import makefieldname
+from eppy.idfreader import convertafield
+
+logger = logging.getLogger(__name__)
+
+# Same decoding eppy uses when it reads IDD/IDF text
+IDF_ENCODING = "latin-1"
+
+
+def iter_idf_objects(idf_path: str,
+                     object_types: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Stream the objects of an IDF file
+
+    Comments are stripped and objects may span any number of lines. When
+    ``object_types`` is given, other objects are skipped as soon as their type is
+    known, without splitting or storing their fields.
+
+    Args:
+        idf_path: Path to the IDF file
+        object_types: Object types to keep (case-insensitive). None keeps everything.
+
+    Yields:
+        (object type as written in the file, list of stripped field values)
+    """
+    wanted = {t.upper() for t in object_types} if object_types is not None else None
+
+    pieces: List[str] = []  # text of the current object seen so far
+    obj_type: Optional[str] = None  # known once the first comma is seen
+    skipping = False
+
+    with open(idf_path, "r", encoding=IDF_ENCODING) as f:
+        for line in f:
+            bang = line.find("!")
+            if bang >= 0:
+                line = line[:bang]
+
+            while line:
+                semi = line.find(";")
+                if semi >= 0:
+                    chunk, line = line[:semi], line[semi + 1:]
+                else:
+                    chunk, line = line, ""
+
+                if skipping:
+                    if semi >= 0:
+                        skipping = False
+                    continue
+
+                if obj_type is None:
+                    pieces.append(chunk)
+                    head = "".join(pieces)
+                    comma = head.find(",")
+                    if comma >= 0 or semi >= 0:
+                        obj_type = (head[:comma] if comma >= 0 else head).strip()
+                        if wanted is not None and obj_type.upper() not in wanted:
+                            pieces = []
+                            obj_type = None
+                            skipping = semi < 0
+                            continue
+                        pieces = [head]
+                else:
+                    pieces.append(chunk)
+
+                if semi >= 0:
+                    text = "".join(pieces)
+                    pieces = []
+                    obj_type = None
+                    parts = text.split(",")
+                    obj_name = parts[0].strip()
+                    if obj_name:
+                        yield obj_name, [p.strip() for p in parts[1:]]
+
+
+def count_idf_objects(idf_path: str,
+                      object_types: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Count objects by upper-case type without building any field lists
+
+    Args:
+        idf_path: Path to the IDF file
+        object_types: Object types to count. None counts every type in the file.
+
+    Returns:
+        Dictionary of upper-case object type -> count (requested types default to 0)
+    """
+    counts = Counter(obj_type.upper() for obj_type, _ in iter_idf_objects(idf_path, object_types))
+    if object_types is not None:
+        for obj_type in object_types:
+            counts.setdefault(obj_type.upper(), 0)
+    return dict(counts)
+
+
+class IDFFieldSchema:
+    """Field names and eppy-compatible value conversion taken from the loaded IDD"""
+
+    def __init__(self):
+        self._index: Optional[Dict[str, int]] = None
+        self._schemas: Dict[str, Tuple[List[str], list, list]] = {}
+
+    def _ensure_index(self):
+        if self._index is not None:
+            return
+        if not IDF.idd_info or not IDF.block:
+            if IDF.getiddname() is None:
+                raise RuntimeError("IDD not initialized; set it with IDF.setiddname first")
+            from .idd_snapshot import parse_idd_file
+            IDF.setidd(*parse_idd_file(IDF.getiddname()))
+        self._index = {
+            obj_fields[0].upper(): i for i, obj_fields in enumerate(IDF.block) if obj_fields
+        }
+
+    def get(self, object_type: str) -> Optional[Tuple[List[str], list, list]]:
+        """Return (eppy field names, IDD field comments, A/N field ids) for an object type"""
+        key = object_type.upper()
+        if key not in self._schemas:
+            self._ensure_index()
+            i = self._index.get(key)
+            if i is None:
+                return None
+            comm = IDF.idd_info[i]
+            names = ["key"] + [makefieldname(c["field"][0]) if c.get("field") else "" for c in comm[1:]]
+            self._schemas[key] = (names, comm, IDF.block[i])
+        return self._schemas[key]
+
+    def to_record(self, object_type: str, fields: List[str]) -> Dict[str, Any]:
+        """
+        Convert raw fields into a {field_name: value} record
+
+        Values are converted exactly as eppy converts them (reals/integers become
+        numbers, 'autosize' and blanks stay strings). Fields missing from the IDF
+        are returned as '' like eppy does; fields past the IDD definition are kept
+        under their positional id (e.g. 'N12').
+        """
+        schema = self.get(object_type)
+        if schema is None:
+            return {f"Field_{i + 1}": v for i, v in enumerate(fields)}
+        names, comm, ids = schema
+        record = {}
+        for i in range(1, max(len(names), len(fields) + 1)):
+            value = fields[i - 1] if i <= len(fields) else ""
+            if i < len(names):
+                if value:
+                    value = convertafield(comm[i], value, ids[i])
+                record[names[i]] = value
+            else:
+                record[f"Field_{i}"] = value
+        return record
+
+
+_schema = IDFFieldSchema()
+
+
+def scan_idf_records(idf_path: str, object_types: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream selected objects as field-name records
+
+    Args:
+        idf_path: Path to the IDF file
+        object_types: Object types to return (case-insensitive)
+
+    Yields:
+        (upper-case object type, {eppy field name: value})
+    """
+    for obj_type, fields in iter_idf_objects(idf_path, object_types):
+        yield obj_type.upper(), _schema.to_record(obj_type, fields)
+
+
+def group_idf_records(idf_path: str, object_types: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Collect selected objects grouped by upper-case type, in file order
+
+    Returns:
+        Dictionary of upper-case object type -> list of records (empty for absent types)
+    """
+    object_types = list(object_types)
+    grouped = {t.upper(): [] for t in object_types}
+    for obj_type, record in scan_idf_records(idf_path, object_types):
+        grouped[obj_type].append(record)
+    return grouped
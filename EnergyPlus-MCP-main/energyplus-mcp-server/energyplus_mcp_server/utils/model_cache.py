@@ -0,0 +1,241 @@
+"""
+Parsed model cache for EnergyPlus MCP Server.
+Keeps recently parsed eppy IDF models in memory so inspection tools do not re-parse
+the same file on every call.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from eppy.modeleditor import IDF
+
+logger = logging.getLogger(__name__)
+
+
+class ReadOnlyModelError(RuntimeError):
+    """Raised when an inspection tool tries to modify a cached model"""
+
+
+class ReadOnlyEpBunch:
+    """Read-only view of an eppy EpBunch object"""
+
+    __slots__ = ("_bunch",)
+
+    def __init__(self, bunch):
+        object.__setattr__(self, "_bunch", bunch)
+
+    def __getattr__(self, name):
+        return getattr(self._bunch, name)
+
+    def __getitem__(self, key):
+        return self._bunch[key]
+
+    def __setattr__(self, name, value):
+        raise ReadOnlyModelError(f"Cannot set '{name}' on a read-only model object")
+
+    def __setitem__(self, key, value):
+        raise ReadOnlyModelError(f"Cannot set '{key}' on a read-only model object")
+
+    def __eq__(self, other):
+        if isinstance(other, ReadOnlyEpBunch):
+            other = other._bunch
+        return self._bunch == other
+
+    def __hash__(self):
+        return id(self._bunch)
+
+    def __repr__(self):
+        return repr(self._bunch)
+
+
+class ReadOnlyObjects:
+    """Read-only view of ``IDF.idfobjects``
+
+    Every lookup returns a new list, so callers that extend or sort the result
+    cannot corrupt the cached model.
+    """
+
+    def __init__(self, idfobjects):
+        self._idfobjects = idfobjects
+
+    def get(self, key: str, default=None):
+        objs = self._idfobjects.get(key.upper())
+        if objs is None:
+            return default
+        return [ReadOnlyEpBunch(obj) for obj in objs]
+
+    def __getitem__(self, key: str):
+        return [ReadOnlyEpBunch(obj) for obj in self._idfobjects[key.upper()]]
+
+    def __contains__(self, key: str) -> bool:
+        return key.upper() in self._idfobjects
+
+    def keys(self):
+        return self._idfobjects.keys()
+
+
+class ReadOnlyIDF:
+    """Read-only handle on a cached eppy IDF model used by inspection tools"""
+
+    _MUTATING_METHODS = {
+        "save", "saveas", "savecopy", "newidfobject", "removeidfobject",
+        "removeallidfobjects", "popidfobject", "copyidfobject", "addidfobject",
+        "run", "rename", "setidfname",
+    }
+
+    def __init__(self, idf: IDF, idf_path: str):
+        self._idf = idf
+        self.idf_path = idf_path
+        self.idfobjects = ReadOnlyObjects(idf.idfobjects)
+
+    def getobject(self, key: str, name: str):
+        obj = self._idf.getobject(key.upper(), name)
+        return ReadOnlyEpBunch(obj) if obj is not None else None
+
+    def __getattr__(self, name):
+        if name in self._MUTATING_METHODS:
+            raise ReadOnlyModelError(
+                f"'{name}' is not allowed on a read-only model handle; open a writable copy instead"
+            )
+        return getattr(self._idf, name)
+
+
+class ModelCache:
+    """Process-wide LRU cache of parsed IDF models keyed by (path, mtime, size)"""
+
+    def __init__(self, max_entries: int = 16, max_total_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of parsed models kept in memory
+            max_total_bytes: Upper bound on the summed size of the cached IDF files
+        """
+        self.max_entries = max_entries
+        self.max_total_bytes = max_total_bytes
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], IDF, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def get_cache_key(idf_path: str) -> Tuple[str, Tuple[int, int]]:
+        """Return the normalized path and its (mtime_ns, size) signature"""
+        path = os.path.realpath(idf_path)
+        stat = os.stat(path)
+        return path, (stat.st_mtime_ns, stat.st_size)
+
+    def get_model(self, idf_path: str, read_only: bool = True):
+        """
+        Get a parsed model for the given file
+
+        Args:
+            idf_path: Resolved path to the IDF file
+            read_only: If True, return a shared read-only handle from the cache.
+                       If False, parse a private writable copy (never cached).
+
+        Returns:
+            ReadOnlyIDF handle or a writable eppy IDF instance
+        """
+        if not read_only:
+            return IDF(idf_path)
+
+        path, signature = self.get_cache_key(idf_path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                if entry[0] == signature:
+                    self._entries.move_to_end(path)
+                    self._stats["hits"] += 1
+                    logger.debug(f"Model cache hit: {path}")
+                    return ReadOnlyIDF(entry[1], path)
+                # File changed on disk since it was parsed
+                self._drop(path)
+                self._stats["invalidations"] += 1
+            self._stats["misses"] += 1
+
+        logger.debug(f"Model cache miss, parsing: {path}")
+        idf = IDF(path)
+
+        with self._lock:
+            if path in self._entries:
+                self._drop(path)
+            self._entries[path] = (signature, idf, signature[1])
+            self._total_bytes += signature[1]
+            self._evict()
+
+        return ReadOnlyIDF(idf, path)
+
+    def invalidate(self, idf_path: Optional[str] = None) -> int:
+        """
+        Drop cached models
+
+        Args:
+            idf_path: Path of the model to drop. If None, clears the whole cache.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if idf_path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._total_bytes = 0
+            else:
+                path = os.path.realpath(idf_path)
+                removed = 1 if path in self._entries else 0
+                if removed:
+                    self._drop(path)
+            self._stats["invalidations"] += removed
+            return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "cached_file_bytes": self._total_bytes,
+                "max_total_bytes": self.max_total_bytes,
+                "cached_files": list(self._entries.keys())
+            }
+
+    def _drop(self, path: str):
+        """Remove one entry (caller holds the lock)"""
+        _, _, size = self._entries.pop(path)
+        self._total_bytes -= size
+
+    def _evict(self):
+        """Evict least recently used entries until within bounds (caller holds the lock)"""
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 (self._total_bytes > self.max_total_bytes and len(self._entries) > 1)):
+            path, (_, _, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._stats["evictions"] += 1
+            logger.debug(f"Evicted model from cache: {path}")
+
+
+def get_model_cache() -> ModelCache:
+    """Get the process-wide model cache instance"""
+    if not hasattr(get_model_cache, '_cache'):
+        from ..config import get_config
+        server_config = get_config().server
+        get_model_cache._cache = ModelCache(
+            max_entries=server_config.model_cache_max_entries,
+            max_total_bytes=server_config.model_cache_max_mb * 1024 * 1024
+        )
+    return get_model_cache._cache
@@ -0,0 +1,274 @@
+"""
+Model editing sessions for EnergyPlus MCP Server.
+A session keeps one writable eppy model in memory so that a chain of edits costs
+a single parse and a single save.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from eppy.modeleditor import IDF
+
+logger = logging.getLogger(__name__)
+
+
+class ModelSession:
+    """One open, writable model and its edit history"""
+
+    def __init__(self, session_id: str, idf: IDF, source_path: str):
+        self.session_id = session_id
+        self.idf = idf
+        self.source_path = source_path
+        self.size_bytes = os.path.getsize(source_path)
+        self.opened_at = time.time()
+        self.last_access = self.opened_at
+        self.edits: List[Dict[str, Any]] = []
+        self.saved_paths: List[str] = []
+        self.dirty = False
+
+    def record_edit(self, tool: str, total_modifications: int):
+        """Record an applied edit and mark the session unsaved"""
+        self.edits.append({
+            "tool": tool,
+            "total_modifications": total_modifications,
+            "timestamp": datetime.now().isoformat()
+        })
+        self.dirty = True
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a JSON-serializable description of the session"""
+        now = time.time()
+        return {
+            "session_id": self.session_id,
+            "source_file": self.source_path,
+            "opened_at": datetime.fromtimestamp(self.opened_at).isoformat(),
+            "idle_seconds": round(now - self.last_access, 1),
+            "size_bytes": self.size_bytes,
+            "unsaved_changes": self.dirty,
+            "edit_count": len(self.edits),
+            "edits": self.edits,
+            "saved_paths": self.saved_paths
+        }
+
+
+class ModelSessionManager:
+    """Registry of open model sessions with idle timeout and size-bounded eviction
+
+    Sessions are reaped lazily on every call. A session that is closed by the
+    timeout or by eviction while it still has unsaved edits is written to
+    ``autosave_dir`` first, so no edit is silently lost.
+
+    Eviction bounds the summed size of the session IDF files, a cheap proxy for
+    memory: a parsed eppy model takes roughly 35-120 times its file size.
+    """
+
+    # Closed sessions remembered so their IDs give a useful error
+    CLOSED_HISTORY = 256
+
+    def __init__(self, idle_timeout: int = 1800, max_sessions: int = 8,
+                 max_total_bytes: int = 32 * 1024 * 1024, autosave_dir: Optional[str] = None):
+        """
+        Initialize the session manager
+
+        Args:
+            idle_timeout: Seconds without access after which a session is closed
+            max_sessions: Maximum number of concurrently open sessions
+            max_total_bytes: Upper bound on the summed size of the session IDF files
+                             (file size, not parsed size; see the class docstring)
+            autosave_dir: Where unsaved sessions are written when they are closed automatically
+        """
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.max_total_bytes = max_total_bytes
+        self.autosave_dir = autosave_dir
+        self._sessions: "OrderedDict[str, ModelSession]" = OrderedDict()
+        self._closed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def open_session(self, idf_path: str) -> ModelSession:
+        """
+        Parse a model into a new session
+
+        Args:
+            idf_path: Resolved path to the IDF file
+
+        Returns:
+            The new ModelSession
+        """
+        idf = IDF(idf_path)
+        session = ModelSession(uuid.uuid4().hex[:12], idf, idf_path)
+
+        with self._lock:
+            self._reap_idle()
+            self._sessions[session.session_id] = session
+            self._evict(keep=session.session_id)
+
+        logger.info(f"Opened model session {session.session_id} for {idf_path}")
+        return session
+
+    def get_session(self, session_id: str) -> ModelSession:
+        """
+        Look up an open session and mark it as used
+
+        Raises:
+            ValueError: If the session does not exist or was closed automatically
+        """
+        with self._lock:
+            self._reap_idle()
+            session = self._sessions.get(session_id)
+            if session is None:
+                closed = self._closed.get(session_id)
+                if closed:
+                    autosave = closed.get("autosave_path")
+                    hint = f"; unsaved edits were written to {autosave}" if autosave else ""
+                    raise ValueError(f"Model session '{session_id}' was closed ({closed['reason']}){hint}")
+                raise ValueError(f"Model session '{session_id}' not found")
+            session.last_access = time.time()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def save_session(self, session_id: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Write a session's model to disk
+
+        Args:
+            session_id: Session to save
+            output_path: Target file (if None, creates one with _modified suffix next to the source)
+
+        Returns:
+            Dictionary with save results
+        """
+        session = self.get_session(session_id)
+        if output_path is None:
+            path_obj = Path(session.source_path)
+            output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+
+        session.idf.save(output_path)
+        session.saved_paths.append(output_path)
+        session.dirty = False
+        logger.info(f"Saved model session {session_id} to {output_path}")
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "source_file": session.source_path,
+            "output_file": output_path,
+            "edits_saved": len(session.edits),
+            "total_modifications": sum(e["total_modifications"] for e in session.edits)
+        }
+
+    def close_session(self, session_id: str, discard_changes: bool = False) -> Dict[str, Any]:
+        """
+        Close a session
+
+        Args:
+            session_id: Session to close
+            discard_changes: Close even if there are unsaved edits
+
+        Returns:
+            Dictionary describing the closed session
+
+        Raises:
+            ValueError: If the session has unsaved edits and discard_changes is False
+        """
+        with self._lock:
+            session = self.get_session(session_id)
+            if session.dirty and not discard_changes:
+                raise ValueError(
+                    f"Model session '{session_id}' has {len(session.edits)} unsaved edit(s); "
+                    "save it first or close with discard_changes=True"
+                )
+            info = session.get_info()
+            self._remove(session_id, "closed by user")
+        info["discarded_changes"] = info["unsaved_changes"]
+        return info
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Return information on every open session"""
+        with self._lock:
+            self._reap_idle()
+            return [session.get_info() for session in self._sessions.values()]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return session counters and current occupancy"""
+        with self._lock:
+            return {
+                "open_sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "session_file_bytes": sum(s.size_bytes for s in self._sessions.values()),
+                "max_total_bytes": self.max_total_bytes,
+                "idle_timeout_seconds": self.idle_timeout,
+                "closed_automatically": sum(1 for c in self._closed.values() if c["reason"] != "closed by user")
+            }
+
+    def _reap_idle(self):
+        """Close sessions idle for longer than the timeout (caller holds the lock)"""
+        if self.idle_timeout <= 0:
+            return
+        cutoff = time.time() - self.idle_timeout
+        for session_id in [sid for sid, s in self._sessions.items() if s.last_access < cutoff]:
+            self._remove(session_id, "idle timeout")
+
+    def _evict(self, keep: str):
+        """Close least recently used sessions until within bounds (caller holds the lock)"""
+        def total_bytes():
+            return sum(s.size_bytes for s in self._sessions.values())
+
+        while len(self._sessions) > 1 and (len(self._sessions) > self.max_sessions or
+                                           total_bytes() > self.max_total_bytes):
+            oldest = next(iter(self._sessions))
+            if oldest == keep:
+                break
+            self._remove(oldest, "evicted to free memory")
+
+    def _remove(self, session_id: str, reason: str):
+        """Drop a session, autosaving unsaved edits unless the user closed it (caller holds the lock)"""
+        session = self._sessions.pop(session_id)
+        record = {"reason": reason, "source_file": session.source_path, "autosave_path": None}
+
+        if session.dirty and reason != "closed by user" and self.autosave_dir:
+            try:
+                os.makedirs(self.autosave_dir, exist_ok=True)
+                stem = Path(session.source_path).stem
+                autosave_path = os.path.join(self.autosave_dir, f"{stem}_session_{session_id}.idf")
+                session.idf.save(autosave_path)
+                record["autosave_path"] = autosave_path
+            except Exception as e:
+                logger.error(f"Failed to autosave model session {session_id}: {e}")
+
+        self._closed[session_id] = record
+        while len(self._closed) > self.CLOSED_HISTORY:
+            self._closed.popitem(last=False)
+        logger.info(f"Model session {session_id} closed: {reason}")
+
+    @classmethod
+    def from_config(cls, config) -> "ModelSessionManager":
+        """Build a session manager from a server Config"""
+        return cls(
+            idle_timeout=config.server.session_idle_timeout,
+            max_sessions=config.server.max_sessions,
+            max_total_bytes=config.server.session_max_mb * 1024 * 1024,
+            autosave_dir=os.path.join(config.paths.cache_dir, "sessions")
+        )
+
+
+def get_session_manager() -> ModelSessionManager:
+    """Get a session manager for the global configuration (EnergyPlusManager builds its own from its config)"""
+    if not hasattr(get_session_manager, '_manager'):
+        from ..config import get_config
+        get_session_manager._manager = ModelSessionManager.from_config(get_config())
+    return get_session_manager._manager
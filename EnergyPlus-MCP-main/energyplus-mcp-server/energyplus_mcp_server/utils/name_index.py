@@ -0,0 +1,162 @@
+"""
+Name indexes for output variable and meter validation in EnergyPlus MCP Server.
+Exact lookup by name plus a character trigram index that narrows "did you mean"
+suggestions to a few candidates instead of scoring every available name, and an
+index of model object names that output variable key values are resolved against.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import heapq
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, List, Any, Optional, Iterable
+
+from .idf_scanner import iter_idf_objects
+
+# Object types whose first field is not an object name
+_UNNAMED_TYPES = {"VERSION", "TIMESTEP", "SIMULATIONCONTROL", "BUILDING", "SHADOWCALCULATION",
+                  "HEATBALANCEALGORITHM", "GLOBALGEOMETRYRULES"}
+_UNNAMED_PREFIXES = ("OUTPUT:", "OUTPUTCONTROL:", "SURFACECONVECTIONALGORITHM:", "SITE:GROUNDTEMPERATURE:")
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of a case-folded, space-padded name"""
+    padded = f"  {text.casefold()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Index of available output names (variables or meters) of one model
+
+    ``get`` is a dictionary lookup. ``suggest`` ranks only the names sharing the
+    most trigrams with the query, then scores those with the same similarity
+    ratio as ``difflib.get_close_matches``, so a batch of lookups no longer costs
+    one full scan per name. The suggestions are approximate: when fewer than
+    ``n`` candidates pass the cutoff every name is scored, as difflib does, but
+    otherwise a name outside the candidates that difflib ranks higher is missed.
+    """
+
+    # Names that share the most trigrams with a query and get a similarity score
+    CANDIDATES = 16
+
+    def __init__(self, entries: Iterable[Dict[str, Any]], name_key: str):
+        """
+        Build the index
+
+        Args:
+            entries: Available variables or meters (dicts from parse_rdd_file/parse_mdd_file)
+            name_key: Key holding the name ("variable_name" or "meter_name")
+        """
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            self.entries.setdefault(entry[name_key], entry)
+        self.names: List[str] = list(self.entries)
+        self._trigram_index: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []  # trigrams per name
+        for i, name in enumerate(self.names):
+            trigrams = _trigrams(name)
+            self._sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self._trigram_index.setdefault(trigram, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Entry of an exactly matching name, or None"""
+        return self.entries.get(name)
+
+    def suggest(self, name: str, n: int = 5, cutoff: float = 0.6) -> List[str]:
+        """
+        Closest available names, best first (scored like difflib.get_close_matches)
+
+        Args:
+            name: Requested name
+            n: Maximum number of suggestions
+            cutoff: Minimum similarity ratio (0-1)
+        """
+        query = _trigrams(name)
+        shared = Counter()
+        for trigram in query:
+            shared.update(self._trigram_index.get(trigram, ()))
+
+        # Dice coefficient of the trigram sets picks the candidates
+        sizes = self._sizes
+        candidates = heapq.nlargest(max(self.CANDIDATES, n * 2), shared.items(),
+                                    key=lambda item: item[1] / (len(query) + sizes[item[0]]))
+
+        suggestions = self._score((i for i, _ in candidates), name, n, cutoff)
+        if len(suggestions) < n and len(candidates) < len(self.names):
+            # Trigram overlap misses names that only match in longer runs; score them all
+            suggestions = self._score(range(len(self.names)), name, n, cutoff)
+        return suggestions
+
+    def _score(self, indices: Iterable[int], name: str, n: int, cutoff: float) -> List[str]:
+        """Best n of the given names by SequenceMatcher ratio, as difflib.get_close_matches ranks them"""
+        scored = []
+        matcher = SequenceMatcher()
+        matcher.set_seq2(name)
+        for i in indices:
+            matcher.set_seq1(self.names[i])
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= cutoff:
+                scored.append((ratio, self.names[i]))
+        scored.sort(reverse=True)
+        return [candidate for _, candidate in scored[:n]]
+
+
+class ObjectNameIndex:
+    """Names of the objects in a model, by object type, built in one pass over the IDF
+
+    Used to resolve the key values of output variables: a key names the object
+    (zone, surface, air loop, ...) whose values are reported.
+    """
+
+    def __init__(self, idf_path: str):
+        """
+        Build the index
+
+        Args:
+            idf_path: Path to the IDF file
+        """
+        self.names_by_type: Dict[str, List[str]] = {}
+        self._by_folded: Dict[str, str] = {}
+        for obj_type, fields in iter_idf_objects(idf_path):
+            upper = obj_type.upper()
+            if not fields or not fields[0] or upper in _UNNAMED_TYPES or upper.startswith(_UNNAMED_PREFIXES):
+                continue
+            self.names_by_type.setdefault(upper, []).append(fields[0])
+            self._by_folded.setdefault(fields[0].casefold(), fields[0])
+
+    def find(self, name: str) -> Optional[str]:
+        """Name of any object matching case-insensitively, as written in the model, or None"""
+        return self._by_folded.get(name.casefold())
+
+    def all_names(self) -> List[str]:
+        return list(self._by_folded.values())
+
+    def names_for(self, object_types: Iterable[str]) -> List[str]:
+        """
+        Names of the objects of the given types
+
+        Args:
+            object_types: Upper-case object types or type prefixes (COIL:COOLING covers
+                          COIL:COOLING:DX:SINGLESPEED)
+        """
+        names = {}
+        for trigger in object_types:
+            for obj_type, type_names in self.names_by_type.items():
+                if obj_type == trigger or obj_type.startswith(trigger + ":"):
+                    for name in type_names:
+                        names.setdefault(name.casefold(), name)
+        return list(names.values())
@@ -0,0 +1,1037 @@
+"""
+Output discovery pipeline for EnergyPlus MCP Server.
+Runs one short simulation that writes both the variable dictionary (.rdd) and the
+meter dictionary (.mdd) of a model, parses both, and keeps the results in an
+on-disk store shared by the output variable and output meter managers.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import shutil
+import sqlite3
+import hashlib
+import logging
+import threading
+import subprocess
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Callable
+
+from .idf_scanner import iter_idf_objects, count_idf_objects, IDF_ENCODING
+from .simulation_jobs import build_energyplus_command, SimulationJob, SimulationJobManager, COMPLETED, QUEUED
+from .simulation_salvage import summarize_err_file
+from .variable_predictor import VariablePredictor
+from .name_index import NameIndex
+from .validation_cache import file_key
+
+logger = logging.getLogger(__name__)
+
+# Bump when the signature derivation or the stored result layout changes
+SIGNATURE_FORMAT = 2
+
+# Objects that cannot change which variables and meters a model reports. Their
+# edits (run period, timestep, requested outputs, reports) keep the signature.
+_IGNORED_OBJECT_TYPES = {
+    "VERSION", "BUILDING", "TIMESTEP", "SIMULATIONCONTROL", "SHADOWCALCULATION", "CONVERGENCELIMITS",
+    "SITE:LOCATION", "SITE:WATERMAINSTEMPERATURE"
+}
+_IGNORED_OBJECT_PREFIXES = ("OUTPUT:", "OUTPUTCONTROL:", "RUNPERIOD", "SIZINGPERIOD:", "SITE:GROUNDTEMPERATURE:")
+
+# Output:Diagnostics keys that make EnergyPlus register more variables; the
+# object counts in the signature (and stays in discovery models) for these only
+_REGISTERING_DIAGNOSTICS = {"DISPLAYADVANCEDREPORTVARIABLES"}
+
+# Objects whose existence and name matter but whose values do not (schedule
+# values, material properties, flow rates and multipliers)
+_NAME_ONLY_OBJECT_PREFIXES = (
+    "SCHEDULE:", "SCHEDULETYPELIMITS", "MATERIAL", "WINDOWMATERIAL:", "CONSTRUCTION",
+    "ZONEINFILTRATION:", "ZONEVENTILATION:"
+)
+
+
+def output_signature(idf_path: str, energyplus_version: str = "") -> str:
+    """
+    Hash the parts of a model that decide its available output variables and meters
+
+    HVAC, zones, surfaces and equipment count in full (equipment end-use
+    subcategories and zone names appear in meter names). Schedules, materials,
+    constructions and infiltration count by type and name only, and run
+    controls, requested outputs and reports are ignored, so editing those
+    reuses earlier discovery results. Output:Diagnostics counts by the keys
+    that register more variables (DisplayAdvancedReportVariables).
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256(f"{SIGNATURE_FORMAT}:{energyplus_version}".encode())
+    for obj_type, fields in iter_idf_objects(idf_path):
+        upper = obj_type.upper()
+        if upper == "OUTPUT:DIAGNOSTICS":
+            fields = sorted({value.upper() for value in fields} & _REGISTERING_DIAGNOSTICS)
+            if not fields:
+                continue
+        elif upper in _IGNORED_OBJECT_TYPES or upper.startswith(_IGNORED_OBJECT_PREFIXES):
+            continue
+        if upper.startswith(_NAME_ONLY_OBJECT_PREFIXES):
+            fields = fields[:1]
+        digest.update(upper.encode("latin-1"))
+        for value in fields:
+            digest.update(b"\x1f")
+            digest.update(value.upper().encode("latin-1"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+# Dropped from the discovery model: requested outputs and reports do not change
+# what the .rdd/.mdd list, but cost time to compute and write. Output:Diagnostics
+# is kept, as DisplayAdvancedReportVariables registers more variables.
+_DISCOVERY_DROPPED_PREFIXES = ("OUTPUT:", "OUTPUTCONTROL:")
+_DISCOVERY_KEPT_TYPES = {"OUTPUT:DIAGNOSTICS"}
+
+# Object types that ExpandObjects turns into regular objects before the run
+_EXPANDOBJECTS_PREFIXES = ("HVACTEMPLATE:", "GROUNDHEATTRANSFER:")
+
+
+def _set_field(fields: List[str], index: int, value: str):
+    """Set an IDF field, padding skipped optional fields with blanks (defaults)"""
+    if len(fields) <= index:
+        fields.extend([""] * (index + 1 - len(fields)))
+    fields[index] = value
+
+
+def write_discovery_idf(idf_path: str, output_path: str, run_days: int = 1) -> Dict[str, Any]:
+    """
+    Write the stripped-down model a discovery run simulates
+
+    Works on the IDF text through the streaming scanner, without building an eppy
+    model. Relative to the source model it:
+      - drops the Output:* and OutputControl:* objects except Output:Diagnostics, and
+        requests the variable and meter dictionaries with Output:VariableDictionary,IDF
+      - keeps only the first RunPeriod, shortened to run_days (at most 7) in January
+      - uses one timestep per hour and at most one warmup day
+      - turns off sizing calculations when nothing is autosized and no HVACTemplate
+        objects need sizing, and simulates the sizing periods only when the model
+        has no RunPeriod (design-day-only models)
+
+    None of these change which variables and meters EnergyPlus registers, so the
+    dictionaries stay complete.
+
+    Returns:
+        Dictionary with removed_objects, sizing_disabled and needs_expandobjects
+    """
+    objects = []
+    removed = 0
+    autosized = False
+    needs_expandobjects = False
+    has_run_period = has_simulation_control = False
+
+    for obj_type, fields in iter_idf_objects(idf_path):
+        upper = obj_type.upper()
+        if upper.startswith(_DISCOVERY_DROPPED_PREFIXES) and upper not in _DISCOVERY_KEPT_TYPES:
+            removed += 1
+            continue
+        if upper == "RUNPERIOD":
+            if has_run_period:
+                removed += 1
+                continue
+            has_run_period = True
+        if upper.startswith(_EXPANDOBJECTS_PREFIXES):
+            needs_expandobjects = True
+        if not autosized:
+            autosized = any(value.upper() == "AUTOSIZE" for value in fields)
+        objects.append((obj_type, upper, fields))
+
+    sizing_disabled = not autosized and not needs_expandobjects
+    sizing = "No" if sizing_disabled else "Yes"
+    # Without a RunPeriod the sizing periods are the only environments left to simulate
+    run_sizing_periods, run_weather_periods = ("No", "Yes") if has_run_period else ("Yes", "No")
+    days = str(max(1, min(run_days, 7)))
+
+    for obj_type, upper, fields in objects:
+        if upper == "RUNPERIOD":
+            # Version 9+ has a Begin Year field between the begin and end dates
+            has_year = len(fields) > 5 and (not fields[3] or len(fields[3]) == 4)
+            _set_field(fields, 1, "1")
+            _set_field(fields, 2, "1")
+            _set_field(fields, 4 if has_year else 3, "1")
+            _set_field(fields, 5 if has_year else 4, days)
+            if has_year and len(fields) > 6 and fields[3] and fields[6]:
+                fields[6] = fields[3]
+        elif upper == "TIMESTEP":
+            fields[:] = ["1"]
+        elif upper == "BUILDING":
+            _set_field(fields, 6, "1")  # Maximum Number of Warmup Days
+            _set_field(fields, 7, "1")  # Minimum Number of Warmup Days
+        elif upper == "SIMULATIONCONTROL":
+            has_simulation_control = True
+            for index in range(3):
+                _set_field(fields, index, sizing)
+            _set_field(fields, 3, run_sizing_periods)  # Run Simulation for Sizing Periods
+            _set_field(fields, 4, run_weather_periods)  # Run Simulation for Weather File Run Periods
+            if len(fields) > 5:
+                fields[5] = "No"  # Do HVAC Sizing Simulation for Sizing Periods
+
+    if not has_simulation_control:
+        objects.append(("SimulationControl", "SIMULATIONCONTROL",
+                        [sizing, sizing, sizing, run_sizing_periods, run_weather_periods]))
+    objects.append(("Output:VariableDictionary", "OUTPUT:VARIABLEDICTIONARY", ["IDF"]))
+
+    with open(output_path, "w", encoding=IDF_ENCODING) as f:
+        for obj_type, _, fields in objects:
+            if fields:
+                f.write(obj_type + ",\n    " + ",\n    ".join(fields) + ";\n\n")
+            else:
+                f.write(obj_type + ";\n\n")
+
+    return {
+        "removed_objects": removed,
+        "sizing_disabled": sizing_disabled,
+        "needs_expandobjects": needs_expandobjects
+    }
+
+
+def parse_rdd_file(rdd_file_path: str) -> List[Dict[str, Any]]:
+    """Parse an .rdd file (Output:VariableDictionary IDF or Regular format) into available output variables"""
+    variables = []
+
+    with open(rdd_file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+
+            # Skip comments and empty lines
+            if line.startswith('!') or not line:
+                continue
+
+            # Look for Output:Variable lines
+            if line.startswith('Output:Variable,'):
+                try:
+                    # Format: Output:Variable,*,Variable Name,frequency; !- Units [Unit]
+                    parts = line.split(',')
+                    if len(parts) >= 4:
+                        key_value = parts[1].strip()
+                        variable_name = parts[2].strip()
+                        frequency = parts[3].strip().split(';')[0].strip()
+
+                        # Extract units from comment if present
+                        units = ""
+                        if '!-' in line:
+                            comment_part = line.split('!-')[1].strip()
+                            if '[' in comment_part and ']' in comment_part:
+                                units = comment_part.split('[')[1].split(']')[0]
+
+                        variables.append({
+                            "key_value": key_value,
+                            "variable_name": variable_name,
+                            "default_frequency": frequency,
+                            "units": units,
+                            "output_variable_line": f"Output:Variable,{key_value},{variable_name},{frequency};"
+                        })
+                except Exception as e:
+                    logger.warning(f"Could not parse .rdd line: {line} - Error: {e}")
+                    continue
+
+            # Regular format: Zone,Average,Variable Name [Units]
+            elif line.count(',') >= 2 and not line.startswith(('Program Version', 'Var Type')):
+                var_type, report_type, name_units = (part.strip() for part in line.split(',', 2))
+                variable_name, units = name_units, ""
+                if name_units.endswith(']') and ' [' in name_units:
+                    variable_name, units = name_units[:-1].rsplit(' [', 1)
+                variables.append({
+                    "key_value": "*",
+                    "variable_name": variable_name,
+                    "default_frequency": "hourly",
+                    "units": units,
+                    "var_type": var_type,
+                    "report_type": report_type,
+                    "output_variable_line": f"Output:Variable,*,{variable_name},hourly;"
+                })
+
+    return variables
+
+
+def infer_meter_resource_type(meter_name: str) -> str:
+    """Infer resource type from meter name"""
+    meter_lower = meter_name.lower()
+
+    if 'electricity' in meter_lower:
+        return 'Electricity'
+    elif 'naturalgas' in meter_lower or ':gas' in meter_lower:
+        return 'NaturalGas'
+    elif 'water' in meter_lower:
+        if 'mains' in meter_lower:
+            return 'MainsWater'
+        else:
+            return 'Water'
+    elif 'steam' in meter_lower:
+        return 'Steam'
+    elif 'energytransfer' in meter_lower or 'energy transfer' in meter_lower:
+        return 'EnergyTransfer'
+    elif 'carbon' in meter_lower or 'co2' in meter_lower:
+        return 'Carbon Equivalent'
+    elif 'purchased' in meter_lower:
+        return 'ElectricityPurchased'
+    elif 'surplus' in meter_lower:
+        return 'ElectricitySurplusSold'
+    elif 'net' in meter_lower:
+        return 'ElectricityNet'
+    else:
+        return 'Other'
+
+
+def _meter_info(meter_name: str, units: str, var_type: str, frequency: str) -> Dict[str, Any]:
+    return {
+        "meter_name": meter_name,
+        "units": units,
+        "resource_type": infer_meter_resource_type(meter_name),
+        "var_type": var_type,
+        "default_frequency": frequency,
+        "output_meter_line": f"Output:Meter,{meter_name},hourly;",
+        "output_meter_fileonly_line": f"Output:Meter:MeterFileOnly,{meter_name},hourly;",
+        "output_meter_cumulative_line": f"Output:Meter:Cumulative,{meter_name},hourly;",
+        "output_meter_cumulative_fileonly_line": f"Output:Meter:Cumulative:MeterFileOnly,{meter_name},hourly;"
+    }
+
+
+def _parse_output_meter_format(lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse .mdd lines in Output:Meter format"""
+    meters = []
+
+    for line in lines:
+        line = line.strip()
+
+        # Skip empty lines and comments
+        if not line or line.startswith('!'):
+            continue
+
+        # Process Output:Meter lines (but not cumulative ones to avoid duplicates)
+        if line.startswith('Output:Meter,') and not line.startswith('Output:Meter:Cumulative'):
+            try:
+                # Parse: Output:Meter,MeterName,frequency; !- [Units]
+                parts = line[len('Output:Meter,'):].split(',')
+                if len(parts) >= 2:
+                    meter_name = parts[0].strip()
+                    frequency = parts[1].strip().split(';')[0].strip()
+
+                    # Extract units from comment if present
+                    units = ""
+                    if '!-' in line:
+                        comment_part = line.split('!-')[1]
+                        if '[' in comment_part and ']' in comment_part:
+                            units = comment_part[comment_part.find('[') + 1:comment_part.find(']')].strip()
+
+                    # Skip empty meter names
+                    if not meter_name:
+                        continue
+
+                    meters.append(_meter_info(meter_name, units, "Zone", frequency or "hourly"))
+
+            except Exception as e:
+                logger.warning(f"Could not parse .mdd Output:Meter line: {line} - Error: {e}")
+                continue
+
+    return meters
+
+
+def _parse_csv_format(lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse .mdd lines in CSV format"""
+    meters = []
+
+    data_started = False
+    for line in lines:
+        line = line.strip()
+
+        # Skip empty lines and the program version line
+        if not line or line.startswith('Program Version,'):
+            continue
+
+        # Data follows the column header line
+        if 'Var Type' in line and 'Var Report Type' in line and 'Variable Name' in line:
+            data_started = True
+            continue
+
+        if data_started:
+            try:
+                # Parse CSV line: Var Type, Var Report Type, Variable Name [Units]
+                parts = [part.strip() for part in line.split(',')]
+
+                if len(parts) >= 3 and parts[1].lower() == 'meter':
+                    var_type, variable_with_units = parts[0], parts[2]
+
+                    # Extract meter name and units (split on the last '[')
+                    if '[' in variable_with_units and ']' in variable_with_units:
+                        meter_name = variable_with_units.rsplit('[', 1)[0].strip()
+                        units = variable_with_units.rsplit('[', 1)[1].replace(']', '').strip()
+                    else:
+                        meter_name = variable_with_units.strip()
+                        units = ""
+
+                    # Skip empty meter names
+                    if not meter_name:
+                        continue
+
+                    meters.append(_meter_info(meter_name, units, var_type, "hourly"))
+
+            except Exception as e:
+                logger.warning(f"Could not parse .mdd meter line: {line} - Error: {e}")
+                continue
+
+    return meters
+
+
+def parse_mdd_file(mdd_file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse an .mdd (Meter Data Dictionary) file into available output meters
+
+    The .mdd file can have two formats:
+    1. CSV format:
+       Program Version,EnergyPlus, Version X.X.X, YMD=YYYY.MM.DD HH:MM,
+       Var Type (reported time step),Var Report Type,Variable Name [Units]
+       Zone,Meter,MeterName [Units]
+       ...
+    2. Output:Meter format:
+       ! Program Version,EnergyPlus, Version X.X.X, YMD=YYYY.MM.DD HH:MM,
+       ! Output:Meter Objects (applicable to this run)
+       Output:Meter,MeterName,hourly; !- [Units]
+       Output:Meter:Cumulative,MeterName,hourly; !- [Units]
+       ...
+
+    Returns:
+        Unique meters sorted by name
+    """
+    with open(mdd_file_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    if any(line.strip().startswith('Output:Meter') for line in lines):
+        meters = _parse_output_meter_format(lines)
+    else:
+        meters = _parse_csv_format(lines)
+
+    # Remove duplicates and sort by meter name
+    unique_meters = {}
+    for meter in meters:
+        unique_meters.setdefault(meter["meter_name"], meter)
+
+    sorted_meters = sorted(unique_meters.values(), key=lambda x: x["meter_name"])
+    logger.info(f"Parsed {len(sorted_meters)} unique meters from .mdd file")
+    return sorted_meters
+
+
+class DiscoveryStore:
+    """SQLite store of discovery results keyed by output signature
+
+    Entries survive restarts. Beyond ``max_entries`` the least recently used
+    entries are deleted.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 500):
+        """
+        Initialize the store
+
+        Args:
+            db_path: SQLite database file (created if missing)
+            max_entries: Discovery results kept
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS discovery (
+                    signature TEXT PRIMARY KEY,
+                    source_idf TEXT,
+                    run_days INTEGER,
+                    weather_file TEXT,
+                    duration TEXT,
+                    variables TEXT,
+                    meters TEXT,
+                    created REAL,
+                    last_used REAL,
+                    object_types TEXT
+                )
+            """)
+            # Stores created before object types were recorded
+            columns = {row[1] for row in db.execute("PRAGMA table_info(discovery)")}
+            if "object_types" not in columns:
+                db.execute("ALTER TABLE discovery ADD COLUMN object_types TEXT")
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection, commit on success and always close it"""
+        db = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, signature: str) -> Optional[Dict[str, Any]]:
+        """Return the stored discovery result for a signature and mark it as used, or None"""
+        with self._lock, self._connect() as db:
+            row = db.execute(
+                "SELECT source_idf, run_days, weather_file, duration, variables, meters "
+                "FROM discovery WHERE signature = ?", (signature,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute("UPDATE discovery SET last_used = ? WHERE signature = ?", (time.time(), signature))
+            self.hits += 1
+        return {
+            "success": True,
+            "source_idf": row[0],
+            "run_days": row[1],
+            "weather_file": row[2],
+            "duration": row[3],
+            "variables": json.loads(row[4]) if row[4] is not None else None,
+            "meters": json.loads(row[5]) if row[5] is not None else None
+        }
+
+    def put(self, signature: str, result: Dict[str, Any]):
+        """Store a successful discovery result and evict beyond max_entries"""
+        now = time.time()
+        variables, meters = result.get("variables"), result.get("meters")
+        object_types = result.get("object_types")
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO discovery VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (signature, result.get("source_idf"), result.get("run_days"), result.get("weather_file"),
+                 result.get("duration"),
+                 json.dumps(variables) if variables is not None else None,
+                 json.dumps(meters) if meters is not None else None,
+                 now, now,
+                 json.dumps(object_types) if object_types is not None else None)
+            )
+            db.execute(
+                "DELETE FROM discovery WHERE signature NOT IN "
+                "(SELECT signature FROM discovery ORDER BY last_used DESC LIMIT ?)", (self.max_entries,)
+            )
+
+    def iter_observations(self):
+        """Yield (object types, variables) of every stored run that recorded both"""
+        with self._lock, self._connect() as db:
+            rows = db.execute(
+                "SELECT object_types, variables FROM discovery "
+                "WHERE object_types IS NOT NULL AND variables IS NOT NULL"
+            ).fetchall()
+        for object_types, variables in rows:
+            yield json.loads(object_types), json.loads(variables)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return store counters and occupancy"""
+        with self._lock, self._connect() as db:
+            entries = db.execute("SELECT COUNT(*) FROM discovery").fetchone()[0]
+        return {
+            "db_path": self.db_path,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class OutputDiscovery:
+    """Shared discovery of the output variables and meters a model can report
+
+    One short simulation with ``Output:VariableDictionary,IDF`` produces both the
+    .rdd and the .mdd file, so variables and meters of a model are discovered
+    together. Results are stored on disk under the model's output signature
+    (see output_signature), so they are reused across restarts and by any model
+    that differs only in run controls, requested outputs, schedule values or
+    material properties. Concurrent requests for the same signature wait for a
+    single discovery run.
+
+    Until a model has been discovered, its variables can be predicted from its
+    object types (see VariablePredictor), trained on the stored runs and on the
+    .rdd files of the illustrative examples.
+
+    Discovery can also start speculatively when a model is loaded (see
+    speculate): the run then goes through the simulation scheduler as a
+    low-priority preemptible job, so it never delays requested simulations.
+    """
+
+    def __init__(self, config, store: Optional[DiscoveryStore] = None):
+        """
+        Initialize the discovery pipeline
+
+        Args:
+            config: Server configuration (temp directory, default weather file, EnergyPlus version)
+            store: Persistent result store (default: output_discovery.sqlite under cache_dir)
+        """
+        self.config = config
+        self.store = store or DiscoveryStore(
+            os.path.join(config.paths.cache_dir, "output_discovery.sqlite"),
+            max_entries=config.server.discovery_cache_max_entries
+        )
+        self._lock = threading.Lock()
+        self._signature_locks: Dict[str, threading.Lock] = {}
+        self._signatures: Dict[tuple, str] = {}  # (path, mtime, size) -> signature
+        self.simulations_run = 0
+        self._predictor: Optional[VariablePredictor] = None
+        self._background: Dict[str, SimulationJob] = {}  # signature -> scheduler job
+        self._name_indexes: "OrderedDict[tuple, NameIndex]" = OrderedDict()  # (signature, kind) -> index
+        self._speculative: Dict[str, SimulationJob] = {}  # signature -> scheduler job
+        self._speculation_stats = {"started": 0, "completed": 0, "preempted": 0, "file_changed": 0,
+                                   "failed": 0, "skipped_busy": 0}
+
+    def get_signature(self, idf_path: str) -> str:
+        """Output signature of a model file, memoized by path, modification time and size"""
+        stat = os.stat(idf_path)
+        file_key = (os.path.abspath(idf_path), stat.st_mtime_ns, stat.st_size)
+        signature = self._signatures.get(file_key)
+        if signature is None:
+            signature = output_signature(idf_path, self.config.energyplus.version)
+            with self._lock:
+                if len(self._signatures) >= 1024:
+                    self._signatures.clear()
+                self._signatures[file_key] = signature
+        return signature
+
+    def discover(self, idf_path: str, run_days: int = 1, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Discover the available output variables and meters of a model
+
+        Args:
+            idf_path: Path to the IDF file
+            run_days: Number of days to run the discovery simulation
+            force_refresh: Run a new discovery simulation even if results are stored
+
+        Returns:
+            Dictionary with success, variables (from the .rdd), meters (from the .mdd),
+            run_days, weather_file, duration, signature and cached. variables or meters
+            is None if the simulation did not write that file. On failure, success is
+            False and error holds the reason.
+        """
+        signature = self.get_signature(idf_path)
+        with self._lock:
+            signature_lock = self._signature_locks.setdefault(signature, threading.Lock())
+
+        with signature_lock:
+            if not force_refresh:
+                stored = self.store.get(signature)
+                if stored is not None:
+                    logger.debug(f"Using stored output discovery for {idf_path} (from {stored['source_idf']})")
+                    return {**stored, "signature": signature, "cached": True}
+
+            result = self._run_discovery(idf_path, run_days)
+            if result["success"]:
+                self._store_result(signature, result)
+            return {**result, "signature": signature, "cached": False}
+
+    def lookup(self, idf_path: str) -> Optional[Dict[str, Any]]:
+        """Return the stored discovery result of a model without running a simulation, or None"""
+        signature = self.get_signature(idf_path)
+        stored = self.store.get(signature)
+        if stored is None:
+            return None
+        return {**stored, "signature": signature, "cached": True}
+
+    def get_name_index(self, signature: str, kind: str, entries: List[Dict[str, Any]]) -> NameIndex:
+        """
+        Name index of a discovery result, built once per output signature
+
+        Args:
+            signature: Output signature of the discovery result
+            kind: "variables" or "meters"
+            entries: The result's variables or meters
+        """
+        key = (signature, kind)
+        with self._lock:
+            index = self._name_indexes.get(key)
+            if index is not None:
+                self._name_indexes.move_to_end(key)
+                return index
+        index = NameIndex(entries, "variable_name" if kind == "variables" else "meter_name")
+        with self._lock:
+            self._name_indexes[key] = index
+            while len(self._name_indexes) > 32:
+                self._name_indexes.popitem(last=False)
+        return index
+
+    def get_predictor(self) -> VariablePredictor:
+        """The variable predictor, trained on first use"""
+        with self._lock:
+            if self._predictor is None:
+                predictor = VariablePredictor()
+                for object_types, variables in self.store.iter_observations():
+                    predictor.add_observation(object_types, variables)
+                # Example outputs sit in a folder named after the model, next to its IDF
+                for rdd_path in sorted(Path(self.config.paths.illustrative_examples_path).glob("*/*.rdd")):
+                    idf_path = rdd_path.parent.parent / f"{rdd_path.parent.name}.idf"
+                    if not idf_path.exists():
+                        continue
+                    try:
+                        predictor.add_observation(count_idf_objects(str(idf_path)), parse_rdd_file(str(rdd_path)))
+                    except (OSError, UnicodeDecodeError) as e:
+                        logger.warning(f"Skipping example variable dictionary {rdd_path}: {e}")
+                logger.info(f"Variable predictor trained on {predictor.observations} discovery results")
+                self._predictor = predictor
+            return self._predictor
+
+    def predict_variables(self, idf_path: str) -> Dict[str, Any]:
+        """
+        Predict the available output variables of a model without running a simulation
+
+        Returns:
+            VariablePredictor.predict result for the model's object types
+        """
+        return self.get_predictor().predict(count_idf_objects(idf_path))
+
+    def discover_in_background(self, idf_path: str, job_manager: SimulationJobManager, run_days: int = 1,
+                               priority: int = -10) -> bool:
+        """
+        Queue a discovery run as a low-priority scheduler job
+
+        Unlike a speculative run the job is not preemptible, since a validation
+        already asked for the model's outputs; its low priority still lets
+        requested simulations start first. Must be called from the server's event loop.
+
+        Returns:
+            False if a discovery run for the model is already queued, or if no event
+            loop is running (the run is then left to the next discovery request)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug(f"No event loop running, not queueing background output discovery for {idf_path}")
+            return False
+        signature = self.get_signature(idf_path)
+        with self._lock:
+            if signature in self._background or signature in self._speculative:
+                return False
+
+        def on_done(job: SimulationJob, stored: bool):
+            with self._lock:
+                self._background.pop(signature, None)
+            if not stored:
+                logger.info(f"Background output discovery for {idf_path} ended without a result "
+                            f"({job.error or job.status})")
+
+        job = self._submit_discovery(idf_path, signature, job_manager, run_days, priority,
+                                     preemptible=False, kind="background", on_done=on_done)
+        with self._lock:
+            self._background[signature] = job
+        logger.info(f"Queued background output discovery for {idf_path} (job {job.job_id})")
+        return True
+
+    def speculate(self, idf_path: str, job_manager: SimulationJobManager, run_days: int = 1,
+                  priority: int = -10, poll_interval: float = 2.0) -> Dict[str, Any]:
+        """
+        Start discovery for a model whose outputs nobody has asked for yet
+
+        The run is queued on the simulation scheduler as a preemptible job, so it
+        only uses idle capacity: nothing starts while the scheduler is busy, and
+        the job is cancelled when a regular simulation needs its worker slot or
+        when the model file changes before the run finishes. Must be called from
+        the server's event loop.
+
+        Args:
+            idf_path: Path to the IDF file
+            job_manager: Simulation scheduler that runs the job
+            run_days: Number of days to run the discovery simulation
+            priority: Scheduler priority of the job
+            poll_interval: Seconds between checks of the model file while the job runs
+
+        Returns:
+            Dictionary with status (stored, pending, busy or queued) and signature,
+            plus job_id when a run was queued
+        """
+        signature = self.get_signature(idf_path)
+        with self._lock:
+            pending = signature in self._background or signature in self._speculative
+        if pending:
+            return {"status": "pending", "signature": signature}
+        if self.store.get(signature) is not None:
+            return {"status": "stored", "signature": signature}
+        if job_manager.is_busy():
+            self._speculation_stats["skipped_busy"] += 1
+            return {"status": "busy", "signature": signature}
+
+        source_key = file_key(idf_path)
+        file_changed = False
+
+        def on_done(job: SimulationJob, stored: bool):
+            with self._lock:
+                self._speculative.pop(signature, None)
+            if stored:
+                outcome = "completed"
+            elif job.status == COMPLETED:
+                outcome = "file_changed" if file_key(idf_path) != source_key else "failed"
+            else:
+                outcome = "preempted" if job.preempted else "file_changed" if file_changed else "failed"
+            self._speculation_stats[outcome] += 1
+            if outcome != "completed":
+                logger.info(f"Speculative output discovery for {idf_path} ended: {outcome}")
+
+        job = self._submit_discovery(idf_path, signature, job_manager, run_days, priority,
+                                     preemptible=True, kind="speculative", on_done=on_done)
+        with self._lock:
+            self._speculative[signature] = job
+        self._speculation_stats["started"] += 1
+
+        loop = asyncio.get_running_loop()
+
+        def watch():
+            nonlocal file_changed
+            if job.finished:
+                return
+            if file_key(idf_path) != source_key:
+                file_changed = True
+                logger.info(f"{idf_path} changed, cancelling speculative output discovery")
+                job_manager.cancel(job.job_id)
+                return
+            loop.call_later(poll_interval, watch)
+
+        loop.call_later(poll_interval, watch)
+        logger.info(f"Started speculative output discovery for {idf_path} (job {job.job_id})")
+        return {"status": "queued", "signature": signature, "job_id": job.job_id}
+
+    def _submit_discovery(self, idf_path: str, signature: str, job_manager: SimulationJobManager,
+                          run_days: int, priority: int, preemptible: bool, kind: str,
+                          on_done: Callable[[SimulationJob, bool], None]) -> SimulationJob:
+        """
+        Queue a discovery run on the simulation scheduler
+
+        The job's post_process step parses the dictionaries and stores the result
+        in the job's worker slot, so only bookkeeping runs on the event loop. The
+        result is dropped if the model file changed since the run was queued.
+
+        Args:
+            kind: Labels the job in its metadata (``<kind>_discovery``)
+            on_done: Called on the event loop with the finished job and whether its
+                     result was stored
+        """
+        source_key = file_key(idf_path)
+        temp_idf_path, output_dir = self._run_paths()
+        try:
+            transform = write_discovery_idf(idf_path, temp_idf_path, run_days)
+            os.makedirs(output_dir, exist_ok=True)
+            command, weather_file = self._discovery_command(temp_idf_path, output_dir,
+                                                            transform["needs_expandobjects"])
+        except Exception:
+            self._cleanup_temp_files(temp_idf_path, output_dir)
+            raise
+
+        stored = False
+
+        def post_process(job: SimulationJob):
+            nonlocal stored
+            try:
+                if file_key(idf_path) != source_key:
+                    return
+                with self._lock:
+                    self.simulations_run += 1
+                duration = str(timedelta(seconds=time.time() - job.started_at))
+                self._store_result(signature, self._collect_results(idf_path, output_dir, run_days,
+                                                                    weather_file, duration))
+                stored = True
+            finally:
+                self._cleanup_temp_files(temp_idf_path, output_dir)
+
+        def on_finish(job: SimulationJob):
+            if job.status != COMPLETED:
+                self._cleanup_temp_files(temp_idf_path, output_dir)
+            on_done(job, stored)
+
+        return job_manager.submit(
+            command,
+            cwd=output_dir,
+            metadata={"input_idf": temp_idf_path, "output_directory": output_dir,
+                      "weather_file": weather_file, f"{kind}_discovery": idf_path},
+            priority=priority,
+            on_finish=on_finish,
+            timeout=self.config.server.simulation_timeout,
+            cpu_limit=self.config.server.simulation_cpu_limit,
+            preemptible=preemptible,
+            post_process=post_process
+        )
+
+    def _store_result(self, signature: str, result: Dict[str, Any]):
+        """Persist a successful discovery result and train the predictor on it"""
+        self.store.put(signature, result)
+        if self._predictor is not None and result["variables"] is not None:
+            self._predictor.add_observation(result["object_types"], result["variables"])
+
+    async def wait_for_speculation(self, idf_path: str, job_manager: SimulationJobManager) -> bool:
+        """
+        Let a running speculative or background discovery run of a model finish
+        before discovering it
+
+        A job still waiting in the queue is cancelled instead, since the caller
+        would otherwise wait behind every other simulation.
+
+        Returns:
+            True if a running job was awaited
+        """
+        signature = self.get_signature(idf_path)
+        job = self._speculative.get(signature) or self._background.get(signature)
+        if job is None or job.finished:
+            return False
+        if job.status == QUEUED:
+            job_manager.cancel(job.job_id)
+            return False
+        logger.info(f"Waiting for queued output discovery of {idf_path} (job {job.job_id})")
+        await job_manager.wait(job.job_id)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return discovery store statistics and the number of discovery simulations run"""
+        stats = {**self.store.get_stats(), "simulations_run": self.simulations_run,
+                 "background_queued": len(self._background),
+                 "speculative": {**self._speculation_stats, "in_flight": len(self._speculative)}}
+        if self._predictor is not None:
+            stats["predictor"] = self._predictor.get_stats()
+        return stats
+
+    def _run_discovery(self, idf_path: str, run_days: int) -> Dict[str, Any]:
+        """Run one discovery simulation and parse both dictionaries"""
+        logger.info(f"Discovering available output variables and meters for: {idf_path}")
+        temp_idf_path, output_dir = self._run_paths()
+
+        try:
+            transform = write_discovery_idf(idf_path, temp_idf_path, run_days)
+            sim_result = self._run_discovery_simulation(temp_idf_path, output_dir,
+                                                        transform["needs_expandobjects"])
+            if not sim_result["success"]:
+                return {
+                    "success": False,
+                    "error": "Failed to run simulation for output discovery",
+                    "simulation_error": sim_result.get("error", "Unknown error")
+                }
+            self.simulations_run += 1
+            return self._collect_results(idf_path, output_dir, run_days,
+                                         sim_result["weather_file"], sim_result["duration"])
+        finally:
+            self._cleanup_temp_files(temp_idf_path, output_dir)
+
+    def _run_paths(self):
+        """Unique discovery model path and output directory under temp_dir"""
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        return (os.path.join(self.config.paths.temp_dir, f"temp_output_discovery_{run_id}.idf"),
+                os.path.join(self.config.paths.temp_dir, f"output_discovery_{run_id}"))
+
+    def _collect_results(self, idf_path: str, output_dir: str, run_days: int,
+                         weather_file: Optional[str], duration: str) -> Dict[str, Any]:
+        """Parse the dictionaries of a finished discovery run"""
+        rdd_files = sorted(Path(output_dir).glob("*.rdd"))
+        mdd_files = sorted(Path(output_dir).glob("*.mdd"))
+        variables = parse_rdd_file(str(rdd_files[0])) if rdd_files else None
+        meters = parse_mdd_file(str(mdd_files[0])) if mdd_files else None
+        logger.info(f"Discovered {len(variables or [])} output variables and "
+                    f"{len(meters or [])} meters in {duration}")
+
+        return {
+            "success": True,
+            "source_idf": idf_path,
+            "object_types": sorted(count_idf_objects(idf_path)),
+            "variables": variables,
+            "meters": meters,
+            "run_days": run_days,
+            "weather_file": weather_file,
+            "duration": duration
+        }
+
+    def _find_weather_file(self) -> Optional[str]:
+        """Configured default weather file, else the first sample weather file"""
+        default_weather = self.config.energyplus.default_weather_file
+        if default_weather and os.path.exists(default_weather):
+            logger.info(f"Using configured default weather file: {default_weather}")
+            return default_weather
+
+        sample_dir = Path(self.config.paths.sample_files_path)
+        epw_files = sorted(sample_dir.glob('*.epw')) if sample_dir.is_dir() else []
+        if epw_files:
+            logger.info(f"Using sample weather file: {epw_files[0]}")
+            return str(epw_files[0])
+
+        logger.warning("No weather file found, running design day simulation only")
+        return None
+
+    def _discovery_command(self, temp_idf_path: str, output_dir: str, expandobjects: bool):
+        """EnergyPlus command line of a discovery run (no ReadVarsESO) and its weather file"""
+        weather_file = self._find_weather_file()
+        simulation_options = {
+            'output_directory': output_dir,
+            'design_day': not weather_file,  # Only use design days if no weather file
+            'readvars': False,
+            'expandobjects': expandobjects,
+            'output_prefix': 'output_discovery',
+            'output_suffix': 'C'
+        }
+        if weather_file:
+            simulation_options['weather'] = weather_file
+        command = build_energyplus_command(
+            self.config.energyplus.executable_path,
+            temp_idf_path,
+            simulation_options,
+            idd_path=self.config.energyplus.idd_path
+        )
+        return command, weather_file
+
+    def _run_discovery_simulation(self, temp_idf_path: str, output_dir: str,
+                                  expandobjects: bool) -> Dict[str, Any]:
+        """Run the EnergyPlus CLI on the discovery model (no ReadVarsESO)"""
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            command, weather_file = self._discovery_command(temp_idf_path, output_dir, expandobjects)
+
+            start_time = datetime.now()
+            completed = subprocess.run(
+                command,
+                cwd=output_dir,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=self.config.server.simulation_timeout or None
+            )
+            if completed.returncode != 0:
+                err_files = sorted(Path(output_dir).glob("*.err"))
+                details = summarize_err_file(err_files[0])["last_severe_messages"] if err_files else []
+                stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+                raise RuntimeError(f"EnergyPlus exited with code {completed.returncode}: "
+                                   f"{'; '.join(details) or stderr or 'no error details'}")
+
+            return {
+                "success": True,
+                "duration": str(datetime.now() - start_time),
+                "weather_file": weather_file
+            }
+
+        except Exception as e:
+            logger.error(f"Simulation failed during output discovery: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def _cleanup_temp_files(self, temp_idf_path: str, temp_output_dir: str):
+        """Clean up temporary files and directories"""
+        try:
+            if os.path.exists(temp_idf_path):
+                os.remove(temp_idf_path)
+            if os.path.exists(temp_output_dir):
+                shutil.rmtree(temp_output_dir)
+        except Exception as e:
+            logger.warning(f"Error cleaning up temporary files: {e}")
+
+
+def get_output_discovery() -> OutputDiscovery:
+    """Get the process-wide output discovery pipeline"""
+    if not hasattr(get_output_discovery, '_discovery'):
+        from ..config import get_config
+        get_output_discovery._discovery = OutputDiscovery(get_config())
+    return get_output_discovery._discovery
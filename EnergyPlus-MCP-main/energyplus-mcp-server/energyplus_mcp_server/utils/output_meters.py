@@ -10,47 +10,19 @@ any required approvals from the U.S. Dept. of Energy). All rights reserved.
 See License.txt in the parent directory for license details.
 """
 
-import os
 import json
 import logging
-import time
-from typing import Dict, List, Any, Optional
-from pathlib import Path
-from datetime import datetime
-import shutil
+from typing import Dict, List, Any, Optional, Union
 import re
 
 from eppy.modeleditor import IDF
 
-logger = logging.getLogger(__name__)
-
+from .model_cache import get_model_cache
+from .output_discovery import get_output_discovery
+from .name_index import NameIndex
+from .validation_cache import get_validation_cache, file_key
 
-class ValidationCache:
-    """Cache expensive discovery results to improve performance"""
-    
-    def __init__(self):
-        self._available_meters_cache = {}
-        self._configured_meters_cache = {}
-        self._cache_timestamps = {}
-    
-    def get_cache_key(self, idf_path: str) -> str:
-        """Generate cache key based on file path and modification time"""
-        try:
-            path_obj = Path(idf_path)
-            if path_obj.exists():
-                mtime = os.path.getmtime(idf_path)
-                return f"{idf_path}:{mtime}"
-            return idf_path
-        except Exception:
-            return idf_path
-    
-    def is_cache_valid(self, cache_key: str, max_age_seconds: int = 300) -> bool:
-        """Check if cache entry is still valid (default: 5 minutes)"""
-        if cache_key not in self._cache_timestamps:
-            return False
-        
-        age = time.time() - self._cache_timestamps[cache_key]
-        return age < max_age_seconds
+logger = logging.getLogger(__name__)
 
 
 class OutputMeterManager:
@@ -59,7 +31,9 @@ class OutputMeterManager:
     def __init__(self, config):
         """Initialize with configuration"""
         self.config = config
-        self._validation_cache = ValidationCache()
+        self.model_cache = get_model_cache()
+        self.validation_cache = get_validation_cache()
+        self.discovery = get_output_discovery()
         
         # Valid frequencies for EnergyPlus output meters
         self.VALID_FREQUENCIES = {
@@ -100,54 +74,47 @@ class OutputMeterManager:
         else:
             return self.get_configured_meters(idf_path)
     
-    def discover_available_meters(self, idf_path: str, run_days: int = 1) -> Dict[str, Any]:
+    def discover_available_meters(self, idf_path: str, run_days: int = 1,
+                                  force_refresh: bool = False) -> Dict[str, Any]:
         """
         Discover all available output meters by running simulation with minimal configuration
         
+        The discovery simulation is shared with OutputVariableManager: one run writes
+        both the .rdd and the .mdd file, and its results are reused for a while.
+        
         Args:
             idf_path: Path to the IDF file
             run_days: Number of days to run simulation (default: 1 for speed)
+            force_refresh: Run a new discovery simulation even if results are cached
         
         Returns:
             Dictionary with discovered meters and metadata
         """
         try:
-            logger.info(f"Discovering available output meters for: {idf_path}")
-            
-            # Create temporary modified IDF for meter discovery
-            temp_idf_path = self._create_temp_idf_for_meter_discovery(idf_path, run_days)
-            
-            # Run short simulation
-            logger.info("Running short simulation to generate meter data dictionary...")
-            sim_result = self._run_meter_discovery_simulation(temp_idf_path)
+            discovery = self.discovery.discover(idf_path, run_days, force_refresh)
             
-            if not sim_result["success"]:
+            if not discovery["success"]:
                 return {
                     "success": False,
                     "error": "Failed to run simulation for meter discovery",
-                    "simulation_error": sim_result.get("error", "Unknown error")
+                    "simulation_error": discovery.get("simulation_error", discovery.get("error", "Unknown error"))
                 }
             
-            # Parse .mdd file for meters (Meter Data Dictionary)
-            mdd_file_path = self._find_mdd_file(sim_result["output_directory"])
-            if not mdd_file_path:
+            meters = discovery["meters"]
+            if meters is None:
                 return {
                     "success": False,
                     "error": "Could not find .mdd file in simulation output"
                 }
             
-            # Extract meters from .mdd file
-            meters = self._parse_mdd_file_for_meters(mdd_file_path)
-            
-            # Clean up temporary files
-            self._cleanup_temp_files(temp_idf_path, sim_result["output_directory"])
-            
             result = {
                 "success": True,
                 "discovery_mode": True,
                 "input_file": idf_path,
                 "total_meters": len(meters),
-                "run_days": run_days,
+                "run_days": discovery["run_days"],
+                "cached_discovery": discovery["cached"],
+                "signature": discovery["signature"],
                 "categories": self._categorize_meters(meters),
                 "meters": meters
             }
@@ -159,19 +126,21 @@ class OutputMeterManager:
             logger.error(f"Error discovering available output meters: {e}")
             raise RuntimeError(f"Error discovering available output meters: {str(e)}")
     
-    def get_configured_meters(self, idf_path: str) -> Dict[str, Any]:
+    def get_configured_meters(self, idf_path: str, idf=None) -> Dict[str, Any]:
         """
         Get currently configured output meters from the IDF file
         
         Args:
             idf_path: Path to the IDF file
+            idf: Already open model to read instead of the file (e.g. from a model session)
         
         Returns:
             Dictionary with currently configured meters
         """
         try:
             logger.debug(f"Getting configured output meters for: {idf_path}")
-            idf = IDF(idf_path)
+            if idf is None:
+                idf = self.model_cache.get_model(idf_path)
             
             output_meters = idf.idfobjects.get("Output:Meter", [])
             output_meter_fileonly = idf.idfobjects.get("Output:Meter:MeterFileOnly", [])
@@ -239,347 +208,6 @@ class OutputMeterManager:
             logger.error(f"Error getting configured output meters: {e}")
             raise RuntimeError(f"Error getting configured output meters: {str(e)}")
     
-    def _create_temp_idf_for_meter_discovery(self, idf_path: str, run_days: int) -> str:
-        """Create temporary IDF optimized for meter discovery simulation"""
-        idf = IDF(idf_path)
-        
-        # Remove existing Output:VariableDictionary to avoid conflicts
-        existing_var_dict = idf.idfobjects.get('Output:VariableDictionary', [])
-        for var_dict in existing_var_dict:
-            idf.removeidfobject(var_dict)
-        
-        # Add Output:VariableDictionary for meter discovery (IDF generates .mdd file)
-        var_dict = idf.newidfobject('Output:VariableDictionary')
-        var_dict.Key_Field = 'IDF'
-        logger.debug(f"Added Output:VariableDictionary with Key_Field 'IDF' for meter discovery")
-        
-        # Modify run period to be very short for fast discovery
-        run_periods = idf.idfobjects.get("RunPeriod", [])
-        if run_periods:
-            run_period = run_periods[0]
-            # Set to run for specified days in January
-            run_period.Begin_Month = 1
-            run_period.Begin_Day_of_Month = 1
-            run_period.End_Month = 1
-            run_period.End_Day_of_Month = min(run_days, 7)  # Cap at 7 days max
-            run_period.Use_Weather_File_Holidays_and_Special_Days = 'No'
-            run_period.Use_Weather_File_Daylight_Saving_Period = 'No'
-            run_period.Apply_Weekend_Holiday_Rule = 'No'
-            run_period.Use_Weather_File_Rain_Indicators = 'No'
-            run_period.Use_Weather_File_Snow_Indicators = 'No'
-        
-        # Disable design day simulations to speed up
-        sim_control = idf.idfobjects.get("SimulationControl", [])
-        if sim_control:
-            control = sim_control[0]
-            control.Run_Simulation_for_Sizing_Periods = 'No'
-            control.Run_Simulation_for_Weather_File_Run_Periods = 'Yes'
-        
-        # Create temporary file
-        temp_path = os.path.join(
-            self.config.paths.temp_dir, 
-            f"temp_meter_discovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}.idf"
-        )
-        idf.save(temp_path)
-        
-        return temp_path
-    
-    def _run_meter_discovery_simulation(self, temp_idf_path: str) -> Dict[str, Any]:
-        """Run a minimal simulation to generate the .mdd file with meter information"""
-        try:
-            # Create output directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_dir = os.path.join(self.config.paths.temp_dir, f"meter_discovery_{timestamp}")
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Try to find a weather file
-            weather_file = None
-            
-            # First, check if there's a default weather file configured
-            if hasattr(self.config, 'energyplus') and hasattr(self.config.energyplus, 'default_weather_file'):
-                if os.path.exists(self.config.energyplus.default_weather_file):
-                    weather_file = self.config.energyplus.default_weather_file
-                    logger.info(f"Using configured default weather file: {weather_file}")
-            
-            # If no configured weather file, look for one in sample_files
-            if not weather_file:
-                sample_files_dir = os.path.join(os.path.dirname(temp_idf_path), '..', '..', 'sample_files')
-                sample_files_dir = os.path.abspath(sample_files_dir)
-                if os.path.exists(sample_files_dir):
-                    epw_files = list(Path(sample_files_dir).glob('*.epw'))
-                    if epw_files:
-                        weather_file = str(epw_files[0])
-                        logger.info(f"Using sample weather file: {weather_file}")
-            
-            if not weather_file:
-                logger.warning("No weather file found, running design day simulation only")
-            
-            # Load IDF for simulation
-            if weather_file and os.path.exists(weather_file):
-                idf = IDF(temp_idf_path, weather_file)
-            else:
-                idf = IDF(temp_idf_path)
-            
-            # Run simulation with minimal options optimized for meter discovery
-            simulation_options = {
-                'output_directory': output_dir,
-                'annual': False,
-                'design_day': not bool(weather_file),  # Only use design day if no weather file
-                'readvars': False,  # Don't need variable processing
-                'expandobjects': True,  # May be needed for proper meter enumeration
-                'output_prefix': 'meter_discovery',
-                'output_suffix': 'C',
-                'verbose': 'v'  # Minimal verbosity
-            }
-            
-            # Add weather file to options if available
-            if weather_file and os.path.exists(weather_file):
-                simulation_options['weather'] = weather_file
-            
-            start_time = datetime.now()
-            result = idf.run(**simulation_options)
-            end_time = datetime.now()
-            
-            return {
-                "success": True,
-                "output_directory": output_dir,
-                "duration": str(end_time - start_time),
-                "weather_file": weather_file,
-                "result": str(result) if result else "Completed"
-            }
-            
-        except Exception as e:
-            logger.error(f"Simulation failed during meter discovery: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    def _find_mdd_file(self, output_directory: str) -> Optional[str]:
-        """Find the .mdd (Meter Data Dictionary) file in the simulation output directory"""
-        output_dir = Path(output_directory)
-        mdd_files = list(output_dir.glob("*.mdd"))
-        
-        if mdd_files:
-            return str(mdd_files[0])
-        return None
-    
-    def _parse_mdd_file_for_meters(self, mdd_file_path: str) -> List[Dict[str, Any]]:
-        """
-        Parse the .mdd (Meter Data Dictionary) file to extract available output meters
-        
-        The .mdd file can have two formats:
-        1. CSV format:
-           Program Version,EnergyPlus, Version X.X.X, YMD=YYYY.MM.DD HH:MM,
-           Var Type (reported time step),Var Report Type,Variable Name [Units]
-           Zone,Meter,MeterName [Units]
-           Zone,Meter,AnotherMeter [Units]
-           ...
-        2. Output:Meter format:
-           ! Program Version,EnergyPlus, Version X.X.X, YMD=YYYY.MM.DD HH:MM,
-           ! Output:Meter Objects (applicable to this run)
-           Output:Meter,MeterName,hourly; !- [Units]
-           Output:Meter:Cumulative,MeterName,hourly; !- [Units]
-           ...
-        """
-        meters = []
-        
-        try:
-            with open(mdd_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Determine format by checking if we have Output:Meter lines
-            has_output_meter_format = any(line.strip().startswith('Output:Meter') for line in lines)
-            
-            if has_output_meter_format:
-                # Parse Output:Meter format
-                meters = self._parse_output_meter_format(lines)
-            else:
-                # Parse CSV format
-                meters = self._parse_csv_format(lines)
-                
-        except Exception as e:
-            logger.error(f"Error reading .mdd file {mdd_file_path}: {e}")
-            raise
-        
-        # Remove duplicates and sort by meter name
-        unique_meters = {}
-        for meter in meters:
-            key = meter["meter_name"]
-            if key not in unique_meters:
-                unique_meters[key] = meter
-        
-        sorted_meters = sorted(unique_meters.values(), key=lambda x: x["meter_name"])
-        logger.info(f"Parsed {len(sorted_meters)} unique meters from .mdd file")
-        
-        return sorted_meters
-    
-    def _parse_output_meter_format(self, lines: List[str]) -> List[Dict[str, Any]]:
-        """Parse .mdd file in Output:Meter format"""
-        meters = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('!'):
-                continue
-            
-            # Process Output:Meter lines (but not cumulative ones to avoid duplicates)
-            if line.startswith('Output:Meter,') and not line.startswith('Output:Meter:Cumulative'):
-                try:
-                    # Parse: Output:Meter,MeterName,frequency; !- [Units]
-                    # Remove the "Output:Meter," prefix
-                    meter_part = line[len('Output:Meter,'):]
-                    
-                    # Split by comma to get meter name and frequency
-                    parts = meter_part.split(',')
-                    if len(parts) >= 2:
-                        meter_name = parts[0].strip()
-                        frequency_part = parts[1].strip()
-                        
-                        # Remove frequency (everything after first semicolon or before comment)
-                        if ';' in frequency_part:
-                            frequency = frequency_part.split(';')[0].strip()
-                        else:
-                            frequency = frequency_part.strip()
-                        
-                        # Extract units from comment if present
-                        units = ""
-                        if '!-' in line and '[' in line and ']' in line:
-                            comment_part = line.split('!-')[1]
-                            if '[' in comment_part and ']' in comment_part:
-                                units_start = comment_part.find('[') + 1
-                                units_end = comment_part.find(']')
-                                units = comment_part[units_start:units_end].strip()
-                        
-                        # Skip empty meter names
-                        if not meter_name:
-                            continue
-                        
-                        # Determine resource type from meter name
-                        resource_type = self._infer_resource_type(meter_name)
-                        
-                        meter_info = {
-                            "meter_name": meter_name,
-                            "units": units,
-                            "resource_type": resource_type,
-                            "var_type": "Zone",  # Default for this format
-                            "default_frequency": frequency if frequency else "hourly",
-                            "output_meter_line": f"Output:Meter,{meter_name},hourly;",
-                            "output_meter_fileonly_line": f"Output:Meter:MeterFileOnly,{meter_name},hourly;",
-                            "output_meter_cumulative_line": f"Output:Meter:Cumulative,{meter_name},hourly;",
-                            "output_meter_cumulative_fileonly_line": f"Output:Meter:Cumulative:MeterFileOnly,{meter_name},hourly;"
-                        }
-                        
-                        meters.append(meter_info)
-                        
-                except Exception as e:
-                    logger.warning(f"Could not parse .mdd Output:Meter line: {line} - Error: {e}")
-                    continue
-        
-        return meters
-    
-    def _parse_csv_format(self, lines: List[str]) -> List[Dict[str, Any]]:
-        """Parse .mdd file in CSV format"""
-        meters = []
-        
-        # Skip header lines and find the data
-        data_started = False
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            # Skip program version line
-            if line.startswith('Program Version,'):
-                continue
-            
-            # Skip column header line
-            if 'Var Type' in line and 'Var Report Type' in line and 'Variable Name' in line:
-                data_started = True
-                continue
-            
-            # Process meter data lines
-            if data_started and line:
-                try:
-                    # Parse CSV line: Var Type, Var Report Type, Variable Name [Units]
-                    parts = [part.strip() for part in line.split(',')]
-                    
-                    if len(parts) >= 3:
-                        var_type = parts[0]  # Usually "Zone"
-                        report_type = parts[1]  # Should be "Meter"
-                        variable_with_units = parts[2]  # "MeterName [Units]"
-                        
-                        # Only process lines that are meters
-                        if report_type.lower() == 'meter':
-                            # Extract meter name and units
-                            if '[' in variable_with_units and ']' in variable_with_units:
-                                # Split on the last occurrence of '['
-                                meter_name = variable_with_units.rsplit('[', 1)[0].strip()
-                                units_part = variable_with_units.rsplit('[', 1)[1]
-                                units = units_part.replace(']', '').strip()
-                            else:
-                                meter_name = variable_with_units.strip()
-                                units = ""
-                            
-                            # Skip empty meter names
-                            if not meter_name:
-                                continue
-                            
-                            # Determine resource type from meter name
-                            resource_type = self._infer_resource_type(meter_name)
-                            
-                            meter_info = {
-                                "meter_name": meter_name,
-                                "units": units,
-                                "resource_type": resource_type,
-                                "var_type": var_type,
-                                "default_frequency": "hourly",  # Default frequency
-                                "output_meter_line": f"Output:Meter,{meter_name},hourly;",
-                                "output_meter_fileonly_line": f"Output:Meter:MeterFileOnly,{meter_name},hourly;",
-                                "output_meter_cumulative_line": f"Output:Meter:Cumulative,{meter_name},hourly;",
-                                "output_meter_cumulative_fileonly_line": f"Output:Meter:Cumulative:MeterFileOnly,{meter_name},hourly;"
-                            }
-                            
-                            meters.append(meter_info)
-                            
-                except Exception as e:
-                    logger.warning(f"Could not parse .mdd meter line: {line} - Error: {e}")
-                    continue
-        
-        return meters
-    
-    def _infer_resource_type(self, meter_name: str) -> str:
-        """Infer resource type from meter name"""
-        meter_lower = meter_name.lower()
-        
-        if 'electricity' in meter_lower:
-            return 'Electricity'
-        elif 'naturalgas' in meter_lower or ':gas' in meter_lower:
-            return 'NaturalGas'
-        elif 'water' in meter_lower:
-            if 'mains' in meter_lower:
-                return 'MainsWater'
-            else:
-                return 'Water'
-        elif 'steam' in meter_lower:
-            return 'Steam'
-        elif 'energytransfer' in meter_lower or 'energy transfer' in meter_lower:
-            return 'EnergyTransfer'
-        elif 'carbon' in meter_lower or 'co2' in meter_lower:
-            return 'Carbon Equivalent'
-        elif 'purchased' in meter_lower:
-            return 'ElectricityPurchased'
-        elif 'surplus' in meter_lower:
-            return 'ElectricitySurplusSold'
-        elif 'net' in meter_lower:
-            return 'ElectricityNet'
-        else:
-            return 'Other'
-    
     def _categorize_meters(self, meters: List[Dict[str, Any]]) -> Dict[str, int]:
         """Categorize meters by resource type and other characteristics"""
         categories = {}
@@ -621,88 +249,55 @@ class OutputMeterManager:
         
         return categories
     
-    def _cleanup_temp_files(self, temp_idf_path: str, temp_output_dir: str):
-        """Clean up temporary files and directories"""
-        try:
-            # Remove temporary IDF file
-            if os.path.exists(temp_idf_path):
-                os.remove(temp_idf_path)
-                logger.debug(f"Cleaned up temporary IDF: {temp_idf_path}")
-            
-            # Remove temporary output directory
-            if os.path.exists(temp_output_dir):
-                shutil.rmtree(temp_output_dir)
-                logger.debug(f"Cleaned up temporary output directory: {temp_output_dir}")
-        
-        except Exception as e:
-            logger.warning(f"Error cleaning up temporary files: {e}")
-    
-    def _get_available_meters_cached(self, idf_path: str, force_refresh: bool = False) -> List[Dict]:
-        """Get available meters using discovery tool with intelligent caching"""
-        cache_key = self._validation_cache.get_cache_key(idf_path)
-        
-        # Check cache first
-        if (not force_refresh and 
-            cache_key in self._validation_cache._available_meters_cache and
-            self._validation_cache.is_cache_valid(cache_key)):
-            
-            logger.debug(f"Using cached available meters for {idf_path}")
-            return self._validation_cache._available_meters_cache[cache_key]
-        
-        logger.info(f"Discovering available meters for validation: {idf_path}")
-        
-        try:
-            # Use existing discovery method
-            discovery_result = self.discover_available_meters(idf_path, run_days=1)
-            
-            if discovery_result.get("success"):
-                available_meters = discovery_result.get("meters", [])
-                # Cache the results
-                self._validation_cache._available_meters_cache[cache_key] = available_meters
-                self._validation_cache._cache_timestamps[cache_key] = time.time()
-                logger.info(f"Cached {len(available_meters)} available meters")
-                return available_meters
-            else:
-                logger.warning(f"Failed to discover available meters: {discovery_result.get('error')}")
-                return []
+    def _get_available_meters_cached(self, idf_path: str, force_refresh: bool = False) -> NameIndex:
+        """Get an index of the available meters from the shared (cached) output discovery"""
+        cache_key = ("available_meters",) + file_key(idf_path)
+        if force_refresh:
+            self.validation_cache.invalidate(cache_key)
+        
+        def discover():
+            try:
+                discovery_result = self.discover_available_meters(idf_path, run_days=1, force_refresh=force_refresh)
                 
-        except Exception as e:
-            logger.error(f"Error during meter discovery: {e}")
-            return []
+                if discovery_result.get("success"):
+                    return self.discovery.get_name_index(discovery_result["signature"], "meters",
+                                                         discovery_result["meters"])
+                else:
+                    logger.warning(f"Failed to discover available meters: {discovery_result.get('error')}")
+                    
+            except Exception as e:
+                logger.error(f"Error during meter discovery: {e}")
+            return None
+        
+        # Concurrent requests for the same model wait for a single discovery
+        return self.validation_cache.get_or_compute(cache_key, discover) or NameIndex([], "meter_name")
     
     def _get_configured_meters_cached(self, idf_path: str) -> List[Dict]:
         """Get currently configured meters with caching"""
-        cache_key = self._validation_cache.get_cache_key(idf_path)
-        
-        # Check cache first
-        if (cache_key in self._validation_cache._configured_meters_cache and
-            self._validation_cache.is_cache_valid(cache_key)):
-            return self._validation_cache._configured_meters_cache[cache_key]
-        
-        try:
-            # Use existing method
-            configured_result = self.get_configured_meters(idf_path)
-            
-            if configured_result.get("success"):
-                # Flatten all meter types into one list for easier caching
-                all_configured_meters = []
-                for meter_type_key in ["output_meters", "output_meter_fileonly", 
-                                     "output_meter_cumulative", "output_meter_cumulative_fileonly"]:
-                    meters = configured_result.get(meter_type_key, [])
-                    for meter in meters:
-                        meter["meter_type"] = meter.get("meter_type", meter_type_key)
-                        all_configured_meters.append(meter)
-                
-                # Cache the results
-                self._validation_cache._configured_meters_cache[cache_key] = all_configured_meters
-                self._validation_cache._cache_timestamps[cache_key] = time.time()
-                return all_configured_meters
-            else:
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error getting configured meters: {e}")
-            return []
+        def read_configured():
+            try:
+                configured_result = self.get_configured_meters(idf_path)
+                if configured_result.get("success"):
+                    return self._flatten_configured_meters(configured_result)
+            except Exception as e:
+                logger.error(f"Error getting configured meters: {e}")
+            return None
+        
+        configured_meters = self.validation_cache.get_or_compute(
+            ("configured_meters",) + file_key(idf_path), read_configured
+        )
+        return configured_meters if configured_meters is not None else []
+    
+    def _flatten_configured_meters(self, configured_result: Dict[str, Any]) -> List[Dict]:
+        """Flatten all meter types from get_configured_meters into one list"""
+        all_configured_meters = []
+        for meter_type_key in ["output_meters", "output_meter_fileonly", 
+                             "output_meter_cumulative", "output_meter_cumulative_fileonly"]:
+            meters = configured_result.get(meter_type_key, [])
+            for meter in meters:
+                meter["meter_type"] = meter.get("meter_type", meter_type_key)
+                all_configured_meters.append(meter)
+        return all_configured_meters
     
     def auto_resolve_meter_specs(self, meters: List) -> List[Dict]:
         """Convert various input formats to standardized meter specifications"""
@@ -794,8 +389,8 @@ class OutputMeterManager:
             }
     
     def validate_meter_name(self, idf_path: str, meter_name: str, 
-                           available_meters: Optional[List[Dict]] = None) -> Dict[str, Any]:
-        """Validate meter name against available meters in the model"""
+                           available_meters: Optional[Union[List[Dict], NameIndex]] = None) -> Dict[str, Any]:
+        """Validate meter name against available meters in the model (a list or a prebuilt NameIndex)"""
         if not meter_name or not isinstance(meter_name, str):
             return {
                 "is_valid": False,
@@ -812,14 +407,14 @@ class OutputMeterManager:
                     "is_valid": True,
                     "note": "Meter name validation skipped (discovery failed)"
                 }
+        elif not isinstance(available_meters, NameIndex):
+            available_meters = NameIndex(available_meters, "meter_name")
         
-        available_names = {meter["meter_name"] for meter in available_meters}
-        meter_lookup = {meter["meter_name"]: meter for meter in available_meters}
-        
-        if meter_name in available_names:
+        metadata = available_meters.get(meter_name)
+        if metadata is not None:
             return {
                 "is_valid": True,
-                "metadata": meter_lookup[meter_name]
+                "metadata": metadata
             }
         else:
             result = {
@@ -828,8 +423,7 @@ class OutputMeterManager:
             }
             
             # Find similar meter names
-            from difflib import get_close_matches
-            suggestions = get_close_matches(meter_name, available_names, n=5, cutoff=0.6)
+            suggestions = available_meters.suggest(meter_name, n=5, cutoff=0.6)
             if suggestions:
                 result["suggestions"] = suggestions
             
@@ -851,7 +445,7 @@ class OutputMeterManager:
         }
         
         # Get available meters for validation (only for strict/moderate, using cache)
-        available_meters = []
+        available_meters = NameIndex([], "meter_name")
         if validation_level in ["strict", "moderate"]:
             available_meters = self._get_available_meters_cached(idf_path)
             if available_meters:
@@ -877,7 +471,7 @@ class OutputMeterManager:
         
         return validation_report
     
-    def _validate_single_meter(self, meter_spec: Dict, index: int, available_meters: List[Dict],
+    def _validate_single_meter(self, meter_spec: Dict, index: int, available_meters: NameIndex,
                               validation_level: str, idf_path: str) -> Dict[str, Any]:
         """Validate a single meter specification"""
         result = {
@@ -932,10 +526,13 @@ class OutputMeterManager:
         return result
     
     def check_duplicate_meters(self, idf_path: str, meters: List[Dict], 
-                              allow_duplicates: bool = False) -> Dict[str, Any]:
+                              allow_duplicates: bool = False, idf=None) -> Dict[str, Any]:
         """Check for duplicate meters against existing configuration"""
-        # Get currently configured meters using cached method
-        configured_meters = self._get_configured_meters_cached(idf_path)
+        # Get currently configured meters using cached method (an open session model may differ from the file)
+        if idf is not None:
+            configured_meters = self._flatten_configured_meters(self.get_configured_meters(idf_path, idf))
+        else:
+            configured_meters = self._get_configured_meters_cached(idf_path)
         
         if not configured_meters:
             logger.warning("Failed to get configured meters for duplicate checking")
@@ -983,11 +580,12 @@ class OutputMeterManager:
         }
     
     def add_meters_to_idf(self, idf_path: str, meters: List[Dict], 
-                         output_path: str) -> Dict[str, Any]:
-        """Add output meters to IDF file and save"""
+                         output_path: Optional[str], idf=None) -> Dict[str, Any]:
+        """Add output meters to IDF file and save (an open session model is edited in memory instead)"""
         try:
             # Load IDF
-            idf = IDF(idf_path)
+            if idf is None:
+                idf = IDF(idf_path)
             
             added_meters = []
             
@@ -1009,8 +607,9 @@ class OutputMeterManager:
                 added_meters.append(meter_spec)
                 logger.debug(f"Added {meter_type}: {meter_spec}")
             
-            # Save modified IDF
-            idf.save(output_path)
+            # Save modified IDF (session models stay in memory until the session is saved)
+            if output_path:
+                idf.save(output_path)
             
             return {
                 "success": True,
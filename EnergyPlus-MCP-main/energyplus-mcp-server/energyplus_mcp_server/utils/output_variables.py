@@ -10,47 +10,24 @@ any required approvals from the U.S. Dept. of Energy). All rights reserved.
 See License.txt in the parent directory for license details.
 """
 
-import os
+import re
 import json
 import logging
 import time
-from typing import Dict, List, Any, Optional, Set, Tuple
-from pathlib import Path
-from datetime import datetime
-import shutil
+import fnmatch
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from difflib import get_close_matches
 
 from eppy.modeleditor import IDF
 
-logger = logging.getLogger(__name__)
-
+from .model_cache import get_model_cache
+from .output_discovery import get_output_discovery
+from .variable_predictor import VariablePredictor, AVAILABLE, UNAVAILABLE
+from .name_index import NameIndex, ObjectNameIndex
+from .validation_cache import get_validation_cache, file_key
+from .simulation_jobs import get_simulation_job_manager
 
-class ValidationCache:
-    """Cache expensive discovery results to improve performance"""
-    
-    def __init__(self):
-        self._available_vars_cache = {}
-        self._configured_vars_cache = {}
-        self._cache_timestamps = {}
-    
-    def get_cache_key(self, idf_path: str) -> str:
-        """Generate cache key based on file path and modification time"""
-        try:
-            path_obj = Path(idf_path)
-            if path_obj.exists():
-                mtime = os.path.getmtime(idf_path)
-                return f"{idf_path}:{mtime}"
-            return idf_path
-        except Exception:
-            return idf_path
-    
-    def is_cache_valid(self, cache_key: str, max_age_seconds: int = 300) -> bool:
-        """Check if cache entry is still valid (default: 5 minutes)"""
-        if cache_key not in self._cache_timestamps:
-            return False
-        
-        age = time.time() - self._cache_timestamps[cache_key]
-        return age < max_age_seconds
+logger = logging.getLogger(__name__)
 
 
 class OutputVariableManager:
@@ -59,7 +36,9 @@ class OutputVariableManager:
     def __init__(self, config):
         """Initialize with configuration"""
         self.config = config
-        self._validation_cache = ValidationCache()
+        self.model_cache = get_model_cache()
+        self.validation_cache = get_validation_cache()
+        self.discovery = get_output_discovery()
         
         # Valid frequencies for EnergyPlus output variables
         self.VALID_FREQUENCIES = {
@@ -72,54 +51,47 @@ class OutputVariableManager:
             "annual": "Annual summary"
         }
     
-    def discover_available_variables(self, idf_path: str, run_days: int = 1) -> Dict[str, Any]:
+    def discover_available_variables(self, idf_path: str, run_days: int = 1,
+                                     force_refresh: bool = False) -> Dict[str, Any]:
         """
         Discover all available output variables by running simulation with Output:VariableDictionary
         
+        The discovery simulation is shared with OutputMeterManager: one run writes
+        both the .rdd and the .mdd file, and its results are reused for a while.
+        
         Args:
             idf_path: Path to the IDF file
             run_days: Number of days to run simulation (default: 1 for speed)
+            force_refresh: Run a new discovery simulation even if results are cached
         
         Returns:
             Dictionary with discovered variables and metadata
         """
         try:
-            logger.info(f"Discovering available output variables for: {idf_path}")
-            
-            # Create temporary modified IDF with Output:VariableDictionary
-            temp_idf_path = self._create_temp_idf_with_variable_dictionary(idf_path, run_days)
+            discovery = self.discovery.discover(idf_path, run_days, force_refresh)
             
-            # Run short simulation
-            logger.info("Running short simulation to generate variable dictionary...")
-            sim_result = self._run_variable_discovery_simulation(temp_idf_path)
-            
-            if not sim_result["success"]:
+            if not discovery["success"]:
                 return {
                     "success": False,
                     "error": "Failed to run simulation for variable discovery",
-                    "simulation_error": sim_result.get("error", "Unknown error")
+                    "simulation_error": discovery.get("simulation_error", discovery.get("error", "Unknown error"))
                 }
             
-            # Parse .rdd file
-            rdd_file_path = self._find_rdd_file(sim_result["output_directory"])
-            if not rdd_file_path:
+            variables = discovery["variables"]
+            if variables is None:
                 return {
                     "success": False,
                     "error": "Could not find .rdd file in simulation output"
                 }
             
-            # Extract variables from .rdd file
-            variables = self._parse_rdd_file(rdd_file_path)
-            
-            # Clean up temporary files
-            self._cleanup_temp_files(temp_idf_path, sim_result["output_directory"])
-            
             result = {
                 "success": True,
                 "discovery_mode": True,
                 "input_file": idf_path,
                 "total_variables": len(variables),
-                "run_days": run_days,
+                "run_days": discovery["run_days"],
+                "cached_discovery": discovery["cached"],
+                "signature": discovery["signature"],
                 "categories": self._categorize_variables(variables),
                 "variables": variables
             }
@@ -131,19 +103,21 @@ class OutputVariableManager:
             logger.error(f"Error discovering available output variables: {e}")
             raise RuntimeError(f"Error discovering available output variables: {str(e)}")
     
-    def get_configured_variables(self, idf_path: str) -> Dict[str, Any]:
+    def get_configured_variables(self, idf_path: str, idf=None) -> Dict[str, Any]:
         """
         Get currently configured output variables from the IDF file
         
         Args:
             idf_path: Path to the IDF file
+            idf: Already open model to read instead of the file (e.g. from a model session)
         
         Returns:
             Dictionary with currently configured variables
         """
         try:
             logger.debug(f"Getting configured output variables for: {idf_path}")
-            idf = IDF(idf_path)
+            if idf is None:
+                idf = self.model_cache.get_model(idf_path)
             
             output_vars = idf.idfobjects.get("Output:Variable", [])
             output_meters = idf.idfobjects.get("Output:Meter", [])
@@ -184,165 +158,6 @@ class OutputVariableManager:
             logger.error(f"Error getting configured output variables: {e}")
             raise RuntimeError(f"Error getting configured output variables: {str(e)}")
     
-    def _create_temp_idf_with_variable_dictionary(self, idf_path: str, run_days: int) -> str:
-        """Create temporary IDF with Output:VariableDictionary and short run period"""
-        idf = IDF(idf_path)
-        
-        # Check if Output:VariableDictionary already exists
-        existing_var_dict = idf.idfobjects.get('Output:VariableDictionary', [])
-        
-        if existing_var_dict:
-            # Update existing Output:VariableDictionary to use 'IDF' key field
-            var_dict = existing_var_dict[0]  # Use the first one if multiple exist
-            var_dict.Key_Field = 'IDF'
-            logger.debug(f"Updated existing Output:VariableDictionary Key_Field to 'IDF'")
-        else:
-            # Add new Output:VariableDictionary object
-            var_dict = idf.newidfobject('Output:VariableDictionary')
-            var_dict.Key_Field = 'IDF'
-            logger.debug(f"Added new Output:VariableDictionary with Key_Field 'IDF'")
-        
-        # Remove any additional Output:VariableDictionary objects to avoid conflicts
-        if len(existing_var_dict) > 1:
-            for extra_dict in existing_var_dict[1:]:
-                idf.removeidfobject(extra_dict)
-            logger.debug(f"Removed {len(existing_var_dict) - 1} extra Output:VariableDictionary objects")
-        
-        # Modify run period to be short (1 day by default)
-        run_periods = idf.idfobjects.get("RunPeriod", [])
-        if run_periods:
-            run_period = run_periods[0]
-            # Set to run for specified days in January
-            run_period.Begin_Month = 1
-            run_period.Begin_Day_of_Month = 1
-            run_period.End_Month = 1
-            run_period.End_Day_of_Month = run_days
-        
-        # Create temporary file
-        temp_path = os.path.join(
-            self.config.paths.temp_dir, 
-            f"temp_variable_discovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}.idf"
-        )
-        idf.save(temp_path)
-        
-        return temp_path
-    
-    def _run_variable_discovery_simulation(self, temp_idf_path: str) -> Dict[str, Any]:
-        """Run a minimal simulation just to generate the .rdd file"""
-        try:
-            # Create output directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_dir = os.path.join(self.config.paths.temp_dir, f"variable_discovery_{timestamp}")
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Check for weather file
-            weather_file = None
-            if os.path.exists(self.config.energyplus.default_weather_file):
-                weather_file = self.config.energyplus.default_weather_file
-                logger.info(f"Using default weather file: {weather_file}")
-            else:
-                logger.warning("Default weather file not found, running without weather data")
-            
-            # Load IDF for simulation (with weather file if available)
-            if weather_file:
-                idf = IDF(temp_idf_path, weather_file)
-            else:
-                idf = IDF(temp_idf_path)
-            
-            # Run simulation with minimal options
-            simulation_options = {
-                'output_directory': output_dir,
-                'annual': False,  # Use RunPeriod only
-                'design_day': False,
-                'readvars': False,  # Don't need variable processing
-                'expandobjects': False,  # Speed up
-                'output_prefix': 'variable_discovery',
-                'output_suffix': 'C'
-            }
-            
-            # Add weather file to options if available
-            if weather_file:
-                simulation_options['weather'] = weather_file
-            
-            start_time = datetime.now()
-            result = idf.run(**simulation_options)
-            end_time = datetime.now()
-            
-            return {
-                "success": True,
-                "output_directory": output_dir,
-                "duration": str(end_time - start_time),
-                "weather_file": weather_file,
-                "result": str(result) if result else "Completed"
-            }
-            
-        except Exception as e:
-            logger.error(f"Simulation failed during variable discovery: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    def _find_rdd_file(self, output_directory: str) -> Optional[str]:
-        """Find the .rdd file in the simulation output directory"""
-        output_dir = Path(output_directory)
-        rdd_files = list(output_dir.glob("*.rdd"))
-        
-        if rdd_files:
-            return str(rdd_files[0])
-        return None
-    
-    def _parse_rdd_file(self, rdd_file_path: str) -> List[Dict[str, Any]]:
-        """Parse the .rdd file to extract available output variables"""
-        variables = []
-        
-        try:
-            with open(rdd_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    # Skip comments and empty lines
-                    if line.startswith('!') or not line:
-                        continue
-                    
-                    # Look for Output:Variable lines
-                    if line.startswith('Output:Variable,'):
-                        try:
-                            # Parse the CSV-like format
-                            # Format: Output:Variable,*,Variable Name,frequency; !- Units [Unit]
-                            parts = line.split(',')
-                            if len(parts) >= 4:
-                                key_value = parts[1].strip()
-                                variable_name = parts[2].strip()
-                                frequency_part = parts[3].strip()
-                                
-                                # Extract frequency (remove semicolon and comment)
-                                frequency = frequency_part.split(';')[0].strip()
-                                
-                                # Extract units from comment if present
-                                units = ""
-                                if '!-' in line:
-                                    comment_part = line.split('!-')[1].strip()
-                                    if '[' in comment_part and ']' in comment_part:
-                                        units = comment_part.split('[')[1].split(']')[0]
-                                
-                                variables.append({
-                                    "key_value": key_value,
-                                    "variable_name": variable_name,
-                                    "default_frequency": frequency,
-                                    "units": units,
-                                    "output_variable_line": f"Output:Variable,{key_value},{variable_name},{frequency};"
-                                })
-                        except Exception as e:
-                            logger.warning(f"Could not parse .rdd line: {line} - Error: {e}")
-                            continue
-        
-        except Exception as e:
-            logger.error(f"Error reading .rdd file {rdd_file_path}: {e}")
-            raise
-        
-        return variables
-    
     def _categorize_variables(self, variables: List[Dict[str, Any]]) -> Dict[str, int]:
         """Categorize variables by type for summary statistics"""
         categories = {}
@@ -372,80 +187,45 @@ class OutputVariableManager:
         
         return categories
     
-    def _cleanup_temp_files(self, temp_idf_path: str, temp_output_dir: str):
-        """Clean up temporary files and directories"""
-        try:
-            # Remove temporary IDF file
-            if os.path.exists(temp_idf_path):
-                os.remove(temp_idf_path)
-                logger.debug(f"Cleaned up temporary IDF: {temp_idf_path}")
-            
-            # Remove temporary output directory
-            if os.path.exists(temp_output_dir):
-                shutil.rmtree(temp_output_dir)
-                logger.debug(f"Cleaned up temporary output directory: {temp_output_dir}")
-        
-        except Exception as e:
-            logger.warning(f"Error cleaning up temporary files: {e}")
-
-    def _get_available_variables_cached(self, idf_path: str, force_refresh: bool = False) -> List[Dict]:
-        """Get available variables using discovery tool with intelligent caching"""
-        cache_key = self._validation_cache.get_cache_key(idf_path)
-        
-        # Check cache first
-        if (not force_refresh and 
-            cache_key in self._validation_cache._available_vars_cache and
-            self._validation_cache.is_cache_valid(cache_key)):
-            
-            logger.debug(f"Using cached available variables for {idf_path}")
-            return self._validation_cache._available_vars_cache[cache_key]
-        
-        logger.info(f"Discovering available variables for validation: {idf_path}")
-        
-        try:
-            # Use existing discovery method
-            discovery_result = self.discover_available_variables(idf_path, run_days=1)
-            
-            if discovery_result.get("success"):
-                available_vars = discovery_result.get("variables", [])
-                # Cache the results
-                self._validation_cache._available_vars_cache[cache_key] = available_vars
-                self._validation_cache._cache_timestamps[cache_key] = time.time()
-                logger.info(f"Cached {len(available_vars)} available variables")
-                return available_vars
-            else:
-                logger.warning(f"Failed to discover available variables: {discovery_result.get('error')}")
-                return []
+    def _get_available_variables_cached(self, idf_path: str, force_refresh: bool = False) -> NameIndex:
+        """Get an index of the available variables from the shared (cached) output discovery"""
+        cache_key = ("available_variables",) + file_key(idf_path)
+        if force_refresh:
+            self.validation_cache.invalidate(cache_key)
+        
+        def discover():
+            try:
+                discovery_result = self.discover_available_variables(idf_path, run_days=1,
+                                                                     force_refresh=force_refresh)
                 
-        except Exception as e:
-            logger.error(f"Error during variable discovery: {e}")
-            return []
+                if discovery_result.get("success"):
+                    return self.discovery.get_name_index(discovery_result["signature"], "variables",
+                                                         discovery_result["variables"])
+                else:
+                    logger.warning(f"Failed to discover available variables: {discovery_result.get('error')}")
+                    
+            except Exception as e:
+                logger.error(f"Error during variable discovery: {e}")
+            return None
+        
+        # Concurrent requests for the same model wait for a single discovery
+        return self.validation_cache.get_or_compute(cache_key, discover) or NameIndex([], "variable_name")
     
     def _get_configured_variables_cached(self, idf_path: str) -> List[Dict]:
         """Get currently configured variables with caching"""
-        cache_key = self._validation_cache.get_cache_key(idf_path)
-        
-        # Check cache first
-        if (cache_key in self._validation_cache._configured_vars_cache and
-            self._validation_cache.is_cache_valid(cache_key)):
-            return self._validation_cache._configured_vars_cache[cache_key]
-        
-        try:
-            # Use existing method
-            configured_result = self.get_configured_variables(idf_path)
-            
-            if configured_result.get("success"):
-                configured_vars = configured_result.get("output_variables", [])
-                # Cache the results
-                self._validation_cache._configured_vars_cache[cache_key] = configured_vars
-                self._validation_cache._cache_timestamps[cache_key] = time.time()
-                return configured_vars
-            else:
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error getting configured variables: {e}")
-            return []
+        def read_configured():
+            try:
+                configured_result = self.get_configured_variables(idf_path)
+                if configured_result.get("success"):
+                    return configured_result.get("output_variables", [])
+            except Exception as e:
+                logger.error(f"Error getting configured variables: {e}")
+            return None
+        
+        configured_vars = self.validation_cache.get_or_compute(
+            ("configured_variables",) + file_key(idf_path), read_configured
+        )
+        return configured_vars if configured_vars is not None else []
     
     def validate_frequency(self, frequency: str) -> Dict[str, Any]:
         """Validate reporting frequency against EnergyPlus specifications"""
@@ -473,8 +253,8 @@ class OutputVariableManager:
             }
     
     def validate_variable_name(self, idf_path: str, variable_name: str, 
-                             available_vars: Optional[List[Dict]] = None) -> Dict[str, Any]:
-        """Validate variable name against available variables in the model"""
+                             available_vars: Optional[Union[List[Dict], NameIndex]] = None) -> Dict[str, Any]:
+        """Validate variable name against available variables in the model (a list or a prebuilt NameIndex)"""
         if not variable_name or not isinstance(variable_name, str):
             return {
                 "is_valid": False,
@@ -484,14 +264,14 @@ class OutputVariableManager:
         # Get available variables if not provided
         if available_vars is None:
             available_vars = self._get_available_variables_cached(idf_path)
+        elif not isinstance(available_vars, NameIndex):
+            available_vars = NameIndex(available_vars, "variable_name")
         
-        available_names = {var["variable_name"] for var in available_vars}
-        variable_lookup = {var["variable_name"]: var for var in available_vars}
-        
-        if variable_name in available_names:
+        metadata = available_vars.get(variable_name)
+        if metadata is not None:
             return {
                 "is_valid": True,
-                "metadata": variable_lookup[variable_name]
+                "metadata": metadata
             }
         else:
             result = {
@@ -500,14 +280,70 @@ class OutputVariableManager:
             }
             
             # Find similar variable names
-            suggestions = get_close_matches(variable_name, available_names, n=5, cutoff=0.6)
+            suggestions = available_vars.suggest(variable_name, n=5, cutoff=0.6)
             if suggestions:
                 result["suggestions"] = suggestions
             
             return result
     
+    def validate_predicted_variable_name(self, variable_name: str, prediction: Dict[str, Any],
+                                         predicted_index: Optional[NameIndex] = None) -> Dict[str, Any]:
+        """Validate variable name against the variables predicted for the model (see predict_variables)"""
+        if not variable_name or not isinstance(variable_name, str):
+            return {
+                "is_valid": False,
+                "error": "Variable name must be a non-empty string"
+            }
+        
+        check = VariablePredictor.check(prediction, variable_name)
+        if check["status"] == AVAILABLE:
+            return {
+                "is_valid": True,
+                "predicted": True,
+                "metadata": check["metadata"]
+            }
+        if check["status"] == UNAVAILABLE:
+            # The rules are mined from a few observed models, so only a discovery can rule a variable out
+            result = {
+                "is_valid": True,
+                "predicted": True,
+                "warning": (f"Variable '{variable_name}' may not be reported by this model "
+                            f"(predicted to require any of: {', '.join(check['requires_any_of'])}); "
+                            f"use strict validation or get_output_variables(discover_available=True) to verify it")
+            }
+            if predicted_index is None:
+                predicted_index = NameIndex(prediction["available"].values(), "variable_name")
+            suggestions = predicted_index.suggest(variable_name, n=5, cutoff=0.6)
+            if suggestions:
+                result["suggestions"] = suggestions
+            return result
+        return {
+            "is_valid": True,
+            "predicted": True,
+            "warning": (f"Variable '{variable_name}' could not be checked without a discovery simulation; "
+                        f"use strict validation or get_output_variables(discover_available=True) to verify it")
+        }
+    
+    def _get_object_name_index(self, idf_path: str) -> ObjectNameIndex:
+        """Object name index of a model file, rebuilt when the file changes"""
+        return self.validation_cache.get_or_compute(("object_names",) + file_key(idf_path),
+                                                    lambda: ObjectNameIndex(idf_path))
+    
+    @staticmethod
+    def is_key_pattern(key_value: str) -> bool:
+        """Whether a key value is a wildcard (Zone*, ?) or regex: pattern rather than a name"""
+        key_value = key_value.strip()
+        return key_value != "*" and (key_value.startswith("regex:") or any(c in key_value for c in "*?["))
+    
     def validate_key_value(self, idf_path: str, key_value: str, variable_name: str) -> Dict[str, Any]:
-        """Validate key value against model objects (basic implementation)"""
+        """
+        Validate key value against the names of the objects that report the variable
+        
+        Literal keys are resolved to such an object name (case-insensitive). Wildcard
+        keys (``Zone*``) and ``regex:<pattern>`` keys are expanded to the matching names.
+        The reporting object types are predicted, so a key that names no such object
+        only draws a warning; a pattern is an error only when it matches no name at all.
+        """
         if not key_value or not isinstance(key_value, str):
             return {
                 "is_valid": False,
@@ -524,14 +360,82 @@ class OutputVariableManager:
                 "note": "Will apply to all applicable objects"
             }
         
-        # For now, accept any non-empty string as potentially valid
-        # Advanced validation would require loading the IDF and checking object names
-        # This could be enhanced later with model introspection
-        return {
+        sources = self.discovery.get_predictor().key_sources(variable_name)
+        name_index = self._get_object_name_index(idf_path)
+        if sources is not None:
+            candidates = sources["fixed_keys"] + name_index.names_for(sources["object_types"])
+            described = ", ".join(sources["fixed_keys"] + sources["object_types"])
+        else:
+            candidates = None
+            described = "any object"
+        
+        if self.is_key_pattern(key_value):
+            if key_value.startswith("regex:"):
+                try:
+                    regex = re.compile(key_value[len("regex:"):], re.IGNORECASE)
+                except re.error as e:
+                    return {
+                        "is_valid": False,
+                        "error": f"Invalid regular expression in key value '{key_value}': {e}"
+                    }
+                matches_key = regex.fullmatch
+            else:
+                matches_key = lambda name: fnmatch.fnmatchcase(name.upper(), key_value.upper())
+            pool = candidates if candidates is not None else name_index.all_names()
+            matches = [name for name in pool if matches_key(name)]
+            result = {}
+            if not matches and candidates is not None:
+                matches = [name for name in name_index.all_names() if matches_key(name)]
+                if matches:
+                    result["warnings"] = [f"Key pattern '{key_value}' matches no {described} names, only "
+                                          f"other objects that may not report '{variable_name}'"]
+            if not matches:
+                return {
+                    "is_valid": False,
+                    "error": f"Key pattern '{key_value}' matches no {described} names in the model"
+                }
+            return {
+                "is_valid": True,
+                "resolved_keys": matches,
+                "expanded": True,
+                "note": f"Pattern expands to {len(matches)} key(s)",
+                **result
+            }
+        
+        if candidates is None:
+            name = name_index.find(key_value)
+            if name is not None:
+                return {"is_valid": True, "resolved_keys": [name]}
+            return {
+                "is_valid": True,
+                "resolved_keys": [key_value],
+                "warnings": [f"Key '{key_value}' for '{variable_name}' is not an object name in the model; "
+                             f"it may name a node or be misspelled"]
+            }
+        
+        folded = {name.casefold(): name for name in candidates}
+        name = folded.get(key_value.casefold())
+        if name is not None:
+            return {"is_valid": True, "resolved_keys": [name]}
+        
+        # Types are predicted from a few observed models, so a miss cannot rule the key out
+        name = name_index.find(key_value)
+        if name is not None:
+            warning = (f"Key '{key_value}' names an object that is not predicted to report '{variable_name}' "
+                       f"(expected a {described} name)")
+        else:
+            name = key_value
+            warning = (f"Key '{key_value}' does not name any {described} object in the model; "
+                       f"it may be misspelled")
+        result = {
             "is_valid": True,
-            "resolved_keys": [key_value],
-            "note": f"Will apply to object '{key_value}' if it exists in the model"
+            "resolved_keys": [name],
+            "warnings": [warning]
         }
+        suggestions = NameIndex(({"name": n} for n in candidates), "name").suggest(key_value, n=5, cutoff=0.6)
+        if suggestions:
+            result["suggestions"] = suggestions
+        return result
     
     def auto_resolve_variable_specs(self, variables: List) -> List[Dict]:
         """Convert various input formats to standardized variable specifications"""
@@ -580,18 +484,46 @@ class OutputVariableManager:
             "performance": {}
         }
         
-        # Get available variables for validation (cached)
-        available_vars = []
+        # Get available variables for validation: a stored discovery result, else a
+        # prediction from the model's object types while discovery runs in the background
+        available_vars = NameIndex([], "variable_name")
+        prediction = None
         if validation_level in ["strict", "moderate"]:
-            available_vars = self._get_available_variables_cached(idf_path)
-            validation_report["performance"]["available_variables_found"] = len(available_vars)
+            stored = None
+            if self.config.server.predict_output_variables:
+                stored = self.discovery.lookup(idf_path)
+                if stored is None or stored["variables"] is None:
+                    prediction = self.discovery.predict_variables(idf_path)
+                    
+                    # Strict validation runs the discovery now unless every variable is predicted
+                    if validation_level == "strict" and any(
+                        VariablePredictor.check(prediction, spec.get("variable_name", ""))["status"] != AVAILABLE
+                        for spec in variables
+                    ):
+                        prediction = None
+                    else:
+                        self.discovery.discover_in_background(idf_path, get_simulation_job_manager())
+            
+            if prediction is not None:
+                validation_report["availability_source"] = "prediction"
+                validation_report["performance"]["predicted_variables"] = len(prediction["available"])
+                validation_report["performance"]["predictor_observations"] = prediction["observations"]
+                available_vars = NameIndex(prediction["available"].values(), "variable_name")
+            else:
+                validation_report["availability_source"] = "discovery"
+                if stored is not None and stored["variables"] is not None:
+                    available_vars = self.discovery.get_name_index(stored["signature"], "variables",
+                                                                   stored["variables"])
+                else:
+                    available_vars = self._get_available_variables_cached(idf_path)
+                validation_report["performance"]["available_variables_found"] = len(available_vars)
         
         validation_report["performance"]["discovery_time"] = time.time() - start_time
         
         # Validate each variable specification
         for i, var_spec in enumerate(variables):
             var_validation = self._validate_single_variable(
-                var_spec, i, available_vars, validation_level, idf_path
+                var_spec, i, available_vars, validation_level, idf_path, prediction
             )
             
             if var_validation["is_valid"]:
@@ -604,9 +536,10 @@ class OutputVariableManager:
         
         return validation_report
     
-    def _validate_single_variable(self, var_spec: Dict, index: int, available_vars: List[Dict],
-                                 validation_level: str, idf_path: str) -> Dict[str, Any]:
-        """Validate a single variable specification"""
+    def _validate_single_variable(self, var_spec: Dict, index: int, available_vars: NameIndex,
+                                 validation_level: str, idf_path: str,
+                                 prediction: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Validate a single variable specification (against the prediction if one is given)"""
         result = {
             "index": index,
             "specification": var_spec,
@@ -635,7 +568,14 @@ class OutputVariableManager:
         
         # 2. Variable name validation (moderate and strict)
         if validation_level in ["strict", "moderate"]:
-            var_validation = self.validate_variable_name(idf_path, variable_name, available_vars)
+            if prediction is not None:
+                var_validation = self.validate_predicted_variable_name(variable_name, prediction, available_vars)
+                if "warning" in var_validation:
+                    result["warnings"].append(var_validation["warning"])
+                if var_validation["is_valid"] and "suggestions" in var_validation:
+                    result["suggestions"] = var_validation["suggestions"]
+            else:
+                var_validation = self.validate_variable_name(idf_path, variable_name, available_vars)
             result["validation_details"]["variable_name"] = var_validation
             if not var_validation["is_valid"]:
                 result["is_valid"] = False
@@ -645,23 +585,32 @@ class OutputVariableManager:
             elif "metadata" in var_validation:
                 result["metadata"] = var_validation["metadata"]
         
-        # 3. Key value validation (strict only)
-        if validation_level == "strict":
+        # 3. Key value validation (strict, and key patterns that must be expanded at any level but lenient)
+        if validation_level == "strict" or (validation_level == "moderate" and self.is_key_pattern(key_value)):
             key_validation = self.validate_key_value(idf_path, key_value, variable_name)
             result["validation_details"]["key_value"] = key_validation
+            if "suggestions" in key_validation:
+                result["key_suggestions"] = key_validation["suggestions"]
             if not key_validation["is_valid"]:
                 result["is_valid"] = False
                 result["errors"].append(key_validation["error"])
             else:
                 result["warnings"].extend(key_validation.get("warnings", []))
+                if key_validation.get("expanded"):
+                    result["expanded_specifications"] = [
+                        {**var_spec, "key_value": key} for key in key_validation["resolved_keys"]
+                    ]
         
         return result
     
     def check_duplicate_variables(self, idf_path: str, variables: List[Dict], 
-                                allow_duplicates: bool = False) -> Dict[str, Any]:
+                                allow_duplicates: bool = False, idf=None) -> Dict[str, Any]:
         """Check for duplicate variables against existing configuration"""
-        # Get currently configured variables
-        configured_vars = self._get_configured_variables_cached(idf_path)
+        # Get currently configured variables (an open session model may differ from the file)
+        if idf is not None:
+            configured_vars = self.get_configured_variables(idf_path, idf)["output_variables"]
+        else:
+            configured_vars = self._get_configured_variables_cached(idf_path)
         
         # Create set of existing specifications
         existing_specs = set()
@@ -698,11 +647,12 @@ class OutputVariableManager:
         }
     
     def add_variables_to_idf(self, idf_path: str, variables: List[Dict], 
-                           output_path: str) -> Dict[str, Any]:
-        """Add output variables to IDF file and save"""
+                           output_path: Optional[str], idf=None) -> Dict[str, Any]:
+        """Add output variables to IDF file and save (an open session model is edited in memory instead)"""
         try:
             # Load IDF
-            idf = IDF(idf_path)
+            if idf is None:
+                idf = IDF(idf_path)
             
             added_variables = []
             
@@ -717,8 +667,9 @@ class OutputVariableManager:
                 added_variables.append(var_spec)
                 logger.debug(f"Added Output:Variable: {var_spec}")
             
-            # Save modified IDF
-            idf.save(output_path)
+            # Save modified IDF (session models stay in memory until the session is saved)
+            if output_path:
+                idf.save(output_path)
             
             return {
                 "success": True,
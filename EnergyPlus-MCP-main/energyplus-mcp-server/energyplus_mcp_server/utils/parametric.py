@@ -0,0 +1,276 @@
+"""
+Parametric batch utilities for EnergyPlus MCP Server.
+Builds model variants from a base IDF in a process pool, reusing the server's own
+modification tools, and condenses each variant's outputs into a few key numbers.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import re
+import csv
+import json
+import sqlite3
+import logging
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from .sql_results import SqlResults, find_sql_output
+from .html_tables import find_html_tables, load_html_tables, html_table_cells
+
+logger = logging.getLogger(__name__)
+
+# Variant keys and the modification tool each one is applied with
+VARIANT_TRANSFORMS = {
+    "infiltration_multiplier": "change_infiltration_by_mult",
+    "coating": "add_coating_outside",
+    "window_film": "add_window_film_outside",
+    "people": "modify_people",
+    "lights": "modify_lights",
+    "electric_equipment": "modify_electric_equipment"
+}
+
+# Columns of the batch result table
+RESULT_COLUMNS = [
+    "variant", "status", "cache_hit", "elapsed_seconds",
+    "total_site_energy_gj", "total_source_energy_gj", "site_eui_mj_m2",
+    "unmet_heating_hours", "unmet_cooling_hours",
+    "site_energy_change_pct", "warnings", "severe_errors", "error"
+]
+
+_SUMMARY_ROWS = {
+    "Total Site Energy": ("total_site_energy_gj", "site_eui_mj_m2"),
+    "Total Source Energy": ("total_source_energy_gj", None),
+    "Time Setpoint Not Met During Occupied Heating": ("unmet_heating_hours", None),
+    "Time Setpoint Not Met During Occupied Cooling": ("unmet_cooling_hours", None)
+}
+
+_ERR_SUMMARY = re.compile(r"EnergyPlus (?:Completed Successfully|Terminated)--\s*(\d+)\s+Warning;\s*(\d+)\s+Severe")
+
+
+def normalize_variants(variants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Validate variant specifications and give each a unique, file-name-safe name
+
+    Each variant is a dictionary with an optional "name" and any of:
+      - "infiltration_multiplier": float
+      - "coating": {"location": "wall"|"roof", "solar_abs", "thermal_abs"} or a list of them
+      - "window_film": {"u_value", "shgc", "visible_transmittance"}
+      - "people" / "lights" / "electric_equipment": modification lists as accepted by
+        modify_people, modify_lights and modify_electric_equipment
+
+    Raises:
+        ValueError: If a variant is malformed
+    """
+    normalized = []
+    seen = set()
+    for i, variant in enumerate(variants):
+        if not isinstance(variant, dict):
+            raise ValueError(f"Variant {i} must be a dictionary")
+        unknown = set(variant) - set(VARIANT_TRANSFORMS) - {"name"}
+        if unknown:
+            raise ValueError(f"Variant {i} has unknown keys {sorted(unknown)}; "
+                             f"supported: {sorted(VARIANT_TRANSFORMS)}")
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(variant.get("name") or f"variant_{i + 1}")).strip("_")
+        if not name or name in seen or name == "baseline":
+            raise ValueError(f"Variant {i} needs a unique name other than 'baseline' (got '{name}')")
+        seen.add(name)
+
+        coating = variant.get("coating")
+        if isinstance(coating, dict):
+            coating = [coating]
+        for spec in coating or []:
+            if str(spec.get("location", "")).casefold() not in ("wall", "roof"):
+                raise ValueError(f"Variant '{name}': coating location must be 'wall' or 'roof'")
+        for key in ("people", "lights", "electric_equipment"):
+            if key in variant and not isinstance(variant[key], list):
+                raise ValueError(f"Variant '{name}': '{key}' must be a list of modifications")
+
+        normalized.append({**variant, "name": name, **({"coating": coating} if coating else {})})
+    return normalized
+
+
+_worker_manager = None
+
+
+def _init_variant_worker(config):
+    """Create one EnergyPlusManager per worker process from the parent's configuration"""
+    global _worker_manager
+    from ..energyplus_tools import EnergyPlusManager
+    _worker_manager = EnergyPlusManager(config)
+
+
+def build_variant(base_idf: str, variant: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+    """
+    Apply a variant's transforms to the base model and save it (runs in a worker process)
+
+    The model is opened as a model session, so every transform edits it in memory
+    and it is written once.
+
+    Returns:
+        Dictionary with the variant name, written IDF path and per-transform modification counts
+    """
+    manager = _worker_manager
+    session_id = manager.sessions.open_session(base_idf).session_id
+    applied = []
+    try:
+        def apply(transform: str, result_json: str, count_field: str):
+            result = json.loads(result_json)
+            if not result.get("success", False):
+                raise ValueError(f"{transform} failed: {result.get('validation_errors') or result.get('error')}")
+            applied.append({"transform": transform, "modifications": result.get(count_field, 0)})
+
+        if "infiltration_multiplier" in variant:
+            apply("change_infiltration_by_mult", manager.change_infiltration_by_mult(
+                base_idf, variant["infiltration_multiplier"], session_id=session_id), "total_modifications")
+        for spec in variant.get("coating", []):
+            apply("add_coating_outside", manager.add_coating_outside(
+                base_idf, spec["location"], spec.get("solar_abs", 0.4), spec.get("thermal_abs", 0.9),
+                session_id=session_id), "total_modifications")
+        if "window_film" in variant:
+            apply("add_window_film_outside", manager.add_window_film_outside(
+                base_idf, **variant["window_film"], session_id=session_id), "total_modifications")
+        if "people" in variant:
+            apply("modify_people", manager.modify_people(
+                base_idf, variant["people"], session_id=session_id), "total_modifications_applied")
+        if "lights" in variant:
+            apply("modify_lights", manager.modify_lights(
+                base_idf, variant["lights"], session_id=session_id), "total_modifications_applied")
+        if "electric_equipment" in variant:
+            apply("modify_electric_equipment", manager.modify_electric_equipment(
+                base_idf, variant["electric_equipment"], session_id=session_id), "total_modifications_applied")
+
+        manager.sessions.save_session(session_id, output_path)
+    finally:
+        manager.sessions.close_session(session_id, discard_changes=True)
+
+    return {"name": variant["name"], "idf_path": output_path, "transforms": applied}
+
+
+def build_variants(base_idf: str, variants: List[Dict[str, Any]], output_directory: str,
+                   max_workers: int, config) -> List[Dict[str, Any]]:
+    """
+    Build all variant IDFs concurrently in a process pool
+
+    Worker processes are spawned rather than forked, so the server's threads and
+    event loop are not copied into them. Each worker gets a pickled copy of
+    ``config``, so it uses the same IDD and paths as the calling manager rather
+    than a configuration rebuilt from its own environment.
+
+    Returns:
+        One entry per variant, in input order; failed variants carry an "error" field
+    """
+    stem = Path(base_idf).stem
+    workers = max(1, min(max_workers, len(variants)))
+    built = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_variant_worker, initargs=(config,)) as pool:
+        futures = [
+            pool.submit(build_variant, base_idf, variant,
+                        str(Path(output_directory) / f"{stem}_{variant['name']}.idf"))
+            for variant in variants
+        ]
+        for variant, future in zip(variants, futures):
+            try:
+                built.append(future.result())
+            except Exception as e:
+                logger.error(f"Could not build variant '{variant['name']}': {e}")
+                built.append({"name": variant["name"], "idf_path": None, "transforms": [], "error": str(e)})
+    return built
+
+
+def _to_number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def summarize_simulation_outputs(output_directory: str) -> Dict[str, Any]:
+    """
+    Read key results of a finished run from its tabular reports and .err file
+
+    The tabular data of the SQLite output is used when the run wrote one, else
+    the HTML tabular report (through its table cache), else the tabular CSV report.
+
+    Returns:
+        Dictionary with whichever of the RESULT_COLUMNS metrics were found
+    """
+    summary: Dict[str, Any] = {}
+    output_dir = Path(output_directory)
+
+    cells: List[Dict[str, Any]] = []
+    sql_path = find_sql_output(output_dir)
+    if sql_path is not None:
+        try:
+            with SqlResults(sql_path) as results:
+                cells = results.tabular(rows=list(_SUMMARY_ROWS))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read the tabular data of {sql_path}: {e}")
+    html_path = find_html_tables(output_dir)
+    if not cells and html_path is not None:
+        try:
+            cells = html_table_cells(load_html_tables(html_path)[0], rows=list(_SUMMARY_ROWS))
+        except OSError as e:
+            logger.warning(f"Could not read the tables of {html_path}: {e}")
+
+    # Like the CSV: the first table holding a row, its first (and second) value column
+    found: Dict[str, List[Any]] = {}
+    for cell in cells:
+        values = found.setdefault(cell["row"].strip(), [(cell["report"], cell["table"])])
+        if values[0] == (cell["report"], cell["table"]):
+            values.append(cell["value"])
+    for row, (_, *values) in found.items():
+        keys = _SUMMARY_ROWS.get(row)
+        if keys is None:
+            continue
+        summary[keys[0]] = _to_number(values[0])
+        if keys[1] and len(values) > 1:
+            summary[keys[1]] = _to_number(values[1])
+
+    tables = sorted(output_dir.glob("*Table.csv")) or sorted(output_dir.glob("*tbl.csv"))
+    if tables and not summary:
+        with open(tables[0], "r", encoding="latin-1", newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 3:
+                    continue
+                keys = _SUMMARY_ROWS.get(row[1].strip())
+                if keys is None or keys[0] in summary:
+                    continue
+                summary[keys[0]] = _to_number(row[2])
+                if keys[1] and len(row) > 3:
+                    summary[keys[1]] = _to_number(row[3])
+
+    for err_file in output_dir.glob("*.err"):
+        with open(err_file, "r", encoding="latin-1") as f:
+            match = _ERR_SUMMARY.search(f.read())
+        if match:
+            summary["warnings"] = int(match.group(1))
+            summary["severe_errors"] = int(match.group(2))
+            break
+
+    return summary
+
+
+def build_result_table(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Turn per-variant result dictionaries into a compact column/row table
+
+    Site energy change is computed against the "baseline" row when present.
+    """
+    baseline = next((r for r in rows if r.get("variant") == "baseline"), None)
+    base_energy = baseline.get("total_site_energy_gj") if baseline else None
+    for row in rows:
+        energy = row.get("total_site_energy_gj")
+        if base_energy and energy is not None:
+            row["site_energy_change_pct"] = round(100.0 * (energy - base_energy) / base_energy, 2)
+    return {
+        "columns": RESULT_COLUMNS,
+        "rows": [[row.get(column) for column in RESULT_COLUMNS] for row in rows]
+    }
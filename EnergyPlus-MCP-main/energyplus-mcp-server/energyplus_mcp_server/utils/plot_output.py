@@ -0,0 +1,121 @@
+"""
+HTML plot artifacts for EnergyPlus MCP Server.
+Writes plotly figures that load plotly.js from one local bundle shared by every
+plot under an output root, instead of embedding the ~4.8 MB library in each
+file. Plots stay viewable offline, and can optionally be gzip-compressed.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import gzip
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+import plotly
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_DIRECTORY = "plotly_bundle"
+
+# The version in the name keeps plots written by another plotly release working
+BUNDLE_NAME = f"plotly-{plotly.__version__}.min.js"
+
+BUNDLE_MODES = ("shared", "inline")
+
+
+def bundle_root_for(html_path: Union[str, Path], output_root: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Directory whose bundle a plot uses: ``output_root`` when the plot is written
+    under it, else the plot's own directory
+    """
+    html_dir = Path(html_path).resolve().parent
+    if output_root:
+        root = Path(output_root).resolve()
+        if html_dir == root or root in html_dir.parents:
+            return root
+    return html_dir
+
+
+def ensure_plotly_bundle(root: Union[str, Path]) -> Path:
+    """
+    Write the plotly.js bundle under ``root`` unless it is already there
+
+    Args:
+        root: Output root shared by the plots
+
+    Returns:
+        Path of the bundle
+    """
+    bundle_dir = Path(root) / BUNDLE_DIRECTORY
+    bundle_path = bundle_dir / BUNDLE_NAME
+    if bundle_path.exists():
+        return bundle_path
+
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file first so a concurrent plot never references a partial bundle
+    fd, tmp_path = tempfile.mkstemp(dir=bundle_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+        os.replace(tmp_path, bundle_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(f"Wrote plotly.js bundle: {bundle_path}")
+    return bundle_path
+
+
+def write_plot_html(fig, html_path: Union[str, Path], bundle: str = "shared",
+                    output_root: Optional[Union[str, Path]] = None, compress: bool = False) -> Dict[str, Any]:
+    """
+    Write a plotly figure as HTML
+
+    Args:
+        fig: plotly Figure
+        html_path: Path of the HTML file (".gz" is appended when compress is set)
+        bundle: "shared" loads plotly.js from the bundle of the output root through a
+            relative path; "inline" embeds it in the file
+        output_root: Root whose bundle plots under it share (see bundle_root_for)
+        compress: Write gzip-compressed HTML
+
+    Returns:
+        Dictionary with output_file, size_bytes, bundle and plotly_bundle (the bundle path or None)
+    """
+    if bundle not in BUNDLE_MODES:
+        raise ValueError(f"Unknown plot bundle mode '{bundle}'. Use one of: {', '.join(BUNDLE_MODES)}")
+
+    html_path = Path(html_path)
+    bundle_path = None
+    include_plotlyjs = True
+    if bundle == "shared":
+        bundle_path = ensure_plotly_bundle(bundle_root_for(html_path, output_root))
+        # Relative and with forward slashes so the output root can be moved or served as is
+        include_plotlyjs = Path(os.path.relpath(bundle_path, html_path.resolve().parent)).as_posix()
+
+    html = pio.to_html(fig, include_plotlyjs=include_plotlyjs, full_html=True)
+    if compress:
+        html_path = html_path.with_name(html_path.name + ".gz")
+        # Level 1: most of the size reduction of level 6 (plot data is repetitive) at half the time
+        with gzip.open(html_path, "wt", encoding="utf-8", compresslevel=1) as f:
+            f.write(html)
+    else:
+        html_path.write_text(html, encoding="utf-8")
+
+    return {
+        "output_file": str(html_path),
+        "size_bytes": html_path.stat().st_size,
+        "bundle": bundle,
+        "plotly_bundle": str(bundle_path) if bundle_path else None,
+    }
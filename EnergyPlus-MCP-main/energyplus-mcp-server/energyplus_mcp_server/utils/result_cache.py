@@ -0,0 +1,294 @@
+"""
+Content-addressed simulation result cache for EnergyPlus MCP Server.
+Maps a hash of the normalized model, the weather file, the simulation options and
+the EnergyPlus version to the output directory of a successful run, so identical
+re-runs can be answered without invoking EnergyPlus.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, List, Any, Optional, Iterable
+
+from .file_hashing import file_sha256
+from .idf_scanner import iter_idf_objects
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation changes so old entries stop matching
+CACHE_FORMAT = 1
+
+# Options that only decide where outputs go, not what they contain
+_LOCATION_OPTIONS = {"output_directory", "verbose"}
+
+
+def idf_content_digest(idf_path: str) -> str:
+    """
+    Hash an IDF by content, ignoring comments, whitespace, line breaks and the
+    letter case of object types
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for obj_type, fields in iter_idf_objects(idf_path):
+        digest.update(obj_type.upper().encode("latin-1"))
+        for value in fields:
+            digest.update(b"\x1f")
+            digest.update(value.encode("latin-1"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def make_result_key(idf_path: str, weather_path: Optional[str], options: Dict[str, Any],
+                    energyplus_version: str) -> str:
+    """
+    Build the cache key of a simulation
+
+    Args:
+        idf_path: Model to simulate
+        weather_path: Weather file, or None for design-day-only runs
+        options: EnergyPlus CLI options; the output directory is ignored
+        energyplus_version: Version of the EnergyPlus that produces the results
+
+    Returns:
+        SHA-256 hex digest identifying the run
+    """
+    material = {
+        "format": CACHE_FORMAT,
+        "idf": idf_content_digest(idf_path),
+        "weather": file_sha256(weather_path) if weather_path else None,
+        "options": {k: v for k, v in sorted(options.items()) if k not in _LOCATION_OPTIONS},
+        "energyplus_version": energyplus_version
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _directory_manifest(directory: str) -> Dict[str, int]:
+    """Return {path relative to the directory: size} for the files under a directory"""
+    manifest = {}
+    for parent, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(parent, name)
+            manifest[os.path.relpath(path, directory)] = os.path.getsize(path)
+    return manifest
+
+
+def existing_files(directory: str) -> List[str]:
+    """Relative paths of the files already under a directory, to exclude from a later put"""
+    return list(_directory_manifest(directory)) if os.path.isdir(directory) else []
+
+
+def _is_within(path: str, root: str) -> bool:
+    path, root = os.path.realpath(path), os.path.realpath(root)
+    return path != root and os.path.commonpath([path, root]) == root
+
+
+class SimulationResultCache:
+    """Size-bounded LRU index of successful simulation output directories
+
+    The index lives in ``index_dir/index.json``. Entries point at output
+    directories under ``root`` (the server's output directory); runs written
+    elsewhere are not cached. Each entry lists the files the run wrote, and
+    evicting it deletes only those files, plus directories they leave empty.
+    An entry whose files were changed or removed since it was stored is
+    dropped on lookup.
+    """
+
+    def __init__(self, index_dir: str, max_bytes: int = 2 * 1024 * 1024 * 1024, root: Optional[str] = None):
+        """
+        Initialize the result cache
+
+        Args:
+            index_dir: Directory holding the cache index
+            max_bytes: Upper bound on the summed size of cached output directories
+            root: Directory the cached output directories must be under (None allows any)
+        """
+        self.index_dir = index_dir
+        self.index_path = os.path.join(index_dir, "index.json")
+        self.max_bytes = max_bytes
+        self.root = root
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached run and mark it as used
+
+        Returns:
+            The cache entry (output_directory, files, size_bytes, ...) or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_intact(entry):
+                logger.info(f"Dropping stale result cache entry for {entry['output_directory']}")
+                del self._entries[key]
+                self._save_index()
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            entry["last_used"] = time.time()
+            entry["hits"] += 1
+            self.hits += 1
+            self._save_index()
+            return dict(entry)
+
+    def put(self, key: str, output_directory: str, metadata: Optional[Dict[str, Any]] = None,
+            exclude: Optional[Iterable[str]] = None) -> bool:
+        """
+        Record the output directory of a successful run and evict beyond the size bound
+
+        Args:
+            key: Cache key from make_result_key
+            output_directory: Directory holding the run's outputs
+            metadata: Descriptive fields stored with the entry (input_idf, weather_file, ...)
+            exclude: Relative paths of files that were in the directory before the run;
+                     they are not part of the entry and eviction leaves them alone
+
+        Returns:
+            True when the run was cached, False when its directory is outside the root
+        """
+        if self.root and not _is_within(output_directory, self.root):
+            logger.info(f"Not caching simulation results outside {self.root}: {output_directory}")
+            return False
+
+        excluded = set(exclude or ())
+        files = {name: size for name, size in _directory_manifest(output_directory).items()
+                 if name not in excluded}
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {
+                "output_directory": os.path.abspath(output_directory),
+                "files": files,
+                "size_bytes": sum(files.values()),
+                "created": now,
+                "last_used": now,
+                "hits": 0,
+                **(metadata or {})
+            }
+            self._evict(keep=key)
+            self._save_index()
+        return True
+
+    def materialize(self, entry: Dict[str, Any], target_directory: str) -> str:
+        """
+        Make a cached run available in another directory
+
+        Files are copied rather than hard-linked, so writing to them cannot change
+        the cached originals.
+
+        Returns:
+            The target directory
+        """
+        os.makedirs(target_directory, exist_ok=True)
+        for name in entry["files"]:
+            source = os.path.join(entry["output_directory"], name)
+            target = os.path.join(target_directory, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.exists(target):
+                os.remove(target)
+            shutil.copy2(source, target)
+        return target_directory
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": sum(e["size_bytes"] for e in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _is_intact(self, entry: Dict[str, Any]) -> bool:
+        """Check that every stored file still exists with its recorded size"""
+        directory = entry["output_directory"]
+        try:
+            return all(os.path.getsize(os.path.join(directory, name)) == size
+                       for name, size in entry["files"].items())
+        except OSError:
+            return False
+
+    def _evict(self, keep: str):
+        """Delete least recently used runs until within the size bound (caller holds the lock)"""
+        total = sum(e["size_bytes"] for e in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            entry = self._entries.pop(key)
+            total -= entry["size_bytes"]
+            self._remove_files(entry)
+            logger.info(f"Evicted cached simulation results {entry['output_directory']}")
+
+    def _remove_files(self, entry: Dict[str, Any]):
+        """Delete the files of an entry, then the directories they leave empty, deepest first"""
+        directory = entry["output_directory"]
+        parents = {directory}
+        for name in entry["files"]:
+            path = os.path.join(directory, name)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            parent = os.path.dirname(path)
+            while parent != directory and parent not in parents:
+                parents.add(parent)
+                parent = os.path.dirname(parent)
+        for parent in sorted(parents, key=len, reverse=True):
+            try:
+                os.rmdir(parent)  # only succeeds when empty, so files the run did not write stay
+            except OSError:
+                pass
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable result cache index {self.index_path}: {e}")
+            return {}
+
+    def _save_index(self):
+        """Write the index atomically (caller holds the lock)"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+
+def get_result_cache() -> SimulationResultCache:
+    """Get the process-wide simulation result cache"""
+    if not hasattr(get_result_cache, '_cache'):
+        from ..config import get_config
+        config = get_config()
+        get_result_cache._cache = SimulationResultCache(
+            index_dir=os.path.join(config.paths.cache_dir, "results"),
+            max_bytes=config.server.result_cache_max_mb * 1024 * 1024,
+            root=config.paths.output_dir
+        )
+    return get_result_cache._cache
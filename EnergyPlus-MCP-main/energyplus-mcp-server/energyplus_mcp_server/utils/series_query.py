@@ -0,0 +1,464 @@
+"""
+Streaming aggregation of simulation time series for EnergyPlus MCP Server.
+Answers questions such as "monthly peak of Electricity:Facility" or "mean zone
+temperature during occupied hours" by reading only the selected series, chunk
+by chunk as float32, into per-window accumulators, and returns small JSON
+instead of the series themselves.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import re
+import sqlite3
+import calendar
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple, Union
+
+import numpy as np
+
+from .eso_reader import read_eso, read_eso_dictionary, parse_csv_timestamps, EsoVariable, FREQUENCIES, DAY_TYPES
+from .columnar_store import ColumnarStore, find_time_series_sources, is_store_current
+from .sql_results import SqlResults, find_sql_output
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("auto", "store", "sql", "eso", "csv")
+WINDOWS = ("none", "hourly", "daily", "monthly")
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+# Day type filters accept EnergyPlus day types and these groups (case-insensitive)
+DAY_TYPE_GROUPS = {
+    "weekday": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday"),
+    "weekend": ("Saturday", "Sunday"),
+    "designday": ("SummerDesignDay", "WinterDesignDay"),
+}
+
+# Frequencies stamped at the end of each interval (hour 24 = end of the day)
+_INTERVAL_FREQUENCIES = {"Each Call", "Detailed", "TimeStep", "Hourly"}
+
+_LABEL = re.compile(r"^(?:(?P<key>[^:]*):)?(?P<name>.*?)\s*\[(?P<units>[^\]]*)\]\s*\((?P<frequency>[^)]*)\)\s*$")
+
+# A chunk: end-of-interval times (datetime64[m]), environment indexes, day type codes, values (rows x columns)
+Chunk = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _label_variable(label: str) -> Optional[EsoVariable]:
+    """Parse a ReadVarsESO column label into an EsoVariable (report id 0)"""
+    match = _LABEL.match(label.strip())
+    if not match:
+        return None
+    return EsoVariable(0, match["key"] or "", match["name"].strip(), match["units"], match["frequency"])
+
+
+def _slices(columns: Dict[str, np.ndarray], labels: List[str], chunk_rows: int) -> Iterator[Chunk]:
+    """Cut already selected columns into chunks"""
+    values = np.column_stack([columns[label] for label in labels]).astype(np.float32, copy=False)
+    for start in range(0, len(values), chunk_rows):
+        stop = start + chunk_rows
+        yield (columns["Date/Time"][start:stop], columns["Environment"][start:stop],
+               columns["Day Type"][start:stop], values[start:stop])
+
+
+def _pick_frequency(variables: List[EsoVariable], frequency: Optional[str]) -> Optional[str]:
+    reported = {var.frequency for var in variables}
+    if frequency is not None:
+        return frequency if frequency in reported else None
+    return next((f for f in FREQUENCIES if f in reported), None)
+
+
+class _Selection:
+    """Matched series of one source and frequency, and how to stream them"""
+
+    def __init__(self, source: str, path: str, frequency: str, labels: List[str],
+                 environments: List[Optional[str]], chunks, has_day_types: bool = True):
+        self.source = source
+        self.path = path
+        self.frequency = frequency
+        self.labels = labels
+        self.environments = environments
+        self.chunks = chunks  # callable(chunk_rows) -> iterator of Chunk
+        self.has_day_types = has_day_types
+
+
+def _select_store(directory: Path, selectors: List[str], frequency: Optional[str]) -> Optional[_Selection]:
+    if not is_store_current(directory):
+        return None
+    store = ColumnarStore(directory)
+    for source in ("eso", "mtr"):
+        matches = store.find(selectors, source=source)
+        variables = [_label_variable(key["label"]) for _, keys in matches for key in keys]
+        chosen = _pick_frequency(variables, frequency)
+        if chosen is None:
+            continue
+        labels = [var.label for var in variables if var.frequency == chosen]
+
+        def chunks(chunk_rows, source=source, chosen=chosen):
+            frame = store.load(selectors, chosen, source, stamps=True)
+            codes = {name: code for code, name in enumerate(DAY_TYPES)}
+            columns = {label: frame[label].to_numpy() for label in labels}
+            columns["Date/Time"] = frame["Date/Time"].to_numpy().astype("datetime64[m]")
+            columns["Environment"] = frame["Environment"].to_numpy()
+            columns["Day Type"] = frame["Day Type"].map(lambda name: codes.get(name, -1)).to_numpy()
+            return _slices(columns, labels, chunk_rows)
+
+        return _Selection("columnar store", store.root, chosen, labels,
+                          store.manifest["environments"].get(source, []), chunks)
+    return None
+
+
+def _select_sql(directory: Path, selectors: List[str], frequency: Optional[str]) -> Optional[_Selection]:
+    sql_path = find_sql_output(directory)
+    if sql_path is None:
+        return None
+    try:
+        results = SqlResults(sql_path)
+        variables = results.find(selectors)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read {sql_path}: {e}")
+        return None
+    chosen = _pick_frequency(variables, frequency)
+    if chosen is None:
+        results.close()
+        return None
+    labels = [var.label for var in variables if var.frequency == chosen]
+
+    def chunks(chunk_rows):
+        with results:
+            return _slices(results.columns(variables, chosen), labels, chunk_rows)
+
+    return _Selection("sql", str(sql_path), chosen, labels, results.environments, chunks)
+
+
+def _select_eso(directory: Path, selectors: List[str], frequency: Optional[str]) -> Optional[_Selection]:
+    selector_set = {s.casefold() for s in selectors}
+    for source, path in find_time_series_sources(directory).items():
+        variables = [var for var in read_eso_dictionary(path) if var.matches(selector_set)]
+        chosen = _pick_frequency(variables, frequency)
+        if chosen is None:
+            continue
+        labels = [var.label for var in variables if var.frequency == chosen]
+        selection = _Selection(source, path, chosen, labels, [], None)
+
+        def chunks(chunk_rows):
+            eso = read_eso(path, variables=selectors, frequencies=[chosen], dtype=np.float32)
+            selection.environments = eso.environments  # titles are only known once the file is read
+            return _slices(eso.columns(chosen), labels, chunk_rows)
+
+        selection.chunks = chunks
+        return selection
+    return None
+
+
+def _select_csv(directory: Path, selectors: List[str], frequency: Optional[str]) -> Optional[_Selection]:
+    import pandas as pd
+
+    selector_set = {s.casefold() for s in selectors}
+    for path in sorted(directory.glob("*.csv")):
+        try:
+            header = list(pd.read_csv(path, nrows=0).columns)
+        except Exception:
+            continue
+        if not header or header[0].strip() != "Date/Time":
+            continue
+        matched = {}
+        for column in header[1:]:
+            var = _label_variable(column)
+            if var is not None and var.matches(selector_set):
+                matched[column] = var
+        chosen = _pick_frequency(list(matched.values()), frequency)
+        if chosen is None:
+            continue
+        columns = [column for column, var in matched.items() if var.frequency == chosen]
+        labels = [matched[column].label for column in columns]
+
+        def chunks(chunk_rows, path=path, columns=columns, labels=labels):
+            reader = pd.read_csv(path, usecols=[header[0]] + columns, chunksize=chunk_rows,
+                                 dtype={column: np.float32 for column in columns})
+            for frame in reader:
+                values = frame[columns].to_numpy(np.float32)
+                keep = ~np.isnan(values).all(axis=1)  # rows of other frequencies in a mixed CSV
+                if not keep.any():
+                    continue
+                times = parse_csv_timestamps(frame[header[0]])[0][keep]
+                yield (times, np.zeros(len(times), dtype=np.int32), np.full(len(times), -1, dtype=np.int32),
+                       values[keep])
+
+        return _Selection("csv", str(path), chosen, labels, [None], chunks, has_day_types=False)
+    return None
+
+
+def _resolve_day_types(day_types: Iterable[str]) -> np.ndarray:
+    codes = {name.casefold(): code for code, name in enumerate(DAY_TYPES)}
+    selected = set()
+    for day_type in day_types:
+        names = DAY_TYPE_GROUPS.get(day_type.casefold(), (day_type,))
+        for name in names:
+            if name.casefold() not in codes:
+                raise ValueError(f"Unknown day type '{day_type}'; use {list(DAY_TYPES)} "
+                                 f"or {list(DAY_TYPE_GROUPS)}")
+            selected.add(codes[name.casefold()])
+    return np.array(sorted(selected), dtype=np.int32)
+
+
+def _window_keys(starts: np.ndarray, window: str) -> np.ndarray:
+    """Integer window of each interval start (-1 without a calendar time)"""
+    minutes = starts.astype(np.int64)
+    if window == "hourly":
+        keys = minutes // 60
+    elif window == "daily":
+        keys = minutes // 1440
+    elif window == "monthly":
+        keys = starts.astype("datetime64[M]").astype(np.int64)
+    else:
+        keys = np.zeros(len(starts), dtype=np.int64)
+    return np.where(np.isnat(starts), -1, keys)
+
+
+def _window_label(start: np.datetime64, window: str) -> str:
+    if np.isnat(start) or window == "none":
+        return "all"
+    moment = start.astype("datetime64[m]").item()
+    if window == "hourly":
+        return moment.strftime("%m/%d %H:00")
+    if window == "daily":
+        return moment.strftime("%m/%d")
+    return calendar.month_name[moment.month]
+
+
+def _format_time(stamp: np.datetime64, frequency: str) -> Optional[str]:
+    """End-of-interval time in EnergyPlus's month/day style, without the placeholder year"""
+    if np.isnat(stamp):
+        return None
+    moment = stamp.astype("datetime64[m]").item()
+    if frequency in _INTERVAL_FREQUENCIES:
+        return moment.strftime("%m/%d %H:%M")
+    if frequency == "Daily":
+        return moment.strftime("%m/%d")
+    return calendar.month_name[moment.month]
+
+
+def _number(value) -> Optional[float]:
+    """JSON-friendly float with float32 precision; None for NaN and infinities"""
+    value = float(value)
+    return float(f"{value:.7g}") if np.isfinite(value) else None
+
+
+class _Window:
+    """Running aggregates of every selected column within one window"""
+
+    def __init__(self, environment: int, label: str, width: int, keep_values: bool):
+        self.environment = environment
+        self.label = label
+        self.count = np.zeros(width, dtype=np.int64)
+        self.sum = np.zeros(width, dtype=np.float64)
+        self.min = np.full(width, np.inf)
+        self.max = np.full(width, -np.inf)
+        self.min_time = np.full(width, np.datetime64("NaT"), dtype="datetime64[m]")
+        self.max_time = np.full(width, np.datetime64("NaT"), dtype="datetime64[m]")
+        self.values: Optional[List[np.ndarray]] = [] if keep_values else None
+
+    def add(self, times: np.ndarray, block: np.ndarray):
+        valid = ~np.isnan(block)
+        columns = np.arange(block.shape[1])
+        self.count += valid.sum(axis=0)
+        self.sum += np.where(valid, block, 0).sum(axis=0, dtype=np.float64)
+
+        high = np.where(valid, block, -np.inf)
+        at = high.argmax(axis=0)
+        peak = high[at, columns]
+        better = peak > self.max
+        self.max[better] = peak[better]
+        self.max_time[better] = times[at[better]]
+
+        low = np.where(valid, block, np.inf)
+        at = low.argmin(axis=0)
+        trough = low[at, columns]
+        better = trough < self.min
+        self.min[better] = trough[better]
+        self.min_time[better] = times[at[better]]
+
+        if self.values is not None:
+            self.values.append(block)
+
+    def results(self, aggregations: List[str], percentiles: List[float], frequency: str) -> List[Dict[str, Any]]:
+        """One dictionary per column"""
+        quantiles = None
+        if percentiles:
+            values = np.concatenate(self.values)
+            with np.errstate(all="ignore"):
+                quantiles = np.nanpercentile(values, percentiles, axis=0) if len(values) else None
+
+        rows = []
+        for i in range(len(self.count)):
+            count = int(self.count[i])
+            row = {}
+            if "count" in aggregations:
+                row["count"] = count
+            if "sum" in aggregations:
+                row["sum"] = _number(self.sum[i]) if count else None
+            if "mean" in aggregations:
+                row["mean"] = _number(self.sum[i] / count) if count else None
+            if "min" in aggregations:
+                row["min"] = _number(self.min[i]) if count else None
+                row["min_time"] = _format_time(self.min_time[i], frequency) if count else None
+            if "max" in aggregations:
+                row["max"] = _number(self.max[i]) if count else None
+                row["max_time"] = _format_time(self.max_time[i], frequency) if count else None
+            for j, q in enumerate(percentiles):
+                row[f"p{q:g}"] = _number(quantiles[j][i]) if quantiles is not None and count else None
+            rows.append(row)
+        return rows
+
+
+def query_time_series(output_directory: Union[str, Path], variables: List[str],
+                      aggregations: Optional[List[str]] = None, window: str = "none",
+                      percentiles: Optional[List[float]] = None, day_types: Optional[List[str]] = None,
+                      hours: Optional[List[int]] = None, months: Optional[List[int]] = None,
+                      environment: Optional[Union[int, str]] = None, frequency: Optional[str] = None,
+                      source: str = "auto", chunk_rows: int = 8760, max_windows: int = 400) -> Dict[str, Any]:
+    """
+    Aggregate selected time series of a run over time windows
+
+    Only the selected series are read: from the run's columnar store when it is
+    current, else from the EnergyPlus SQLite output (through its variable index),
+    else from the .eso/.mtr (unselected lines are skipped unparsed), else from the
+    ReadVarsESO CSV in chunks of ``chunk_rows`` with only the
+    selected columns. Values are float32; sums and means accumulate in float64.
+    Memory is bounded by the selected series, not by the size of the output.
+
+    Args:
+        output_directory: Output directory of the run
+        variables: Selectors: variable or meter name (all keys), "KEY:Variable Name",
+                   column label or report id; case-insensitive
+        aggregations: Any of "count", "sum", "mean", "min", "max" (default: all); min
+                      and max come with the time of the value
+        window: "none" (whole environment), "hourly", "daily" or "monthly"
+        percentiles: Percentiles to compute per window, e.g. [50, 95] (keeps the
+                     filtered float32 values of the selected series in memory)
+        day_types: Keep only these EnergyPlus day types or groups ("Weekday",
+                   "Weekend", "DesignDay"); needs the .eso, the SQLite output or the columnar store
+        hours: [start, end) hours of the day to keep, by interval start; end < start wraps
+        months: Months (1-12) to keep
+        environment: Environment title or index to keep (default: all, reported separately)
+        frequency: Reporting frequency to use (default: finest one of the matches)
+        source: "auto", "store", "sql", "eso" or "csv"
+        chunk_rows: Rows per chunk
+        max_windows: Upper bound on the windows reported per series
+
+    Returns:
+        Dictionary with the source, frequency, filters and, per series, one entry per window
+
+    Raises:
+        FileNotFoundError: If no source holds a matching series
+        ValueError: On unknown aggregations, windows or day types, or filters the frequency cannot honour
+    """
+    directory = Path(output_directory)
+    if not directory.exists():
+        raise FileNotFoundError(f"Output directory not found: {output_directory}")
+    if not variables:
+        raise ValueError("Select at least one variable or meter")
+    aggregations = [a.lower() for a in (aggregations or AGGREGATIONS)]
+    unknown = [a for a in aggregations if a not in AGGREGATIONS]
+    if unknown:
+        raise ValueError(f"Unknown aggregations {unknown}; use {list(AGGREGATIONS)} and percentiles")
+    if window not in WINDOWS:
+        raise ValueError(f"Unknown window '{window}'; use {list(WINDOWS)}")
+    percentiles = [float(q) for q in (percentiles or [])]
+    if any(not 0 <= q <= 100 for q in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100")
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}'; use {list(SOURCES)}")
+
+    selectors = [str(v) for v in variables]
+    selectors_by_source = {"store": _select_store, "sql": _select_sql, "eso": _select_eso, "csv": _select_csv}
+    order = ["store", "sql", "eso", "csv"] if source == "auto" else [source]
+    selection = None
+    for name in order:
+        selection = selectors_by_source[name](directory, selectors, frequency)
+        if selection is not None:
+            break
+    if selection is None:
+        at = f" at {frequency} frequency" if frequency else ""
+        raise FileNotFoundError(f"No time series matching {selectors}{at} in {output_directory}")
+
+    interval = selection.frequency in _INTERVAL_FREQUENCIES
+    if hours is not None and not interval:
+        raise ValueError(f"Hour filters need hourly or finer data, not {selection.frequency}")
+    if day_types and (not selection.has_day_types or selection.frequency not in _INTERVAL_FREQUENCIES | {"Daily"}):
+        raise ValueError(f"Day type filters need daily or finer data from the .eso, SQLite output or columnar store, "
+                         f"not {selection.frequency} data from {selection.source}")
+    day_codes = _resolve_day_types(day_types) if day_types else None
+    if hours is not None and len(hours) != 2:
+        raise ValueError("hours must be [start, end), e.g. [8, 18]")
+
+    windows: Dict[Tuple[int, int], _Window] = {}
+    rows_read = rows_used = 0
+    env_index = None
+    for times, environments, codes, values in selection.chunks(chunk_rows):
+        rows_read += len(times)
+        if env_index is None and environment is not None:
+            names = selection.environments
+            if isinstance(environment, str):
+                folded = [str(n).casefold() for n in names]
+                if environment.casefold() not in folded:
+                    raise ValueError(f"Unknown environment '{environment}'; the run has {names}")
+                env_index = folded.index(environment.casefold())
+            else:
+                env_index = int(environment)
+
+        starts = times - np.timedelta64(1, "m") if interval else times
+        keep = np.ones(len(times), dtype=bool)
+        if env_index is not None:
+            keep &= environments == env_index
+        if months:
+            keep &= ~np.isnat(starts) & np.isin(starts.astype("datetime64[M]").astype(np.int64) % 12 + 1, months)
+        if hours is not None:
+            hour = starts.astype(np.int64) // 60 % 24
+            start, end = hours
+            keep &= (hour >= start) & (hour < end) if start <= end else (hour >= start) | (hour < end)
+        if day_codes is not None:
+            keep &= np.isin(codes, day_codes)
+        if not keep.all():
+            times, environments, starts, values = times[keep], environments[keep], starts[keep], values[keep]
+        rows_used += len(times)
+        if not len(times):
+            continue
+
+        keys = _window_keys(starts, window)
+        bounds = np.flatnonzero((np.diff(keys) != 0) | (np.diff(environments) != 0)) + 1
+        for begin, stop in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(keys)]))):
+            key = (int(environments[begin]), int(keys[begin]))
+            target = windows.get(key)
+            if target is None:
+                if len(windows) >= max_windows:
+                    raise ValueError(f"The query spans more than {max_windows} windows; "
+                                     f"use a coarser window or narrower filters")
+                target = windows[key] = _Window(key[0], _window_label(starts[begin], window),
+                                                len(selection.labels), bool(percentiles))
+            target.add(times[begin:stop], values[begin:stop])
+
+    names = selection.environments
+    series = [{"label": label, "units": _label_variable(label).units, "windows": []}
+              for label in selection.labels]
+    for target in windows.values():
+        environment_name = names[target.environment] if 0 <= target.environment < len(names) else None
+        for entry, values in zip(series, target.results(aggregations, percentiles, selection.frequency)):
+            entry["windows"].append({"environment": environment_name, "window": target.label, **values})
+
+    logger.debug(f"Aggregated {rows_used} of {rows_read} rows of {len(series)} series from {selection.path}")
+    return {
+        "source": selection.source,
+        "path": selection.path,
+        "frequency": selection.frequency,
+        "window": window,
+        "filters": {"day_types": day_types, "hours": hours, "months": months, "environment": environment},
+        "rows_read": rows_read,
+        "rows_used": rows_used,
+        "series": series
+    }
@@ -0,0 +1,614 @@
+"""
+Asynchronous simulation jobs for EnergyPlus MCP Server.
+Runs EnergyPlus as a background subprocess so a simulation never blocks the MCP
+event loop, tracks each run under a job ID, and schedules runs onto a bounded
+number of worker slots.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import sys
+import time
+import uuid
+import heapq
+import signal
+import asyncio
+import logging
+import itertools
+import threading
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+
+from .simulation_progress import SimulationProgress
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed_out"
+FINISHED_STATES = {COMPLETED, FAILED, CANCELLED, TIMED_OUT}
+
+# SIGKILL and SIGXCPU do not exist on Windows
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+_SIGXCPU = getattr(signal, "SIGXCPU", None)
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere. It can include
+# pages inherited from the server at fork, so it is a conservative estimate.
+_MAXRSS_TO_MB = 1.0 / (1024 * 1024) if sys.platform == "darwin" else 1.0 / 1024
+
+
+def get_physical_memory_mb() -> Optional[int]:
+    """Total physical memory in MB, or None if the platform does not report it"""
+    try:
+        return int(os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024))
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def build_energyplus_command(executable: str, idf_path: str, options: Dict[str, Any],
+                             idd_path: Optional[str] = None) -> List[str]:
+    """
+    Build an EnergyPlus command line the same way eppy's runner does
+
+    Args:
+        executable: Path to the energyplus executable
+        idf_path: IDF file to simulate
+        options: CLI options, e.g. {"output_directory": ..., "annual": True, "weather": ...}.
+                 True booleans become flags, falsy values are dropped.
+        idd_path: Optional IDD passed with --idd
+
+    Returns:
+        Command as an argument list
+    """
+    cmd = [executable]
+    for name, value in options.items():
+        if name == "verbose" or not value:
+            continue
+        cmd.append(f"--{name.replace('_', '-')}")
+        if not isinstance(value, bool):
+            cmd.append(str(value))
+    if idd_path:
+        cmd.extend(["--idd", idd_path])
+    cmd.append(idf_path)
+    return cmd
+
+
+class SimulationJob:
+    """One EnergyPlus run and its lifecycle"""
+
+    def __init__(self, job_id: str, command: List[str], cwd: str, metadata: Dict[str, Any],
+                 log_path: Optional[str], tail_lines: int, priority: int = 0, memory_mb: int = 0,
+                 timeout: int = 0, cpu_limit: int = 0, total_days: Optional[int] = None,
+                 preemptible: bool = False):
+        self.job_id = job_id
+        self.command = command
+        self.cwd = cwd
+        self.metadata = metadata
+        self.log_path = log_path
+        self.priority = priority
+        self.memory_mb = memory_mb  # admission estimate
+        self.timeout = timeout  # wall-clock seconds, 0 = unlimited
+        self.cpu_limit = cpu_limit  # CPU seconds, 0 = unlimited
+        self.limit_exceeded: Optional[str] = None  # "wall_time" or "cpu_time"
+        self.preemptible = preemptible  # cancelled when a regular job needs its slot
+        self.preempted = False
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.returncode: Optional[int] = None
+        self.error: Optional[str] = None
+        self.cpu_user_seconds: Optional[float] = None
+        self.cpu_system_seconds: Optional[float] = None
+        self.peak_memory_mb: Optional[float] = None
+        self.stdout_tail: deque = deque(maxlen=tail_lines)
+        self.progress = SimulationProgress(total_days)
+        self.cancel_requested = False
+        self.cached = False  # answered from the result cache without running EnergyPlus
+        self.on_finish: Optional[Callable[["SimulationJob"], None]] = None
+        self.post_process: Optional[Callable[["SimulationJob"], None]] = None
+        self.process: Optional[subprocess.Popen] = None
+        self.task: Optional[asyncio.Task] = None
+        self.done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def get_info(self, tail: int = 0) -> Dict[str, Any]:
+        """Return a JSON-serializable description of the job"""
+        def iso(ts):
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        end = self.finished_at or time.time()
+        info = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "priority": self.priority,
+            "input_idf": self.metadata.get("input_idf"),
+            "weather_file": self.metadata.get("weather_file"),
+            "output_directory": self.metadata.get("output_directory"),
+            "created_at": iso(self.created_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+            "queued_seconds": round((self.started_at or end) - self.created_at, 2),
+            "elapsed_seconds": round(end - self.started_at, 2) if self.started_at else 0.0,
+            "cpu_seconds": (round(self.cpu_user_seconds + self.cpu_system_seconds, 2)
+                            if self.cpu_user_seconds is not None else None),
+            "peak_memory_mb": round(self.peak_memory_mb, 1) if self.peak_memory_mb is not None else None,
+            "memory_estimate_mb": self.memory_mb,
+            "timeout_seconds": self.timeout,
+            "cpu_limit_seconds": self.cpu_limit,
+            "returncode": self.returncode,
+            "cached": self.cached,
+            "pid": self.process.pid if self.process else None,
+            "log_file": self.log_path
+        }
+        if not self.cached:
+            info["progress"] = self.progress.get_info()
+        if self.limit_exceeded:
+            info["limit_exceeded"] = self.limit_exceeded
+        if self.preemptible:
+            info["preemptible"] = True
+            info["preempted"] = self.preempted
+        if self.error:
+            info["error"] = self.error
+        if tail:
+            info["stdout_tail"] = list(self.stdout_tail)[-tail:]
+        return info
+
+
+class SimulationJobManager:
+    """Bounded scheduler for simulation subprocesses with a history of jobs
+
+    Jobs wait in a priority queue (higher priority first, FIFO within a priority)
+    and start when a worker slot is free and their memory estimate fits under
+    the memory limit. The estimate for a model is the peak RSS of its last run,
+    or ``default_memory_mb`` for a model that has not run yet. A job that does
+    not fit still starts when nothing else is running, so the queue never stalls.
+
+    Preemptible jobs (speculative work nobody is waiting for) only use spare
+    capacity: when a regular job is waiting for a slot, a running preemptible
+    job is cancelled to make room.
+
+    Each running job holds one thread that streams its output and reaps the
+    process with ``os.wait4``, which yields exact CPU time and peak memory.
+
+    A job that outlives its wall-clock limit has its process group terminated
+    like a cancellation. The CPU limit is applied to the EnergyPlus process as
+    RLIMIT_CPU (Linux only), so the kernel stops it once the limit is spent.
+    Either way the job ends as ``timed_out``.
+
+    Every method except ``wait`` is synchronous; ``submit`` and ``cancel`` must be
+    called from code running inside the server's event loop.
+    """
+
+    def __init__(self, max_workers: int = 0, memory_limit_mb: int = 0, default_memory_mb: int = 1024,
+                 max_history: int = 100, tail_lines: int = 200, kill_grace_seconds: float = 10.0):
+        """
+        Initialize the job manager
+
+        Args:
+            max_workers: Simulations run at the same time (0 = CPU count)
+            memory_limit_mb: Summed memory estimate of running jobs (0 = 80% of physical memory)
+            default_memory_mb: Memory estimate for a model with no recorded run
+            max_history: Finished jobs kept for status/result queries
+            tail_lines: Lines of EnergyPlus stdout kept in memory per job
+            kill_grace_seconds: Delay between SIGTERM and SIGKILL when cancelling
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if not memory_limit_mb:
+            physical_mb = get_physical_memory_mb()
+            memory_limit_mb = int(physical_mb * 0.8) if physical_mb else 0
+        self.memory_limit_mb = memory_limit_mb
+        self.default_memory_mb = default_memory_mb
+        self.max_history = max_history
+        self.tail_lines = tail_lines
+        self.kill_grace_seconds = kill_grace_seconds
+        self._jobs: "OrderedDict[str, SimulationJob]" = OrderedDict()
+        self._queue: List[tuple] = []  # heap of (-priority, sequence, job)
+        self._sequence = itertools.count()
+        self._running: Dict[str, SimulationJob] = {}
+        self._peak_memory: Dict[str, float] = {}  # input file -> peak RSS (MB) of its last run
+        self._totals = {"cpu_seconds": 0.0, "wall_seconds": 0.0, "finished_jobs": 0, "preempted_jobs": 0}
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="energyplus-job")
+
+    def submit(self, command: List[str], cwd: str, metadata: Optional[Dict[str, Any]] = None,
+               log_path: Optional[str] = None, priority: int = 0,
+               on_finish: Optional[Callable[[SimulationJob], None]] = None,
+               timeout: int = 0, cpu_limit: int = 0, total_days: Optional[int] = None,
+               preemptible: bool = False,
+               post_process: Optional[Callable[[SimulationJob], None]] = None) -> SimulationJob:
+        """
+        Queue a simulation and return immediately
+
+        Args:
+            command: Full command line (see build_energyplus_command)
+            cwd: Working directory of the process
+            metadata: Descriptive fields reported with the job (input_idf, output_directory, ...)
+            log_path: File that receives the complete stdout/stderr of the run
+            priority: Higher values start first; equal priorities start in submission order
+            on_finish: Called with the job once it reaches a final state
+            timeout: Wall-clock limit in seconds, counted from the start of the run (0 = none)
+            cpu_limit: CPU time limit in seconds (0 = none)
+            total_days: Days the run will simulate, used to report progress as a
+                        fraction with an estimated time remaining
+            preemptible: Cancel the job when a regular job is waiting for its worker slot
+            post_process: Called with the job in a worker thread after a successful run,
+                          before it is marked completed; it keeps the job's slot and
+                          its failures are logged, not reported as job failures
+
+        Returns:
+            The new SimulationJob (status queued or running)
+        """
+        metadata = metadata or {}
+        memory_mb = int(self._peak_memory.get(metadata.get("input_idf"), self.default_memory_mb))
+        job = SimulationJob(uuid.uuid4().hex[:12], command, cwd, metadata, log_path,
+                            self.tail_lines, priority, memory_mb, timeout, cpu_limit, total_days,
+                            preemptible)
+        job.on_finish = on_finish
+        job.post_process = post_process
+        self._jobs[job.job_id] = job
+        self._prune()
+        heapq.heappush(self._queue, (-priority, next(self._sequence), job))
+        logger.info(f"Queued simulation job {job.job_id} (priority {priority}): {' '.join(command)}")
+        self._dispatch()
+        return job
+
+    def record_cached(self, metadata: Dict[str, Any]) -> SimulationJob:
+        """Register an already completed job whose results came from the result cache"""
+        job = SimulationJob(uuid.uuid4().hex[:12], [], metadata.get("output_directory"),
+                            metadata, None, self.tail_lines)
+        job.cached = True
+        job.status = COMPLETED
+        job.returncode = 0
+        job.started_at = job.finished_at = job.created_at
+        job.done.set()
+        self._jobs[job.job_id] = job
+        self._prune()
+        logger.info(f"Simulation job {job.job_id} answered from result cache: {job.cwd}")
+        return job
+
+    def get_job(self, job_id: str) -> SimulationJob:
+        """
+        Look up a job
+
+        Raises:
+            ValueError: If the job ID is unknown
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Simulation job '{job_id}' not found")
+        return job
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return job descriptions, newest first, optionally filtered by status"""
+        jobs = reversed(self._jobs.values())
+        return [job.get_info() for job in jobs if status is None or job.status == status]
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None,
+                   on_progress: Optional[Callable[[SimulationJob], Awaitable[None]]] = None,
+                   progress_interval: float = 1.0) -> SimulationJob:
+        """
+        Wait for a job to finish without blocking the event loop
+
+        Args:
+            job_id: Job to wait for
+            timeout: Seconds to wait at most (None = no limit)
+            on_progress: Coroutine function called with the job whenever its progress
+                         changed, checked every progress_interval seconds
+            progress_interval: Seconds between progress checks
+        """
+        job = self.get_job(job_id)
+        if job.finished:
+            return job
+        if on_progress is None:
+            await asyncio.wait_for(job.done.wait(), timeout)
+            return job
+
+        async def watch():
+            reported = None
+            while True:
+                state = (job.status, job.progress.version)
+                if state != reported:
+                    reported = state
+                    try:
+                        await on_progress(job)
+                    except Exception as e:
+                        logger.warning(f"Progress callback of simulation job {job.job_id} failed: {e}")
+                if job.finished:
+                    return
+                try:
+                    await asyncio.wait_for(job.done.wait(), progress_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        await asyncio.wait_for(watch(), timeout)
+        return job
+
+    def cancel(self, job_id: str) -> SimulationJob:
+        """
+        Cancel a queued or running job
+
+        A queued job is dropped from the queue. A running job's process group gets
+        SIGTERM and, if still alive after the grace period, SIGKILL. A job that is
+        dispatched but has not started its process yet is stopped by _run as soon
+        as it has.
+        """
+        job = self.get_job(job_id)
+        if job.finished:
+            return job
+
+        job.cancel_requested = True
+        if job.status == QUEUED:
+            # Left in the heap and skipped by _dispatch
+            self._finish(job, CANCELLED)
+        elif job.process is not None:
+            self._terminate(job)
+        logger.info(f"Cancellation requested for simulation job {job_id}")
+        return job
+
+    def is_busy(self) -> bool:
+        """True if every worker slot is taken or jobs are waiting for one"""
+        return len(self._running) >= self.max_workers or any(
+            entry[2].status == QUEUED for entry in self._queue
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return job counts by status, worker and memory occupancy, and resource totals"""
+        counts = {state: 0 for state in (QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED, TIMED_OUT)}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {
+            "counts": counts,
+            "max_workers": self.max_workers,
+            "busy_workers": len(self._running),
+            "memory_limit_mb": self.memory_limit_mb,
+            "memory_reserved_mb": sum(job.memory_mb for job in self._running.values()),
+            "total_cpu_seconds": round(self._totals["cpu_seconds"], 2),
+            "total_wall_seconds": round(self._totals["wall_seconds"], 2),
+            "finished_jobs": self._totals["finished_jobs"],
+            "preempted_jobs": self._totals["preempted_jobs"],
+            "max_history": self.max_history
+        }
+
+    def _dispatch(self):
+        """Start queued jobs while worker slots and memory allow"""
+        while self._queue and len(self._running) < self.max_workers:
+            job = self._queue[0][2]
+            if job.status != QUEUED:
+                heapq.heappop(self._queue)
+                continue
+            reserved = sum(j.memory_mb for j in self._running.values())
+            if self._running and self.memory_limit_mb and reserved + job.memory_mb > self.memory_limit_mb:
+                self._preempt_for(job)
+                break
+            heapq.heappop(self._queue)
+            self._running[job.job_id] = job
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.task = asyncio.get_running_loop().create_task(self._run(job))
+        if self._queue and len(self._running) >= self.max_workers:
+            self._preempt_for(self._queue[0][2])
+
+    def _preempt_for(self, waiting: SimulationJob):
+        """Cancel one running preemptible job so a waiting regular job can start"""
+        if waiting.status != QUEUED or waiting.preemptible:
+            return
+        if any(job.preempted and not job.finished for job in self._running.values()):
+            return  # a slot is already being freed
+        victims = [job for job in self._running.values() if job.preemptible and not job.cancel_requested]
+        if not victims:
+            return
+        victim = min(victims, key=lambda job: (job.priority, -job.started_at))
+        victim.preempted = True
+        self._totals["preempted_jobs"] += 1
+        logger.info(f"Preempting simulation job {victim.job_id} for waiting job {waiting.job_id}")
+        self.cancel(victim.job_id)
+
+    async def _run(self, job: SimulationJob):
+        """Run the job's process in a worker thread and record its outcome"""
+        status = FAILED
+        loop = asyncio.get_running_loop()
+        timer = None
+        try:
+            if job.cancel_requested:
+                # Cancelled between _dispatch and this task's first step
+                status = CANCELLED
+                return
+            job.process = subprocess.Popen(
+                job.command,
+                cwd=job.cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                start_new_session=(os.name == "posix")
+            )
+            if job.cancel_requested:
+                # cancel() found no process to signal yet (e.g. a preempted job dispatched this tick)
+                self._terminate(job)
+            if job.cpu_limit:
+                self._apply_cpu_limit(job)
+            if job.timeout:
+                timer = loop.call_later(job.timeout, self._expire, job)
+            usage = await loop.run_in_executor(self._executor, self._collect, job)
+            if usage is not None:
+                job.cpu_user_seconds = usage.ru_utime
+                job.cpu_system_seconds = usage.ru_stime
+                job.peak_memory_mb = usage.ru_maxrss * _MAXRSS_TO_MB
+                self._peak_memory[job.metadata.get("input_idf")] = job.peak_memory_mb
+
+            if job.cpu_limit and not job.limit_exceeded and job.returncode != 0:
+                cpu_used = (job.cpu_user_seconds or 0) + (job.cpu_system_seconds or 0)
+                if (_SIGXCPU and job.returncode == -_SIGXCPU) or cpu_used >= job.cpu_limit:
+                    job.limit_exceeded = "cpu_time"
+
+            if job.limit_exceeded:
+                status = TIMED_OUT
+                limit = job.timeout if job.limit_exceeded == "wall_time" else job.cpu_limit
+                job.error = f"Simulation exceeded its {job.limit_exceeded.replace('_', '-')} limit of {limit}s"
+            elif job.cancel_requested:
+                status = CANCELLED
+            elif job.returncode == 0:
+                if job.post_process is not None:
+                    await loop.run_in_executor(self._executor, self._post_process, job)
+                status = COMPLETED
+            else:
+                job.error = f"EnergyPlus exited with code {job.returncode}"
+
+        except asyncio.CancelledError:
+            status = CANCELLED
+            if job.process is not None and job.process.returncode is None:
+                self._signal(job, _SIGKILL)
+        except Exception as e:
+            job.error = str(e)
+            logger.error(f"Simulation job {job.job_id} failed to run: {e}")
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._finish(job, status)
+
+    def _apply_cpu_limit(self, job: SimulationJob):
+        """Set RLIMIT_CPU on the running process: SIGXCPU at the limit, SIGKILL after the grace period"""
+        if resource is None or not hasattr(resource, "prlimit"):
+            logger.warning(f"CPU limits are not supported on this platform; job {job.job_id} runs unlimited")
+            return
+        try:
+            hard = job.cpu_limit + max(1, int(self.kill_grace_seconds))
+            resource.prlimit(job.process.pid, resource.RLIMIT_CPU, (job.cpu_limit, hard))
+        except (ProcessLookupError, OSError) as e:
+            logger.warning(f"Could not set CPU limit on simulation job {job.job_id}: {e}")
+
+    def _expire(self, job: SimulationJob):
+        """Stop a job that ran past its wall-clock limit"""
+        if job.finished or job.process is None or job.process.returncode is not None:
+            return
+        logger.warning(f"Simulation job {job.job_id} exceeded its wall-clock limit of {job.timeout}s, terminating")
+        job.limit_exceeded = "wall_time"
+        self._terminate(job)
+
+    def _terminate(self, job: SimulationJob):
+        """SIGTERM the job's process group now and SIGKILL it after the grace period"""
+        self._signal(job, signal.SIGTERM)
+        asyncio.get_running_loop().call_later(self.kill_grace_seconds, self._kill_if_alive, job)
+
+    def _collect(self, job: SimulationJob):
+        """Reap the process while a helper thread streams its output (worker thread)
+
+        Helpers spawned by EnergyPlus inherit its stdout, so end of output is not a
+        reliable end of run. Once EnergyPlus itself has exited, anything left in
+        its process group is killed so the pipe closes.
+        """
+        reader = threading.Thread(target=self._read_output, args=(job,), daemon=True)
+        reader.start()
+
+        if hasattr(os, "wait4"):
+            _, wait_status, usage = os.wait4(job.process.pid, 0)
+            job.process.returncode = os.waitstatus_to_exitcode(wait_status)
+        else:
+            job.process.wait()
+            usage = None
+        job.returncode = job.process.returncode
+
+        if os.name == "posix":
+            self._signal(job, _SIGKILL)
+        reader.join()
+        return usage
+
+    def _post_process(self, job: SimulationJob):
+        """Run the job's post-processing step (worker thread)"""
+        try:
+            job.post_process(job)
+        except Exception as e:
+            logger.warning(f"Post-processing of simulation job {job.job_id} failed: {e}")
+
+    def _read_output(self, job: SimulationJob):
+        """Stream output into the log, tail buffer and progress tracker (reader thread)"""
+        log = open(job.log_path, "w") if job.log_path else None
+        try:
+            for raw in job.process.stdout:
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                job.stdout_tail.append(line)
+                job.progress.feed(line)
+                if log:
+                    log.write(line + "\n")
+        finally:
+            job.process.stdout.close()
+            if log:
+                log.close()
+
+    def _finish(self, job: SimulationJob, status: str):
+        """Record a final state, free the job's slot and start the next queued job"""
+        job.status = status
+        job.finished_at = time.time()
+        self._running.pop(job.job_id, None)
+        job.done.set()
+
+        self._totals["finished_jobs"] += 1
+        if job.started_at:
+            self._totals["wall_seconds"] += job.finished_at - job.started_at
+        if job.cpu_user_seconds is not None:
+            self._totals["cpu_seconds"] += job.cpu_user_seconds + job.cpu_system_seconds
+        logger.info(f"Simulation job {job.job_id} {status} "
+                    f"after {job.finished_at - (job.started_at or job.created_at):.1f}s")
+        if job.on_finish is not None:
+            try:
+                job.on_finish(job)
+            except Exception as e:
+                logger.error(f"Finish callback of simulation job {job.job_id} failed: {e}")
+        self._dispatch()
+
+    def _signal(self, job: SimulationJob, sig: int):
+        """Send a signal to the job's whole process group (EnergyPlus spawns helpers)"""
+        try:
+            if os.name == "posix":
+                os.killpg(job.process.pid, sig)
+            elif sig == signal.SIGTERM:
+                job.process.terminate()
+            else:
+                job.process.kill()
+        except ProcessLookupError:
+            pass
+
+    def _kill_if_alive(self, job: SimulationJob):
+        if job.process is not None and job.process.returncode is None:
+            logger.warning(f"Simulation job {job.job_id} ignored SIGTERM, killing")
+            self._signal(job, _SIGKILL)
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_history"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
+
+
+def get_simulation_job_manager() -> SimulationJobManager:
+    """Get the process-wide simulation job manager"""
+    if not hasattr(get_simulation_job_manager, '_manager'):
+        from ..config import get_config
+        config = get_config()
+        get_simulation_job_manager._manager = SimulationJobManager(
+            max_workers=config.server.simulation_workers,
+            memory_limit_mb=config.server.simulation_memory_limit_mb,
+            default_memory_mb=config.server.simulation_memory_estimate_mb,
+            max_history=config.server.max_job_history
+        )
+    return get_simulation_job_manager._manager
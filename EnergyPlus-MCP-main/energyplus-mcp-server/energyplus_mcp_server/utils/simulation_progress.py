@@ -0,0 +1,244 @@
+"""
+Live simulation progress for EnergyPlus MCP Server.
+Follows EnergyPlus console output line by line to track the current phase,
+environment, warmup day and day of simulation, and estimates the time remaining.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import re
+import time
+import logging
+from typing import Dict, Any, Optional
+
+from .idf_scanner import iter_idf_objects
+
+logger = logging.getLogger(__name__)
+
+# Simulation phases in the order EnergyPlus goes through them
+INITIALIZING = "initializing"
+SIZING = "sizing"
+WARMUP = "warmup"
+SIMULATING = "simulating"
+REPORTING = "reporting"
+COMPLETED = "completed"
+
+_DAYS_BEFORE_MONTH = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+_ENVIRONMENT_LINE = re.compile(r"(Starting|Continuing|Updating) Simulation at (\d{1,2})/(\d{1,2})(?:/\d{4})? for (.+)$")
+_WARMUP_LINE = re.compile(r"Warming up(?: \{(\d+)\})?")
+
+
+def _day_of_year(month: int, day: int) -> int:
+    """Zero-based day of a non-leap year"""
+    return _DAYS_BEFORE_MONTH[min(max(month, 1), 12) - 1] + day - 1
+
+
+class SimulationProgress:
+    """Progress of one EnergyPlus run, built from its console output
+
+    ``feed`` is called with every line EnergyPlus prints. Most lines are rejected
+    by a couple of substring tests, so following the output costs next to nothing
+    next to the simulation itself.
+
+    EnergyPlus reports the simulated date once per environment start and once per
+    month within a run period, so progress advances in those steps. The time
+    remaining is extrapolated from the pace since the first environment started,
+    which leaves input processing and sizing out of the estimate.
+    """
+
+    def __init__(self, total_days: Optional[int] = None):
+        """
+        Initialize progress tracking
+
+        Args:
+            total_days: Days the run will simulate over all environments, if known
+                        (see estimate_simulation_days); without it no fraction or
+                        time remaining is reported
+        """
+        self.total_days = total_days
+        self.phase = INITIALIZING
+        self.environment: Optional[str] = None
+        self.environments_started = 0
+        self.warmup_day = 0
+        self.date: Optional[str] = None
+        self.completed_days = 0  # days of environments already finished
+        self.day_in_environment = 0
+        self._environment_start = 0  # day of year the current environment began
+        self.simulation_started_at: Optional[float] = None
+        self.updated_at: Optional[float] = None
+        self.version = 0  # incremented on every change
+
+    @property
+    def day_of_simulation(self) -> int:
+        """Days simulated so far, counting the current day"""
+        if self.environment is None:
+            return self.completed_days
+        return self.completed_days + self.day_in_environment + 1
+
+    def feed(self, line: str) -> bool:
+        """
+        Update progress from one line of EnergyPlus output
+
+        Returns:
+            True if the line changed the progress
+        """
+        if "Simulation at" in line:
+            match = _ENVIRONMENT_LINE.search(line)
+            if match is None:
+                return False
+            kind, month, day = match.group(1), int(match.group(2)), int(match.group(3))
+            if kind == "Starting":
+                self._close_environment()
+                self.environment = match.group(4).strip()
+                self.environments_started += 1
+                self._environment_start = _day_of_year(month, day)
+                self.day_in_environment = 0
+                if self.simulation_started_at is None:
+                    self.simulation_started_at = time.time()
+            elif self.environment is not None:
+                self.day_in_environment = (_day_of_year(month, day) - self._environment_start) % 365
+            self.phase = SIMULATING
+            self.warmup_day = 0
+            self.date = f"{month:02d}/{day:02d}"
+        elif line.startswith("Warming up"):
+            match = _WARMUP_LINE.match(line)
+            self.warmup_day = int(match.group(1)) if match.group(1) else self.warmup_day + 1
+            if self.phase != SIZING:
+                self.phase = WARMUP
+        elif "Initializing New Environment Parameters" in line:
+            self._close_environment()
+        elif line.startswith("Performing") and "Sizing" in line:
+            self.phase = SIZING
+            self.warmup_day = 0
+        elif line.startswith("Beginning Primary Simulation"):
+            self.phase = INITIALIZING
+            self.warmup_day = 0
+        elif line.startswith("Writing ") or line.startswith("EnergyPlus Run Time"):
+            if self.phase == REPORTING:
+                return False
+            self._close_environment()
+            self.phase = REPORTING
+        elif "EnergyPlus Completed Successfully" in line:
+            self._close_environment()
+            self.phase = COMPLETED
+        else:
+            return False
+
+        self.updated_at = time.time()
+        self.version += 1
+        return True
+
+    def _close_environment(self):
+        if self.environment is not None:
+            self.completed_days += self.day_in_environment + 1
+            self.environment = None
+            self.day_in_environment = 0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the run done (0-1), or None when the total is unknown"""
+        if self.phase in (REPORTING, COMPLETED):
+            return 1.0
+        if not self.total_days:
+            return None
+        return min(self.day_of_simulation / self.total_days, 0.99)
+
+    def eta_seconds(self, now: Optional[float] = None) -> Optional[float]:
+        """Estimated seconds until the simulated days are done, or None if unknown"""
+        fraction = self.fraction
+        if fraction is None or self.simulation_started_at is None or self.phase == COMPLETED:
+            return None
+        if fraction >= 1.0:
+            return 0.0
+        done = self.day_of_simulation
+        if done <= 1:
+            return None
+        elapsed = (now or time.time()) - self.simulation_started_at
+        return elapsed / (done - 1) * (self.total_days - done + 1)
+
+    def describe(self) -> str:
+        """One-line human-readable progress message"""
+        if self.phase == SIMULATING:
+            text = f"{self.environment or 'Simulating'} {self.date}"
+            if self.total_days:
+                text += f" (day {self.day_of_simulation} of {self.total_days})"
+        elif self.phase == WARMUP:
+            text = f"Warmup day {self.warmup_day}"
+        elif self.phase == SIZING:
+            text = "Sizing" + (f", warmup day {self.warmup_day}" if self.warmup_day else "")
+        else:
+            text = self.phase.capitalize()
+        eta = self.eta_seconds()
+        if eta is not None and self.phase != REPORTING:
+            text += f", about {int(round(eta))}s remaining"
+        return text
+
+    def get_info(self) -> Dict[str, Any]:
+        """Return a JSON-serializable snapshot"""
+        fraction = self.fraction
+        eta = self.eta_seconds()
+        return {
+            "phase": self.phase,
+            "environment": self.environment,
+            "environments_started": self.environments_started,
+            "warmup_day": self.warmup_day,
+            "date": self.date,
+            "day_of_simulation": self.day_of_simulation,
+            "total_days": self.total_days,
+            "percent": round(fraction * 100, 1) if fraction is not None else None,
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "message": self.describe()
+        }
+
+
+def _run_period_days(fields) -> int:
+    """Length of a RunPeriod in days (IDF fields after the object type)"""
+    # Version 9+ has a Begin Year field between the begin and end dates
+    has_year = len(fields) > 5 and (not fields[3] or len(fields[3]) == 4)
+    begin_month, begin_day = int(fields[1]), int(fields[2])
+    end_month, end_day = (int(fields[4]), int(fields[5])) if has_year else (int(fields[3]), int(fields[4]))
+    return (_day_of_year(end_month, end_day) - _day_of_year(begin_month, begin_day)) % 365 + 1
+
+
+def estimate_simulation_days(idf_path: str, annual: bool = False, design_day: bool = False,
+                             has_weather: bool = True) -> Optional[int]:
+    """
+    Estimate how many days a run will simulate over all its environments
+
+    Mirrors how EnergyPlus picks environments: ``--annual`` runs the weather file
+    year only, ``--design-day`` runs the design days only, and otherwise
+    SimulationControl decides between sizing periods and run periods.
+
+    Returns:
+        Number of simulated days, or None if it cannot be determined
+    """
+    run_sizing_periods = run_weather_periods = True
+    design_days = 0
+    run_period_days = 0
+    try:
+        for obj_type, fields in iter_idf_objects(idf_path, ["SimulationControl", "SizingPeriod:DesignDay",
+                                                            "RunPeriod"]):
+            obj_type = obj_type.upper()
+            if obj_type == "SIMULATIONCONTROL":
+                run_sizing_periods = len(fields) < 4 or fields[3].casefold() != "no"
+                run_weather_periods = len(fields) < 5 or fields[4].casefold() != "no"
+            elif obj_type == "SIZINGPERIOD:DESIGNDAY":
+                design_days += 1
+            else:
+                run_period_days += _run_period_days(fields)
+    except (ValueError, IndexError, OSError) as e:
+        logger.debug(f"Could not estimate simulation length of {idf_path}: {e}")
+        return None
+
+    if annual:
+        return 365
+    if design_day:
+        return design_days or None
+    total = (design_days if run_sizing_periods else 0) + (run_period_days if run_weather_periods and has_weather else 0)
+    return total or None
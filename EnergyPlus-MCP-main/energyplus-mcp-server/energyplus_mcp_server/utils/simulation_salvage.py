@@ -0,0 +1,168 @@
+"""
+Partial-output salvage for EnergyPlus MCP Server.
+Works out how far an interrupted, failed or timed-out simulation got from the
+files it left behind (.err, .eso) and its last console output.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Only the end of the .eso is read; it can be hundreds of MB
+ESO_TAIL_BYTES = 4 * 1024 * 1024
+
+_ERR_SEVERITY = re.compile(r"^\s*\*\*\s*(Warning|Severe|Fatal)\s*\*\*\s*(.*)$")
+_ERR_CONTINUE = re.compile(r"^\s*\*\*\s*~~~\s*\*\*\s*(.*)$")
+_PROGRESS_LINE = re.compile(r"(Starting|Continuing|Updating) Simulation at (\d{2}/\d{2})(?:/\d{4})? for (.+)$")
+
+
+def _read_tail(path: Path, max_bytes: int) -> List[str]:
+    """Return the complete lines in the last max_bytes of a file"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        data = f.read().decode("latin-1")
+    lines = data.splitlines()
+    return lines[1:] if size > max_bytes else lines
+
+
+def summarize_err_file(err_path: Path, max_messages: int = 5) -> Dict[str, Any]:
+    """
+    Count warnings/severe/fatal messages in an .err file and keep the last severe ones
+
+    Returns:
+        Dictionary with counts, completion flag and the last severe/fatal messages
+    """
+    counts = {"warnings": 0, "severe": 0, "fatal": 0}
+    messages: List[str] = []
+    completed = False
+    last_kind = None
+
+    with open(err_path, "r", encoding="latin-1") as f:
+        for line in f:
+            match = _ERR_SEVERITY.match(line)
+            if match:
+                kind = match.group(1)
+                last_kind = kind
+                counts["warnings" if kind == "Warning" else kind.lower()] += 1
+                if kind != "Warning":
+                    messages.append(f"{kind}: {match.group(2).strip()}")
+                continue
+            match = _ERR_CONTINUE.match(line)
+            if match and last_kind and last_kind != "Warning" and messages:
+                messages[-1] += " " + match.group(1).strip()
+                continue
+            if "EnergyPlus Completed Successfully" in line:
+                completed = True
+
+    return {
+        **counts,
+        "completed_successfully": completed,
+        "last_severe_messages": messages[-max_messages:]
+    }
+
+
+def find_eso_progress(eso_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Find the last time step written to an .eso file
+
+    Returns:
+        Dictionary with the environment, day of simulation, date and hour reached, or
+        None if no data records were written yet
+    """
+    environment = None
+    last_time = None
+    for line in reversed(_read_tail(eso_path, ESO_TAIL_BYTES)):
+        if line.startswith("End of Data Dictionary"):
+            break
+        fields = line.split(",")
+        record_id = fields[0].strip()
+        try:
+            record = _parse_time_record(record_id, fields) if last_time is None else None
+        except ValueError:
+            continue
+        if record is not None:
+            last_time = record
+        elif record_id == "1" and len(fields) >= 2:
+            # 1,Environment Title,Latitude,Longitude,Time Zone,Elevation
+            environment = fields[1].strip()
+            break
+    if last_time is None:
+        return None
+    return {"environment": environment, **last_time}
+
+
+def _parse_time_record(record_id: str, fields: List[str]) -> Optional[Dict[str, Any]]:
+    """Parse an .eso time-step (2) or daily (3) record; None for other records"""
+    if record_id == "2" and len(fields) >= 6:
+        # 2,Day of Simulation,Month,Day of Month,DST Indicator,Hour,StartMinute,EndMinute,DayType
+        return {
+            "day_of_simulation": int(fields[1]),
+            "date": f"{int(fields[2]):02d}/{int(fields[3]):02d}",
+            "hour": int(fields[5])
+        }
+    if record_id == "3" and len(fields) >= 4:
+        # 3,Cumulative Day of Simulation,Month,Day of Month,DST Indicator,DayType
+        return {
+            "day_of_simulation": int(fields[1]),
+            "date": f"{int(fields[2]):02d}/{int(fields[3]):02d}",
+            "hour": 24
+        }
+    return None
+
+
+def salvage_partial_outputs(output_directory: str, stdout_tail: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Report how far a simulation got and which outputs it left behind
+
+    Args:
+        output_directory: The run's output directory
+        stdout_tail: Last lines of EnergyPlus console output, if captured
+
+    Returns:
+        Dictionary with the last console progress line, the last .eso time step,
+        the .err summary and the partial output files present
+    """
+    output_dir = Path(output_directory)
+    salvage: Dict[str, Any] = {
+        "last_progress": None,
+        "eso_progress": None,
+        "err_summary": None,
+        "partial_files": []
+    }
+
+    for line in reversed(list(stdout_tail or [])):
+        match = _PROGRESS_LINE.search(line)
+        if match:
+            salvage["last_progress"] = {"date": match.group(2), "environment": match.group(3).strip(),
+                                        "line": line.strip()}
+            break
+
+    if not output_dir.is_dir():
+        return salvage
+
+    for path in sorted(output_dir.iterdir()):
+        if not path.is_file():
+            continue
+        salvage["partial_files"].append({"name": path.name, "size_bytes": path.stat().st_size})
+        try:
+            if path.suffix == ".err" and salvage["err_summary"] is None:
+                salvage["err_summary"] = summarize_err_file(path)
+            elif path.suffix == ".eso" and salvage["eso_progress"] is None:
+                salvage["eso_progress"] = find_eso_progress(path)
+        except Exception as e:
+            logger.warning(f"Could not salvage {path}: {e}")
+
+    return salvage
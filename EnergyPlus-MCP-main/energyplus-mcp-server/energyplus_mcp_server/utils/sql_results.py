@@ -0,0 +1,338 @@
+"""
+EnergyPlus SQLite output reader for EnergyPlus MCP Server.
+Requests Output:SQLite for runs, adds the indexes selective queries need to the
+eplusout.sql EnergyPlus writes, and reads time series and tabular reports from
+it with SQL instead of parsing the CSV and HTML outputs.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import shutil
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Union
+
+import numpy as np
+
+from .eso_reader import EsoVariable, DAY_TYPES
+from .idf_scanner import iter_idf_objects, IDF_ENCODING
+
+logger = logging.getLogger(__name__)
+
+SQL_OUTPUT_OPTION = "SimpleAndTabular"
+
+# EnergyPlus only indexes ReportData by TimeIndex, so reading one variable scans the whole table
+SQL_INDEXES = (
+    ("mcp_report_data_variable", "ReportData", "ReportDataDictionaryIndex, TimeIndex"),
+    ("mcp_time_environment", "Time", "EnvironmentPeriodIndex, IntervalType"),
+    ("mcp_dictionary_name", "ReportDataDictionary", "Name, KeyValue"),
+    ("mcp_tabular_report", "TabularData", "ReportNameIndex, TableNameIndex"),
+)
+
+# ReportDataDictionary.ReportingFrequency -> .eso frequency names
+_FREQUENCIES = {
+    "each call": "Each Call",
+    "hvac system timestep": "Detailed",
+    "detailed": "Detailed",
+    "zone timestep": "TimeStep",
+    "timestep": "TimeStep",
+    "hourly": "Hourly",
+    "daily": "Daily",
+    "monthly": "Monthly",
+    "run period": "RunPeriod",
+    "runperiod": "RunPeriod",
+    "annual": "Annual",
+}
+
+# Time.IntervalType of daily and coarser rows (-1 and 0 are system and zone timesteps, 1 hourly)
+_DAILY, _MONTHLY, _RUN_PERIOD, _ANNUAL = 2, 3, 4, 5
+
+_DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+
+# Aliases of the Strings joins in tabular queries
+_TABULAR_JOINS = (
+    "JOIN Strings report_s ON report_s.StringIndex = t.ReportNameIndex "
+    "JOIN Strings for_s ON for_s.StringIndex = t.ReportForStringIndex "
+    "JOIN Strings table_s ON table_s.StringIndex = t.TableNameIndex "
+)
+
+
+def find_sql_output(output_directory: Union[str, Path]) -> Optional[Path]:
+    """The EnergyPlus SQLite output of a run directory (eplusout.sql or <prefix>.sql), or None"""
+    directory = Path(output_directory)
+    default = directory / "eplusout.sql"
+    if default.exists():
+        return default
+    candidates = sorted(directory.glob("*.sql"), key=lambda path: path.stat().st_mtime, reverse=True)
+    return candidates[0] if candidates else None
+
+
+def idf_has_sqlite_output(idf_path: str) -> bool:
+    """True if the model already requests Output:SQLite"""
+    return any(True for _ in iter_idf_objects(idf_path, ["Output:SQLite"]))
+
+
+def inject_sqlite_output(idf_path: str, output_directory: str, option: str = SQL_OUTPUT_OPTION) -> str:
+    """
+    Return a model to simulate that writes the SQLite output
+
+    The model itself is returned when it already has an Output:SQLite object;
+    otherwise a copy with one appended is written to the output directory, so the
+    source model is never changed.
+
+    Args:
+        idf_path: Model to simulate
+        output_directory: Directory of the run
+        option: Output:SQLite option ("Simple" or "SimpleAndTabular")
+
+    Returns:
+        Path of the IDF to pass to EnergyPlus
+    """
+    if idf_has_sqlite_output(idf_path):
+        return idf_path
+    sqlite_idf = Path(output_directory) / f"{Path(idf_path).stem}_sqlite.idf"
+    shutil.copyfile(idf_path, sqlite_idf)
+    with open(sqlite_idf, "a", encoding=IDF_ENCODING) as f:
+        f.write(f"\n\nOutput:SQLite,\n    {option + ';':<25}!- Option Type\n")
+    return str(sqlite_idf)
+
+
+def ensure_sql_indexes(sql_path: Union[str, Path]) -> List[str]:
+    """
+    Create the SQL_INDEXES that are missing in an EnergyPlus SQLite output
+
+    Tables the run did not write (e.g. TabularData for the "Simple" option) are skipped.
+
+    Returns:
+        Names of the indexes created
+    """
+    created = []
+    with sqlite3.connect(str(sql_path)) as connection:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        existing = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name, table, columns in SQL_INDEXES:
+            if table in tables and name not in existing:
+                connection.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+                created.append(name)
+    if created:
+        logger.info(f"Indexed {sql_path}: {', '.join(created)}")
+    return created
+
+
+class SqlResults:
+    """Read-only queries over an EnergyPlus SQLite output"""
+
+    def __init__(self, sql_path: Union[str, Path], create_indexes: bool = True):
+        """
+        Open an EnergyPlus SQLite output
+
+        Args:
+            sql_path: eplusout.sql (or <prefix>.sql) of a run
+            create_indexes: Add the missing SQL_INDEXES first (changes the file once)
+        """
+        self.path = Path(sql_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"SQLite output not found: {sql_path}")
+        if create_indexes:
+            try:
+                ensure_sql_indexes(self.path)
+            except sqlite3.OperationalError as e:  # read-only copy: queries still work, only slower
+                logger.warning(f"Could not index {self.path}: {e}")
+        self.connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        rows = self.connection.execute(
+            "SELECT EnvironmentPeriodIndex, EnvironmentName FROM EnvironmentPeriods "
+            "ORDER BY EnvironmentPeriodIndex").fetchall()
+        self._environment_ids = [row[0] for row in rows]
+        self.environments: List[str] = [row[1] for row in rows]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _environment_id(self, environment: Union[int, str]) -> int:
+        """EnvironmentPeriodIndex of an environment index (0-based) or title"""
+        if isinstance(environment, str) and not environment.isdigit():
+            titles = [title.casefold() for title in self.environments]
+            if environment.casefold() not in titles:
+                raise ValueError(f"Unknown environment '{environment}'. Available: {self.environments}")
+            return self._environment_ids[titles.index(environment.casefold())]
+        index = int(environment)
+        if not 0 <= index < len(self._environment_ids):
+            raise ValueError(f"Environment index {index} out of range. Available: {self.environments}")
+        return self._environment_ids[index]
+
+    def dictionary(self) -> List[EsoVariable]:
+        """Output variables and meters of the run; report_id is the ReportDataDictionaryIndex"""
+        rows = self.connection.execute(
+            "SELECT ReportDataDictionaryIndex, KeyValue, Name, Units, ReportingFrequency "
+            "FROM ReportDataDictionary ORDER BY ReportDataDictionaryIndex").fetchall()
+        return [EsoVariable(rid, key or "", name, units or "",
+                            _FREQUENCIES.get(str(frequency).strip().casefold(), str(frequency)))
+                for rid, key, name, units, frequency in rows]
+
+    def find(self, selectors: Iterable[str]) -> List[EsoVariable]:
+        """Variables named by any selector (name, key:name, label or report id, case-insensitive)"""
+        selector_set = {str(s).casefold() for s in selectors}
+        return [var for var in self.dictionary() if var.matches(selector_set)]
+
+    def columns(self, variables: List[EsoVariable], frequency: str,
+                environment: Optional[Union[int, str]] = None, year: int = 2001) -> Dict[str, np.ndarray]:
+        """
+        Time stamp and value columns of variables reporting at one frequency
+
+        Same layout and time stamp conventions as EsoData.columns: "Row" holds the
+        TimeIndex, and "Date/Time" is the end of the interval for timestep and hourly
+        rows and the start of the day, month or year for coarser ones.
+
+        Args:
+            variables: Variables from dictionary() or find()
+            frequency: Reporting frequency to read
+            environment: Environment index or title to include (default: all)
+            year: Calendar year for the time stamps
+
+        Returns:
+            {"Row", "Date/Time", "Environment", "Day Type", then one float64 array per variable label}
+        """
+        selected = [var for var in variables if var.frequency == frequency]
+        if not selected:
+            raise ValueError(f"No selected variables report at {frequency} frequency")
+
+        ids = [var.report_id for var in selected]
+        # One pass over the variable index; every column numeric so the rows convert to one array
+        day_type = " ".join(f"WHEN '{name.upper()}' THEN {code}" for code, name in enumerate(DAY_TYPES))
+        query = (f"SELECT d.ReportDataDictionaryIndex, d.TimeIndex, d.Value, t.Month, t.Day, t.Hour, t.Minute, "
+                 f"t.IntervalType, CASE upper(t.DayType) {day_type} ELSE -1 END, t.EnvironmentPeriodIndex "
+                 f"FROM ReportData d JOIN Time t ON t.TimeIndex = d.TimeIndex "
+                 f"WHERE d.ReportDataDictionaryIndex IN ({','.join('?' * len(ids))}) "
+                 f"AND (t.WarmupFlag IS NULL OR t.WarmupFlag = 0)")
+        params: List[Any] = list(ids)
+        if environment is not None:
+            query += " AND t.EnvironmentPeriodIndex = ?"
+            params.append(self._environment_id(environment))
+        data = np.array(self.connection.execute(query, params).fetchall(), dtype=np.float64).reshape(-1, 10)
+        data[:, 3:] = np.nan_to_num(data[:, 3:])  # NULL time fields (e.g. of run period rows)
+        variable_ids = data[:, 0].astype(np.int64)
+        time_ids = data[:, 1].astype(np.int64)
+        rows, first = np.unique(time_ids, return_index=True)
+
+        columns = {"Row": rows, **self._stamps(data[first, 3:].astype(np.int64), year)}
+        positions = np.searchsorted(rows, time_ids)
+        for var in selected:
+            column = np.full(len(rows), np.nan)
+            mine = variable_ids == var.report_id
+            column[positions[mine]] = data[mine, 2]
+            columns[var.label] = column
+        return columns
+
+    def _stamps(self, fields: np.ndarray, year: int) -> Dict[str, np.ndarray]:
+        """Date/Time, Environment and Day Type of Time rows (Month, Day, Hour, Minute, IntervalType,
+        day type code, EnvironmentPeriodIndex)"""
+        month, day, hour, minute, interval, day_types, env_ids = (fields[:, i] for i in range(7))
+        month, day = np.clip(month, 1, 12), np.maximum(day, 1)
+        leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+        day_of_year = _DAYS_BEFORE_MONTH[month - 1] + day - 1 + ((month > 2) & leap)
+        minutes = day_of_year * 1440
+        minutes = np.where(interval < _DAILY, minutes + hour * 60 + minute, minutes)
+        minutes = np.where(interval == _MONTHLY, (day_of_year - day + 1) * 1440, minutes)
+        minutes = np.where(interval == _ANNUAL, 0, minutes)
+        stamps = np.datetime64(f"{year}-01-01", "m") + minutes.astype("timedelta64[m]")
+        stamps[interval == _RUN_PERIOD] = np.datetime64("NaT")
+
+        day_types = np.where(interval >= _MONTHLY, -1, day_types).astype(np.int32)
+        known = np.array(self._environment_ids + [np.iinfo(np.int64).max], dtype=np.int64)
+        environments = np.searchsorted(known, env_ids).astype(np.int32)
+        environments[known[environments] != env_ids] = -1
+        return {"Date/Time": stamps, "Environment": environments, "Day Type": day_types}
+
+    def tabular(self, report: Optional[str] = None, table: Optional[str] = None,
+                report_for: Optional[str] = None, rows: Optional[List[str]] = None,
+                columns: Optional[List[str]] = None, limit: int = 2000) -> List[Dict[str, Any]]:
+        """
+        Cells of the tabular reports, filtered by exact (case-insensitive) names
+
+        Args:
+            report: Report name, e.g. "AnnualBuildingUtilityPerformanceSummary"
+            table: Table name, e.g. "Site and Source Energy"
+            report_for: "For" string of the report, e.g. "Entire Facility"
+            rows: Row names to keep
+            columns: Column names to keep
+            limit: Maximum number of cells returned
+
+        Returns:
+            List of {"report", "report_for", "table", "row", "column", "units", "value"} in report
+            order, row by row; numeric values are floats
+        """
+        names = self._string_indexes({"ReportName": report, "ReportForString": report_for, "TableName": table})
+        if names is None:
+            return []
+        conditions, params = [], []
+        for column, indexes in names.items():
+            conditions.append(f"t.{column}Index IN ({','.join('?' * len(indexes))})")
+            params.extend(indexes)
+        for alias, wanted in (("row_s", rows), ("column_s", columns)):
+            if wanted:
+                conditions.append(f"lower({alias}.Value) IN ({','.join('?' * len(wanted))})")
+                params.extend(str(name).casefold() for name in wanted)
+
+        query = ("SELECT report_s.Value, for_s.Value, table_s.Value, row_s.Value, column_s.Value, units_s.Value, "
+                 "t.Value FROM TabularData t " + _TABULAR_JOINS +
+                 "JOIN Strings row_s ON row_s.StringIndex = t.RowNameIndex "
+                 "JOIN Strings column_s ON column_s.StringIndex = t.ColumnNameIndex "
+                 "LEFT JOIN Strings units_s ON units_s.StringIndex = t.UnitsIndex")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        # String indexes follow the order reports were written; cells are stored column by column
+        query += (" ORDER BY t.ReportNameIndex, t.ReportForStringIndex, t.TableNameIndex, t.RowId, t.ColumnId"
+                  " LIMIT ?")
+        params.append(int(limit))
+
+        cells = []
+        for values in self.connection.execute(query, params):
+            cell = dict(zip(("report", "report_for", "table", "row", "column", "units", "value"), values))
+            cell["value"] = _cell_value(cell["value"])
+            cells.append(cell)
+        return cells
+
+    def tabular_index(self) -> List[Dict[str, Any]]:
+        """Reports and tables in the tabular output with their cell counts"""
+        query = ("SELECT report_s.Value, for_s.Value, table_s.Value, COUNT(*) FROM TabularData t " + _TABULAR_JOINS +
+                 "GROUP BY t.ReportNameIndex, t.ReportForStringIndex, t.TableNameIndex "
+                 "ORDER BY MIN(t.TabularDataIndex)")
+        return [{"report": report, "report_for": report_for, "table": table, "cells": cells}
+                for report, report_for, table, cells in self.connection.execute(query)]
+
+    def _string_indexes(self, filters: Dict[str, Optional[str]]) -> Optional[Dict[str, List[int]]]:
+        """StringIndex values naming each given filter; None when a filter matches nothing"""
+        indexes = {}
+        for column, value in filters.items():
+            if value is None:
+                continue
+            found = [row[0] for row in self.connection.execute(
+                "SELECT s.StringIndex FROM Strings s JOIN StringTypes st ON st.StringTypeIndex = s.StringTypeIndex "
+                "WHERE st.Value = ? AND lower(s.Value) = ?", (column, str(value).casefold()))]
+            if not found:
+                return None
+            indexes[column] = found
+        return indexes
+
+
+def _cell_value(value: Optional[str]) -> Any:
+    """Tabular cells are stored as text; numbers are returned as floats"""
+    if value is None:
+        return None
+    text = value.strip()
+    try:
+        return float(text)
+    except ValueError:
+        return text
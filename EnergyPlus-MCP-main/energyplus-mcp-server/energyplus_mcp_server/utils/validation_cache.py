@@ -0,0 +1,211 @@
+"""
+Validation cache for EnergyPlus MCP Server.
+Bounded in-memory cache shared by output variable and meter validation, for the
+configured outputs of a model and the index of its available outputs.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def file_key(path: str) -> Tuple:
+    """Cache key part identifying one version of a file (path, modification time, size)"""
+    try:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (path,)
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Rough memory footprint in bytes of a value made of containers, strings and plain objects"""
+    size = sys.getsizeof(value)
+    if _depth > 6:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1)
+    return size
+
+
+class _Flight:
+    """One computation in progress that other callers for the same key wait on"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class ValidationCache:
+    """LRU cache with a time-to-live and a memory cap
+
+    Entries expire ``ttl_seconds`` after they were stored. Beyond ``max_entries``
+    or ``max_total_bytes`` (estimated) the least recently used entries are
+    evicted. Population is single-flight: while one caller computes a key,
+    others asking for it wait for that result instead of computing it again.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300, max_total_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Entries kept
+            ttl_seconds: Seconds an entry stays valid (0 = no expiry)
+            max_total_bytes: Summed estimated size of the cached values
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_total_bytes = max_total_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()  # key -> (value, size, stored)
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired"""
+        with self._lock:
+            return self._lookup(key)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any],
+                       should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached value for a key, computing it once if needed
+
+        Args:
+            key: Cache key
+            compute: Called without arguments to produce the value on a miss
+            should_cache: Decides whether a computed value is stored (default: always);
+                          callers waiting on the computation get the value either way
+
+        Returns:
+            The cached or computed value. Exceptions from compute propagate to every waiting caller.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+            if flight.value is not None and (should_cache is None or should_cache(flight.value)):
+                self.put(key, flight.value)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting least recently used entries beyond the bounds"""
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_total_bytes:
+                logger.debug(f"Not caching {key}: {size} bytes exceeds the validation cache size")
+                return
+            self._entries[key] = (value, size, time.time())
+            self._total_bytes += size
+            self._evict()
+
+    def invalidate(self, key: Hashable):
+        """Remove one entry if present"""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "estimated_bytes": self._total_bytes,
+                "max_total_bytes": self.max_total_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "in_flight": len(self._inflight)
+            }
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        """Return a live entry and mark it used, counting the hit or miss (caller holds the lock)"""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl_seconds and time.time() - entry[2] > self.ttl_seconds:
+            self._drop(key)
+            self._stats["expirations"] += 1
+            entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[0]
+
+    def _drop(self, key: Hashable):
+        """Remove one entry (caller holds the lock)"""
+        _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _evict(self):
+        """Evict least recently used entries until within bounds (caller holds the lock)"""
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_total_bytes):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self._stats["evictions"] += 1
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get the process-wide validation cache instance"""
+    if not hasattr(get_validation_cache, '_cache'):
+        from ..config import get_config
+        server_config = get_config().server
+        get_validation_cache._cache = ValidationCache(
+            max_entries=server_config.validation_cache_max_entries,
+            ttl_seconds=server_config.validation_cache_ttl,
+            max_total_bytes=server_config.validation_cache_max_mb * 1024 * 1024
+        )
+    return get_validation_cache._cache
@@ -0,0 +1,275 @@
+"""
+Simulation-free output variable prediction for EnergyPlus MCP Server.
+Learns which object types make EnergyPlus report each output variable from
+variable dictionaries (.rdd) of earlier discovery runs and bundled examples,
+and predicts the variables of a model from its object types alone.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import threading
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Tuple, FrozenSet
+
+logger = logging.getLogger(__name__)
+
+# Variable name prefixes whose reporting objects are not named after the
+# variable. None marks variables every model reports.
+_PREFIX_TRIGGERS: Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...] = (
+    ("Site ", None),
+    ("Facility ", None),
+    ("Air System ", ("AIRLOOPHVAC",)),
+    ("HVAC System ", ("AIRLOOPHVAC", "PLANTLOOP", "CONDENSERLOOP", "ZONEHVAC")),
+    ("Zone Air System ", ("ZONE",)),
+    ("Zone System ", ("ZONE",)),
+    ("Zone Outdoor ", ("ZONE",)),
+    ("System Node ", ("AIRLOOPHVAC", "PLANTLOOP", "CONDENSERLOOP", "ZONEHVAC", "OUTDOORAIR:NODE")),
+    ("Plant ", ("PLANTLOOP", "CONDENSERLOOP")),
+    ("Zone Windows ", ("FENESTRATIONSURFACE", "WINDOW", "GLAZEDDOOR")),
+    ("Surface Window ", ("FENESTRATIONSURFACE", "WINDOW", "GLAZEDDOOR")),
+    ("Surface ", ("BUILDINGSURFACE", "FENESTRATIONSURFACE", "WALL", "ROOFCEILING", "CEILING", "FLOOR", "ROOF",
+                  "WINDOW", "DOOR", "GLAZEDDOOR", "INTERNALMASS", "SHADING")),
+    ("Enclosure ", ("ZONE",)),
+)
+
+# Key values of variables that are not keyed by an object name
+_FIXED_KEYS = (
+    ("Site ", ("Environment",)),
+    ("Facility ", ("Whole Building",)),
+)
+
+# Variables keyed by names that are not object names (nodes are named inside other objects)
+_UNINDEXED_KEY_PREFIXES = ("System Node ",)
+
+# Object types whose names key variables with a prefix, besides the variable's triggers
+# ("Zone Lights ..." variables are keyed by zone, "Lights ..." ones by Lights object)
+_KEY_PREFIX_TYPES = (
+    ("Zone ", ("ZONE", "SPACE", "ZONELIST")),
+    ("Space ", ("SPACE", "ZONE")),
+    ("Enclosure ", ("ZONE",)),
+)
+
+# Object types that never cause variables to be reported
+_IGNORED_PREFIXES = ("OUTPUT:", "OUTPUTCONTROL:", "VERSION")
+
+# Leading words of a variable name matched against object type segments
+_NAME_WORDS = 3
+
+# Words that prefix variables of many object types ("Zone Lights ...", "Space People ...");
+# on their own they only match when no other word does
+_WEAK_WORDS = {"zone", "space"}
+
+# Predicted availability of one variable
+AVAILABLE = "available"
+UNAVAILABLE = "unavailable"
+UNKNOWN = "unknown"
+
+
+def _name_tokens(variable_name: str, weak: bool = False) -> List[Tuple[str, int]]:
+    """Leading words of a variable name and their concatenations, with word position"""
+    words = variable_name.lower().split()[:_NAME_WORDS]
+    tokens = []
+    for start in range(len(words)):
+        for end in range(start + 1, len(words) + 1):
+            token = "".join(words[start:end])
+            if weak or token not in _WEAK_WORDS:
+                tokens.append((token, start))
+    return tokens
+
+
+def _match_object_type(tokens: List[Tuple[str, int]], object_type: str) -> Optional[Tuple[tuple, str]]:
+    """
+    Score how well an object type names a variable
+
+    A token equal to a type segment counts as an exact match; a token of five or
+    more letters inside a segment counts as a partial match. Exact matches rank
+    first, then matches of earlier words, then matches in earlier segments, then
+    the matched length.
+
+    Returns:
+        (score, trigger) or None if nothing matched. The trigger is the object type
+        cut after its last matched segment, so COIL:COOLING:DX:SINGLESPEED becomes
+        COIL:COOLING for "Cooling Coil ..." variables.
+    """
+    segments = object_type.lower().split(":")
+    exact = length = 0
+    position = _NAME_WORDS
+    first_segment, last_segment = len(segments), -1
+    for index, segment in enumerate(segments):
+        for token, word in tokens:
+            if token == segment:
+                exact += 1
+            elif len(token) < 5 or token not in segment:
+                continue
+            length += len(token)
+            position = min(position, word)
+            first_segment = min(first_segment, index)
+            last_segment = max(last_segment, index)
+    if last_segment < 0:
+        return None
+    return (exact, -position, -first_segment, length), ":".join(object_type.split(":")[:last_segment + 1])
+
+
+def _matches_trigger(object_type: str, trigger: str) -> bool:
+    return object_type == trigger or object_type.startswith(trigger + ":")
+
+
+class VariablePredictor:
+    """Predict the output variables of a model from its object types
+
+    Each observation pairs the object types of a model with the variables its
+    discovery run listed. For every variable the predictor derives triggers:
+    object types (or type prefixes) whose presence makes EnergyPlus report it.
+    Triggers come from a short table of naming conventions (``Air System``
+    variables belong to AirLoopHVAC) or else from the object type, present in
+    every model that reported the variable, whose name best matches the
+    variable's leading words (``Zone Lights ...`` -> Lights).
+
+    A variable is predicted available when the model has any of its triggers,
+    unavailable when it has none, and unknown when it was never observed or no
+    trigger could be derived.
+    """
+
+    def __init__(self):
+        self._observations: List[Tuple[FrozenSet[str], Dict[str, Dict[str, Any]]]] = []
+        self._rules: Optional[Dict[str, Optional[Tuple[str, ...]]]] = None  # None = always reported
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add_observation(self, object_types: Iterable[str], variables: List[Dict[str, Any]]):
+        """
+        Add the result of one discovery run
+
+        Args:
+            object_types: Object types of the model (any case)
+            variables: Variables from its .rdd file (see parse_rdd_file)
+        """
+        types = frozenset(t.upper() for t in object_types if not t.upper().startswith(_IGNORED_PREFIXES))
+        by_name = {var["variable_name"]: var for var in variables}
+        with self._lock:
+            self._observations.append((types, by_name))
+            for name, var in by_name.items():
+                self._metadata.setdefault(name, var)
+            self._rules = None
+
+    @property
+    def observations(self) -> int:
+        return len(self._observations)
+
+    def _build_rules(self) -> Dict[str, Optional[Tuple[str, ...]]]:
+        """Derive triggers for every observed variable (variables without one are left out)"""
+        present: Dict[str, Optional[FrozenSet[str]]] = {}
+        counts: Dict[str, int] = {}
+        for types, by_name in self._observations:
+            for name in by_name:
+                present[name] = types if name not in present else present[name] & types
+                counts[name] = counts.get(name, 0) + 1
+
+        rules: Dict[str, Optional[Tuple[str, ...]]] = {}
+        for name, required_types in present.items():
+            prefix_rule = next((triggers for prefix, triggers in _PREFIX_TRIGGERS if name.startswith(prefix)), False)
+            if prefix_rule is not False:
+                rules[name] = prefix_rule
+                continue
+
+            triggers = set()
+            for weak in (False, True):
+                tokens = _name_tokens(name, weak)
+                best_score = None
+                for object_type in required_types:
+                    match = _match_object_type(tokens, object_type)
+                    if match is None:
+                        continue
+                    score, trigger = match
+                    if best_score is None or score > best_score:
+                        best_score, triggers = score, {trigger}
+                    elif score == best_score:
+                        triggers.add(trigger)
+                if triggers:
+                    break
+
+            if triggers:
+                rules[name] = tuple(sorted(triggers))
+            elif counts[name] == len(self._observations):
+                rules[name] = None  # reported by every observed model
+        return rules
+
+    def _get_rules(self) -> Dict[str, Optional[Tuple[str, ...]]]:
+        with self._lock:
+            if self._rules is None:
+                self._rules = self._build_rules()
+            return self._rules
+
+    def predict(self, object_types: Iterable[str]) -> Dict[str, Any]:
+        """
+        Predict the output variables of a model
+
+        Args:
+            object_types: Object types of the model (any case)
+
+        Returns:
+            Dictionary with available (variable name -> .rdd metadata), unavailable
+            (variable name -> triggers the model lacks) and observations
+        """
+        types = {t.upper() for t in object_types}
+        available, unavailable = {}, {}
+        for name, triggers in self._get_rules().items():
+            if triggers is None or any(_matches_trigger(t, trigger) for t in types for trigger in triggers):
+                available[name] = self._metadata[name]
+            else:
+                unavailable[name] = list(triggers)
+        return {
+            "available": available,
+            "unavailable": unavailable,
+            "observations": len(self._observations)
+        }
+
+    def key_sources(self, variable_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Where the key values of a variable come from
+
+        Returns:
+            Dictionary with fixed_keys (keys that are not object names) and object_types
+            (types or type prefixes whose object names are keys), or None if unknown
+        """
+        for prefix, keys in _FIXED_KEYS:
+            if variable_name.startswith(prefix):
+                return {"fixed_keys": list(keys), "object_types": []}
+        if variable_name.startswith(_UNINDEXED_KEY_PREFIXES):
+            return None
+
+        object_types = set()
+        for prefix, types in _KEY_PREFIX_TYPES:
+            if variable_name.startswith(prefix):
+                object_types.update(types)
+        triggers = self._get_rules().get(variable_name)
+        if triggers is None:
+            triggers = next((t for prefix, t in _PREFIX_TRIGGERS if variable_name.startswith(prefix) and t), ())
+        object_types.update(triggers)
+        if not object_types:
+            return None
+        return {"fixed_keys": [], "object_types": sorted(object_types)}
+
+    @staticmethod
+    def check(prediction: Dict[str, Any], variable_name: str) -> Dict[str, Any]:
+        """Look up one variable in a prediction (see predict)"""
+        if variable_name in prediction["available"]:
+            return {"status": AVAILABLE, "metadata": prediction["available"][variable_name]}
+        if variable_name in prediction["unavailable"]:
+            return {"status": UNAVAILABLE, "requires_any_of": prediction["unavailable"][variable_name]}
+        return {"status": UNKNOWN}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the size of the training set and of the learned rule set"""
+        rules = self._get_rules()
+        return {
+            "observations": len(self._observations),
+            "known_variables": len(self._metadata),
+            "predictable_variables": len(rules),
+            "always_reported": sum(1 for triggers in rules.values() if triggers is None)
+        }
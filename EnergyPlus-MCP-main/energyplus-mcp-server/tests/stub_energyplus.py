@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the energyplus executable in tests
+
+Prints the console lines of a short annual run, spread over --seconds, writes
+an .err file into --output-directory, and exits with --exit-code. Any other
+EnergyPlus option is accepted and ignored.
+
+Usage:
+    python tests/stub_energyplus.py [--seconds 0.2] [--exit-code 0]
+        [--output-directory DIR] [--output-prefix PREFIX] [energyplus options] [model.idf]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=0.2)
+    parser.add_argument("--exit-code", type=int, default=0)
+    parser.add_argument("--output-directory", default=".")
+    parser.add_argument("--output-prefix", default="eplus")
+    args, _ = parser.parse_known_args()
+
+    lines = ["EnergyPlus Starting", "Processing Data Dictionary", "Processing Input File",
+             "Initializing Simulation", "Beginning Primary Simulation",
+             "Initializing New Environment Parameters", "Warming up {1}", "Warming up {2}",
+             "Starting Simulation at 01/01/2017 for RUN PERIOD 1"]
+    lines += [f"Continuing Simulation at {month:02d}/01/2017 for RUN PERIOD 1" for month in range(2, 13)]
+    lines += ["Writing tabular output file results using HTML format.",
+              "EnergyPlus Run Time=00hr 00min  0.20sec"]
+    for line in lines:
+        print(line, flush=True)
+        time.sleep(args.seconds / len(lines))
+
+    if os.path.isdir(args.output_directory):
+        outcome = "Completed Successfully" if args.exit_code == 0 else "Terminated"
+        with open(os.path.join(args.output_directory, f"{args.output_prefix}out.err"), "w") as f:
+            f.write(f" ************* EnergyPlus {outcome}-- 0 Warning; {int(args.exit_code != 0)} Severe Errors\n")
+    print(f"EnergyPlus {'Completed Successfully' if args.exit_code == 0 else 'Terminated--Fatal Error Detected'}.",
+          flush=True)
+    sys.exit(args.exit_code)
+
+
+if __name__ == "__main__":
+    main()
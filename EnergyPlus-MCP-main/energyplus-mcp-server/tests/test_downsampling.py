@@ -0,0 +1,42 @@
+"""
+Tests for Largest-Triangle-Three-Buckets downsampling (utils/downsampling.py)
+"""
+
+import numpy as np
+import pytest
+
+from energyplus_mcp_server.utils.downsampling import lttb_indices
+
+
+@pytest.mark.parametrize("n, threshold", [(10000, 500), (8760, 5000), (1001, 3), (12, 11)])
+def test_keeps_endpoints_and_one_point_per_bucket(n, threshold):
+    rng = np.random.default_rng(0)
+    x = np.arange(n, dtype=np.float64)
+    indices = lttb_indices(x, rng.normal(size=n), threshold)
+
+    assert len(indices) == threshold
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert np.all(np.diff(indices) > 0)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    assert np.array_equal(np.searchsorted(edges, indices[1:-1], side="right") - 1, np.arange(threshold - 2))
+
+
+def test_short_series_are_kept_whole():
+    assert np.array_equal(lttb_indices(np.arange(5), np.ones(5), 5), np.arange(5))
+    assert np.array_equal(lttb_indices(np.arange(5), np.ones(5), 50), np.arange(5))
+    assert np.array_equal(lttb_indices(np.arange(5), np.ones(5), 2), np.arange(5))
+
+
+def test_keeps_isolated_peaks():
+    y = np.zeros(52560)
+    y[[1234, 30000, 45678]] = [50.0, -20.0, 80.0]
+    indices = lttb_indices(np.arange(len(y)), y, 1000)
+    assert {1234, 30000, 45678} <= set(indices.tolist())
+
+
+def test_datetime_x():
+    times = np.datetime64("2001-01-01T00:10") + np.arange(52560) * np.timedelta64(10, "m")
+    y = np.sin(np.arange(52560) / 500.0)
+    indices = lttb_indices(times, y, 2000)
+    assert np.array_equal(indices, lttb_indices(np.arange(52560) * 600.0, y, 2000))
+    assert len(indices) == 2000
@@ -0,0 +1,98 @@
+"""
+Tests for the streaming .eso reader (utils/eso_reader.py)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from energyplus_mcp_server.utils.eso_reader import read_eso, read_eso_dictionary, parse_csv_timestamps
+
+OUTPUTS = os.path.join(os.path.dirname(__file__), "..", "illustrative examples", "5ZoneAirCooled", "5ZoneAirCooled")
+ESO, CSV = OUTPUTS + ".eso", OUTPUTS + ".csv"
+
+
+@pytest.fixture(scope="module")
+def csv():
+    frame = pd.read_csv(CSV)
+    frame.columns = [c.strip() for c in frame.columns]
+    return frame
+
+
+def test_matches_readvars_csv(csv):
+    data = read_eso(ESO)
+    frame = data.to_frame()
+    assert list(frame.columns) == list(csv.columns)
+    assert len(frame) == len(csv)
+    np.testing.assert_allclose(frame.iloc[:, 1:].to_numpy(), csv.iloc[:, 1:].to_numpy(), rtol=1e-12)
+    assert data.environments == ["RUN PERIOD 1"]
+
+
+def test_hour_24_rolls_over_to_the_next_day(csv):
+    frame = read_eso(ESO, ["Site Outdoor Air Drybulb Temperature"]).to_frame()
+    assert csv["Date/Time"][23].strip() == "06/01  24:00:00"
+    assert frame["Date/Time"][23] == pd.Timestamp("2001-06-02 00:00")
+    assert frame["Date/Time"][24] == pd.Timestamp("2001-06-02 01:00")
+    assert frame["Date/Time"].is_monotonic_increasing
+
+
+def test_selectors(csv):
+    label = "SPACE1-1 LIGHTS 1:Lights Electricity Energy [J](Hourly)"
+    by_name = read_eso(ESO, ["Lights Electricity Energy"])
+    assert len(by_name.variables) == 5
+
+    for selector in ("space1-1 lights 1:lights electricity energy", label):
+        data = read_eso(ESO, [selector])
+        (variable,) = data.variables.values()
+        assert variable.label == label
+        np.testing.assert_array_equal(data.values[variable.report_id], csv[label].to_numpy())
+        assert read_eso(ESO, [variable.report_id]).variables.keys() == {variable.report_id}
+
+    assert read_eso(ESO, ["No Such Variable"]).variables == {}
+    assert read_eso(ESO, frequencies=["Daily"]).variables == {}
+
+
+def test_float32_values(csv):
+    data = read_eso(ESO, ["Site Outdoor Air Drybulb Temperature"], dtype=np.float32)
+    (values,) = data.values.values()
+    assert values.dtype == np.float32
+    np.testing.assert_allclose(values, csv["Environment:Site Outdoor Air Drybulb Temperature [C](Hourly)"], rtol=1e-6)
+
+
+def test_dictionary():
+    variables = read_eso_dictionary(ESO)
+    assert len(variables) == 38
+    assert {v.frequency for v in variables} == {"Hourly"}
+    assert variables[0].key == "Environment" and variables[0].units == "C"
+
+
+def test_incomplete_file(tmp_path):
+    path = tmp_path / "eplusout.eso"
+    path.write_text("Program Version,EnergyPlus\n1,5,Environment Title[],Latitude[deg]\n")
+    with pytest.raises(ValueError, match="No complete data dictionary"):
+        read_eso(str(path))
+
+
+def test_csv_timestamps_match_the_eso(csv):
+    times, environments = parse_csv_timestamps(csv["Date/Time"])
+    expected = read_eso(ESO, ["Site Outdoor Air Drybulb Temperature"]).to_frame()["Date/Time"]
+    np.testing.assert_array_equal(times, expected.to_numpy().astype("datetime64[m]"))
+    assert not environments.any()
+
+
+def test_csv_timestamps_roll_over_and_split_environments():
+    stamps = pd.Series([" 12/31  23:00:00", " 12/31  24:00:00", "12/31", "December",
+                        " 01/21  01:00:00", " 01/21  24:00:00", "01/21", "RunPeriod"])
+    times, environments = parse_csv_timestamps(stamps, year=2001)
+    assert times.tolist()[:7] == [np.datetime64(t, "m").item() for t in (
+        "2001-12-31T23:00", "2002-01-01T00:00", "2001-12-31T00:00", "2001-12-01T00:00",
+        "2001-01-21T01:00", "2001-01-22T00:00", "2001-01-21T00:00")]
+    assert np.isnat(times[7])
+    assert environments.tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+
+
+def test_csv_timestamps_in_a_leap_year():
+    times, _ = parse_csv_timestamps(pd.Series([" 02/28  24:00:00", " 03/01  01:00:00"]), year=2004)
+    assert times.tolist() == [np.datetime64("2004-02-29T00:00").item(), np.datetime64("2004-03-01T01:00").item()]
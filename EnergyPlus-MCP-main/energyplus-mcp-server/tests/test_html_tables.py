@@ -0,0 +1,93 @@
+"""
+Tests for HTML tabular report extraction and its JSON cache (utils/html_tables.py)
+"""
+
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from energyplus_mcp_server.utils.html_tables import (
+    CACHE_SUFFIX, find_html_tables, parse_html_tables, load_html_tables, html_table_index, html_table_cells
+)
+
+REPORT = os.path.join(os.path.dirname(__file__), "..", "illustrative examples", "5ZoneAirCooled",
+                      "5ZoneAirCooledTable.htm")
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return parse_html_tables(REPORT)
+
+
+@pytest.fixture
+def report_copy(tmp_path):
+    return shutil.copy(REPORT, tmp_path / "eplustbl.htm")
+
+
+def test_extracts_every_table(tables):
+    assert len(tables) == 263
+    first = tables[0]
+    assert (first["report"], first["title"], first["report_for"], first["table"]) == (
+        "AnnualBuildingUtilityPerformanceSummary", "Annual Building Utility Performance Summary",
+        "Entire Facility", "Site and Source Energy")
+    assert first["columns"] == ["Total Energy [GJ]", "Energy Per Total Building Area [MJ/m2]",
+                                "Energy Per Conditioned Building Area [MJ/m2]"]
+    assert first["rows"][0] == ["Total Site Energy", 48.24, 52.03, 52.03]
+    assert any(entry["report_for"] == "VAV SYS 1" for entry in tables)
+
+
+def test_matches_pandas_read_html(tables):
+    pytest.importorskip("lxml")  # the parser read_html uses
+    frames = pd.read_html(REPORT)
+    assert len(frames) == len(tables)
+    for entry, frame in zip(tables, frames):
+        assert frame.shape == (len(entry["rows"]) + 1, len(entry["columns"]) + 1)
+        for row, values in zip(entry["rows"], frame.iloc[1:].itertuples(index=False)):
+            for ours, theirs in zip(row[1:], values[1:]):
+                if isinstance(ours, float):
+                    assert ours == pytest.approx(float(theirs))
+
+
+def test_cells(tables):
+    cells = html_table_cells(tables, report="annual building utility performance summary",
+                             rows=["total site energy"], columns=["Total Energy"])
+    assert cells == [{"report": "AnnualBuildingUtilityPerformanceSummary", "report_for": "Entire Facility",
+                      "table": "Site and Source Energy", "row": "Total Site Energy", "column": "Total Energy",
+                      "units": "GJ", "value": 48.24}]
+    assert len(html_table_cells(tables, limit=10)) == 10
+    assert html_table_cells(tables, report="No Such Report") == []
+
+    index = html_table_index(tables)
+    assert index[0] == {"report": "AnnualBuildingUtilityPerformanceSummary", "report_for": "Entire Facility",
+                        "table": "Site and Source Energy", "cells": len(tables[0]["rows"]) * 3}
+
+
+def test_cache_is_written_and_reused(report_copy, tables):
+    cache_path = report_copy.with_name("eplustbl" + CACHE_SUFFIX)
+    loaded, cached = load_html_tables(report_copy)
+    assert not cached and loaded == tables
+    assert cache_path.exists()
+
+    loaded, cached = load_html_tables(report_copy)
+    assert cached and loaded == tables
+    assert find_html_tables(report_copy.parent) == report_copy
+
+
+def test_changed_report_is_parsed_again(report_copy):
+    load_html_tables(report_copy)
+    text = report_copy.read_text(encoding="utf-8", errors="replace")
+    report_copy.write_text(text.replace("       48.24</td>", "       50.00</td>", 1), encoding="utf-8")
+
+    loaded, cached = load_html_tables(report_copy)
+    assert not cached
+    assert loaded[0]["rows"][0][1] == 50.0
+    assert load_html_tables(report_copy)[1]
+
+
+def test_unreadable_cache_is_ignored(report_copy, tables):
+    report_copy.with_name("eplustbl" + CACHE_SUFFIX).write_text("{not json")
+    loaded, cached = load_html_tables(report_copy)
+    assert not cached and loaded == tables
+    assert load_html_tables(report_copy, use_cache=False) == (tables, False)
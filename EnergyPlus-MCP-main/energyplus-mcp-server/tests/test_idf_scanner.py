@@ -0,0 +1,83 @@
+"""
+Tests for the streaming IDF scanner (utils/idf_scanner.py)
+"""
+
+import os
+
+import pytest
+from eppy.modeleditor import IDF
+
+from energyplus_mcp_server.utils.idf_scanner import iter_idf_objects, count_idf_objects, group_idf_records
+
+SAMPLE_FILES = os.path.join(os.path.dirname(__file__), "..", "sample_files")
+
+# Sample models the IDD bundled with eppy can parse
+MODELS = ["1ZoneUncontrolled.idf", "1ZoneEvapCooler.idf", "5ZoneAirCooled.idf"]
+
+BASICS_TYPES = ["Building", "Timestep", "RunPeriod", "SimulationControl", "Zone", "Site:Location",
+                "BuildingSurface:Detailed", "FenestrationSurface:Detailed", "People", "Lights",
+                "Schedule:Compact", "Material", "Construction", "Output:Variable"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def idd():
+    """Use the IDD eppy ships unless one was set already (eppy allows only one per process)"""
+    if IDF.getiddname() is None:
+        import eppy
+        IDF.setiddname(os.path.join(os.path.dirname(eppy.__file__), "resources", "iddfiles", "Energy+V9_2_0.idd"))
+
+
+@pytest.fixture(scope="module")
+def eppy_models():
+    return {name: IDF(os.path.join(SAMPLE_FILES, name)) for name in MODELS}
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_counts_match_eppy(eppy_models, name):
+    idf = eppy_models[name]
+    expected = {key: len(objs) for key, objs in idf.idfobjects.items() if objs}
+    assert count_idf_objects(os.path.join(SAMPLE_FILES, name)) == expected
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_records_match_eppy(eppy_models, name):
+    idf = eppy_models[name]
+    grouped = group_idf_records(os.path.join(SAMPLE_FILES, name), BASICS_TYPES)
+    assert list(grouped) == [t.upper() for t in BASICS_TYPES]
+    for obj_type, records in grouped.items():
+        expected = [dict(zip(obj.fieldnames[1:], obj.obj[1:] + [""] * (len(obj.fieldnames) - len(obj.obj))))
+                    for obj in idf.idfobjects[obj_type]]
+        assert records == expected, obj_type
+
+
+def test_comments_and_multiline_objects(tmp_path):
+    path = tmp_path / "model.idf"
+    path.write_text(
+        "! header comment\n"
+        "Zone,   ! the zone\n"
+        "  Core_ZN,  !- Name\n"
+        "  0;        !- Direction of Relative North\n"
+        "Timestep,4;  Version,\n"
+        "  23.2;\n"
+        "Lights,Core_ZN_Lights,Core_ZN,  ! ; in a comment\n"
+        "  Always On;\n"
+    )
+    assert list(iter_idf_objects(str(path))) == [
+        ("Zone", ["Core_ZN", "0"]),
+        ("Timestep", ["4"]),
+        ("Version", ["23.2"]),
+        ("Lights", ["Core_ZN_Lights", "Core_ZN", "Always On"]),
+    ]
+    assert list(iter_idf_objects(str(path), ["lights", "TIMESTEP"])) == [
+        ("Timestep", ["4"]),
+        ("Lights", ["Core_ZN_Lights", "Core_ZN", "Always On"]),
+    ]
+    assert count_idf_objects(str(path), ["Zone", "People"]) == {"ZONE": 1, "PEOPLE": 0}
+
+
+def test_unknown_object_types_keep_positional_fields(tmp_path):
+    path = tmp_path / "model.idf"
+    path.write_text("NotAnObject:Type,a,1.5;\nZone,Core_ZN;\n")
+    grouped = group_idf_records(str(path), ["NotAnObject:Type", "Zone"])
+    assert grouped["NOTANOBJECT:TYPE"] == [{"Field_1": "a", "Field_2": "1.5"}]
+    assert grouped["ZONE"][0]["Name"] == "Core_ZN"
@@ -0,0 +1,143 @@
+"""
+Tests for the parsed model cache and read-only model handles (utils/model_cache.py)
+"""
+
+import os
+
+import pytest
+
+from energyplus_mcp_server.utils import model_cache
+from energyplus_mcp_server.utils.model_cache import ModelCache, ReadOnlyIDF, ReadOnlyModelError
+
+
+class FakeBunch:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __getitem__(self, key):
+        return self.__dict__[key]
+
+
+class FakeIDF:
+    """Stands in for eppy's IDF, which needs an IDD; counts how often files are parsed"""
+    parsed = []
+
+    def __init__(self, path):
+        FakeIDF.parsed.append(path)
+        self.path = path
+        self.idfobjects = {"ZONE": [FakeBunch(Name="Core_ZN", Multiplier=1)]}
+
+    def getobject(self, key, name):
+        return next((obj for obj in self.idfobjects.get(key, []) if obj.Name == name), None)
+
+    def save(self):
+        raise AssertionError("the cached model must not be saved")
+
+
+@pytest.fixture(autouse=True)
+def fake_idf(monkeypatch):
+    FakeIDF.parsed = []
+    monkeypatch.setattr(model_cache, "IDF", FakeIDF)
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    def write(name, size=100):
+        path = tmp_path / name
+        path.write_text("!" * (size - 1) + "\n")
+        return str(path)
+    return write
+
+
+def test_cache_key_is_the_real_path(tmp_path, model_file):
+    path = model_file("a.idf")
+    link = tmp_path / "link.idf"
+    os.symlink(path, link)
+    cache = ModelCache()
+
+    first = cache.get_model(path)
+    assert cache.get_model(str(link))._idf is first._idf
+    assert cache.get_model(str(tmp_path / "." / "a.idf"))._idf is first._idf
+    assert FakeIDF.parsed == [os.path.realpath(path)]
+    assert cache.get_stats()["hits"] == 2
+
+
+def test_changed_file_is_parsed_again(model_file):
+    path = model_file("a.idf")
+    cache = ModelCache()
+    cache.get_model(path)
+    with open(path, "a") as f:
+        f.write("Zone,Core_ZN;\n")
+
+    cache.get_model(path)
+    stats = cache.get_stats()
+    assert len(FakeIDF.parsed) == 2
+    assert (stats["misses"], stats["invalidations"], stats["entries"]) == (2, 1, 1)
+    assert stats["cached_file_bytes"] == os.path.getsize(path)
+
+
+def test_writable_models_are_never_cached(model_file):
+    cache = ModelCache()
+    path = model_file("a.idf")
+    assert isinstance(cache.get_model(path, read_only=False), FakeIDF)
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(model_file):
+    cache = ModelCache(max_entries=2)
+    a, b, c = model_file("a.idf"), model_file("b.idf"), model_file("c.idf")
+    cache.get_model(a)
+    cache.get_model(b)
+    cache.get_model(a)
+    cache.get_model(c)
+
+    stats = cache.get_stats()
+    assert stats["cached_files"] == [os.path.realpath(a), os.path.realpath(c)]
+    assert stats["evictions"] == 1
+
+
+def test_eviction_by_file_size_keeps_one_model(model_file):
+    cache = ModelCache(max_total_bytes=250)
+    cache.get_model(model_file("a.idf"))
+    cache.get_model(model_file("b.idf"))
+    big = model_file("big.idf", size=400)
+    cache.get_model(big)
+
+    stats = cache.get_stats()
+    assert stats["cached_files"] == [os.path.realpath(big)]
+    assert stats["cached_file_bytes"] == 400
+
+
+def test_invalidate(model_file):
+    cache = ModelCache()
+    a, b = model_file("a.idf"), model_file("b.idf")
+    cache.get_model(a)
+    cache.get_model(b)
+    assert cache.invalidate(a) == 1
+    assert cache.invalidate(a) == 0
+    assert cache.invalidate() == 1
+    assert cache.get_stats()["cached_file_bytes"] == 0
+
+
+def test_read_only_handle_rejects_writes(model_file):
+    model = ModelCache().get_model(model_file("a.idf"))
+    assert isinstance(model, ReadOnlyIDF)
+
+    zone = model.idfobjects["Zone"][0]
+    assert zone.Name == "Core_ZN" and zone["Multiplier"] == 1
+    with pytest.raises(ReadOnlyModelError):
+        zone.Multiplier = 2
+    with pytest.raises(ReadOnlyModelError):
+        zone["Multiplier"] = 2
+    assert model.getobject("zone", "Core_ZN") == zone
+    assert model.getobject("ZONE", "Plenum") is None
+
+    for method in ("save", "newidfobject", "removeidfobject"):
+        with pytest.raises(ReadOnlyModelError, match=method):
+            getattr(model, method)
+
+    # Lookups return fresh lists, so changing one leaves the cached model intact
+    model.idfobjects["ZONE"].clear()
+    assert len(model.idfobjects.get("zone")) == 1
+    assert model.idfobjects.get("LIGHTS", []) == []
+    assert model._idf.idfobjects["ZONE"][0].Multiplier == 1
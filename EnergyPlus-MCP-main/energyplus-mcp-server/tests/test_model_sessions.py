@@ -0,0 +1,125 @@
+"""
+Tests for model editing sessions (utils/model_sessions.py)
+"""
+
+import os
+import time
+
+import pytest
+
+from energyplus_mcp_server.config import Config
+from energyplus_mcp_server.utils import model_sessions
+from energyplus_mcp_server.utils.model_sessions import ModelSessionManager
+
+
+class FakeIDF:
+    """Stands in for eppy's IDF, which needs an IDD; save copies the source text"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def save(self, path):
+        with open(path, "w") as f, open(self.path) as src:
+            f.write(src.read())
+
+
+@pytest.fixture(autouse=True)
+def fake_idf(monkeypatch):
+    monkeypatch.setattr(model_sessions, "IDF", FakeIDF)
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    def write(name, size=100):
+        path = tmp_path / name
+        path.write_text("!" * (size - 1) + "\n")
+        return str(path)
+    return write
+
+
+def test_close_refuses_unsaved_edits(tmp_path, model_file):
+    manager = ModelSessionManager(autosave_dir=str(tmp_path / "autosave"))
+    session = manager.open_session(model_file("a.idf"))
+    session.record_edit("change_people", 2)
+
+    with pytest.raises(ValueError, match="1 unsaved edit"):
+        manager.close_session(session.session_id)
+    assert manager.get_session(session.session_id) is session
+
+    info = manager.close_session(session.session_id, discard_changes=True)
+    assert info["discarded_changes"]
+    assert not os.path.exists(tmp_path / "autosave")
+    with pytest.raises(ValueError, match="closed by user"):
+        manager.get_session(session.session_id)
+
+
+def test_saved_session_closes(tmp_path, model_file):
+    manager = ModelSessionManager()
+    session = manager.open_session(model_file("a.idf"))
+    session.record_edit("change_people", 1)
+    result = manager.save_session(session.session_id)
+    assert result["output_file"] == str(tmp_path / "a_modified.idf")
+    assert not manager.close_session(session.session_id)["discarded_changes"]
+
+
+def test_idle_session_is_autosaved(tmp_path, model_file):
+    manager = ModelSessionManager(idle_timeout=60, autosave_dir=str(tmp_path / "autosave"))
+    dirty = manager.open_session(model_file("dirty.idf"))
+    clean = manager.open_session(model_file("clean.idf"))
+    dirty.record_edit("change_people", 1)
+    dirty.last_access = clean.last_access = time.time() - 120
+
+    assert manager.list_sessions() == []
+    autosave = str(tmp_path / "autosave" / f"dirty_session_{dirty.session_id}.idf")
+    assert os.path.exists(autosave)
+    assert os.listdir(tmp_path / "autosave") == [os.path.basename(autosave)]
+    with pytest.raises(ValueError, match=f"idle timeout.*{autosave}"):
+        manager.get_session(dirty.session_id)
+    assert manager.get_stats()["closed_automatically"] == 2
+
+
+def test_least_recently_used_session_is_evicted(model_file):
+    manager = ModelSessionManager(max_sessions=2)
+    first = manager.open_session(model_file("a.idf"))
+    second = manager.open_session(model_file("b.idf"))
+    manager.get_session(first.session_id)
+    manager.open_session(model_file("c.idf"))
+
+    assert [s["session_id"] for s in manager.list_sessions()][0] == first.session_id
+    with pytest.raises(ValueError, match="evicted"):
+        manager.get_session(second.session_id)
+
+
+def test_eviction_by_file_size_keeps_the_new_session(model_file):
+    manager = ModelSessionManager(max_total_bytes=250)
+    manager.open_session(model_file("a.idf"))
+    manager.open_session(model_file("b.idf"))
+    big = manager.open_session(model_file("big.idf", size=400))
+
+    assert [s["session_id"] for s in manager.list_sessions()] == [big.session_id]
+    assert manager.get_stats()["session_file_bytes"] == 400
+
+
+def test_closed_history_is_capped(monkeypatch, model_file):
+    monkeypatch.setattr(ModelSessionManager, "CLOSED_HISTORY", 3)
+    manager = ModelSessionManager()
+    path = model_file("a.idf")
+    ids = []
+    for _ in range(5):
+        ids.append(manager.open_session(path).session_id)
+        manager.close_session(ids[-1])
+
+    assert list(manager._closed) == ids[2:]
+    with pytest.raises(ValueError, match="not found"):
+        manager.get_session(ids[0])
+
+
+def test_from_config(tmp_path):
+    config = Config()
+    config.paths.cache_dir = str(tmp_path)
+    config.server.max_sessions = 3
+    config.server.session_max_mb = 4
+    manager = ModelSessionManager.from_config(config)
+    assert manager.max_sessions == 3
+    assert manager.max_total_bytes == 4 * 1024 * 1024
+    assert manager.autosave_dir == os.path.join(str(tmp_path), "sessions")
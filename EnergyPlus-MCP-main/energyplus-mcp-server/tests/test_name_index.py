@@ -0,0 +1,57 @@
+"""
+Tests for output name and object name indexes (utils/name_index.py)
+"""
+
+import difflib
+
+import pytest
+
+from energyplus_mcp_server.utils.name_index import NameIndex, ObjectNameIndex
+
+VARIABLES = [
+    "Chiller COP", "Chiller Electricity Rate", "Chiller Electricity Energy", "Chiller Evaporator Cooling Rate",
+    "Zone Mean Air Temperature", "Zone Air Temperature", "Zone Air Relative Humidity",
+    "Zone Lights Electricity Energy", "Zone Lights Electricity Rate", "Lights Electricity Energy",
+    "Site Outdoor Air Drybulb Temperature", "Site Outdoor Air Wetbulb Temperature",
+    "Surface Inside Face Temperature", "Surface Outside Face Temperature",
+] + [f"Fan Coil Unit {i} Fan Electricity Rate" for i in range(30)]
+
+
+@pytest.fixture
+def index():
+    return NameIndex(({"variable_name": name, "units": "W"} for name in VARIABLES), "variable_name")
+
+
+def test_exact_lookup(index):
+    assert len(index) == len(VARIABLES)
+    assert "Chiller COP" in index
+    assert index.get("Chiller COP") == {"variable_name": "Chiller COP", "units": "W"}
+    assert index.get("chiller cop") is None
+
+
+def test_few_trigram_matches_fall_back_to_a_full_scan(index):
+    # Shares almost no trigrams with "Chiller COP", but difflib still finds it
+    assert index.suggest("yhrlej CP", n=5, cutoff=0.6) == ["Chiller COP"]
+    assert difflib.get_close_matches("yhrlej CP", VARIABLES, n=5, cutoff=0.6) == ["Chiller COP"]
+
+
+@pytest.mark.parametrize("query", ["Zone Mean Air Temprature", "Site Outdor Air Drybulb Temperature",
+                                   "Surface Inside Temperature", "Chiller Electric Energy", "zone lights"])
+def test_suggestions_match_difflib(index, query):
+    assert index.suggest(query, n=3, cutoff=0.6) == difflib.get_close_matches(query, VARIABLES, n=3, cutoff=0.6)
+
+
+def test_no_suggestions_below_cutoff(index):
+    assert index.suggest("Boiler Gas Rate", n=5, cutoff=0.9) == []
+
+
+def test_object_name_index(tmp_path):
+    idf = tmp_path / "model.idf"
+    idf.write_text("Version,23.2;\nTimestep,4;\nZone,Core_ZN;\nLights,Core_ZN_Lights,Core_ZN;\n"
+                   "Output:Variable,*,Zone Mean Air Temperature,hourly;\n"
+                   "BuildingSurface:Detailed,Core_ZN_Wall,Wall,Ext,Core_ZN;\n")
+    names = ObjectNameIndex(str(idf))
+    assert names.find("core_zn") == "Core_ZN"
+    assert names.find("4") is None and names.find("*") is None
+    assert sorted(names.all_names()) == ["Core_ZN", "Core_ZN_Lights", "Core_ZN_Wall"]
+    assert sorted(names.names_for(["BUILDINGSURFACE", "ZONE"])) == ["Core_ZN", "Core_ZN_Wall"]
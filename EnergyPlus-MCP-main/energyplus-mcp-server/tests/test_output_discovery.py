@@ -0,0 +1,119 @@
+"""
+Tests for output discovery signatures and discovery models (utils/output_discovery.py)
+"""
+
+import pytest
+
+from energyplus_mcp_server.utils.idf_scanner import iter_idf_objects
+from energyplus_mcp_server.utils.output_discovery import output_signature, write_discovery_idf
+
+MODEL = """
+Version,23.2;
+Building,Office,0,Suburbs,0.04,0.4,FullInteriorAndExterior,25,6;
+Timestep,4;
+SimulationControl,Yes,Yes,Yes,No,Yes;
+RunPeriod,Annual,1,1,,12,31,,Sunday,Yes,Yes,No,Yes,Yes;
+Site:Location,San Francisco,37.62,-122.40,-8.0,2.0;
+ScheduleTypeLimits,Fraction,0,1,Continuous;
+Schedule:Constant,Always On,Fraction,1;
+Material,Concrete,MediumRough,0.2,1.7,2240,900;
+Construction,Ext Wall,Concrete;
+Zone,Core_ZN;
+ZoneInfiltration:DesignFlowRate,Core_ZN_Infiltration,Core_ZN,Always On,Flow/Zone,0.02;
+Lights,Core_ZN_Lights,Core_ZN,Always On,Watts/Area,,10,,0,0.4,0.2,1,General;
+Output:Variable,*,Zone Mean Air Temperature,hourly;
+Output:Meter,Electricity:Facility,monthly;
+OutputControl:Table:Style,HTML;
+"""
+
+
+@pytest.fixture
+def signature_of(tmp_path):
+    def signature(text, version="25.1.0"):
+        path = tmp_path / "model.idf"
+        path.write_text(text)
+        return output_signature(str(path), version)
+    return signature
+
+
+@pytest.mark.parametrize("old, new", [
+    ("Timestep,4;", "Timestep,6;"),
+    ("RunPeriod,Annual,1,1,,12,31,", "RunPeriod,Summer,6,1,,8,31,"),
+    ("SimulationControl,Yes,Yes,Yes,No,Yes;", "SimulationControl,No,No,No,Yes,No;"),
+    ("Output:Variable,*,Zone Mean Air Temperature,hourly;", "Output:Variable,*,Site Outdoor Air Drybulb Temperature,timestep;"),
+    ("Output:Meter,Electricity:Facility,monthly;", ""),
+    ("Building,Office,0,", "Building,Lab,30,"),
+    ("Schedule:Constant,Always On,Fraction,1;", "Schedule:Constant,Always On,Fraction,0.5;"),
+    ("Material,Concrete,MediumRough,0.2,", "Material,Concrete,Rough,0.3,"),
+    ("Flow/Zone,0.02;", "Flow/Zone,0.05;"),
+    ("Zone,Core_ZN;", "! core zone\nZONE,\n  Core_ZN;"),
+    ("Version,23.2;", "Version,23.2;\nOutput:Diagnostics,DisplayExtraWarnings;"),
+])
+def test_signature_ignores_edits_that_keep_outputs(signature_of, old, new):
+    assert old in MODEL
+    assert signature_of(MODEL.replace(old, new)) == signature_of(MODEL)
+
+
+@pytest.mark.parametrize("old, new", [
+    ("Zone,Core_ZN;", "Zone,Core_ZN;\nZone,Plenum_ZN;"),
+    ("Lights,Core_ZN_Lights,", "Lights,Core_ZN_Task_Lights,"),
+    ("0.2,1,General;", "0.2,1,Task;"),
+    ("Schedule:Constant,Always On,", "Schedule:Constant,Office Hours,"),
+    ("Version,23.2;", "Version,23.2;\nOutput:Diagnostics,DisplayAdvancedReportVariables;"),
+])
+def test_signature_changes_with_output_relevant_edits(signature_of, old, new):
+    assert old in MODEL
+    assert signature_of(MODEL.replace(old, new)) != signature_of(MODEL)
+
+
+def test_signature_depends_on_energyplus_version(signature_of):
+    assert signature_of(MODEL, "25.1.0") != signature_of(MODEL, "24.2.0")
+
+
+@pytest.fixture
+def discovery_model(tmp_path):
+    def write(text, run_days=1):
+        source, target = tmp_path / "model.idf", tmp_path / "discovery.idf"
+        source.write_text(text)
+        info = write_discovery_idf(str(source), str(target), run_days)
+        objects = {}
+        for obj_type, fields in iter_idf_objects(str(target)):
+            objects.setdefault(obj_type.upper(), []).append(fields)
+        return info, objects
+    return write
+
+
+def test_discovery_model(discovery_model):
+    text = MODEL + "RunPeriod,Second,7,1,,7,31;\nOutput:Diagnostics,DisplayAdvancedReportVariables;\n"
+    info, objects = discovery_model(text, run_days=3)
+
+    assert info == {"removed_objects": 4, "sizing_disabled": True, "needs_expandobjects": False}
+    assert not {"OUTPUT:VARIABLE", "OUTPUT:METER", "OUTPUTCONTROL:TABLE:STYLE"} & set(objects)
+    assert objects["OUTPUT:DIAGNOSTICS"] == [["DisplayAdvancedReportVariables"]]
+    assert objects["OUTPUT:VARIABLEDICTIONARY"] == [["IDF"]]
+    assert objects["RUNPERIOD"] == [["Annual", "1", "1", "", "1", "3", "", "Sunday", "Yes", "Yes", "No", "Yes", "Yes"]]
+    assert objects["TIMESTEP"] == [["1"]]
+    assert objects["BUILDING"][0][6:8] == ["1", "1"]
+    assert objects["SIMULATIONCONTROL"] == [["No", "No", "No", "No", "Yes"]]
+    assert objects["LIGHTS"] == [["Core_ZN_Lights", "Core_ZN", "Always On", "Watts/Area", "", "10", "", "0",
+                                  "0.4", "0.2", "1", "General"]]
+
+
+def test_discovery_model_run_days_are_capped(discovery_model):
+    _, objects = discovery_model(MODEL, run_days=30)
+    assert objects["RUNPERIOD"][0][4:6] == ["1", "7"]
+
+
+def test_autosized_model_keeps_sizing(discovery_model):
+    info, objects = discovery_model(MODEL.replace("Watts/Area,,10,", "Watts/Area,,autosize,"))
+    assert not info["sizing_disabled"]
+    assert objects["SIMULATIONCONTROL"] == [["Yes", "Yes", "Yes", "No", "Yes"]]
+
+
+def test_design_day_model_simulates_sizing_periods(discovery_model):
+    text = MODEL.replace("SimulationControl,Yes,Yes,Yes,No,Yes;\n", "")
+    text = text.replace("RunPeriod,Annual,1,1,,12,31,,Sunday,Yes,Yes,No,Yes,Yes;", "HVACTemplate:Thermostat,All Zones;")
+    info, objects = discovery_model(text)
+    assert info["needs_expandobjects"] and not info["sizing_disabled"]
+    assert "RUNPERIOD" not in objects
+    assert objects["SIMULATIONCONTROL"] == [["Yes", "Yes", "Yes", "Yes", "No"]]
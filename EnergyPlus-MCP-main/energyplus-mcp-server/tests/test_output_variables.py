@@ -0,0 +1,93 @@
+"""
+Tests for output variable key value validation (utils/output_variables.py)
+"""
+
+import pytest
+
+from energyplus_mcp_server.config import get_config
+from energyplus_mcp_server.utils.output_variables import OutputVariableManager
+from energyplus_mcp_server.utils.variable_predictor import VariablePredictor
+
+MODEL = """
+Version,23.2;
+Zone,Core_ZN;
+BuildingSurface:Detailed,Core_ZN_Wall_North,Wall,Ext Wall,Core_ZN,,Outdoors;
+Ceiling:Adiabatic,Core_ZN_Ceiling,Int Ceiling,Core_ZN,,0,0,0,10,10;
+Ceiling:Interzone,Core_ZN_Ceiling_Up,Int Ceiling,Core_ZN,,Plenum_Floor,0,0,0,10,10;
+InternalMass,Internal-P1T,Int Mass,Core_ZN,,50;
+Lights,Core_ZN_Lights,Core_ZN,Always On,Watts/Area,,10;
+"""
+
+SURFACE_VARIABLE = "Surface Inside Face Temperature"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Manager whose predictor has seen one model, so key sources do not depend on stored discoveries"""
+    predictor = VariablePredictor()
+    predictor.add_observation(
+        ["ZONE", "BUILDINGSURFACE:DETAILED", "LIGHTS"],
+        [{"key": "*", "variable_name": SURFACE_VARIABLE, "frequency": "hourly", "units": "C"},
+         {"key": "*", "variable_name": "Lights Electricity Energy", "frequency": "hourly", "units": "J"}]
+    )
+    variables = OutputVariableManager(get_config())
+    monkeypatch.setattr(variables.discovery, "get_predictor", lambda: predictor)
+    return variables
+
+
+@pytest.fixture
+def idf_path(tmp_path):
+    path = tmp_path / "model.idf"
+    path.write_text(MODEL)
+    return str(path)
+
+
+def test_surface_keys_include_internal_mass_and_simple_ceilings():
+    sources = VariablePredictor().key_sources(SURFACE_VARIABLE)
+    assert {"INTERNALMASS", "CEILING", "BUILDINGSURFACE", "FLOOR", "WALL"} <= set(sources["object_types"])
+
+
+@pytest.mark.parametrize("key", ["Internal-P1T", "core_zn_ceiling", "Core_ZN_Ceiling_Up", "Core_ZN_Wall_North"])
+def test_surface_keys_resolve_without_warnings(manager, idf_path, key):
+    result = manager.validate_key_value(idf_path, key, SURFACE_VARIABLE)
+    assert result["is_valid"]
+    assert result["resolved_keys"][0].casefold() == key.casefold()
+    assert "warnings" not in result
+
+
+def test_key_of_another_object_type_only_warns(manager, idf_path):
+    result = manager.validate_key_value(idf_path, "core_zn", SURFACE_VARIABLE)
+    assert result["is_valid"]
+    assert result["resolved_keys"] == ["Core_ZN"]
+    assert "not predicted to report" in result["warnings"][0]
+
+
+def test_unknown_key_only_warns_and_suggests(manager, idf_path):
+    result = manager.validate_key_value(idf_path, "Internal-P1", SURFACE_VARIABLE)
+    assert result["is_valid"]
+    assert result["resolved_keys"] == ["Internal-P1"]
+    assert "does not name any" in result["warnings"][0]
+    assert result["suggestions"][0] == "Internal-P1T"
+
+
+def test_key_patterns(manager, idf_path):
+    result = manager.validate_key_value(idf_path, "Core_ZN_Ceiling*", SURFACE_VARIABLE)
+    assert result["expanded"] and sorted(result["resolved_keys"]) == ["Core_ZN_Ceiling", "Core_ZN_Ceiling_Up"]
+    assert "warnings" not in result
+
+    result = manager.validate_key_value(idf_path, "regex:core_zn_l.*", SURFACE_VARIABLE)
+    assert result["is_valid"] and result["resolved_keys"] == ["Core_ZN_Lights"]
+    assert "matches no" in result["warnings"][0]
+
+    result = manager.validate_key_value(idf_path, "Plenum*", SURFACE_VARIABLE)
+    assert not result["is_valid"]
+
+    result = manager.validate_key_value(idf_path, "regex:(", SURFACE_VARIABLE)
+    assert not result["is_valid"] and "Invalid regular expression" in result["error"]
+
+
+def test_wildcard_and_fixed_keys(manager, idf_path):
+    assert manager.validate_key_value(idf_path, "*", SURFACE_VARIABLE)["resolved_keys"] == ["*"]
+    result = manager.validate_key_value(idf_path, "environment", "Site Outdoor Air Drybulb Temperature")
+    assert result == {"is_valid": True, "resolved_keys": ["Environment"]}
+    assert not manager.validate_key_value(idf_path, "", SURFACE_VARIABLE)["is_valid"]
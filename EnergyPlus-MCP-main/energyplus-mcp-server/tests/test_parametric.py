@@ -0,0 +1,73 @@
+"""
+Tests for parametric batch helpers (utils/parametric.py)
+"""
+
+import pytest
+
+from energyplus_mcp_server.utils.parametric import (
+    RESULT_COLUMNS, normalize_variants, build_result_table, summarize_simulation_outputs
+)
+
+
+def test_normalize_variants_names():
+    variants = normalize_variants([
+        {"name": "low infiltration!", "infiltration_multiplier": 0.5},
+        {"infiltration_multiplier": 2},
+        {"name": "cool roof", "coating": {"location": "Roof", "solar_abs": 0.2}},
+    ])
+    assert [v["name"] for v in variants] == ["low_infiltration", "variant_2", "cool_roof"]
+    assert variants[2]["coating"] == [{"location": "Roof", "solar_abs": 0.2}]
+    assert "coating" not in variants[0]
+
+
+@pytest.mark.parametrize("variants, message", [
+    (["not a dict"], "must be a dictionary"),
+    ([{"u_value": 1.0}], "unknown keys"),
+    ([{"name": "a"}, {"name": "a"}], "unique name"),
+    ([{"name": "baseline"}], "unique name"),
+    ([{"name": "!!!"}], "unique name"),
+    ([{"coating": {"location": "floor"}}], "'wall' or 'roof'"),
+    ([{"lights": {"field_name": "Watts_per_Zone_Floor_Area"}}], "must be a list"),
+])
+def test_normalize_variants_rejects(variants, message):
+    with pytest.raises(ValueError, match=message):
+        normalize_variants(variants)
+
+
+def test_build_result_table():
+    table = build_result_table([
+        {"variant": "efficient", "status": "completed", "total_site_energy_gj": 90.0},
+        {"variant": "baseline", "status": "completed", "total_site_energy_gj": 120.0},
+        {"variant": "failed", "status": "failed", "error": "severe"},
+    ])
+    assert table["columns"] == RESULT_COLUMNS
+    change = RESULT_COLUMNS.index("site_energy_change_pct")
+    assert [row[change] for row in table["rows"]] == [-25.0, 0.0, None]
+    assert table["rows"][2][RESULT_COLUMNS.index("error")] == "severe"
+    assert [row[0] for row in table["rows"]] == ["efficient", "baseline", "failed"]
+
+
+def test_build_result_table_without_baseline():
+    table = build_result_table([{"variant": "a", "total_site_energy_gj": 90.0}])
+    assert table["rows"][0][RESULT_COLUMNS.index("site_energy_change_pct")] is None
+
+
+def test_summary_from_tabular_csv_and_err(tmp_path):
+    (tmp_path / "eplustbl.csv").write_text(
+        "REPORT:,Annual Building Utility Performance Summary\n"
+        ",,Total Energy [GJ],Energy Per Total Building Area [MJ/m2]\n"
+        ",Total Site Energy,123.45,456.7\n"
+        ",Total Source Energy,300.1,1110.2\n"
+        ",Time Setpoint Not Met During Occupied Heating,12.5\n"
+        ",Time Setpoint Not Met During Occupied Cooling,0.00\n"
+        ",Total Site Energy,999,999\n"
+    )
+    (tmp_path / "eplusout.err").write_text(
+        "   ************* EnergyPlus Completed Successfully-- 7 Warning; 0 Severe Errors; Elapsed Time=00hr 00min  1.2sec\n"
+    )
+    assert summarize_simulation_outputs(str(tmp_path)) == {
+        "total_site_energy_gj": 123.45, "site_eui_mj_m2": 456.7,
+        "total_source_energy_gj": 300.1, "unmet_heating_hours": 12.5, "unmet_cooling_hours": 0.0,
+        "warnings": 7, "severe_errors": 0
+    }
+    assert summarize_simulation_outputs(str(tmp_path / "missing")) == {}
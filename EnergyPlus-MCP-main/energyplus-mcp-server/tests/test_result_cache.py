@@ -0,0 +1,133 @@
+"""
+Tests for the simulation result cache (utils/result_cache.py)
+"""
+
+import os
+import time
+
+import pytest
+
+from energyplus_mcp_server.utils.result_cache import SimulationResultCache, make_result_key, existing_files
+
+MODEL = """
+Version,23.2;
+Zone,Core_ZN,0;
+Lights,Core_ZN_Lights,Core_ZN,Always On,Watts/Area,,10;
+"""
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "model.idf"
+    path.write_text(MODEL)
+    return str(path)
+
+
+@pytest.fixture
+def weather(tmp_path):
+    path = tmp_path / "weather.epw"
+    path.write_text("LOCATION,San Francisco\n")
+    return str(path)
+
+
+def write_run(directory, files):
+    for name, text in files.items():
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+    return str(directory)
+
+
+def test_key_ignores_comments_whitespace_and_type_case(tmp_path, model, weather):
+    key = make_result_key(model, weather, {"annual": True}, "25.1.0")
+    reformatted = tmp_path / "reformatted.idf"
+    reformatted.write_text("! a comment\nVERSION, 23.2 ;\nzone,\n  Core_ZN,  !- Name\n  0;\n"
+                           "Lights,Core_ZN_Lights,Core_ZN,Always On,Watts/Area,,10;\n")
+    assert make_result_key(str(reformatted), weather, {"annual": True}, "25.1.0") == key
+
+
+def test_key_ignores_output_location(model, weather):
+    key = make_result_key(model, weather, {"annual": True, "output_directory": "/a"}, "25.1.0")
+    assert make_result_key(model, weather, {"output_directory": "/b", "verbose": "s", "annual": True},
+                           "25.1.0") == key
+
+
+def test_key_changes_with_inputs(tmp_path, model, weather):
+    key = make_result_key(model, weather, {"annual": True}, "25.1.0")
+    other_weather = tmp_path / "other.epw"
+    other_weather.write_text("LOCATION,Chicago\n")
+    changed_value = tmp_path / "changed.idf"
+    changed_value.write_text(MODEL.replace(",10;", ",12;"))
+    changed_name = tmp_path / "renamed.idf"
+    changed_name.write_text(MODEL.replace("Core_ZN_Lights", "core_zn_lights"))
+
+    keys = {
+        key,
+        make_result_key(model, str(other_weather), {"annual": True}, "25.1.0"),
+        make_result_key(model, None, {"annual": True}, "25.1.0"),
+        make_result_key(model, weather, {"annual": False}, "25.1.0"),
+        make_result_key(model, weather, {"annual": True}, "24.2.0"),
+        make_result_key(str(changed_value), weather, {"annual": True}, "25.1.0"),
+        make_result_key(str(changed_name), weather, {"annual": True}, "25.1.0"),
+    }
+    assert len(keys) == 7
+
+
+def test_put_get_and_materialize(tmp_path):
+    cache = SimulationResultCache(str(tmp_path / "index"), root=str(tmp_path / "outputs"))
+    run = write_run(tmp_path / "outputs" / "run", {"eplusout.err": "ok", "columnar/eso.npz": "data"})
+    assert cache.put("key", run, {"input_idf": "model.idf"})
+
+    entry = cache.get("key")
+    assert entry["files"] == {"eplusout.err": 2, os.path.join("columnar", "eso.npz"): 4}
+    assert entry["input_idf"] == "model.idf" and entry["hits"] == 1
+    assert cache.get("missing") is None
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+    target = tmp_path / "elsewhere"
+    write_run(target, {"eplusout.err": "old"})
+    cache.materialize(entry, str(target))
+    assert (target / "eplusout.err").read_text() == "ok"
+    assert (target / "columnar" / "eso.npz").read_text() == "data"
+
+    # Writing to the copy leaves the cached run intact
+    (target / "eplusout.err").write_text("changed")
+    assert cache.get("key") is not None
+
+    # The index survives a restart
+    assert SimulationResultCache(str(tmp_path / "index")).get("key")["output_directory"] == run
+
+
+def test_runs_outside_the_root_are_not_cached(tmp_path):
+    cache = SimulationResultCache(str(tmp_path / "index"), root=str(tmp_path / "outputs"))
+    run = write_run(tmp_path / "elsewhere", {"eplusout.err": "ok"})
+    assert not cache.put("key", run)
+    assert not cache.put("key", str(tmp_path / "outputs"))
+    assert cache.get("key") is None
+
+
+def test_changed_run_is_dropped(tmp_path):
+    cache = SimulationResultCache(str(tmp_path / "index"))
+    run = write_run(tmp_path / "run", {"eplusout.err": "ok", "eplusout.sql": "tables"})
+    cache.put("key", run)
+    os.remove(os.path.join(run, "eplusout.sql"))
+    assert cache.get("key") is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_eviction_deletes_only_recorded_files(tmp_path):
+    cache = SimulationResultCache(str(tmp_path / "index"), max_bytes=10)
+    old = write_run(tmp_path / "old", {"notes.txt": "user"})
+    preexisting = existing_files(old)
+    write_run(old, {"eplusout.err": "12345", "plots/a.html": "1"})
+    cache.put("old", old, exclude=preexisting)
+    time.sleep(0.01)
+
+    new = write_run(tmp_path / "new", {"eplusout.err": "1234567"})
+    cache.put("new", new)
+
+    assert cache.get("old") is None
+    assert sorted(os.listdir(old)) == ["notes.txt"]
+    assert cache.get("new") is not None
+    assert cache.get_stats()["size_bytes"] == 7
@@ -0,0 +1,98 @@
+"""
+Tests for time series aggregation (utils/series_query.py)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from energyplus_mcp_server.utils.eso_reader import read_eso, DAY_TYPES
+from energyplus_mcp_server.utils.series_query import query_time_series
+
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "illustrative examples", "5ZoneAirCooled")
+VARIABLE = "Site Outdoor Air Drybulb Temperature"
+LABEL = "Environment:Site Outdoor Air Drybulb Temperature [C](Hourly)"
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """The series with the start of each hourly interval and its day type, from the .eso"""
+    columns = read_eso(os.path.join(OUTPUT_DIR, "5ZoneAirCooled.eso"), [VARIABLE]).columns("Hourly")
+    starts = pd.Series(columns["Date/Time"] - np.timedelta64(1, "m"))
+    return pd.DataFrame({
+        "value": columns[LABEL].astype(np.float32),
+        "month": starts.dt.month, "day": starts.dt.day, "hour": starts.dt.hour,
+        "day_type": [DAY_TYPES[code] for code in columns["Day Type"]],
+    })
+
+
+def windows(result):
+    (series,) = result["series"]
+    assert series["label"] == LABEL and series["units"] == "C"
+    return series["windows"]
+
+
+def test_monthly_weekday_office_hours(reference):
+    result = query_time_series(OUTPUT_DIR, [VARIABLE], window="monthly", percentiles=[95],
+                               hours=[8, 18], day_types=["Weekday"])
+    assert result["source"] == "eso" and result["rows_read"] == len(reference)
+
+    kept = reference[reference["hour"].between(8, 17) &
+                     reference["day_type"].isin(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"])]
+    assert result["rows_used"] == len(kept)
+    expected = kept.groupby("month")["value"]
+    got = windows(result)
+    assert [w["window"] for w in got] == ["June", "July", "August"]
+    assert [w["count"] for w in got] == expected.count().tolist()
+    np.testing.assert_allclose([w["mean"] for w in got], expected.mean(), rtol=1e-5)
+    np.testing.assert_allclose([w["max"] for w in got], expected.max(), rtol=1e-6)
+    np.testing.assert_allclose([w["p95"] for w in got], expected.quantile(0.95), rtol=1e-5)
+    assert all(w["environment"] == "RUN PERIOD 1" for w in got)
+    assert 8 <= int(got[0]["max_time"][-5:-3]) <= 18
+
+
+def test_daily_windows_include_the_24_00_value(reference):
+    got = windows(query_time_series(OUTPUT_DIR, [VARIABLE], window="daily", aggregations=["count", "sum", "max"]))
+    expected = reference.groupby(["month", "day"])["value"]
+    assert len(got) == len(expected)
+    assert got[0]["window"] == "06/01" and got[0]["count"] == 24
+    np.testing.assert_allclose([w["sum"] for w in got], expected.sum(), rtol=1e-5)
+    assert set(got[0]) == {"environment", "window", "count", "sum", "max", "max_time"}
+
+
+def test_csv_and_eso_agree():
+    kwargs = {"window": "daily", "hours": [22, 6], "months": [7]}
+    eso = windows(query_time_series(OUTPUT_DIR, [VARIABLE], source="eso", **kwargs))
+    csv = windows(query_time_series(OUTPUT_DIR, [VARIABLE], source="csv", chunk_rows=100, **kwargs))
+    assert len(eso) == 31 and all(w["count"] == 8 for w in eso)
+    for a, b in zip(eso, csv):
+        assert (a["window"], a["count"], a["min_time"], a["max_time"]) == (b["window"], b["count"],
+                                                                          b["min_time"], b["max_time"])
+        assert a["sum"] == pytest.approx(b["sum"], rel=1e-5)
+
+
+def test_small_chunks_give_the_same_result():
+    whole = query_time_series(OUTPUT_DIR, [VARIABLE, "SPACE1-1 LIGHTS 1:Lights Electricity Energy"])
+    chunked = query_time_series(OUTPUT_DIR, [VARIABLE, "SPACE1-1 LIGHTS 1:Lights Electricity Energy"],
+                                chunk_rows=97)
+    assert whole["series"] == chunked["series"]
+    assert len(whole["series"]) == 2
+
+
+@pytest.mark.parametrize("kwargs, error, message", [
+    ({"variables": ["No Such Variable"]}, FileNotFoundError, "No time series"),
+    ({"aggregations": ["median"]}, ValueError, "Unknown aggregations"),
+    ({"window": "weekly"}, ValueError, "Unknown window"),
+    ({"percentiles": [120]}, ValueError, "between 0 and 100"),
+    ({"day_types": ["Weekday"], "source": "csv"}, ValueError, "Day type filters need"),
+    ({"day_types": ["Workday"]}, ValueError, "Workday"),
+    ({"hours": [8]}, ValueError, r"\[start, end\)"),
+    ({"environment": "WINTER DAY"}, ValueError, "Unknown environment"),
+    ({"window": "hourly", "max_windows": 100}, ValueError, "more than 100 windows"),
+])
+def test_invalid_queries(kwargs, error, message):
+    kwargs = {"variables": [VARIABLE], **kwargs}
+    with pytest.raises(error, match=message):
+        query_time_series(OUTPUT_DIR, **kwargs)
@@ -0,0 +1,173 @@
+"""
+Tests for the simulation job scheduler (utils/simulation_jobs.py)
+
+Jobs run tests/stub_energyplus.py instead of EnergyPlus.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from energyplus_mcp_server.utils.simulation_jobs import (
+    CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING, SimulationJobManager, build_energyplus_command
+)
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_energyplus.py")
+
+
+def stub_command(seconds=0.2, exit_code=0, output_directory=None):
+    command = [sys.executable, STUB, "--seconds", str(seconds), "--exit-code", str(exit_code)]
+    if output_directory:
+        command += ["--output-directory", str(output_directory)]
+    return command
+
+
+@pytest.fixture
+def manager():
+    # Memory limit high enough that only the worker count gates admission
+    jobs = SimulationJobManager(max_workers=1, memory_limit_mb=1024 * 1024, default_memory_mb=1,
+                                max_history=10, kill_grace_seconds=0.5)
+    yield jobs
+    jobs._executor.shutdown(wait=False)
+
+
+def test_build_energyplus_command():
+    command = build_energyplus_command(
+        "energyplus", "model.idf",
+        {"output_directory": "out", "annual": True, "design_day": False, "weather": "w.epw", "verbose": "v"},
+        idd_path="Energy+.idd")
+    assert command == ["energyplus", "--output-directory", "out", "--annual", "--weather", "w.epw",
+                       "--idd", "Energy+.idd", "model.idf"]
+
+
+@pytest.mark.asyncio
+async def test_submit_and_wait_complete_a_job(manager, tmp_path):
+    finished, post_processed = [], []
+    job = manager.submit(stub_command(output_directory=tmp_path), cwd=str(tmp_path),
+                         metadata={"input_idf": "model.idf", "output_directory": str(tmp_path)},
+                         log_path=str(tmp_path / "stdout.log"),
+                         on_finish=finished.append, post_process=lambda j: post_processed.append(j.status))
+    assert job.status == RUNNING
+
+    await manager.wait(job.job_id, timeout=10)
+
+    assert job.status == COMPLETED
+    assert job.returncode == 0
+    assert finished == [job]
+    assert post_processed == [RUNNING]  # before the job is marked completed
+    assert job.stdout_tail[-1] == "EnergyPlus Completed Successfully."
+    assert "Starting Simulation" in (tmp_path / "stdout.log").read_text()
+    assert (tmp_path / "eplusout.err").exists()
+    info = job.get_info(tail=1)
+    assert info["stdout_tail"] == ["EnergyPlus Completed Successfully."]
+    assert info["output_directory"] == str(tmp_path)
+    assert manager.get_stats()["counts"][COMPLETED] == 1
+
+
+@pytest.mark.asyncio
+async def test_nonzero_exit_fails_the_job(manager, tmp_path):
+    job = manager.submit(stub_command(exit_code=1), cwd=str(tmp_path))
+    await manager.wait(job.job_id, timeout=10)
+    assert job.status == FAILED
+    assert job.error == "EnergyPlus exited with code 1"
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_job_terminates_its_process(manager, tmp_path):
+    job = manager.submit(stub_command(seconds=30), cwd=str(tmp_path))
+    while job.process is None or not job.stdout_tail:
+        await asyncio.sleep(0.05)
+
+    start = time.monotonic()
+    manager.cancel(job.job_id)
+    await manager.wait(job.job_id, timeout=10)
+
+    assert job.status == CANCELLED
+    assert job.returncode != 0
+    assert time.monotonic() - start < 5
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_the_process_starts(manager, tmp_path):
+    # _dispatch marks the job running before its task has started the process
+    job = manager.submit(stub_command(seconds=30), cwd=str(tmp_path))
+    assert job.status == RUNNING and job.process is None
+
+    manager.cancel(job.job_id)
+    await manager.wait(job.job_id, timeout=5)
+
+    assert job.status == CANCELLED
+    assert job.process is None
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_job(manager, tmp_path):
+    running = manager.submit(stub_command(seconds=0.5), cwd=str(tmp_path))
+    queued = manager.submit(stub_command(), cwd=str(tmp_path))
+    assert queued.status == QUEUED
+
+    manager.cancel(queued.job_id)
+    assert queued.status == CANCELLED
+    await manager.wait(running.job_id, timeout=10)
+
+    assert running.status == COMPLETED
+    assert queued.started_at is None and queued.process is None
+
+
+@pytest.mark.asyncio
+async def test_preempted_job_dispatched_in_the_same_tick_never_runs(manager, tmp_path):
+    speculative = manager.submit(stub_command(seconds=30), cwd=str(tmp_path), preemptible=True)
+    regular = manager.submit(stub_command(), cwd=str(tmp_path))
+
+    await manager.wait(regular.job_id, timeout=10)
+
+    assert speculative.status == CANCELLED
+    assert speculative.preempted and speculative.process is None
+    assert regular.status == COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_queue_starts_higher_priority_first_then_in_submission_order(manager, tmp_path):
+    started = []
+    blocker = manager.submit(stub_command(seconds=0.3), cwd=str(tmp_path))
+    jobs = {}
+    for name, priority in (("low 1", 0), ("high", 5), ("low 2", 0), ("middle", 1)):
+        jobs[name] = manager.submit(stub_command(seconds=0), cwd=str(tmp_path), priority=priority,
+                                    on_finish=lambda job, name=name: started.append(name))
+        assert jobs[name].status == QUEUED
+
+    await manager.wait(blocker.job_id, timeout=10)
+    for job in jobs.values():
+        await manager.wait(job.job_id, timeout=10)
+
+    assert started == ["high", "middle", "low 1", "low 2"]
+    assert sorted(jobs, key=lambda name: jobs[name].started_at) == started
+
+
+@pytest.mark.asyncio
+async def test_history_keeps_the_newest_finished_jobs(tmp_path):
+    manager = SimulationJobManager(max_workers=1, memory_limit_mb=1024 * 1024, default_memory_mb=1,
+                                   max_history=2)
+    try:
+        jobs = []
+        for _ in range(3):
+            jobs.append(manager.submit(stub_command(seconds=0), cwd=str(tmp_path)))
+            await manager.wait(jobs[-1].job_id, timeout=10)
+        # Pruning happens when the next job is registered
+        latest = manager.submit(stub_command(seconds=0), cwd=str(tmp_path))
+        await manager.wait(latest.job_id, timeout=10)
+
+        with pytest.raises(ValueError, match="not found"):
+            manager.get_job(jobs[0].job_id)
+        assert [info["job_id"] for info in manager.list_jobs()] == [latest.job_id, jobs[2].job_id, jobs[1].job_id]
+        assert [info["job_id"] for info in manager.list_jobs(status=RUNNING)] == []
+    finally:
+        manager._executor.shutdown(wait=False)
+
+
+def test_unknown_job_id():
+    with pytest.raises(ValueError, match="not found"):
+        SimulationJobManager(max_workers=1, memory_limit_mb=1024).get_job("missing")
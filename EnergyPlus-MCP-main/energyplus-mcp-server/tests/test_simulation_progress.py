@@ -0,0 +1,288 @@
+"""
+Tests for live simulation progress (utils/simulation_progress.py)
+"""
+
+import pytest
+
+from energyplus_mcp_server.utils.simulation_progress import (
+    COMPLETED, INITIALIZING, REPORTING, SIMULATING, SIZING, WARMUP, SimulationProgress, estimate_simulation_days
+)
+
+# Console output of a run with two design days and an annual run period, trimmed
+# to the lines around each phase change
+SIZING_LINES = [
+    "EnergyPlus Starting",
+    "EnergyPlus, Version 23.2.0-7636e6b3e9, YMD=2024.01.05 10:00",
+    "Processing Data Dictionary",
+    "Processing Input File",
+    "Initializing Simulation",
+    "Reporting Surfaces",
+    "Initializing Response Factors",
+    "Calculating CTFs for \"ROOF-1\"",
+    "Initializing Window Optical Properties",
+    "Initializing Solar Calculations",
+    "Initializing HVAC",
+    "Warming up",
+    "Warming up",
+    "Warming up",
+    "Performing Zone Sizing Simulation",
+    "...for Sizing Period: #1 CHICAGO ANN HTG 99.6% CONDNS DB",
+    "Warming up",
+    "Warming up",
+    "Performing Zone Sizing Simulation",
+    "...for Sizing Period: #2 CHICAGO ANN CLG .4% CONDNS DB=>MWB",
+    "Calculating System sizing",
+    "...for Sizing Period: #1 CHICAGO ANN HTG 99.6% CONDNS DB",
+    "Adjusting Air System Sizing",
+    "Adjusting Standard 62.1 Ventilation Sizing",
+    "Initializing Simulation",
+    "Reporting Surfaces",
+]
+DESIGN_DAY_LINES = [
+    "Beginning Primary Simulation",
+    "Initializing New Environment Parameters",
+    "Warming up {1}",
+    "Warming up {2}",
+    "Warming up {3}",
+    "Starting Simulation at 12/21 for CHICAGO ANN HTG 99.6% CONDNS DB",
+    "Initializing New Environment Parameters",
+    "Warming up {1}",
+    "Starting Simulation at 07/21 for CHICAGO ANN CLG .4% CONDNS DB=>MWB",
+]
+RUN_PERIOD_LINES = [
+    "Initializing New Environment Parameters",
+    "Warming up {1}",
+    "Warming up {2}",
+    "Starting Simulation at 01/01/2017 for RUN PERIOD 1",
+] + [f"Continuing Simulation at {month:02d}/01/2017 for RUN PERIOD 1" for month in range(2, 13)]
+REPORTING_LINES = [
+    "Writing tabular output file results using HTML format.",
+    "Writing final SQL reports",
+    "EnergyPlus Run Time=00hr 00min  2.05sec",
+]
+COMPLETED_LINE = "EnergyPlus Completed Successfully."
+
+TOTAL_DAYS = 2 + 365
+
+
+def feed(progress, lines):
+    return [progress.feed(line) for line in lines]
+
+
+def test_initial_state():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    assert progress.phase == INITIALIZING
+    assert progress.day_of_simulation == 0
+    assert progress.fraction == 0
+    assert progress.eta_seconds() is None
+    assert progress.describe() == "Initializing"
+
+
+def test_unrelated_lines_do_not_change_progress():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    assert not any(feed(progress, ["EnergyPlus Starting", "Processing Input File",
+                                   "...for Sizing Period: #1 CHICAGO ANN HTG 99.6% CONDNS DB",
+                                   "Simulation at the wrong place"]))
+    assert progress.version == 0 and progress.updated_at is None
+
+
+def test_sizing_keeps_its_phase_through_warmup():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, SIZING_LINES[:14])
+    assert progress.phase == WARMUP
+    assert progress.warmup_day == 3
+
+    feed(progress, SIZING_LINES[14:18])
+    assert progress.phase == SIZING
+    assert progress.warmup_day == 2
+    assert progress.describe() == "Sizing, warmup day 2"
+
+    feed(progress, SIZING_LINES[18:])
+    assert progress.phase == SIZING
+    assert progress.simulation_started_at is None
+    assert progress.day_of_simulation == 0
+
+
+def test_design_days_count_one_day_each():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, SIZING_LINES + DESIGN_DAY_LINES[:5])
+    assert progress.phase == WARMUP
+    assert progress.warmup_day == 3
+    assert progress.describe() == "Warmup day 3"
+
+    feed(progress, DESIGN_DAY_LINES[5:6])
+    assert progress.phase == SIMULATING
+    assert progress.environment == "CHICAGO ANN HTG 99.6% CONDNS DB"
+    assert progress.date == "12/21"
+    assert progress.warmup_day == 0
+    assert progress.day_of_simulation == 1
+    assert progress.simulation_started_at is not None
+
+    feed(progress, DESIGN_DAY_LINES[6:8])
+    assert progress.phase == WARMUP
+    assert progress.environment is None
+    assert progress.day_of_simulation == 1
+
+    feed(progress, DESIGN_DAY_LINES[8:])
+    assert progress.environments_started == 2
+    assert progress.day_of_simulation == 2
+
+
+def test_run_period_advances_by_month():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, SIZING_LINES + DESIGN_DAY_LINES + RUN_PERIOD_LINES[:4])
+    assert progress.environment == "RUN PERIOD 1"
+    assert progress.day_of_simulation == 3
+
+    feed(progress, RUN_PERIOD_LINES[4:5])
+    assert progress.date == "02/01"
+    assert progress.day_of_simulation == 2 + 31 + 1
+    assert progress.describe().startswith("RUN PERIOD 1 02/01 (day 34 of 367)")
+
+    feed(progress, RUN_PERIOD_LINES[5:])
+    assert progress.date == "12/01"
+    assert progress.day_of_simulation == 2 + 334 + 1
+    assert progress.fraction == pytest.approx(337 / 367)
+    assert progress.environments_started == 3
+
+
+def test_eta_extrapolates_the_pace_since_the_first_environment():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, SIZING_LINES + DESIGN_DAY_LINES)
+    progress.simulation_started_at = 1000.0
+    # One day simulated in one second: 366 days to go
+    assert progress.eta_seconds(now=1001.0) == pytest.approx(366.0)
+
+    feed(progress, RUN_PERIOD_LINES[:5])
+    # Day 34 reached after 66 seconds: 2 seconds per day for the remaining 334 days
+    assert progress.eta_seconds(now=1066.0) == pytest.approx(668.0)
+    assert progress.get_info()["eta_seconds"] is not None
+
+
+def test_eta_needs_a_total_and_a_completed_day():
+    progress = SimulationProgress()
+    feed(progress, DESIGN_DAY_LINES + RUN_PERIOD_LINES)
+    assert progress.fraction is None
+    assert progress.eta_seconds() is None
+    assert progress.describe() == "RUN PERIOD 1 12/01"
+
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, DESIGN_DAY_LINES[:6])
+    assert progress.eta_seconds() is None
+
+
+def test_reporting_and_completion():
+    progress = SimulationProgress(total_days=TOTAL_DAYS)
+    feed(progress, SIZING_LINES + DESIGN_DAY_LINES + RUN_PERIOD_LINES)
+    assert feed(progress, REPORTING_LINES) == [True, False, False]
+    assert progress.phase == REPORTING
+    assert progress.environment is None
+    # The run period closes at the last date EnergyPlus reported, 12/01
+    assert progress.day_of_simulation == 2 + 335
+    assert progress.fraction == 1.0
+    assert progress.eta_seconds() == 0.0
+    assert progress.describe() == "Reporting"
+
+    assert progress.feed(COMPLETED_LINE)
+    info = progress.get_info()
+    assert info["phase"] == COMPLETED
+    assert info["percent"] == 100.0
+    assert info["eta_seconds"] is None
+    assert info["message"] == "Completed"
+
+
+def test_run_period_across_the_new_year():
+    progress = SimulationProgress(total_days=90)
+    feed(progress, ["Starting Simulation at 12/01/2016 for WINTER",
+                    "Continuing Simulation at 01/01/2017 for WINTER",
+                    "Continuing Simulation at 02/01/2017 for WINTER"])
+    assert progress.day_of_simulation == 31 + 31 + 1
+
+
+DESIGN_DAYS = """
+SizingPeriod:DesignDay,
+    CHICAGO ANN HTG 99.6% CONDNS DB,  !- Name
+    12,                      !- Month
+    21;                      !- Day of Month
+
+SizingPeriod:DesignDay,
+    CHICAGO ANN CLG .4% CONDNS DB=>MWB,  !- Name
+    7,                       !- Month
+    21;                      !- Day of Month
+"""
+ANNUAL_RUN_PERIOD = """
+RunPeriod,
+    Run Period 1,            !- Name
+    1,                       !- Begin Month
+    1,                       !- Begin Day of Month
+    ,                        !- Begin Year
+    12,                      !- End Month
+    31,                      !- End Day of Month
+    ,                        !- End Year
+    Tuesday;                 !- Day of Week for Start Day
+"""
+
+
+def simulation_control(run_sizing_periods, run_weather_periods):
+    return f"""
+SimulationControl,
+    Yes,                     !- Do Zone Sizing Calculation
+    Yes,                     !- Do System Sizing Calculation
+    No,                      !- Do Plant Sizing Calculation
+    {run_sizing_periods},    !- Run Simulation for Sizing Periods
+    {run_weather_periods};   !- Run Simulation for Weather File Run Periods
+"""
+
+
+@pytest.fixture
+def write_idf(tmp_path):
+    def write(*objects):
+        path = tmp_path / "model.idf"
+        path.write_text("Version,23.2;\n" + "".join(objects))
+        return str(path)
+    return write
+
+
+@pytest.mark.parametrize("run_sizing_periods, run_weather_periods, expected", [
+    ("Yes", "Yes", 2 + 365),
+    ("No", "Yes", 365),
+    ("Yes", "No", 2),
+    ("No", "No", None),
+])
+def test_estimate_follows_simulation_control(write_idf, run_sizing_periods, run_weather_periods, expected):
+    idf = write_idf(simulation_control(run_sizing_periods, run_weather_periods), DESIGN_DAYS, ANNUAL_RUN_PERIOD)
+    assert estimate_simulation_days(idf) == expected
+
+
+def test_estimate_without_simulation_control_runs_everything(write_idf):
+    assert estimate_simulation_days(write_idf(DESIGN_DAYS, ANNUAL_RUN_PERIOD)) == 2 + 365
+    assert estimate_simulation_days(write_idf(DESIGN_DAYS)) == 2
+    assert estimate_simulation_days(write_idf(ANNUAL_RUN_PERIOD)) == 365
+    assert estimate_simulation_days(write_idf()) is None
+
+
+def test_estimate_skips_run_periods_without_weather(write_idf):
+    idf = write_idf(DESIGN_DAYS, ANNUAL_RUN_PERIOD)
+    assert estimate_simulation_days(idf, has_weather=False) == 2
+    assert estimate_simulation_days(write_idf(ANNUAL_RUN_PERIOD), has_weather=False) is None
+
+
+def test_estimate_with_command_line_modes(write_idf):
+    idf = write_idf(simulation_control("No", "No"), DESIGN_DAYS, ANNUAL_RUN_PERIOD)
+    assert estimate_simulation_days(idf, annual=True) == 365
+    assert estimate_simulation_days(idf, design_day=True) == 2
+    assert estimate_simulation_days(write_idf(ANNUAL_RUN_PERIOD), design_day=True) is None
+
+
+def test_estimate_run_period_lengths(write_idf):
+    # Pre-9.0 RunPeriod without year fields, and a winter period across the new year
+    old_format = "RunPeriod,January,1,1,1,31,UseWeatherFile,Yes,Yes,No,Yes,Yes;\n"
+    winter = "RunPeriod,Winter,12,1,2016,2,28,2017,Thursday,Yes,Yes,No,Yes,Yes;\n"
+    assert estimate_simulation_days(write_idf(old_format)) == 31
+    assert estimate_simulation_days(write_idf(winter)) == 31 + 31 + 28
+    assert estimate_simulation_days(write_idf(old_format, winter, DESIGN_DAYS)) == 31 + 90 + 2
+
+
+def test_estimate_unreadable_models(write_idf, tmp_path):
+    assert estimate_simulation_days(str(tmp_path / "missing.idf")) is None
+    assert estimate_simulation_days(write_idf("RunPeriod,Broken,January,1,,12,31;\n")) is None
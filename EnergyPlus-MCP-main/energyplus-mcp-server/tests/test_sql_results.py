@@ -0,0 +1,255 @@
+"""
+Tests for the EnergyPlus SQLite output reader (utils/sql_results.py)
+
+The fixtures write a tiny database with the tables and columns of the
+EnergyPlus SQLite schema that the reader uses.
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from energyplus_mcp_server.utils.eso_reader import DAY_TYPES
+from energyplus_mcp_server.utils.sql_results import (
+    SQL_INDEXES, SqlResults, ensure_sql_indexes, find_sql_output, idf_has_sqlite_output, inject_sqlite_output
+)
+
+SCHEMA = """
+CREATE TABLE EnvironmentPeriods (EnvironmentPeriodIndex INTEGER PRIMARY KEY, SimulationIndex INTEGER,
+    EnvironmentName TEXT, EnvironmentType INTEGER);
+CREATE TABLE Time (TimeIndex INTEGER PRIMARY KEY, Year INTEGER, Month INTEGER, Day INTEGER, Hour INTEGER,
+    Minute INTEGER, Dst INTEGER, Interval INTEGER, IntervalType INTEGER, SimulationDays INTEGER,
+    DayType TEXT, EnvironmentPeriodIndex INTEGER, WarmupFlag INTEGER);
+CREATE TABLE ReportDataDictionary (ReportDataDictionaryIndex INTEGER PRIMARY KEY, IsMeter INTEGER,
+    Type TEXT, IndexGroup TEXT, TimestepType TEXT, KeyValue TEXT, Name TEXT, ReportingFrequency TEXT,
+    ScheduleName TEXT, Units TEXT);
+CREATE TABLE ReportData (ReportDataIndex INTEGER PRIMARY KEY, TimeIndex INTEGER,
+    ReportDataDictionaryIndex INTEGER, Value REAL);
+CREATE TABLE StringTypes (StringTypeIndex INTEGER PRIMARY KEY, Value TEXT);
+CREATE TABLE Strings (StringIndex INTEGER PRIMARY KEY, StringTypeIndex INTEGER, Value TEXT);
+CREATE TABLE TabularData (TabularDataIndex INTEGER PRIMARY KEY, ReportNameIndex INTEGER,
+    ReportForStringIndex INTEGER, TableNameIndex INTEGER, RowNameIndex INTEGER, ColumnNameIndex INTEGER,
+    UnitsIndex INTEGER, SimulationIndex INTEGER, RowId INTEGER, ColumnId INTEGER, Value TEXT);
+CREATE INDEX rdTI ON ReportData (TimeIndex ASC);
+"""
+
+# TimeIndex, Month, Day, Hour, Minute, IntervalType, DayType, EnvironmentPeriodIndex, WarmupFlag
+TIME_ROWS = [
+    (1, 1, 21, 1, 0, 1, "WinterDesignDay", 1, 1),  # warmup
+    (2, 1, 21, 1, 0, 1, "WinterDesignDay", 1, 0),
+    (3, 1, 21, 2, 0, 1, "WinterDesignDay", 1, 0),
+    (4, 1, 1, 1, 0, 1, "Monday", 2, 0),
+    (5, 1, 1, 2, 0, 1, "Monday", 2, 0),
+    (6, 1, 1, 24, 0, 2, "Monday", 2, 0),  # daily
+    (7, 1, 31, 24, 0, 3, None, 2, 0),  # monthly
+    (8, None, None, None, None, 4, None, 2, 0),  # run period
+]
+
+# ReportDataDictionaryIndex, IsMeter, KeyValue, Name, ReportingFrequency, Units
+DICTIONARY = [
+    (1, 0, "ZONE ONE", "Zone Mean Air Temperature", "Hourly", "C"),
+    (2, 1, None, "Electricity:Facility", "Hourly", "J"),
+    (3, 0, "ZONE ONE", "Zone Mean Air Temperature", "Daily", "C"),
+    (4, 1, None, "Electricity:Facility", "Monthly", "J"),
+    (5, 1, None, "Electricity:Facility", "Run Period", "J"),
+]
+
+# TimeIndex, ReportDataDictionaryIndex, Value
+REPORT_DATA = [
+    (1, 1, -5.0), (2, 1, 10.0), (3, 1, 11.0), (4, 1, 20.0), (5, 1, 21.0),
+    (2, 2, 100.0), (4, 2, 200.0),  # the meter has no value at TimeIndex 3 and 5
+    (6, 3, 20.5), (7, 4, 400.0), (8, 5, 400.0),
+]
+
+# Report, for, table, row, column, units, RowId, ColumnId, value
+TABULAR = [
+    ("AnnualBuildingUtilityPerformanceSummary", "Entire Facility", "Site and Source Energy",
+     "Total Site Energy", "Total Energy", "GJ", 0, 0, "      48.24"),
+    ("AnnualBuildingUtilityPerformanceSummary", "Entire Facility", "Site and Source Energy",
+     "Total Site Energy", "Energy Per Total Building Area", "MJ/m2", 0, 1, "      52.03"),
+    ("AnnualBuildingUtilityPerformanceSummary", "Entire Facility", "Site and Source Energy",
+     "Net Site Energy", "Total Energy", "GJ", 1, 0, "      48.24"),
+    ("AnnualBuildingUtilityPerformanceSummary", "Entire Facility", "End Uses",
+     "Heating", "Natural Gas", "GJ", 0, 0, "2.71"),
+    ("InputVerificationandResultsSummary", "Entire Facility", "General",
+     "Weather File", "Value", "", 0, 0, "Chicago Ohare Intl Ap IL USA"),
+]
+
+
+def write_sql(path):
+    """Write the synthetic EnergyPlus SQLite output to path"""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    connection.executemany("INSERT INTO EnvironmentPeriods VALUES (?, 1, ?, ?)",
+                           [(1, "CHICAGO ANN HTG 99.6% CONDNS DB", 1), (2, "RUN PERIOD 1", 3)])
+    connection.executemany(
+        "INSERT INTO Time VALUES (?, 2001, ?, ?, ?, ?, 0, 60, ?, 1, ?, ?, ?)", TIME_ROWS)
+    connection.executemany(
+        "INSERT INTO ReportDataDictionary VALUES (?, ?, 'Avg', 'Zone', 'Zone', ?, ?, ?, NULL, ?)", DICTIONARY)
+    connection.executemany(
+        "INSERT INTO ReportData (TimeIndex, ReportDataDictionaryIndex, Value) VALUES (?, ?, ?)", REPORT_DATA)
+
+    string_types = ["ReportName", "ReportForString", "TableName", "RowName", "ColumnName", "Units"]
+    connection.executemany("INSERT INTO StringTypes VALUES (?, ?)",
+                           [(i + 1, name) for i, name in enumerate(string_types)])
+    strings = {}
+
+    def string_index(type_index, value):
+        if (type_index, value) not in strings:
+            strings[(type_index, value)] = len(strings) + 1
+            connection.execute("INSERT INTO Strings VALUES (?, ?, ?)",
+                               (strings[(type_index, value)], type_index + 1, value))
+        return strings[(type_index, value)]
+
+    for *names, row_id, column_id, value in TABULAR:
+        indexes = [string_index(i, name) for i, name in enumerate(names)]
+        connection.execute(
+            "INSERT INTO TabularData (ReportNameIndex, ReportForStringIndex, TableNameIndex, RowNameIndex, "
+            "ColumnNameIndex, UnitsIndex, SimulationIndex, RowId, ColumnId, Value) "
+            "VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?, ?)", (*indexes, row_id, column_id, value))
+    connection.commit()
+    connection.close()
+
+
+def index_names(path):
+    with sqlite3.connect(path) as connection:
+        return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+@pytest.fixture
+def sql_path(tmp_path):
+    path = tmp_path / "eplusout.sql"
+    write_sql(path)
+    return path
+
+
+@pytest.fixture
+def results(sql_path):
+    with SqlResults(sql_path) as opened:
+        yield opened
+
+
+def test_dictionary_maps_frequencies_and_keys(results):
+    variables = {var.report_id: var for var in results.dictionary()}
+    assert variables[1].label == "ZONE ONE:Zone Mean Air Temperature [C](Hourly)"
+    assert variables[2].key == ""
+    assert variables[5].frequency == "RunPeriod"
+    assert [var.report_id for var in results.find(["Electricity:Facility"])] == [2, 4, 5]
+
+
+def test_hourly_columns_skip_warmup_and_align_variables(results):
+    columns = results.columns(results.find(["Zone Mean Air Temperature", "Electricity:Facility"]), "Hourly")
+
+    assert columns["Row"].tolist() == [2, 3, 4, 5]
+    assert columns["Date/Time"].tolist() == np.array(
+        ["2001-01-21T01:00", "2001-01-21T02:00", "2001-01-01T01:00", "2001-01-01T02:00"],
+        dtype="datetime64[m]").tolist()
+    assert columns["Environment"].tolist() == [0, 0, 1, 1]
+    assert columns["Day Type"].tolist() == [DAY_TYPES.index("WinterDesignDay")] * 2 + [DAY_TYPES.index("Monday")] * 2
+    assert columns["ZONE ONE:Zone Mean Air Temperature [C](Hourly)"].tolist() == [10.0, 11.0, 20.0, 21.0]
+    meter = columns["Electricity:Facility [J](Hourly)"]
+    assert meter[[0, 2]].tolist() == [100.0, 200.0]
+    assert np.isnan(meter[[1, 3]]).all()
+
+
+def test_coarse_columns_stamp_the_start_of_the_interval(results):
+    daily = results.columns(results.find(["Zone Mean Air Temperature"]), "Daily")
+    assert daily["Date/Time"].tolist() == np.array(["2001-01-01T00:00"], dtype="datetime64[m]").tolist()
+    assert daily["Day Type"].tolist() == [DAY_TYPES.index("Monday")]
+
+    monthly = results.columns(results.find(["Electricity:Facility"]), "Monthly")
+    assert monthly["Date/Time"].tolist() == np.array(["2001-01-01T00:00"], dtype="datetime64[m]").tolist()
+    assert monthly["Day Type"].tolist() == [-1]
+    assert monthly["Electricity:Facility [J](Monthly)"].tolist() == [400.0]
+
+    run_period = results.columns(results.find(["Electricity:Facility"]), "RunPeriod")
+    assert np.isnat(run_period["Date/Time"]).all()
+    assert run_period["Environment"].tolist() == [1]
+
+
+def test_columns_filter_by_environment(results):
+    variables = results.find(["Zone Mean Air Temperature"])
+    by_title = results.columns(variables, "Hourly", environment="run period 1")
+    by_index = results.columns(variables, "Hourly", environment=1)
+    assert by_title["Row"].tolist() == by_index["Row"].tolist() == [4, 5]
+
+    with pytest.raises(ValueError, match="Unknown environment"):
+        results.columns(variables, "Hourly", environment="nope")
+    with pytest.raises(ValueError, match="No selected variables"):
+        results.columns(variables, "Monthly")
+
+
+def test_tabular_filters_match_names_ignoring_case(results):
+    cells = results.tabular(report="annualbuildingutilityperformancesummary", table="site and source energy")
+    assert [(cell["row"], cell["column"]) for cell in cells] == [
+        ("Total Site Energy", "Total Energy"),
+        ("Total Site Energy", "Energy Per Total Building Area"),
+        ("Net Site Energy", "Total Energy"),
+    ]
+    assert cells[0]["units"] == "GJ"
+    assert cells[0]["value"] == 48.24
+
+    cells = results.tabular(rows=["total site energy"], columns=["Total Energy"])
+    assert [cell["value"] for cell in cells] == [48.24]
+
+    cells = results.tabular(report_for="Entire Facility", table="General")
+    assert cells[0]["value"] == "Chicago Ohare Intl Ap IL USA"
+
+    assert results.tabular(report="No Such Report") == []
+    assert len(results.tabular(limit=2)) == 2
+
+
+def test_tabular_index_lists_tables_in_report_order(results):
+    assert [(entry["table"], entry["cells"]) for entry in results.tabular_index()] == [
+        ("Site and Source Energy", 3), ("End Uses", 1), ("General", 1)
+    ]
+
+
+def test_ensure_sql_indexes_adds_missing_indexes_once(sql_path):
+    created = ensure_sql_indexes(sql_path)
+    assert created == [name for name, _, _ in SQL_INDEXES]
+    assert set(created) <= index_names(sql_path)
+    assert ensure_sql_indexes(sql_path) == []
+
+
+def test_ensure_sql_indexes_skips_tables_the_run_did_not_write(tmp_path):
+    path = tmp_path / "simple.sql"
+    with sqlite3.connect(path) as connection:
+        connection.executescript(SCHEMA.replace("CREATE TABLE TabularData", "CREATE TABLE Unused"))
+    assert "mcp_tabular_report" not in ensure_sql_indexes(path)
+
+
+def test_sql_results_can_skip_indexing(sql_path):
+    with SqlResults(sql_path, create_indexes=False) as opened:
+        assert opened.environments == ["CHICAGO ANN HTG 99.6% CONDNS DB", "RUN PERIOD 1"]
+    assert not index_names(sql_path) & {name for name, _, _ in SQL_INDEXES}
+
+
+def test_find_sql_output_prefers_eplusout(tmp_path):
+    assert find_sql_output(tmp_path) is None
+    (tmp_path / "runout.sql").write_bytes(b"")
+    assert find_sql_output(tmp_path).name == "runout.sql"
+    (tmp_path / "eplusout.sql").write_bytes(b"")
+    assert find_sql_output(tmp_path).name == "eplusout.sql"
+
+
+def test_inject_sqlite_output_writes_a_copy(tmp_path):
+    source = tmp_path / "model.idf"
+    source.write_text("Version,\n    9.2;\n\nTimestep,\n    4;\n")
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    injected = inject_sqlite_output(str(source), str(run_dir))
+
+    assert injected == str(run_dir / "model_sqlite.idf")
+    assert not idf_has_sqlite_output(str(source))
+    assert idf_has_sqlite_output(injected)
+    assert "SimpleAndTabular;" in (run_dir / "model_sqlite.idf").read_text()
+
+
+def test_inject_sqlite_output_keeps_models_that_request_it(tmp_path):
+    source = tmp_path / "model.idf"
+    source.write_text("Version,\n    9.2;\n\nOutput:SQLite,\n    Simple;\n")
+    assert inject_sqlite_output(str(source), str(tmp_path)) == str(source)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["model.idf"]
@@ -0,0 +1,138 @@
+"""
+Tests for the shared validation cache (utils/validation_cache.py)
+"""
+
+import threading
+import time
+
+import pytest
+
+from energyplus_mcp_server.utils.validation_cache import ValidationCache, estimate_size, file_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_concurrent_misses_compute_once():
+    cache = ValidationCache()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {"names": ["Zone Mean Air Temperature"]}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("model", compute)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.get_stats()["coalesced"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    stats = cache.get_stats()
+    assert (stats["coalesced"], stats["entries"], stats["in_flight"]) == (7, 1, 0)
+    assert cache.get_or_compute("model", compute) is results[0]
+    assert len(calls) == 1
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    cache = ValidationCache()
+    release = threading.Event()
+    errors = []
+
+    def compute():
+        release.wait(5)
+        raise ValueError("no .rdd file")
+
+    def call():
+        try:
+            cache.get_or_compute("model", compute)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while cache.get_stats()["coalesced"] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert cache.get_or_compute("model", lambda: "ok") == "ok"
+
+
+def test_should_cache():
+    cache = ValidationCache()
+    assert cache.get_or_compute("model", lambda: {"partial": True}, should_cache=lambda v: not v["partial"])
+    assert cache.get("model") is None
+    cache.get_or_compute("model", lambda: {"partial": False}, should_cache=lambda v: not v["partial"])
+    assert cache.get("model") == {"partial": False}
+
+
+def test_entries_expire(clock):
+    cache = ValidationCache(ttl_seconds=300)
+    cache.put("model", ["a"])
+    clock[0] += 299
+    assert cache.get("model") == ["a"]
+    clock[0] += 2
+    assert cache.get("model") is None
+    assert cache.get_stats()["expirations"] == 1
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_no_expiry_with_zero_ttl(clock):
+    cache = ValidationCache(ttl_seconds=0)
+    cache.put("model", ["a"])
+    clock[0] += 10 ** 6
+    assert cache.get("model") == ["a"]
+
+
+def test_entry_cap_evicts_least_recently_used():
+    cache = ValidationCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_size_cap():
+    value = ["x" * 1000 for _ in range(10)]
+    size = estimate_size(list(value))
+    assert size > 10 * 1000
+
+    cache = ValidationCache(max_total_bytes=int(size * 2.5))
+    for key in "abc":
+        cache.put(key, list(value))
+    stats = cache.get_stats()
+    assert stats["entries"] == 2 and stats["estimated_bytes"] == 2 * size
+    assert cache.get("a") is None
+
+    cache.put("huge", value * 3)
+    assert cache.get("huge") is None
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_file_key_changes_with_the_file(tmp_path):
+    path = tmp_path / "model.idf"
+    path.write_text("Zone,Core_ZN;\n")
+    key = file_key(str(path))
+    assert file_key(str(path)) == key
+    path.write_text("Zone,Core_ZN,0;\n")
+    assert file_key(str(path)) != key
+    assert file_key(str(tmp_path / "missing.idf")) == (str(tmp_path / "missing.idf"),)